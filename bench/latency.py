@@ -0,0 +1,24 @@
+"""Example latency benchmark for repeated small solves."""
+from timeit import repeat
+import numpy as np
+import pyamg
+
+
+def latency():
+    """Time one cycle of MultilevelSolver.solve and of FastSolver.solve_into."""
+    A = pyamg.gallery.poisson((100, 100), format='csr')
+    b = np.random.rand(A.shape[0])
+    x = np.zeros(A.shape[0])
+
+    for name, solver in [('SA', pyamg.smoothed_aggregation_solver),
+                         ('RS', pyamg.ruge_stuben_solver)]:
+        ml = solver(A)
+        fast = ml.compile()
+        t_ml = min(repeat(lambda ml=ml: ml.solve(b, maxiter=1), number=100, repeat=5))
+        t_fast = min(repeat(lambda fast=fast: fast.solve_into(b, x), number=100, repeat=5))
+        print(f'{name}: solve {t_ml * 10:.3f} ms, '
+              f'solve_into {t_fast * 10:.3f} ms per cycle')
+
+
+if __name__ == '__main__':
+    latency()
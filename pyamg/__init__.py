@@ -11,13 +11,14 @@ from .version import version as __version__
 from . import (aggregation, amg_core, classical, gallery, krylov, relaxation, util, vis)
 from . import (blackbox, graph, graph_ref, multilevel, strength)
 
-from .multilevel import coarse_grid_solver, multilevel_solver, MultilevelSolver
+from .multilevel import coarse_grid_solver, multilevel_solver, MultilevelSolver, FastSolver
 from .classical import ruge_stuben_solver, air_solver
 from .aggregation import smoothed_aggregation_solver, rootnode_solver, pairwise_solver
 from .gallery import demo
 from .blackbox import solve, solver, solver_configuration
 
 __all__ = [
+    'FastSolver',
     'MultilevelSolver',
     '__version__',
     '__version_tuple__',
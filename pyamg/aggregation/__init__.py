@@ -1,17 +1,19 @@
 """Aggregation-based AMG."""
 
 from .adaptive import adaptive_sa_solver
-from .aggregate import (standard_aggregation, naive_aggregation,
+from .aggregate import (standard_aggregation, naive_aggregation, mis2_aggregation,
                         lloyd_aggregation, balanced_lloyd_aggregation,
-                        metis_aggregation)
+                        metis_aggregation, partition_aggregation)
 from .aggregation import smoothed_aggregation_solver
 from .tentative import fit_candidates
+from .operator import AggregationOperator
 from .smooth import (jacobi_prolongation_smoother, richardson_prolongation_smoother,
                      energy_prolongation_smoother)
 from .rootnode import rootnode_solver
 from .pairwise import pairwise_solver
 
 __all__ = [
+    'AggregationOperator',
     'adaptive_sa_solver',
     'balanced_lloyd_aggregation',
     'energy_prolongation_smoother',
@@ -19,8 +21,10 @@ __all__ = [
     'jacobi_prolongation_smoother',
     'lloyd_aggregation',
     'metis_aggregation',
+    'mis2_aggregation',
     'naive_aggregation',
     'pairwise_solver',
+    'partition_aggregation',
     'richardson_prolongation_smoother',
     'rootnode_solver',
     'smoothed_aggregation_solver',
@@ -123,7 +123,7 @@ def adaptive_sa_solver(A, initial_candidates=None, symmetry='hermitian',
                        smooth=('jacobi', {}), strength='symmetric',
                        coarse_solver='pinv',
                        eliminate_local=(False, {'thresh': 1.0}), keep=False,
-                       **kwargs):
+                       max_work=None, **kwargs):
     """Create a multilevel solver using Adaptive Smoothed Aggregation (aSA).
 
     Parameters
@@ -182,6 +182,11 @@ def adaptive_sa_solver(A, initial_candidates=None, symmetry='hermitian',
         Flag to indicate keeping extra operators in the hierarchy for
         diagnostics.  For example, if True, then strength of connection (C),
         tentative prolongation (T), and aggregation (AggOp) are kept.
+    max_work : float, optional
+        Budget for the adaptive setup, in the units of the returned work.
+        Once it is exceeded, no further candidates are generated or improved,
+        and the solver is built from the candidates computed so far.  The
+        first candidate is always computed.
     **kwargs : dict
         Extra keywords passed to Mulilevel class.
 
@@ -242,6 +247,19 @@ def adaptive_sa_solver(A, initial_candidates=None, symmetry='hermitian',
         levelize_strength_or_aggregation(aggregate, max_levels, max_coarse)
     smooth = levelize_smooth_or_improve_candidates(smooth, max_levels)
 
+    # A is the finest operator of every hierarchy built below, so estimate
+    # rho(D^-1 A) for Jacobi prolongation smoothing only once
+    fn, smooth_kwargs = unpack_arg(smooth[0])
+    if fn == 'jacobi' and not smooth_kwargs.get('filter_entries', False) and \
+            'rho' not in smooth_kwargs:
+        smooth = [(fn, {**smooth_kwargs, 'rho': rho_D_inv_A(A)}), *smooth[1:]]
+
+    def over_budget():
+        if max_work is None or work[0] / A.nnz < max_work:
+            return False
+        warn(f'Adaptive setup stopped after reaching max_work={max_work}')
+        return True
+
     # Develop initial candidate(s).  Note that any predefined aggregation is
     # preserved.
     if initial_candidates is None:
@@ -276,6 +294,9 @@ def adaptive_sa_solver(A, initial_candidates=None, symmetry='hermitian',
 
     # Develop additional candidates
     for i in range(num_candidates):
+        if over_budget():
+            improvement_iters = 0
+            break
         x = general_setup_stage(
             smoothed_aggregation_solver(A, B=B, symmetry=symmetry,
                                         presmoother=prepostsmoother,
@@ -298,47 +319,52 @@ def adaptive_sa_solver(A, initial_candidates=None, symmetry='hermitian',
     # Improve candidates
     if B.shape[1] > 1 and improvement_iters > 0:
         b = np.zeros((A.shape[0], 1), dtype=A.dtype)
-        for _i in range(improvement_iters):
-            for j in range(B.shape[1]):
-                # Run a V-cycle built on everything except candidate j, while
-                # using candidate j as the initial guess
-                x0 = B[:, 0]
-                B = B[:, 1:]
-                sa_temp =\
-                    smoothed_aggregation_solver(A, B=B, symmetry=symmetry,
-                                                presmoother=prepostsmoother,
-                                                postsmoother=prepostsmoother,
-                                                smooth=smooth,
-                                                coarse_solver=coarse_solver,
-                                                aggregate=aggregate,
-                                                strength=strength,
-                                                improve_candidates=None,
-                                                keep=True, **kwargs)
-                x = sa_temp.solve(b, x0=x0,
-                                  tol=1e-20,
-                                  maxiter=candidate_iters, cycle='V')
-                work[:] += 2 * sa_temp.operator_complexity() *\
-                    sa_temp.levels[0].A.nnz * candidate_iters
-
-                # Apply local elimination
-                elim, elim_kwargs = unpack_arg(eliminate_local)
-                if elim is True:
-                    x = x/norm(x, 'inf')
-                    eliminate_local_candidates(x, sa_temp.levels[0].AggOp, A,
-                                               sa_temp.levels[0].T,
-                                               **elim_kwargs)
-
-                # Normalize x and add to candidate list
+        num_candidates = B.shape[1]
+        for step in range(improvement_iters * num_candidates):
+            if over_budget():
+                break
+            j = step % num_candidates
+            # Run a V-cycle built on everything except candidate j, while
+            # using candidate j as the initial guess
+            x0 = B[:, [0]]
+            B = B[:, 1:]
+            sa_temp =\
+                smoothed_aggregation_solver(A, B=B, symmetry=symmetry,
+                                            presmoother=prepostsmoother,
+                                            postsmoother=prepostsmoother,
+                                            smooth=smooth,
+                                            coarse_solver=coarse_solver,
+                                            aggregate=aggregate,
+                                            strength=strength,
+                                            improve_candidates=None,
+                                            keep=True, **kwargs)
+            x = sa_temp.solve(b, x0=x0,
+                              tol=1e-20,
+                              maxiter=candidate_iters, cycle='V')
+            work[:] += 2 * sa_temp.operator_complexity() *\
+                sa_temp.levels[0].A.nnz * candidate_iters
+
+            # Apply local elimination
+            elim, elim_kwargs = unpack_arg(eliminate_local)
+            if elim is True:
                 x = x/norm(x, 'inf')
-                if np.isinf(x[0]) or np.isnan(x[0]):
-                    raise ValueError(f'The {j}th improved adaptive candidate is all 0.')
-                B = np.hstack((B, x.reshape(-1, 1)))
+                eliminate_local_candidates(x, sa_temp.levels[0].AggOp, A,
+                                           sa_temp.levels[0].T,
+                                           **elim_kwargs)
+
+            # Normalize x and add to candidate list
+            x = x/norm(x, 'inf')
+            if np.isinf(x[0]) or np.isnan(x[0]):
+                raise ValueError(f'The {j}th improved adaptive candidate is all 0.')
+            B = np.hstack((B, x.reshape(-1, 1)))
 
     elif improvement_iters > 0:
         # Special case for improving a single candidate
         max_levels = len(aggregate) + 1
         max_coarse = 0
         for _i in range(improvement_iters):
+            if over_budget():
+                break
             B, aggregate, strength =\
                 initial_setup_stage(A, symmetry, pdef, candidate_iters,
                                     epsilon, max_levels, max_coarse,
@@ -179,7 +179,117 @@ def naive_aggregation(C):
     return sparse.csr_array((Tx, Tj, Tp), shape=shape), Cpts
 
 
-def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
+def mis2_aggregation(C, seed=0):
+    """Compute the sparsity pattern of the tentative prolongator from a distance-2 MIS.
+
+    Parameters
+    ----------
+    C : csr_array
+        Strength of connection matrix.
+    seed : int
+        Seed for the priorities of the parallel MIS.  The aggregation is
+        deterministic for a given seed.
+
+    Returns
+    -------
+    csr_array
+        Aggregation operator which determines the sparsity pattern
+        of the tentative prolongator.
+    array
+        Array of Cpts, i.e., Cpts[i] = root node of aggregate i.
+
+    See Also
+    --------
+    amg_core.mis2_aggregation, amg_core.maximal_independent_set_k_parallel
+
+    Notes
+    -----
+    The roots of the aggregates form a distance-2 maximal independent set of
+    the graph of C, computed with the parallel MIS-k algorithm.  As in
+    standard aggregation, each root is aggregated with its neighbors.  A
+    second distance-2 MIS of the nodes that are not adjacent to a root seeds
+    further aggregates, and the remaining nodes then join the neighboring
+    aggregate they are most strongly connected to.  All phases proceed in
+    synchronous rounds, so the result does not depend on the order in which
+    nodes are visited within a round.  Isolated nodes are not aggregated.
+
+    Examples
+    --------
+    >>> from scipy.sparse import csr_array
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.aggregation.aggregate import mis2_aggregation
+    >>> A = poisson((6,), format='csr')   # 1D mesh with 6 vertices
+    >>> AggOp, Cpts = mis2_aggregation(A)
+    >>> AggOp.shape
+    (6, 2)
+    >>> print(AggOp.sum(axis=1))
+    [1 1 1 1 1 1]
+    >>> A = csr_array([[1,0,0],[0,1,1],[0,1,1]])
+    >>> mis2_aggregation(A)[0].toarray()  # first vertex is isolated
+    array([[0],
+           [1],
+           [1]], dtype=int32)
+
+    """
+    if not sparse.issparse(C) or C.format != 'csr':
+        raise TypeError('expected csr_array')
+
+    if C.shape[0] != C.shape[1]:
+        raise ValueError('expected square matrix')
+
+    index_type = C.indptr.dtype
+    num_rows = C.shape[0]
+
+    # distance-2 MIS with reproducible priorities
+    mis = np.empty(num_rows, dtype=index_type)
+    priorities = np.random.default_rng(seed).random(num_rows)
+    amg_core.maximal_independent_set_k_parallel(num_rows, C.indptr, C.indices, 2,
+                                                mis, priorities, -1)
+
+    # secondary roots: distance-2 MIS of the nodes not adjacent to a root
+    G = sparse.csr_array((np.ones_like(C.data), C.indices, C.indptr), shape=C.shape)
+    rest = np.flatnonzero((mis == 0) & ((G @ mis) == 0))
+    if len(rest) > 0:
+        R = G[rest][:, rest].tocsr()
+        R.sort_indices()
+        Rp = R.indptr.astype(index_type, copy=False)
+        Rj = R.indices.astype(index_type, copy=False)
+        mis_rest = np.empty(len(rest), dtype=index_type)
+        amg_core.maximal_independent_set_k_parallel(len(rest), Rp, Rj, 2,
+                                                    mis_rest, priorities[rest], -1)
+        mis[rest[mis_rest == 1]] = 2
+
+    Tj = np.empty(num_rows, dtype=index_type)  # stores the aggregate #s
+    Cpts = np.empty(num_rows, dtype=index_type)  # stores the Cpts
+
+    fn = amg_core.mis2_aggregation
+
+    num_aggregates = fn(num_rows, C.indptr, C.indices, mis, Tj, Cpts)
+    Cpts = Cpts[:num_aggregates]
+
+    # no nodes aggregated
+    if num_aggregates == 0:
+        # return all zero matrix and no Cpts
+        return sparse.csr_array((num_rows, 1), dtype=np.int32), \
+            np.array([], dtype=index_type)
+
+    shape = (num_rows, num_aggregates)
+
+    # some nodes not aggregated
+    if Tj.min() == -1:
+        mask = Tj != -1
+        row = np.arange(num_rows, dtype=index_type)[mask]
+        col = Tj[mask]
+        data = np.ones(len(col), dtype=np.int32)
+        return sparse.coo_array((data, (row, col)), shape=shape).tocsr(), Cpts
+
+    # all nodes aggregated
+    Tp = np.arange(num_rows+1, dtype=index_type)
+    Tx = np.ones(len(Tj), dtype=np.int32)
+    return sparse.csr_array((Tx, Tj, Tp), shape=shape), Cpts
+
+
+def pairwise_aggregation(A, C=None, matchings=1, theta=0.25,
                          norm='min', compute_P=False, strength=None, strengthkw=None):
     """Compute the sparsity pattern of the tentative prolongator.
 
@@ -187,6 +297,9 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
     ----------
     A : csr_array or bsr_array
         level matrix
+    C : csr_array, optional
+        Strength of connection matrix for the first matching.  If None, it
+        is computed from A with the strength method.
     matchings : int, default 2
         number of times to perform pairwise aggregation; each
         matching increases coarsening factor by about two.
@@ -200,6 +313,25 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
         If True, return float interpolation P, converting to BSR
         form with identity of size bsize x bsize on each aggregate
         if A is BSR.
+    strength : str, optional
+        Strength of connection method of each matching, one of 'classical',
+        'pairwise', 'symmetric' or 'energy_based'.  Other values, including
+        None, use 'classical'.
+    strengthkw : dict, optional
+        Keyword arguments of the strength method.  Default is theta and norm
+        for 'classical'.
+
+    Notes
+    -----
+    With the default classical strength, norm='min' and no C, all matchings
+    are done in a single call to amg_core.pairwise_aggregation_multi, which
+    forms the intermediate coarse matrices by summing the entries of each
+    pair instead of with sparse matrix products.  The entries of a row of
+    these matrices are not in the order of the sparse products ``T.T @ A @ T``
+    of the other path, so when several neighbors are equally strong, e.g.,
+    on a structured grid, the fused matchings can pick different pairs and
+    return different aggregates than those computed with C given.  Without
+    such ties, both give the same aggregates.
 
     Examples
     --------
@@ -225,7 +357,7 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
 
     See Also
     --------
-    amg_core.pairwise_aggregation
+    amg_core.pairwise_aggregation, amg_core.pairwise_aggregation_multi
 
     References
     ----------
@@ -234,19 +366,21 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
     123-146.
 
     """
-    if (strength == 'classical'):
-      soc = classical_strength_of_connection
-    elif strength == 'pairwise':
-      soc = pairwise_strength_of_connection
+    if strength == 'pairwise':
+        soc = pairwise_strength_of_connection
     elif strength == 'symmetric':
-      soc = symmetric_strength_of_connection
+        soc = symmetric_strength_of_connection
     elif strength == 'energy_based':
-      soc = energy_based_strength_of_connection
+        soc = energy_based_strength_of_connection
     else:
-      soc = classical_strength_of_connection
+        soc = classical_strength_of_connection
 
+    if strengthkw is None:
+        if soc is classical_strength_of_connection:
+            strengthkw = {'theta': theta, 'norm': norm}
+        else:
+            strengthkw = {}
 
-    # Get SOC matrix
     if not sparse.issparse(A) or A.format not in ('bsr', 'csr'):
         try:
             A = A.tocsr()
@@ -255,6 +389,40 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
             raise TypeError('Invalid matrix type, must be CSR or BSR.') from e
 
     index_type = A.indptr.dtype
+    blocksize = A.blocksize[0] if A.format == 'bsr' else 1
+
+    # Fused matchings for the classical min-norm strength
+    if C is None and soc is classical_strength_of_connection and \
+            strengthkw.get('norm', 'abs') == 'min' and \
+            A.dtype in (np.float32, np.float64):
+        num_rows = A.shape[0] // blocksize
+        Tj = np.empty(num_rows, dtype=index_type)  # stores the aggregate #s
+        Cpts = np.empty(num_rows, dtype=index_type)  # stores the Cpts
+        num_aggregates = amg_core.pairwise_aggregation_multi(
+            num_rows, blocksize, A.indptr, A.indices, A.data.ravel(),
+            strengthkw.get('theta', 0.1), matchings, Tj, Cpts)
+        Cpts = Cpts[:num_aggregates]
+
+        if num_aggregates == 0:
+            T = sparse.csr_array((A.shape[0], 1), dtype=np.int32)
+            warn('No pairwise aggregates found, T = 0.')
+        else:
+            if blocksize > 1:
+                Tj = (blocksize * Tj[:, np.newaxis] +
+                      np.arange(blocksize, dtype=index_type)).ravel()
+            Tp = np.arange(len(Tj) + 1, dtype=index_type)
+            Tx = np.ones(len(Tj), dtype=np.int32)
+            T = sparse.csr_array((Tx, Tj, Tp),
+                                 shape=(A.shape[0], num_aggregates * blocksize))
+
+        if compute_P:
+            T = T.astype(A.dtype, copy=False)
+
+        return T, Cpts
+
+    if C is None:
+        C = soc(A, **strengthkw)
+
     Ac = A      # Let Ac reference A for loop purposes
     T = None
     Cpts = None
@@ -263,12 +431,8 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
     for i in range(0, matchings):
 
         # Compute SOC matrix for this matching
-        if i>0 and sparse.issparse(A) and A.format == 'bsr':
-            #C = classical_strength_of_connection(A=Ac, theta=theta, block=True, norm=norm)
-            C = soc(A=Ac, **strengthkw)
-        elif i>0:
-            #C = classical_strength_of_connection(A=Ac, theta=theta, block=False, norm=norm)
-            C = soc(A=Ac, **strengthkw)
+        if i > 0:
+            C = soc(Ac, **strengthkw)
 
         # Form pairwise aggregation matrix
         num_rows = C.shape[0]
@@ -291,18 +455,18 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
             shape = (num_rows, num_aggregates)
             Tp = np.arange(num_rows+1, dtype=index_type)
             # If A is not BSR
-            if not sparse.issparse(A) or A.format != 'bsr':
+            if A.format != 'bsr':
                 Tx = np.ones(len(Tj), dtype=np.int32)
                 T_temp = sparse.csr_array((Tx, Tj, Tp), shape=shape)
             else:
                 shape = (shape[0]*A.blocksize[0], shape[1]*A.blocksize[1])
-                Tx = np.array(len(Tj)*[np.identity(A.blocksize[0])], dtype=np.int32)
+                Tx = np.tile(np.identity(A.blocksize[0], dtype=np.int32), (len(Tj), 1, 1))
                 T_temp = sparse.bsr_array((Tx, Tj, Tp), blocksize=A.blocksize, shape=shape)
 
         # Form aggregation matrix, need to make sure is CSR/BSR
         if i == 0:
             T = T_temp
-        elif sparse.issparse(A) and A.format == 'bsr':
+        elif A.format == 'bsr':
             T = sparse.bsr_array(T @ T_temp)
         else:
             T = sparse.csr_array(T @ T_temp)
@@ -313,11 +477,11 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
 
         # Form coarse grid operator for next matching
         if i < (matchings-1):
-            if sparse.issparse(T_temp) and T_temp.format == 'csr':
+            if T_temp.format == 'csr':
                 Ac = T_temp.T.tocsr() @ Ac @ T_temp
             else:
                 Ac = T_temp.T @ Ac @ T_temp
-    
+
     T = sparse.csr_array(T)
     # Convert T to dtype int if only used for aggregation
     if compute_P:
@@ -326,7 +490,7 @@ def pairwise_aggregation(A,C=None, matchings=1, theta=0.25,
     return T, Cpts
 
 
-def lloyd_aggregation(C, ratio=0.1, measure='unit', maxiter=5):
+def lloyd_aggregation(C, ratio=0.1, measure='unit', maxiter=5, method='bellman_ford'):
     """Aggregate nodes using Lloyd Clustering.
 
     Parameters
@@ -351,6 +515,9 @@ def lloyd_aggregation(C, ratio=0.1, measure='unit', maxiter=5):
 
     maxiter : int
         Maximum number of iterations to perform.
+    method : {'bellman_ford', 'dijkstra'}
+        Shortest path algorithm passed to :func:`pyamg.graph.lloyd_cluster`.
+        Use 'dijkstra' for large graphs.
 
     Returns
     -------
@@ -420,7 +587,7 @@ def lloyd_aggregation(C, ratio=0.1, measure='unit', maxiter=5):
 
     G = C.__class__((data, C.indices, C.indptr), shape=C.shape)
 
-    clusters, centers = lloyd_cluster(G, naggs, maxiter=maxiter)
+    clusters, centers = lloyd_cluster(G, naggs, maxiter=maxiter, method=method)
 
     if np.any(clusters < 0):
         warn('Lloyd aggregation encountered a point that is unaggregated.')
@@ -438,7 +605,7 @@ def lloyd_aggregation(C, ratio=0.1, measure='unit', maxiter=5):
 
 
 def balanced_lloyd_aggregation(C, ratio=0.1, measure=None, maxiter=5,
-                               rebalance_iters=5, pad=None, A=None):
+                               rebalance_iters=5, pad=None, A=None, method='bellman_ford'):
     """Aggregate nodes using Balanced Lloyd Clustering.
 
     Parameters
@@ -471,6 +638,10 @@ def balanced_lloyd_aggregation(C, ratio=0.1, measure=None, maxiter=5,
         A pad for the measure with the sparsity of A.
     A : csr_array
         Sparse matrix to pad with.
+    method : {'bellman_ford', 'dijkstra'}
+        Shortest path and center algorithm passed to
+        :func:`pyamg.graph.balanced_lloyd_cluster`.  Use 'dijkstra' for large
+        graphs.
 
     Returns
     -------
@@ -560,7 +731,8 @@ def balanced_lloyd_aggregation(C, ratio=0.1, measure=None, maxiter=5,
     G = C.__class__((data, C.indices, C.indptr), shape=C.shape)
 
     clusters, centers = balanced_lloyd_cluster(G, naggs, maxiter=maxiter,
-                                               rebalance_iters=rebalance_iters)
+                                               rebalance_iters=rebalance_iters,
+                                               method=method)
 
     if np.any(clusters < 0):
         warn('Lloyd aggregation encountered a point that is unaggregated.')
@@ -568,7 +740,7 @@ def balanced_lloyd_aggregation(C, ratio=0.1, measure=None, maxiter=5,
     if clusters.min() < 0:
         warn('Lloyd clustering did not cluster every point')
 
-    row = (clusters >= 0).nonzero()[0]
+    row = (clusters >= 0).nonzero()[0].astype(C.indices.dtype)
     col = clusters[row]
     data = np.ones(len(row), dtype=np.int32)
     AggOp = sparse.coo_array((data, (row, col)), shape=(n, naggs)).tocsr()
@@ -576,7 +748,7 @@ def balanced_lloyd_aggregation(C, ratio=0.1, measure=None, maxiter=5,
     return AggOp, centers
 
 
-def metis_aggregation(C, ratio=0.1, measure=None):
+def metis_aggregation(C, ratio=0.1, measure=None, backend=None):
     """Aggregate nodes using a METIS partition.
 
     Parameters
@@ -597,8 +769,10 @@ def metis_aggregation(C, ratio=0.1, measure=None):
         'range'  G[i,j] = np.round(9 * C[i,j])+1
         'unit'   G[i,j] = 1
         =======  ===========================
-    maxiter : int
-        Maximum number of iterations to perform
+    backend : {None, 'metis', 'native'}
+        Partitioner passed to :func:`pyamg.graph.metis_partition`.  None
+        uses METIS if pymetis is installed and the native partitioner
+        otherwise.
 
     Returns
     -------
@@ -608,7 +782,7 @@ def metis_aggregation(C, ratio=0.1, measure=None):
 
     See Also
     --------
-    amg_core.standard_aggregation
+    partition_aggregation
 
     """
     C = sparse.csr_array(C)
@@ -640,14 +814,89 @@ def metis_aggregation(C, ratio=0.1, measure=None):
 
     G = C.__class__((data, C.indices, C.indptr), shape=C.shape)
 
-    parts = metis_partition(G, nparts=naggs, seed=None)
+    parts = metis_partition(G, nparts=naggs, seed=None, backend=backend)
 
     if len(parts) != n:
         warn('METIS aggregation encountered a point that is unaggregated.')
 
-    row = (parts >= 0).nonzero()[0]
-    col = parts[row]
-    data = np.ones(len(row), dtype=np.int32)
-    AggOp = sparse.coo_array((data, (row, col)), shape=(n, naggs)).tocsr()
+    return _parts_to_aggop(parts, C.indices.dtype)
+
+
+def partition_aggregation(C, ratio=0.1, seed=0):
+    """Aggregate nodes using the native multilevel graph partitioner.
+
+    Parameters
+    ----------
+    C : csr_array
+        Strength of connection matrix.
+    ratio : scalar
+        Fraction of nodes to be aggregated (centers).  ratio=0.1 is
+        a coarsening by 10.
+    seed : int
+        Random seed for the partitioner.
+
+    Returns
+    -------
+    AggOp : csr_array
+        Aggregation operator which determines the sparsity pattern
+        of the tentative prolongator.  Node i is in cluster j if AggOp[i,j] = 1.
 
-    return AggOp
+    See Also
+    --------
+    metis_aggregation, amg_core.partition_graph
+
+    Notes
+    -----
+    The edge weights are the magnitudes of the symmetrized strength matrix,
+    |C| + |C|^T, so that strongly connected nodes tend to share an aggregate.
+    Unlike :func:`metis_aggregation`, real weights are used as given and
+    pymetis is not required.  Each aggregate is connected in the graph of C,
+    and aggregates emptied while making the parts connected are dropped.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.aggregation.aggregate import partition_aggregation
+    >>> A = poisson((10, 10), format='csr')
+    >>> AggOp = partition_aggregation(A, ratio=0.1)
+    >>> AggOp.shape
+    (100, 10)
+    >>> print(AggOp.sum(axis=0).min() > 0)
+    True
+
+    """
+    C = sparse.csr_array(C)
+
+    if C.shape[0] != C.shape[1]:
+        raise ValueError('graph should be a square matrix.')
+
+    if ratio <= 0 or ratio > 1:
+        raise ValueError('ratio must be > 0.0 and <= 1.0')
+
+    n = C.shape[0]
+    naggs = int(min(max(ratio * n, 1), n))
+
+    G = abs(C)
+    G = (G + G.T).tocsr()
+    if G.dtype not in (np.float32, np.float64):
+        G = G.astype(np.float64)
+    G.sort_indices()
+
+    parts = metis_partition(G, nparts=naggs, seed=seed, backend='native')
+
+    return _parts_to_aggop(parts, C.indices.dtype)
+
+
+def _parts_to_aggop(parts, index_type):
+    """Build the aggregation operator of a partition, dropping empty parts.
+
+    Points with a negative part are left unaggregated.
+    """
+    n = len(parts)
+    mask = parts >= 0
+    labels, col = np.unique(parts[mask], return_inverse=True)
+    col = col.ravel().astype(index_type)
+    data = np.ones(len(col), dtype=np.int32)
+    indptr = np.zeros(n + 1, dtype=index_type)
+    np.cumsum(mask, out=indptr[1:])
+    return sparse.csr_array((data, col, indptr), shape=(n, len(labels)))
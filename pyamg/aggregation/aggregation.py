@@ -6,7 +6,9 @@ import numpy as np
 from scipy.sparse import csr_array, issparse, SparseEfficiencyWarning
 
 from pyamg.multilevel import MultilevelSolver
+from pyamg.util.stencil import StencilOperator
 from pyamg.relaxation.smoothing import change_smoothers
+from pyamg.util.streaming import galerkin_product
 from pyamg.util.utils import eliminate_diag_dom_nodes, get_blocksize, asfptype, \
     levelize_strength_or_aggregation, levelize_smooth_or_improve_candidates
 from pyamg.strength import classical_strength_of_connection, \
@@ -15,9 +17,10 @@ from pyamg.strength import classical_strength_of_connection, \
     algebraic_distance, affinity_distance, pairwise_strength_of_connection
 
 from .aggregate import standard_aggregation, naive_aggregation,\
-    lloyd_aggregation, balanced_lloyd_aggregation,\
-    metis_aggregation, pairwise_aggregation
+    mis2_aggregation, lloyd_aggregation, balanced_lloyd_aggregation,\
+    metis_aggregation, partition_aggregation, pairwise_aggregation
 from .tentative import fit_candidates
+from .operator import AggregationOperator
 from .smooth import jacobi_prolongation_smoother, \
     richardson_prolongation_smoother, energy_prolongation_smoother
 
@@ -37,13 +40,16 @@ def smoothed_aggregation_solver(A, B=None, BH=None,
                                                     None),
                                 max_levels=10, max_coarse=10,
                                 diagonal_dominance=False,
-                                keep=False, **kwargs):
+                                keep=False, implicit_restriction=False,
+                                **kwargs):
     """Create a multilevel solver using classical-style Smoothed Aggregation (SA).
 
     Parameters
     ----------
-    A : csr_array, bsr_array
-        Sparse NxN matrix in CSR or BSR format.
+    A : csr_array, bsr_array, StencilOperator
+        Sparse NxN matrix in CSR or BSR format.  A StencilOperator is
+        assembled for the setup and kept as the matrix-free operator of the
+        finest level.
     B : None, array
         Right near-nullspace candidates stored in the columns of an NxK array.
         The default value ``B=None`` is equivalent to ``B=ones((N,1))``.
@@ -67,13 +73,15 @@ def smoothed_aggregation_solver(A, B=None, BH=None,
         'affinity', ('predefined', {'C' : csr_array}), None.
     aggregate : str, list
         Method used to aggregate nodes.
-        Choose from 'standard', 'lloyd', 'naive', 'pairwise',
-        ('predefined', {'AggOp' : csr_array}).
+        Choose from 'standard', 'lloyd', 'naive', 'mis2', 'pairwise', 'metis',
+        'partition', ('predefined', {'AggOp' : csr_array}).
     smooth : list
         Method used to smooth the tentative prolongator.  Method-specific
         parameters may be passed in using a tuple, e.g.  smooth=
         ('jacobi',{'filter' : True }).
-        Choose from 'jacobi', 'richardson', 'energy', None.
+        Choose from 'jacobi', 'richardson', 'energy', None.  With None and
+        a single near-nullspace candidate for a CSR matrix, P and R are
+        stored as an AggregationOperator.
     presmoother : tuple, str, list
         Defines the presmoother for the multilevel cycling.  The default block
         Gauss-Seidel option defaults to point-wise Gauss-Seidel, if the matrix
@@ -101,6 +109,12 @@ def smoothed_aggregation_solver(A, B=None, BH=None,
         Flag to indicate keeping extra operators in the hierarchy for
         diagnostics.  For example, if True, then strength of connection (C),
         tentative prolongation (T), and aggregation (AggOp) are kept.
+    implicit_restriction : bool
+        If True and R is the conjugate transpose of P (symmetry is 'hermitian',
+        or 'symmetric' with real P), then R is not stored.  Each level has
+        ``R = None`` and restriction is applied with P during the cycle, see
+        ``pyamg.util.linalg.rmatvec``, which roughly halves the memory used by
+        the transfer operators.
     **kwargs : dict
         Extra keywords passed to the Multilevel class
 
@@ -201,6 +215,11 @@ def smoothed_aggregation_solver(A, B=None, BH=None,
     >>> x,info = cg(A, b, rtol=1e-8, maxiter=30, M=M)   # solve with CG
 
     """
+    # a matrix-free fine level is assembled for the setup only
+    stencil = None
+    if isinstance(A, StencilOperator):
+        stencil, A = A, A.tocsr()
+
     if not issparse(A) or A.format not in ('bsr', 'csr'):
         try:
             A = csr_array(A)
@@ -275,15 +294,23 @@ def smoothed_aggregation_solver(A, B=None, BH=None,
     while len(levels) < max_levels and\
             int(levels[-1].A.shape[0]/get_blocksize(levels[-1].A)) > max_coarse:
         _extend_hierarchy(levels, strength, aggregate, smooth,
-                          improve_candidates, diagonal_dominance, keep)
+                          improve_candidates, diagonal_dominance, keep,
+                          implicit_restriction)
 
     ml = MultilevelSolver(levels, **kwargs)
+    if stencil is not None and len(levels) > 1:
+        # keep the operator as the fine level, with the properties of A
+        for attr in ('symmetry', 'rho_D_inv'):
+            if hasattr(A, attr):
+                setattr(stencil, attr, getattr(A, attr))
+        levels[0].A = stencil
     change_smoothers(ml, presmoother, postsmoother)
     return ml
 
 
 def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
-                      diagonal_dominance=False, keep=True):
+                      diagonal_dominance=False, keep=True,
+                      implicit_restriction=False):
     """Extend the multigrid hierarchy.
 
     Service routine to implement the strength of connection, aggregation,
@@ -351,6 +378,8 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
         AggOp, Cnodes = standard_aggregation(C, **kwargs)
     elif fn == 'naive':
         AggOp, Cnodes = naive_aggregation(C, **kwargs)
+    elif fn == 'mis2':
+        AggOp, Cnodes = mis2_aggregation(C, **kwargs)
     elif fn == 'lloyd':
         AggOp, Cnodes = lloyd_aggregation(C, **kwargs)
     elif fn == 'balanced lloyd':
@@ -359,6 +388,8 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
         AggOp, Cnodes = balanced_lloyd_aggregation(C, **kwargs)
     elif fn == 'metis':
         AggOp = metis_aggregation(C, **kwargs)
+    elif fn == 'partition':
+        AggOp = partition_aggregation(C, **kwargs)
     elif fn == 'pairwise':
         AggOp = pairwise_aggregation(A,C=C,strength=strength_method, strengthkw = strength_kwargs, **kwargs)[0]
     elif fn == 'predefined':
@@ -395,6 +426,9 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
         P = energy_prolongation_smoother(A, T, C, B, None, (False, {}), **kwargs)
     elif fn is None:
         P = T
+        if T.blocksize == (1, 1):
+            # one nonzero per row, store the aggregates only
+            P = AggregationOperator.from_matrix(T)
     else:
         raise ValueError(f'Unrecognized prolongation smoother method {fn!s}')
 
@@ -417,7 +451,9 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
                                              **kwargs)
             R = R.T.conjugate()
         elif fn is None:
-            R = T.T.conjugate()
+            R = TH.T.conjugate()
+            if TH.blocksize == (1, 1):
+                R = AggregationOperator.from_matrix(TH).T.conjugate()
         else:
             raise ValueError(f'Unrecognized prolongation smoother method {fn!s}')
     else:
@@ -431,9 +467,12 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
 
     levels[-1].P = P  # smoothed prolongator
     levels[-1].R = R  # restriction operator
+    if implicit_restriction and (symmetry == 'hermitian' or (
+            symmetry == 'symmetric' and np.dtype(P.dtype).kind != 'c')):
+        levels[-1].R = None  # restriction is applied as P^H
 
     levels.append(MultilevelSolver.Level())
-    A = R @ A @ P              # Galerkin operator
+    A = galerkin_product(R, A, P)  # Galerkin operator
     A.symmetry = symmetry
     levels[-1].A = A
     levels[-1].B = B           # right near nullspace candidates
@@ -0,0 +1,262 @@
+"""Implicit transfer operators for unsmoothed aggregation."""
+
+
+import numpy as np
+from scipy import sparse
+from .. import amg_core
+
+
+class AggregationOperator:
+    """Prolongation with at most one nonzero per row, or its (conjugate) transpose.
+
+    The operator is stored as the aggregate of each fine row and an optional
+    value of the nonzero in that row, instead of as a sparse matrix.
+    Prolongation is a gather, and restriction is a sum over the rows of each
+    aggregate, both in a single pass over the rows.
+
+    Parameters
+    ----------
+    aggregates : array
+        ``aggregates[i]`` is the column of the nonzero in row ``i`` of the
+        prolongator, or -1 if row ``i`` is zero.  Stored as int32, or as
+        int64 if given as a 64-bit integer array.
+    num_aggregates : int, optional
+        Number of columns of the prolongator.  Default is
+        ``max(aggregates) + 1``.
+    scale : array, optional
+        Value of the nonzero in each row.  Default is 1 for all rows.
+    dtype : dtype, optional
+        Type of the operator.  Default is the type of scale, or float64.
+
+    Attributes
+    ----------
+    shape : tuple
+        ``(len(aggregates), num_aggregates)`` for the prolongator, or the
+        reverse for its transpose.
+    nnz : int
+        Number of nonzeros.
+
+    See Also
+    --------
+    pairwise_solver, smoothed_aggregation_solver
+
+    Notes
+    -----
+    The operator acts on arrays with ``@`` and supports the products
+    ``R @ A`` and ``A @ P`` with a sparse matrix ``A``, so that the Galerkin
+    product ``R @ A @ P`` is formed by summing the entries of ``A`` per
+    aggregate, without a sparse matrix product.  It can be used as the ``P``
+    and ``R`` of a level in ``MultilevelSolver``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.aggregation.operator import AggregationOperator
+    >>> P = AggregationOperator(np.array([0, 0, 1, 1]))
+    >>> P.toarray()
+    array([[1., 0.],
+           [1., 0.],
+           [0., 1.],
+           [0., 1.]])
+    >>> P.T @ np.array([1.0, 2.0, 3.0, 4.0])
+    array([3., 7.])
+    >>> A = poisson((4,), format='csr')
+    >>> (P.T @ A @ P).toarray()
+    array([[ 2., -1.],
+           [-1.,  2.]])
+
+    """
+
+    # defer to __rmatmul__ for ndarray @ AggregationOperator
+    __array_ufunc__ = None
+
+    def __init__(self, aggregates, num_aggregates=None, scale=None, dtype=None):
+        """Initialize the prolongator."""
+        aggregates = np.asarray(aggregates)
+        if aggregates.ndim != 1 or aggregates.dtype.kind not in 'iu':
+            raise ValueError('aggregates must be a 1D integer array')
+        index_type = np.int32 if aggregates.dtype.itemsize <= 4 else np.int64
+        aggregates = aggregates.astype(index_type, copy=False)
+
+        if num_aggregates is None:
+            num_aggregates = int(aggregates.max()) + 1 if len(aggregates) > 0 else 0
+        if len(aggregates) > 0 and aggregates.max() >= num_aggregates:
+            raise ValueError('aggregate number out of range')
+
+        if scale is not None:
+            scale = np.asarray(scale)
+            if scale.shape != aggregates.shape:
+                raise ValueError('scale must have the same length as aggregates')
+
+        if dtype is None:
+            dtype = scale.dtype if scale is not None else np.float64
+
+        self.aggregates = aggregates
+        self.num_aggregates = num_aggregates
+        self.scale = scale
+        self.dtype = np.dtype(dtype)
+        self.transposed = False
+
+        self._nnz = int(np.count_nonzero(aggregates >= 0))
+
+    @classmethod
+    def from_matrix(cls, T):
+        """Create the operator from a sparse matrix.
+
+        Parameters
+        ----------
+        T : sparse matrix
+            Matrix with at most one nonzero per row.
+
+        Returns
+        -------
+        AggregationOperator
+            Operator equal to T.
+
+        """
+        T = sparse.csr_array(T)
+        T.sum_duplicates()
+        counts = np.diff(T.indptr)
+        if len(counts) > 0 and counts.max() > 1:
+            raise ValueError('expected at most one nonzero per row')
+
+        rows = counts == 1
+        aggregates = np.full(T.shape[0], -1, dtype=T.indices.dtype)
+        aggregates[rows] = T.indices
+        scale = None
+        if not np.all(T.data == 1):
+            scale = np.zeros(T.shape[0], dtype=T.dtype)
+            scale[rows] = T.data
+        return cls(aggregates, T.shape[1], scale=scale, dtype=T.dtype)
+
+    @property
+    def shape(self):
+        """Shape of the operator."""
+        shape = (len(self.aggregates), self.num_aggregates)
+        return shape[::-1] if self.transposed else shape
+
+    @property
+    def ndim(self):
+        """Number of dimensions (2)."""
+        return 2
+
+    @property
+    def nnz(self):
+        """Number of nonzeros."""
+        return self._nnz
+
+    def _copy(self, scale, transposed):
+        new = object.__new__(AggregationOperator)
+        new.__dict__.update(self.__dict__)
+        new.scale = scale
+        new.transposed = transposed
+        return new
+
+    def transpose(self):
+        """Return the transpose."""
+        return self._copy(self.scale, not self.transposed)
+
+    @property
+    def T(self):
+        """Transpose."""
+        return self.transpose()
+
+    def conjugate(self):
+        """Return the complex conjugate."""
+        if self.scale is None or self.dtype.kind != 'c':
+            return self
+        return self._copy(np.conjugate(self.scale), self.transposed)
+
+    conj = conjugate
+
+    @property
+    def H(self):  # noqa: N802
+        """Conjugate transpose."""
+        return self.transpose().conjugate()
+
+    def astype(self, dtype):
+        """Return the operator with a different dtype."""
+        new = self._copy(self.scale, self.transposed)
+        new.dtype = np.dtype(dtype)
+        if new.scale is not None:
+            new.scale = new.scale.astype(dtype)
+        return new
+
+    def _apply(self, x):
+        dtype = np.result_type(x, self.dtype, np.float32)
+        x = np.ascontiguousarray(x, dtype=dtype)
+        scale = np.empty(0, dtype=dtype) if self.scale is None else \
+            self.scale.astype(dtype, copy=False)
+        num_cols = 1 if x.ndim == 1 else x.shape[1]
+        y = np.empty((self.shape[0], *x.shape[1:]), dtype=dtype)
+        fn = amg_core.aggregation_restrict if self.transposed else \
+            amg_core.aggregation_prolong
+        fn(len(self.aggregates), num_cols, self.aggregates, scale,
+           x.ravel(), y.ravel())
+        return y
+
+    def __matmul__(self, other):
+        """Apply the operator to an array or sparse matrix."""
+        if sparse.issparse(other):
+            if other.shape[0] != self.shape[1]:
+                raise ValueError('dimension mismatch')
+            if self.transposed:
+                # R @ A: sum the rows of A per aggregate
+                A = other.tocoo()
+                mask = self.aggregates[A.row] >= 0
+                data = A.data[mask] if self.scale is None else \
+                    (A.data * self.scale[A.row])[mask]
+                row = self.aggregates[A.row[mask]]
+                return sparse.csr_array((data, (row, A.col[mask])),
+                                        shape=(self.shape[0], A.shape[1]))
+            return self.tocsr() @ other
+
+        x = np.asarray(other)
+        if x.ndim not in (1, 2) or x.shape[0] != self.shape[1]:
+            raise ValueError('dimension mismatch')
+        return self._apply(x)
+
+    def __rmatmul__(self, other):
+        """Apply the operator from the right."""
+        if sparse.issparse(other):
+            if other.shape[1] != self.shape[0]:
+                raise ValueError('dimension mismatch')
+            if not self.transposed:
+                # A @ P: sum the columns of A per aggregate
+                A = other.tocoo()
+                mask = self.aggregates[A.col] >= 0
+                data = A.data[mask] if self.scale is None else \
+                    (A.data * self.scale[A.col])[mask]
+                col = self.aggregates[A.col[mask]]
+                return sparse.csr_array((data, (A.row[mask], col)),
+                                        shape=(A.shape[0], self.shape[1]))
+            return other @ self.tocsr()
+
+        x = np.asarray(other)
+        if x.ndim == 1:
+            return self.transpose() @ x
+        return (self.transpose() @ x.T).T
+
+    def tocsr(self):
+        """Return the operator as a csr_array."""
+        mask = self.aggregates >= 0
+        indptr = np.zeros(len(self.aggregates) + 1, dtype=self.aggregates.dtype)
+        np.cumsum(mask, out=indptr[1:])
+        if self.scale is None:
+            data = np.ones(self.nnz, dtype=self.dtype)
+        else:
+            data = self.scale[mask].astype(self.dtype, copy=False)
+        P = sparse.csr_array((data, self.aggregates[mask], indptr),
+                             shape=(len(self.aggregates), self.num_aggregates))
+        return P.T.tocsr() if self.transposed else P
+
+    def toarray(self):
+        """Return the operator as a dense array."""
+        return self.tocsr().toarray()
+
+    def __repr__(self):
+        """Describe the operator."""
+        kind = 'restriction' if self.transposed else 'prolongation'
+        return (f'<{self.shape[0]}x{self.shape[1]} AggregationOperator ({kind}) '
+                f'of type {self.dtype} with {self.nnz} stored elements>')
@@ -8,7 +8,9 @@ from scipy.sparse import csr_array, issparse, SparseEfficiencyWarning
 from pyamg.multilevel import MultilevelSolver
 from pyamg.relaxation.smoothing import change_smoothers
 from pyamg.util.utils import get_blocksize, levelize_strength_or_aggregation, asfptype
+from pyamg.util.streaming import galerkin_product
 from .aggregate import pairwise_aggregation
+from .operator import AggregationOperator
 
 
 def pairwise_solver(A,
@@ -132,17 +134,15 @@ def _extend_hierarchy(levels, aggregate):
 
     A = levels[-1].A
 
-    # Compute pairwise interpolation and restriction matrices, R=P^*
+    # Compute pairwise interpolation and restriction operators, R=P^*
     _, kwargs = unpack_arg(aggregate[len(levels)-1])
     P = pairwise_aggregation(A, **kwargs, compute_P=True)[0]
+    P = AggregationOperator.from_matrix(P)
     R = P.T.conjugate()
-    if issparse(P) and P.format == 'csr':
-        # In this case, R will be CSC, which must be changed
-        R = R.tocsr()
 
     levels[-1].P = P  # unsmoothed prolongator
     levels[-1].R = R  # restriction operator
 
     levels.append(MultilevelSolver.Level())
-    A = R @ A @ P              # Galerkin operator
+    A = galerkin_product(R, A, P)  # Galerkin operator, summed per aggregate
     levels[-1].A = A
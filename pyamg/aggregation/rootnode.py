@@ -17,7 +17,7 @@ from ..strength import classical_strength_of_connection, \
     energy_based_strength_of_connection, distance_strength_of_connection, \
     algebraic_distance, affinity_distance
 from .aggregate import standard_aggregation, naive_aggregation, \
-    lloyd_aggregation, pairwise_aggregation
+    mis2_aggregation, lloyd_aggregation, pairwise_aggregation
 from .tentative import fit_candidates
 from .smooth import energy_prolongation_smoother
 
@@ -33,7 +33,8 @@ def rootnode_solver(A, B=None, BH=None,
                                         {'sweep': 'symmetric',
                                          'iterations': 4}),
                     max_levels=10, max_coarse=10,
-                    diagonal_dominance=False, keep=False, **kwargs):
+                    diagonal_dominance=False, keep=False,
+                    implicit_restriction=False, **kwargs):
     """Create a multilevel solver using root-node based Smoothed Aggregation (SA).
 
     See the notes below, for the major differences with the classical-style
@@ -116,6 +117,12 @@ def rootnode_solver(A, B=None, BH=None,
         tentative prolongation (T), aggregation (AggOp), and arrays
         storing the C-points (Cpts) and F-points (Fpts) are kept at
         each level.
+    implicit_restriction : bool
+        If True and R is the conjugate transpose of P (symmetry is 'hermitian',
+        or 'symmetric' with real P), then R is not stored.  Each level has
+        ``R = None`` and restriction is applied with P during the cycle, see
+        ``pyamg.util.linalg.rmatvec``, which roughly halves the memory used by
+        the transfer operators.
     **kwargs : dict
         Extra keywords passed to the Multilevel class
 
@@ -303,7 +310,8 @@ def rootnode_solver(A, B=None, BH=None,
     while len(levels) < max_levels and \
             int(levels[-1].A.shape[0]/get_blocksize(levels[-1].A)) > max_coarse:
         _extend_hierarchy(levels, strength, aggregate, smooth,
-                          improve_candidates, diagonal_dominance, keep)
+                          improve_candidates, diagonal_dominance, keep,
+                          implicit_restriction)
 
     ml = MultilevelSolver(levels, **kwargs)
     change_smoothers(ml, presmoother, postsmoother)
@@ -311,7 +319,8 @@ def rootnode_solver(A, B=None, BH=None,
 
 
 def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
-                      diagonal_dominance=False, keep=True):
+                      diagonal_dominance=False, keep=True,
+                      implicit_restriction=False):
     """Extend the multigrid hierarchy.
 
     Service routine to implement the strength of connection, aggregation,
@@ -370,6 +379,8 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
         AggOp, Cnodes = standard_aggregation(C, **kwargs)
     elif fn == 'naive':
         AggOp, Cnodes = naive_aggregation(C, **kwargs)
+    elif fn == 'mis2':
+        AggOp, Cnodes = mis2_aggregation(C, **kwargs)
     elif fn == 'lloyd':
         AggOp, Cnodes = lloyd_aggregation(C, **kwargs)
     elif fn == 'pairwise':
@@ -452,6 +463,9 @@ def _extend_hierarchy(levels, strength, aggregate, smooth, improve_candidates,
 
     levels[-1].P = P                             # smoothed prolongator
     levels[-1].R = R                             # restriction operator
+    if implicit_restriction and (symmetry == 'hermitian' or (
+            symmetry == 'symmetric' and np.dtype(P.dtype).kind != 'c')):
+        levels[-1].R = None  # restriction is applied as P^H
     levels[-1].Cpts = Cpt_params[1]['Cpts']      # Cpts (i.e., rootnodes)
 
     levels.append(MultilevelSolver.Level())
@@ -10,7 +10,7 @@ from ..util.utils import scale_rows, get_diagonal, get_block_diag, \
     unamal, filter_operator, compute_BtBinv, filter_matrix_rows, \
     truncate_rows
 from ..util.linalg import approximate_spectral_radius
-from ..util import upcast
+from ..util import upcast, streaming
 
 
 # satisfy_constraints is a helper function for prolongation smoothing routines
@@ -44,22 +44,122 @@ def satisfy_constraints(U, B, BtBinv):
     cols_per_block = U.blocksize[1]
     num_block_rows = int(U.shape[0]/rows_per_block)
 
-    UB = np.ravel(U@B)
-
-    # Apply constraints, noting that we need the conjugate of B
-    # for use as Bi.H in local projection
-    amg_core.satisfy_constraints_helper(rows_per_block, cols_per_block,
-                                        num_block_rows, B.shape[1],
-                                        np.conjugate(np.ravel(B)),
-                                        UB, np.ravel(BtBinv),
-                                        U.indptr, U.indices,
-                                        np.ravel(U.data))
+    # Form U@B one block row at a time and project it out of that row
+    amg_core.satisfy_constraints_bsr(rows_per_block, cols_per_block,
+                                     num_block_rows, B.shape[1],
+                                     np.ravel(B), np.ravel(BtBinv),
+                                     U.indptr, U.indices,
+                                     np.ravel(U.data))
 
     return U
 
 
+def _pattern_array(pattern, data):
+    """Return a bsr_array with the sparsity pattern of pattern that shares data."""
+    return sparse.bsr_array((data, pattern.indices, pattern.indptr),
+                            shape=pattern.shape, copy=False)
+
+
+def _block_rows(pattern):
+    """Return the block row of each block of a BSR matrix."""
+    num_block_rows = len(pattern.indptr) - 1
+    return np.repeat(np.arange(num_block_rows, dtype=pattern.indptr.dtype),
+                     np.diff(pattern.indptr))
+
+
+def _constrained_product(A, V, S, out, B=None, BtBinv=None, Dinv=None):
+    """Overwrite out with Dinv@A@V on the sparsity pattern of S, projected so that S@B = 0.
+
+    out is the data array of S, and Dinv is an array of diagonal blocks.  The
+    scaling is skipped if Dinv is None and the projection if B is None.
+    """
+    dtype = out.dtype
+    if B is None:
+        B = np.empty((0, 0), dtype=dtype)
+        BtBinv = np.empty(0, dtype=dtype)
+    if Dinv is None:
+        Dinv = np.empty(0, dtype=dtype)
+    amg_core.incomplete_mat_mult_bsr_constrained(A.indptr, A.indices,
+                                                 np.ravel(A.data),
+                                                 V.indptr, V.indices,
+                                                 np.ravel(V.data),
+                                                 S.indptr, S.indices,
+                                                 np.ravel(out),
+                                                 int(S.shape[0]/S.blocksize[0]),
+                                                 int(S.shape[1]/S.blocksize[1]),
+                                                 A.blocksize[0], A.blocksize[1],
+                                                 V.blocksize[1], B.shape[1],
+                                                 np.ravel(B), np.ravel(BtBinv),
+                                                 np.ravel(Dinv))
+
+
+def _diagonal_weighting(A, weighting):
+    """Return the inverse diagonal preconditioner of A as blocks.
+
+    The result has shape (A.shape[0]/R, R, R) for 'block' weighting, and
+    shape (A.shape[0]/R, R, 1) with the diagonal of each block otherwise,
+    where R is the blocksize of A.
+    """
+    rows_per_block = A.blocksize[0]
+    if weighting == 'diagonal':
+        Dinv = get_diagonal(A, norm_eq=False, inv=True)
+    elif weighting == 'block':
+        return get_block_diag(A, blocksize=rows_per_block, inv_flag=True)
+    elif weighting == 'local':
+        # Based on Gershgorin estimate, summing |A| row-wise in place of
+        # forming np.abs(A)
+        absA = sparse.bsr_array((np.abs(A.data), A.indices, A.indptr),
+                                shape=A.shape, copy=False)
+        D = absA @ np.ones(A.shape[0], dtype=absA.dtype)
+        Dinv = np.zeros_like(D)
+        Dinv[D != 0] = 1.0 / D[D != 0]
+    else:
+        raise ValueError('weighting value is invalid')
+    return Dinv.reshape(-1, rows_per_block, 1)
+
+
+def _scale_blocks(Dinv, V, out):
+    """Compute out = Dinv@V blockwise on BSR data, with Dinv[n] the block for V[n]."""
+    if Dinv.shape[2] == 1:
+        np.multiply(Dinv, V, out=out)
+    else:
+        np.matmul(Dinv, V, out=out)
+
+
+def _diagonal_blocks(Dinv):
+    """Expand the diagonal of each block in Dinv to a full block."""
+    if Dinv.shape[2] != 1:
+        return Dinv
+    return Dinv * np.eye(Dinv.shape[1], dtype=Dinv.dtype)
+
+
+def _update_prolongator(T, pattern, U, Cpt_params):
+    """Return T + U, with U the data of the update on pattern, and enforce C-points."""
+    if Cpt_params[0]:
+        # Zero the update at the C-points, and reset T to injection there
+        I_F = Cpt_params[1]['I_F']
+        fpts = I_F.diagonal().reshape(-1, pattern.blocksize[0], 1)
+        U *= fpts[_block_rows(pattern)]
+        T = I_F@T + Cpt_params[1]['P_I']
+    return T + _pattern_array(pattern, U)
+
+
+def _energy_min_arrays(A, T, B, BtBinv, pattern):
+    """Cast the inputs of the energy-minimization iterations to a common type."""
+    xtype = upcast(A.dtype, T.dtype, B.dtype)
+    if A.dtype != xtype:
+        A = A.astype(xtype)
+    if T.dtype != xtype:
+        T = T.astype(xtype)
+    if not sparse.issparse(pattern) or pattern.format != 'bsr':
+        pattern = sparse.bsr_array(pattern, blocksize=T.blocksize)
+    B = np.asarray(B, dtype=xtype)
+    BtBinv = np.asarray(BtBinv, dtype=xtype)
+    return A, T, B, BtBinv, pattern, xtype
+
+
 def jacobi_prolongation_smoother(S, T, C, B, omega=4.0/3.0, degree=1,
-                                 filter_entries=False, weighting='diagonal'):
+                                 filter_entries=False, weighting='diagonal', rho=None):
     """Jacobi prolongation smoother.
 
     Parameters
@@ -87,6 +187,9 @@ def jacobi_prolongation_smoother(S, T, C, B, omega=4.0/3.0, degree=1,
         estimates.
         'block' uses a block diagonal inverse of A if A is BSR
         'diagonal' uses classic Jacobi with D = diagonal(A).
+    rho : float, optional
+        Estimate of the spectral radius of diag(S)^-1 @ S for 'diagonal'
+        weighting, e.g., from rho_D_inv_A.  By default, it is computed.
 
     Returns
     -------
@@ -140,6 +243,9 @@ def jacobi_prolongation_smoother(S, T, C, B, omega=4.0/3.0, degree=1,
         else:
             raise TypeError('S must be sparse BSR or CSR format')
 
+    if weighting == 'diagonal' and not filter_entries and streaming.is_mapped(S):
+        return _jacobi_prolongation_streamed(S, T, omega, degree, rho)
+
     if filter_entries:
         # Implement filtered prolongation smoothing for the general case by
         # utilizing satisfy constraints
@@ -158,12 +264,14 @@ def jacobi_prolongation_smoother(S, T, C, B, omega=4.0/3.0, degree=1,
         # Use diagonal of S
         D_inv = get_diagonal(S, inv=True)
         D_inv_S = scale_rows(S, D_inv, copy=True)
-        D_inv_S = (omega/approximate_spectral_radius(D_inv_S))*D_inv_S
+        if rho is None:
+            rho = approximate_spectral_radius(D_inv_S)
+        D_inv_S = (omega/rho)*D_inv_S
     elif weighting == 'block':
         # Use block diagonal of S
         D_inv = get_block_diag(S, blocksize=S.blocksize[0], inv_flag=True)
-        D_inv = sparse.bsr_array((D_inv, np.arange(D_inv.shape[0], dtype=np.int32),
-                                   np.arange(D_inv.shape[0] + 1, dtype=np.int32)),
+        D_inv = sparse.bsr_array((D_inv, np.arange(D_inv.shape[0], dtype=S.indptr.dtype),
+                                   np.arange(D_inv.shape[0] + 1, dtype=S.indptr.dtype)),
                                   shape=S.shape)
         D_inv_S = D_inv@S
         D_inv_S = (omega/approximate_spectral_radius(D_inv_S))*D_inv_S
@@ -206,6 +314,30 @@ def jacobi_prolongation_smoother(S, T, C, B, omega=4.0/3.0, degree=1,
     return P
 
 
+def _jacobi_prolongation_streamed(S, T, omega, degree, rho):
+    """Jacobi prolongation smoother for a memory-mapped S.
+
+    The rows of P only depend on the same rows of S, so S is read one block
+    of rows at a time and D_inv S is never formed.
+    """
+    D_inv = streaming.diagonal(S)
+    D_inv[D_inv != 0] = 1.0 / D_inv[D_inv != 0]
+    if rho is None:
+        rho = approximate_spectral_radius(streaming.aslinearoperator(S, D_inv))
+    D_inv = (omega/rho)*D_inv
+
+    P = T
+
+    def smooth_rows(start, stop, block):
+        U = scale_rows(block, D_inv[start:stop], copy=True) @ P
+        U = streaming.row_slice(P, start, stop) - U
+        return U.tobsr(blocksize=P.blocksize) if P.format == 'bsr' else U.tocsr()
+
+    for _ in range(degree):
+        P = streaming.map_rows(smooth_rows, S, shape=T.shape)
+    return P
+
+
 def richardson_prolongation_smoother(S, T, omega=4.0/3.0, degree=1):
     """Richardson prolongation smoother.
 
@@ -323,123 +455,74 @@ def cg_prolongation_smoothing(A, T, B, BtBinv, pattern, maxiter, tol,
     pyamg.aggregation.smooth.energy_prolongation_smoother
 
     """
-    # Preallocate
-    AP = sparse.bsr_array((np.zeros(pattern.data.shape, dtype=T.dtype),
-                            pattern.indices, pattern.indptr),
-                           shape=pattern.shape)
+    A, T, B, BtBinv, pattern, xtype = _energy_min_arrays(A, T, B, BtBinv, pattern)
 
     # CG will be run with diagonal preconditioning
-    if weighting == 'diagonal':
-        Dinv = get_diagonal(A, norm_eq=False, inv=True)
-    elif weighting == 'block':
-        Dinv = get_block_diag(A, blocksize=A.blocksize[0], inv_flag=True)
-        Dinv = sparse.bsr_array((Dinv, np.arange(Dinv.shape[0], dtype=np.int32),
-                                 np.arange(Dinv.shape[0] + 1, dtype=np.int32)),
-                                shape=A.shape)
-    elif weighting == 'local':
-        # Based on Gershgorin estimate
-        D = np.abs(A)@np.ones((A.shape[0], 1), dtype=A.dtype)
-        Dinv = np.zeros_like(D)
-        Dinv[D != 0] = 1.0 / np.abs(D[D != 0])
-    else:
-        raise ValueError('weighting value is invalid')
+    Dinv = _diagonal_weighting(A, weighting)
+    Drows = Dinv[_block_rows(pattern)].astype(xtype, copy=False)
+
+    # All iterates share the sparsity pattern of pattern, and only their
+    # data arrays are stored.  U accumulates the update to T.
 
     # Calculate initial residual
     #   Equivalent to R = -A@T;    R = R.multiply(pattern)
     #   with the added constraint that R has an explicit 0 wherever
-    #   R is 0 and pattern is not
-    uones = np.zeros(pattern.data.shape, dtype=T.dtype)
-    R = sparse.bsr_array((uones, pattern.indices,
-                           pattern.indptr),
-                          shape=pattern.shape)
-    amg_core.incomplete_mat_mult_bsr(A.indptr, A.indices,
-                                     np.ravel(A.data),
-                                     T.indptr, T.indices,
-                                     np.ravel(T.data),
-                                     R.indptr, R.indices,
-                                     np.ravel(R.data),
-                                     int(T.shape[0]/T.blocksize[0]),
-                                     int(T.shape[1]/T.blocksize[1]),
-                                     A.blocksize[0], A.blocksize[1],
-                                     T.blocksize[1])
-    R.data *= -1.0
-
-    # Enforce R@B = 0
-    satisfy_constraints(R, B, BtBinv)
-
-    if R.nnz == 0:
+    #   R is 0 and pattern is not, and R@B = 0
+    R = np.empty(pattern.data.shape, dtype=xtype)
+    _constrained_product(A, T, pattern, R, B, BtBinv)
+    R *= -1.0
+
+    if pattern.nnz == 0:
         print('Error in sa_energy_min(..).  Initial R no nonzeros on a level. '
               'Returning tentative prolongator\n')
         return T
 
-    # Calculate Frobenius norm of the residual
-    resid = R.nnz  # np.sqrt((R.data.conjugate()*R.data).sum())
-    # print "Energy Minimization of Prolongator \
-    #       --- Iteration 0 --- r = " + str(resid)
+    Z = np.empty_like(R)
+    P = np.zeros_like(R)
+    AP = np.empty_like(R)
+    U = np.zeros_like(R)
+    Pmat = _pattern_array(pattern, P)
 
     i = 0
-    while i < maxiter and resid > tol:
+    while i < maxiter:
         # Apply diagonal preconditioner
-        if weighting in ('local', 'diagonal'):
-            Z = scale_rows(R, Dinv)
-        else:
-            Z = Dinv@R
+        _scale_blocks(Drows, R, Z)
 
         # Frobenius inner-product of (R,Z) = sum( np.conjugate(rk).*zk)
-        newsum = (R.conjugate().multiply(Z)).sum()
+        newsum = np.vdot(R, Z)
         if newsum < tol:
             # met tolerance, so halt
             break
 
         # P is the search direction, not the prolongator, which is T.
         if i == 0:
-            P = Z
+            P[...] = Z
             oldsum = newsum
         else:
             beta = newsum / oldsum
-            P = Z + beta*P
+            P *= beta
+            P += Z
         oldsum = newsum
 
         # Calculate new direction and enforce constraints
         #   Equivalent to:  AP = A@P;    AP = AP.multiply(pattern)
         #   with the added constraint that explicit zeros are in AP wherever
-        #   AP = 0 and pattern does not  !!!!
-        AP.data[:] = 0.0
-        amg_core.incomplete_mat_mult_bsr(A.indptr, A.indices,
-                                         np.ravel(A.data),
-                                         P.indptr, P.indices,
-                                         np.ravel(P.data),
-                                         AP.indptr, AP.indices,
-                                         np.ravel(AP.data),
-                                         int(T.shape[0]/T.blocksize[0]),
-                                         int(T.shape[1]/T.blocksize[1]),
-                                         A.blocksize[0], A.blocksize[1],
-                                         P.blocksize[1])
-
-        # Enforce AP@B = 0
-        satisfy_constraints(AP, B, BtBinv)
+        #   AP = 0 and pattern does not, and AP@B = 0
+        _constrained_product(A, Pmat, pattern, AP, B, BtBinv)
 
         # Frobenius inner-product of (P, AP)
-        alpha = newsum/(P.conjugate().multiply(AP)).sum()
-
-        # Update the prolongator, T
-        T = T + alpha*P
-
-        # Ensure identity at C-pts
-        if Cpt_params[0]:
-            T = Cpt_params[1]['I_F']@T + Cpt_params[1]['P_I']
+        alpha = newsum / np.vdot(P, AP)
 
-        # Update residual
-        R = R - alpha*AP
+        # Update the prolongator and the residual
+        U += alpha*P
+        R -= alpha*AP
 
         i += 1
 
-        # Calculate Frobenius norm of the residual
-        resid = R.nnz  # np.sqrt((R.data.conjugate()*R.data).sum())
-        # print "Energy Minimization of Prolongator \
-        # --- Iteration " + str(i) + " --- r = " + str(resid)
+    if i == 0:
+        return T
 
-    return T
+    return _update_prolongator(T, pattern, U, Cpt_params)
 
 
 def cgnr_prolongation_smoothing(A, T, B, BtBinv, pattern, maxiter,
@@ -498,123 +581,84 @@ def cgnr_prolongation_smoothing(A, T, B, BtBinv, pattern, maxiter,
     if weighting != 'diagonal':
         warn(f'Weighting of {weighting} unused.', stacklevel=2)
 
+    A, T, B, BtBinv, pattern, xtype = _energy_min_arrays(A, T, B, BtBinv, pattern)
+
     # For non-SPD system, apply CG on Normal Equations with Diagonal
     # Preconditioning (requires transpose)
     Ah = A.T.conjugate()
     Ah.sort_indices()
 
-    # Preallocate
-    uones = np.zeros(pattern.data.shape, dtype=T.dtype)
-    AP = sparse.bsr_array((uones, pattern.indices, pattern.indptr),
-                           shape=pattern.shape)
-
     # D for A.H@A
     Dinv = get_diagonal(A, norm_eq=1, inv=True)
+    Drows = Dinv.reshape(-1, A.blocksize[0], 1)[_block_rows(pattern)]
+    Drows = Drows.astype(xtype, copy=False)
+
+    # Sparsity pattern of A@P for the search directions P, found once
+    ones = sparse.bsr_array((np.ones(A.data.shape), A.indices, A.indptr),
+                            shape=A.shape)
+    AP_temp = ones @ _pattern_array(pattern, np.ones(pattern.data.shape))
+    AP_temp.data = np.zeros(AP_temp.data.shape, dtype=xtype)
 
     # Calculate initial residual
     #   Equivalent to R = -Ah@(A@T);    R = R.multiply(pattern)
     #   with the added constraint that R has an explicit 0 wherever
-    #   R is 0 and pattern is not
-    uones = np.zeros(pattern.data.shape, dtype=T.dtype)
-    R = sparse.bsr_array((uones, pattern.indices, pattern.indptr),
-                          shape=pattern.shape)
+    #   R is 0 and pattern is not, and R@B = 0
     AT = -1.0*A@T
-    R.data[:] = 0.0
-    amg_core.incomplete_mat_mult_bsr(Ah.indptr, Ah.indices,
-                                     np.ravel(Ah.data),
-                                     AT.indptr, AT.indices,
-                                     np.ravel(AT.data),
-                                     R.indptr, R.indices,
-                                     np.ravel(R.data),
-                                     int(T.shape[0]/T.blocksize[0]),
-                                     int(T.shape[1]/T.blocksize[1]),
-                                     Ah.blocksize[0], Ah.blocksize[1],
-                                     T.blocksize[1])
-
-    # Enforce R@B = 0
-    satisfy_constraints(R, B, BtBinv)
-
-    if R.nnz == 0:
+    R = np.empty(pattern.data.shape, dtype=xtype)
+    _constrained_product(Ah, AT, pattern, R, B, BtBinv)
+
+    if pattern.nnz == 0:
         print('Error in sa_energy_min(..).  Initial R no nonzeros on a level. '
               'Returning tentative prolongator')
         return T
 
-    # Calculate Frobenius norm of the residual
-    resid = R.nnz  # np.sqrt((R.data.conjugate()*R.data).sum())
-    # print "Energy Minimization of Prolongator \
-    # --- Iteration 0 --- r = " + str(resid)
+    Z = np.empty_like(R)
+    P = np.zeros_like(R)
+    AP = np.empty_like(R)
+    U = np.zeros_like(R)
+    Pmat = _pattern_array(pattern, P)
 
     i = 0
-    while i < maxiter and resid > tol:
-
-        # vect = np.ravel((A@T).data)
-        # print "Iteration " + str(i) + "   \
-        # Energy = %1.3e"%np.sqrt( (vect.conjugate()*vect).sum() )
-
+    while i < maxiter:
         # Apply diagonal preconditioner
-        Z = scale_rows(R, Dinv)
+        _scale_blocks(Drows, R, Z)
 
         # Frobenius innerproduct of (R,Z) = sum(rk.*zk)
-        newsum = (R.conjugate().multiply(Z)).sum()
+        newsum = np.vdot(R, Z)
         if newsum < tol:
             # met tolerance, so halt
             break
 
         # P is the search direction, not the prolongator, which is T.
         if i == 0:
-            P = Z
+            P[...] = Z
             oldsum = newsum
         else:
             beta = newsum/oldsum
-            P = Z + beta*P
+            P *= beta
+            P += Z
         oldsum = newsum
 
         # Calculate new direction
         #  Equivalent to:  AP = Ah@(A@P);    AP = AP.multiply(pattern)
         #  with the added constraint that explicit zeros are in AP wherever
-        #  AP = 0 and pattern does not
-        AP_temp = A@P
-        AP.data[:] = 0.0
-        amg_core.incomplete_mat_mult_bsr(Ah.indptr, Ah.indices,
-                                         np.ravel(Ah.data),
-                                         AP_temp.indptr, AP_temp.indices,
-                                         np.ravel(AP_temp.data),
-                                         AP.indptr, AP.indices,
-                                         np.ravel(AP.data),
-                                         int(T.shape[0]/T.blocksize[0]),
-                                         int(T.shape[1]/T.blocksize[1]),
-                                         Ah.blocksize[0],
-                                         Ah.blocksize[1], T.blocksize[1])
-        del AP_temp
-
-        # Enforce AP@B = 0
-        satisfy_constraints(AP, B, BtBinv)
+        #  AP = 0 and pattern does not, and AP@B = 0
+        _constrained_product(A, Pmat, AP_temp, AP_temp.data)
+        _constrained_product(Ah, AP_temp, pattern, AP, B, BtBinv)
 
         # Frobenius inner-product of (P, AP)
-        alpha = newsum/(P.conjugate().multiply(AP)).sum()
-
-        # Update the prolongator, T
-        T = T + alpha*P
-
-        # Ensure identity at C-pts
-        if Cpt_params[0]:
-            T = Cpt_params[1]['I_F']@T + Cpt_params[1]['P_I']
+        alpha = newsum / np.vdot(P, AP)
 
-        # Update residual
-        R = R - alpha*AP
+        # Update the prolongator and the residual
+        U += alpha*P
+        R -= alpha*AP
 
         i += 1
 
-        # Calculate Frobenius norm of the residual
-        resid = R.nnz  # np.sqrt((R.data.conjugate()*R.data).sum())
-        # print "Energy Minimization of Prolongator \
-        # --- Iteration " + str(i) + " --- r = " + str(resid)
-
-    # vect = np.ravel((A@T).data)
-    # print "Final Iteration " + str(i) + "   \
-    # Energy = %1.3e"%np.sqrt( (vect.conjugate()*vect).sum() )
+    if i == 0:
+        return T
 
-    return T
+    return _update_prolongator(T, pattern, U, Cpt_params)
 
 
 def apply_givens(Q, v, k):
@@ -698,127 +742,69 @@ def gmres_prolongation_smoothing(A, T, B, BtBinv, pattern, maxiter,
 
     """
     # For non-SPD system, apply GMRES with Diagonal Preconditioning
+    A, T, B, BtBinv, pattern, xtype = _energy_min_arrays(A, T, B, BtBinv, pattern)
 
-    # Preallocate space for new search directions
-    uones = np.zeros(pattern.data.shape, dtype=T.dtype)
-    AV = sparse.bsr_array((uones, pattern.indices, pattern.indptr),
-                           shape=pattern.shape)
+    # GMRES will be run with diagonal preconditioning
+    Dinv = _diagonal_blocks(_diagonal_weighting(A, weighting)).astype(xtype, copy=False)
 
-    # Preallocate for Givens Rotations, Hessenberg matrix and Krylov Space
-    xtype = upcast(A.dtype, T.dtype, B.dtype)
+    # Preallocate for Givens Rotations, Hessenberg matrix and Krylov Space.
+    # The Krylov vectors share the sparsity pattern of pattern, so the
+    # Krylov space is stored as the rows of a dense array of their data.
+    shape = pattern.data.shape
     Q = []      # Givens Rotations
-    V = []      # Krylov Space
-    # vs = []     # vs store the pointers to each column of V for speed
+    V = np.zeros((maxiter+1, pattern.data.size), dtype=xtype)
 
     # Upper Hessenberg matrix, converted to upper tri with Givens Rots
     H = np.zeros((maxiter+1, maxiter+1), dtype=xtype)
 
-    # GMRES will be run with diagonal preconditioning
-    if weighting == 'diagonal':
-        Dinv = get_diagonal(A, norm_eq=False, inv=True)
-    elif weighting == 'block':
-        Dinv = get_block_diag(A, blocksize=A.blocksize[0], inv_flag=True)
-        Dinv = sparse.bsr_array((Dinv, np.arange(Dinv.shape[0], dtype=np.int32),
-                                 np.arange(Dinv.shape[0] + 1, dtype=np.int32)),
-                                 shape=A.shape)
-    elif weighting == 'local':
-        # Based on Gershgorin estimate
-        D = np.abs(A)@np.ones((A.shape[0], 1), dtype=A.dtype)
-        Dinv = np.zeros_like(D)
-        Dinv[D != 0] = 1.0 / np.abs(D[D != 0])
-    else:
-        raise ValueError('weighting value is invalid')
-
     # Calculate initial residual
     #   Equivalent to R = -A@T;    R = R.multiply(pattern)
     #   with the added constraint that R has an explicit 0 wherever
-    #   R is 0 and pattern is not
-    uones = np.zeros(pattern.data.shape, dtype=T.dtype)
-    R = sparse.bsr_array((uones, pattern.indices, pattern.indptr),
-                          shape=pattern.shape)
-    amg_core.incomplete_mat_mult_bsr(A.indptr, A.indices,
-                                     np.ravel(A.data),
-                                     T.indptr, T.indices,
-                                     np.ravel(T.data),
-                                     R.indptr, R.indices,
-                                     np.ravel(R.data),
-                                     int(T.shape[0]/T.blocksize[0]),
-                                     int(T.shape[1]/T.blocksize[1]),
-                                     A.blocksize[0], A.blocksize[1],
-                                     T.blocksize[1])
-    R.data *= -1.0
-
-    # Apply diagonal preconditioner
-    if weighting in ('local', 'diagonal'):
-        R = scale_rows(R, Dinv)
-    else:
-        R = Dinv@R
+    #   R is 0 and pattern is not, followed by the diagonal preconditioner
+    #   and R@B = 0
+    R = V[0].reshape(shape)
+    _constrained_product(A, T, pattern, R, B, BtBinv, Dinv)
+    R *= -1.0
 
-    # Enforce R@B = 0
-    satisfy_constraints(R, B, BtBinv)
-
-    if R.nnz == 0:
+    if pattern.nnz == 0:
         print('Error in sa_energy_min(..).  Initial R no nonzeros on a level. '
               'Returning tentative prolongator\n')
         return T
 
     # This is the RHS vector for the problem in the Krylov Space
-    normr = np.sqrt((R.data.conjugate()*R.data).sum())
+    normr = np.linalg.norm(V[0])
     g = np.zeros((maxiter+1,), dtype=xtype)
     g[0] = normr
 
     # First Krylov vector
     # V[0] = r/normr
     if normr > 0.0:
-        V.append((1.0/normr)*R)
+        V[0] /= normr
 
-    # print "Energy Minimization of Prolongator \
-    # --- Iteration 0 --- r = " + str(normr)
     i = -1
-    # vect = np.ravel((A@T).data)
-    # print "Iteration " + str(i+1) + "   \
-    # Energy = %1.3e"%np.sqrt( (vect.conjugate()*vect).sum() )
-    # print "Iteration " + str(i+1) + "   Normr  %1.3e"%normr
     while i < maxiter-1 and normr > tol:
         i = i+1
 
         # Calculate new search direction
         #   Equivalent to:  AV = A@V;    AV = AV.multiply(pattern)
         #   with the added constraint that explicit zeros are in AP wherever
-        #   AP = 0 and pattern does not
-        AV.data[:] = 0.0
-        amg_core.incomplete_mat_mult_bsr(A.indptr, A.indices,
-                                         np.ravel(A.data),
-                                         V[i].indptr, V[i].indices,
-                                         np.ravel(V[i].data),
-                                         AV.indptr, AV.indices,
-                                         np.ravel(AV.data),
-                                         int(T.shape[0]/T.blocksize[0]),
-                                         int(T.shape[1]/T.blocksize[1]),
-                                         A.blocksize[0], A.blocksize[1],
-                                         T.blocksize[1])
-
-        if weighting in ('local', 'diagonal'):
-            AV = scale_rows(AV, Dinv)
-        else:
-            AV = Dinv@AV
-
-        # Enforce AV@B = 0
-        satisfy_constraints(AV, B, BtBinv)
-        V.append(AV.copy())
+        #   AP = 0 and pattern does not, followed by the diagonal
+        #   preconditioner and AV@B = 0
+        Vi = _pattern_array(pattern, V[i].reshape(shape))
+        _constrained_product(A, Vi, pattern, V[i+1].reshape(shape), B, BtBinv, Dinv)
 
         # Modified Gram-Schmidt
         for j in range(i+1):
             # Frobenius inner-product
-            H[j, i] = (V[j].conjugate().multiply(V[i+1])).sum()
-            V[i+1] = V[i+1] - H[j, i]*V[j]
+            H[j, i] = np.vdot(V[j], V[i+1])
+            V[i+1] -= H[j, i]*V[j]
 
         # Frobenius Norm
-        H[i+1, i] = np.sqrt((V[i+1].data.conjugate()*V[i+1].data).sum())
+        H[i+1, i] = np.linalg.norm(V[i+1])
 
         # Check for breakdown
         if H[i+1, i] != 0.0:
-            V[i+1] = (1.0 / H[i+1, i]) * V[i+1]
+            V[i+1] /= H[i+1, i]
 
         # Apply previous Givens rotations to H
         if i > 0:
@@ -852,18 +838,13 @@ def gmres_prolongation_smoothing(A, T, B, BtBinv, pattern, maxiter,
             H[i+1, i] = 0.0
 
         normr = np.abs(g[i+1])
-        # print "Iteration " + str(i+1) + "   Normr  %1.3e"%normr
     # End while loop
 
     # Find best update to x in Krylov Space, V.  Solve (i x i) system.
     if i != -1:
         y = la.solve(H[0:i+1, 0:i+1], g[0:i+1])
-        for j in range(i+1):
-            T = T + y[j]*V[j]
-
-    # vect = np.ravel((A@T).data)
-    # print "Final Iteration " + str(i) + "   \
-    # Energy = %1.3e"%np.sqrt( (vect.conjugate()*vect).sum() )
+        U = np.dot(y, V[0:i+1]).reshape(shape)
+        return _update_prolongator(T, pattern, U, Cpt_params)
 
     # Ensure identity at C-pts
     if Cpt_params[0]:
@@ -2,6 +2,7 @@
 import warnings
 import numpy as np
 from numpy.testing import TestCase
+import pytest
 from scipy.sparse import SparseEfficiencyWarning
 
 from pyamg.gallery import poisson, linear_elasticity
@@ -62,6 +63,23 @@ class TestAdaptiveSA(TestCase):
         # print "SA convergence (Elasticity) %1.2e" % (conv_sa)
         assert conv_asa < 1.3 * conv_sa
 
+    def test_max_work(self):
+        warnings.filterwarnings('ignore', category=UserWarning,
+                                message='Having less target vectors')
+        A = linear_elasticity((20, 20), format='bsr')[0]
+
+        [_asa, work] = adaptive_sa_solver(A, num_candidates=3)
+        with pytest.warns(UserWarning, match='max_work'):
+            [asa, work_limited] = adaptive_sa_solver(A, num_candidates=3,
+                                                     improvement_iters=2,
+                                                     max_work=work)
+        assert asa.levels[0].B.shape[1] == 3
+        assert work_limited < 1.5 * work
+
+        with pytest.warns(UserWarning, match='max_work'):
+            [asa, _work] = adaptive_sa_solver(A, num_candidates=3, max_work=1)
+        assert asa.levels[0].B.shape[1] == 1
+
     def test_matrix_formats(self):
         warnings.filterwarnings('ignore', category=SparseEfficiencyWarning)
 
@@ -3,11 +3,13 @@ import numpy as np
 from numpy.testing import TestCase, assert_equal
 from scipy import sparse
 
-from pyamg.gallery import poisson, load_example
+from pyamg.gallery import poisson, load_example, linear_elasticity
 from pyamg.strength import (symmetric_strength_of_connection,
                             classical_strength_of_connection)
 from pyamg.aggregation.aggregate import (standard_aggregation, naive_aggregation,
-                                         pairwise_aggregation)
+                                         pairwise_aggregation, partition_aggregation,
+                                         mis2_aggregation)
+from pyamg.aggregation import smoothed_aggregation_solver
 
 from collections import OrderedDict
 
@@ -84,6 +86,108 @@ class TestAggregate(TestCase):
         assert_equal(result.todense(), expected)
         assert_equal(Cpts.shape[0], 4)
 
+    def test_pairwise_aggregation_matchings(self):
+        kw = {'theta': 0.25, 'norm': 'min'}
+        for A in self.cases:
+            C = classical_strength_of_connection(A, **kw)
+            for matchings in [2, 3, 4]:
+                result, Cpts = pairwise_aggregation(A, matchings=matchings, **kw)
+                expected, _ = pairwise_aggregation(A, C=C, matchings=matchings,
+                                                   strength='classical', strengthkw=kw)
+
+                # ties in the strength can be broken differently, so only check
+                # that every node is in one aggregate, at most 2^matchings per
+                # aggregate
+                assert_equal(result.shape, expected.shape)
+                assert_equal(result.sum(axis=1), np.ones(A.shape[0]))
+                assert result.sum(axis=0).max() <= 2**matchings
+                assert_equal(result[Cpts, np.arange(len(Cpts))], np.ones(len(Cpts)))
+
+        # without ties in the strength, the fused matchings give the same result
+        cases = [poisson((N,), format='csr') for N in [2, 7, 19]]
+        cases.append(linear_elasticity((7, 7), format='bsr')[0])
+        for A in cases:
+            C = classical_strength_of_connection(A, **kw)
+            for matchings in [2, 3, 4]:
+                result, Cpts = pairwise_aggregation(A, matchings=matchings, **kw)
+                expected, expected_Cpts = pairwise_aggregation(
+                    A, C=C, matchings=matchings, strength='classical', strengthkw=kw)
+                assert_equal((result != expected).nnz, 0)
+                assert_equal(Cpts, expected_Cpts)
+
+    def test_partition_aggregation(self):
+        for A in self.cases:
+            S = symmetric_strength_of_connection(A)
+            n = S.shape[0]
+            AggOp = partition_aggregation(S, ratio=0.2)
+
+            # every node is in exactly one aggregate, and no aggregate is empty
+            assert_equal(AggOp.shape[0], n)
+            assert_equal(AggOp.sum(axis=1), np.ones(n))
+            assert AggOp.sum(axis=0).min() > 0
+            assert AggOp.shape[1] <= max(int(0.2 * n), 1)
+
+            # aggregates are connected in the graph of S
+            G = abs(S) + abs(S.T)
+            for j in range(AggOp.shape[1]):
+                idx = AggOp[:, [j]].tocoo().row
+                assert sparse.csgraph.connected_components(G[idx][:, idx])[0] == 1
+
+            # the index dtype of S is kept
+            S64 = S.copy()
+            S64.indptr = S64.indptr.astype(np.int64)
+            S64.indices = S64.indices.astype(np.int64)
+            AggOp64 = partition_aggregation(S64, ratio=0.2)
+            assert AggOp64.indptr.dtype == np.int64
+            assert AggOp64.indices.dtype == np.int64
+            assert_equal((AggOp64 != AggOp).nnz, 0)
+
+        A = poisson((30, 30), format='csr')
+        ml = smoothed_aggregation_solver(A, aggregate=('partition', {'ratio': 0.1}),
+                                         max_coarse=10)
+        assert_equal(ml.levels[1].A.shape[0], 90)
+        b = np.random.rand(A.shape[0])
+        residuals = []
+        ml.solve(b, tol=1e-8, residuals=residuals)
+        assert (residuals[-1] / residuals[0])**(1.0 / (len(residuals) - 1)) < 0.5
+
+    def test_mis2_aggregation(self):
+        for A in self.cases:
+            S = symmetric_strength_of_connection(A)
+            AggOp, Cpts = mis2_aggregation(S, seed=1)
+
+            # every non-isolated node is in exactly one aggregate
+            offdiag = S - sparse.diags_array(S.diagonal())
+            offdiag.eliminate_zeros()
+            isolated = np.diff(offdiag.indptr) == 0
+            assert_equal(AggOp.sum(axis=1), (~isolated).astype(int))
+            assert_equal(Cpts.shape[0], AggOp.shape[1])
+            assert_equal(AggOp[Cpts, np.arange(len(Cpts))], np.ones(len(Cpts)))
+
+            # aggregates are connected in the graph of S
+            G = abs(S) + abs(S.T)
+            for j in range(AggOp.shape[1]):
+                idx = AggOp[:, [j]].tocoo().row
+                assert sparse.csgraph.connected_components(G[idx][:, idx])[0] == 1
+
+            # the result only depends on the seed
+            AggOp2, Cpts2 = mis2_aggregation(S, seed=1)
+            assert_equal((AggOp - AggOp2).nnz, 0)
+            assert_equal(Cpts, Cpts2)
+
+        # S is diagonal - no dofs aggregated
+        S = sparse.diags_array([[1, 1, 1, 1]], offsets=[0], shape=(4, 4), format='csr')
+        (result, Cpts) = mis2_aggregation(S)
+        assert_equal(result.toarray(), np.zeros((4, 1)))
+        assert_equal(Cpts.shape[0], 0)
+
+        A = poisson((50, 50), format='csr')
+        ml = smoothed_aggregation_solver(A, aggregate='mis2', max_coarse=10)
+        b = np.random.rand(A.shape[0])
+        residuals = []
+        ml.solve(b, tol=1e-8, residuals=residuals)
+        assert (residuals[-1] / residuals[0])**(1.0 / (len(residuals) - 1)) < 0.5
+
 
 class TestComplexAggregate(TestCase):
     def setUp(self):
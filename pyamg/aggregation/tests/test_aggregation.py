@@ -36,7 +36,7 @@ class TestParameters(TestCase):
             assert convergence_ratio < 0.9
 
     def test_strength_of_connection(self):
-        for strength in ['symmetric', 'evolution']:
+        for strength in ['symmetric', 'evolution', 'energy_based']:
             self.run_cases({'strength': strength})
 
     def test_aggregation_method(self):
@@ -426,6 +426,34 @@ class TestSolverPerformance(TestCase):
             assert np.abs(np.ravel(Ac_old - Ac_new)).max() < 0.01
             sa_old = sa_new
 
+    def test_int64_indices(self):
+        # 64-bit index arrays are kept on all levels and give the same solver
+        A = poisson((20, 20), format='csr')
+        E = linear_elasticity((8, 8), format='bsr')[0]
+        cases = [(A, {}),
+                 (A, {'strength': 'evolution', 'aggregate': 'lloyd'}),
+                 (A, {'aggregate': 'balanced lloyd', 'smooth': 'energy'}),
+                 (A, {'presmoother': 'schwarz', 'postsmoother': 'gauss_seidel_nr'}),
+                 (E, {'presmoother': 'block_gauss_seidel', 'postsmoother': 'jacobi'}),
+                 (E, {'presmoother': ('block_jacobi', {'factorization': 'lu'}),
+                      'postsmoother': ('block_jacobi', {'factorization': 'lu'})})]
+        for AA, kwargs in cases:
+            AA64 = AA.copy()
+            AA64.indptr = AA64.indptr.astype(np.int64)
+            AA64.indices = AA64.indices.astype(np.int64)
+
+            np.random.seed(2206381)
+            sa = smoothed_aggregation_solver(AA, max_coarse=10, **kwargs)
+            np.random.seed(2206381)
+            sa64 = smoothed_aggregation_solver(AA64, max_coarse=10, **kwargs)
+            for level in sa64.levels:
+                assert level.A.indptr.dtype == np.int64
+                assert level.A.indices.dtype == np.int64
+
+            b = np.random.rand(AA.shape[0])
+            assert_array_almost_equal(sa64.solve(b, maxiter=5, tol=1e-20),
+                                      sa.solve(b, maxiter=5, tol=1e-20))
+
 
 class TestComplexSolverPerformance(TestCase):
     """Test imaginary examples.
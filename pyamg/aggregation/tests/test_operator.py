@@ -0,0 +1,95 @@
+"""Test implicit aggregation operators."""
+import numpy as np
+from scipy import sparse
+
+from numpy.testing import TestCase, assert_allclose, assert_equal
+import pytest
+
+from pyamg.gallery import poisson, linear_elasticity
+from pyamg.aggregation import (AggregationOperator, pairwise_solver,
+                               smoothed_aggregation_solver)
+
+
+class TestAggregationOperator(TestCase):
+    def setUp(self):
+        np.random.seed(1174519)
+        self.cases = []
+
+        # all rows aggregated
+        self.cases.append(AggregationOperator(np.array([0, 0, 1, 1, 2])))
+        self.cases.append(AggregationOperator(np.array([2, 1, 0, 0, 1, 2, 1])))
+        # zero rows and an empty aggregate
+        self.cases.append(AggregationOperator(np.array([-1, 0, 0, 3, -1, 3]), 4))
+        # scaled rows, real and complex
+        agg = np.random.randint(0, 10, size=50)
+        self.cases.append(AggregationOperator(agg, 10, scale=np.random.rand(50)))
+        scale = np.random.rand(50) + 1j * np.random.rand(50)
+        self.cases.append(AggregationOperator(agg, 10, scale=scale))
+
+    def test_apply(self):
+        for P in self.cases:
+            Pm = P.tocsr()
+            assert_equal(P.nnz, Pm.nnz)
+
+            for op, opm in [(P, Pm), (P.T, Pm.T), (P.H, Pm.T.conjugate()),
+                            (P.T.conjugate(), Pm.T.conjugate())]:
+                assert_equal(op.shape, opm.shape)
+                assert_allclose(op.toarray(), opm.toarray())
+
+                # vectors and blocks of vectors
+                for shape in [(op.shape[1],), (op.shape[1], 3)]:
+                    x = np.random.rand(*shape) + 1j * np.random.rand(*shape)
+                    assert_allclose(op @ x, opm @ x)
+                    assert_allclose(op @ x.real, opm @ x.real)
+                for shape in [(op.shape[0],), (2, op.shape[0])]:
+                    x = np.random.rand(*shape)
+                    assert_allclose(x @ op, x @ opm.toarray())
+
+    def test_galerkin(self):
+        for P in self.cases:
+            n = P.shape[0]
+            A = sparse.random_array((n, n), density=0.3, format='csr',
+                                    random_state=np.random.default_rng(n))
+            Pm = P.tocsr()
+            assert_allclose((P.H @ A).toarray(), (Pm.T.conjugate() @ A).toarray())
+            assert_allclose((A @ P).toarray(), (A @ Pm).toarray())
+            assert_allclose((P.H @ A @ P).toarray(),
+                            (Pm.T.conjugate() @ A @ Pm).toarray())
+
+    def test_from_matrix(self):
+        for P in self.cases:
+            Q = AggregationOperator.from_matrix(P.tocsr())
+            assert_equal(Q.shape, P.shape)
+            assert_allclose(Q.toarray(), P.toarray())
+
+        with pytest.raises(ValueError, match='one nonzero'):
+            AggregationOperator.from_matrix(sparse.csr_array(np.ones((3, 2))))
+        with pytest.raises(ValueError, match='out of range'):
+            AggregationOperator(np.array([0, 3]), 2)
+
+
+class TestSolvers(TestCase):
+    def test_pairwise_solver(self):
+        for A in [poisson((50, 50), format='csr'),
+                  linear_elasticity((7, 7), format='bsr')[0]]:
+            ml = pairwise_solver(A, max_coarse=10)
+            for level in ml.levels[:-1]:
+                assert isinstance(level.P, AggregationOperator)
+                assert isinstance(level.R, AggregationOperator)
+
+            # coarse operators agree with the sparse Galerkin product
+            for i in range(len(ml.levels) - 1):
+                A, P = ml.levels[i].A, ml.levels[i].P.tocsr()
+                assert_allclose(ml.levels[i + 1].A.toarray(), (P.T @ A @ P).toarray())
+
+    def test_unsmoothed_sa(self):
+        A = poisson((50, 50), format='csr')
+        A = A + 1e-3j * sparse.diags_array(np.random.rand(A.shape[0]))
+        ml = smoothed_aggregation_solver(A, smooth=None, max_coarse=10, keep=True)
+        b = np.random.rand(A.shape[0])
+        res = []
+        ml.solve(b, tol=1e-8, residuals=res, accel='cg')
+        for level in ml.levels[:-1]:
+            assert isinstance(level.P, AggregationOperator)
+            assert_allclose(level.P.toarray(), level.T.toarray())
+        assert res[-1] < 1e-8 * res[0]
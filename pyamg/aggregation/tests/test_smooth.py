@@ -4,11 +4,15 @@ import numpy as np
 from numpy.testing import TestCase, assert_array_almost_equal, \
     assert_equal, assert_almost_equal
 from scipy import sparse
+import scipy.linalg as la
 
 from pyamg.gallery import poisson, linear_elasticity, load_example, \
     gauge_laplacian
-from pyamg.aggregation import smoothed_aggregation_solver, rootnode_solver
-from pyamg.amg_core import incomplete_mat_mult_bsr
+from pyamg.aggregation import smoothed_aggregation_solver, rootnode_solver, \
+    jacobi_prolongation_smoother
+from pyamg.relaxation.smoothing import rho_D_inv_A
+from pyamg.util.utils import unamal, compute_BtBinv
+from pyamg.amg_core import incomplete_mat_mult_bsr, incomplete_mat_mult_bsr_constrained
 
 
 class TestEnergyMin(TestCase):
@@ -283,6 +287,48 @@ class TestEnergyMin(TestCase):
             assert_array_almost_equal(result.indices, exact.indices)
             assert_array_almost_equal(result.indptr, exact.indptr)
 
+    def test_incomplete_mat_mult_bsr_constrained(self):
+        # D A X on the pattern of S, followed by the row-wise projection
+        # S_i = S_i - (S_i B) pinv(B_i.H B_i) B_i.H that gives S B = 0
+        np.random.seed(2310231)
+        for (R, C, K, dtype) in [(1, 1, 1, float), (2, 3, 2, complex),
+                                 (3, 2, 4, float), (2, 2, 3, complex)]:
+            n, m = 12, 7
+            A = sparse.csr_array(np.random.rand(n, n) < 0.4)
+            X = sparse.csr_array(np.random.rand(n, m) < 0.3)
+            S = sparse.csr_array(np.random.rand(n, m) < 0.5)
+            A = unamal(A, R, R).astype(dtype)
+            X = unamal(X, R, C).astype(dtype)
+            S = unamal(S, R, C).astype(dtype)
+            A.data = np.random.rand(*A.data.shape).astype(dtype)
+            X.data = np.random.rand(*X.data.shape).astype(dtype)
+            B = np.random.rand(m*C, K).astype(dtype)
+            D = np.random.rand(n, R, R).astype(dtype)
+            if np.dtype(dtype).kind == 'c':
+                A.data += 1j*np.random.rand(*A.data.shape)
+                B += 1j*np.random.rand(*B.shape)
+
+            Sfull = (sparse.block_diag(list(D)) @ A @ X).toarray()
+            mask = S.toarray() != 0
+            exact = np.zeros((n*R, m*C), dtype=dtype)
+            for i in range(n):
+                rows = slice(i*R, (i+1)*R)
+                cols = np.ravel(np.nonzero(mask[i*R]))
+                Si = Sfull[rows, cols]
+                Bi = B[cols]
+                exact[rows, cols] = Si - Si @ Bi @ la.pinv(Bi.conj().T @ Bi) @ Bi.conj().T
+
+            BtBinv = compute_BtBinv(B, S)
+            result = np.ones(S.data.shape, dtype=dtype)
+            incomplete_mat_mult_bsr_constrained(A.indptr, A.indices, np.ravel(A.data),
+                                                X.indptr, X.indices, np.ravel(X.data),
+                                                S.indptr, S.indices, np.ravel(result),
+                                                n, m, R, R, C, K, np.ravel(B),
+                                                np.ravel(BtBinv), np.ravel(D))
+            S.data = result
+            assert_array_almost_equal(S.toarray(), exact)
+            assert_array_almost_equal(S @ B, np.zeros((n*R, K)))
+
     def test_range(self):
         """Check that P*R=B."""
         warnings.filterwarnings('ignore', category=UserWarning,
@@ -621,6 +667,26 @@ class TestEnergyMin(TestCase):
             assert_equal(ml_nofilter.levels[0].P.nnz
                          > ml_filter.levels[0].P.nnz, True)
 
+
+class TestJacobi(TestCase):
+    def test_rho(self):
+        A = poisson((40, 40), format='csr')
+        ml = smoothed_aggregation_solver(A, max_coarse=10, keep=True)
+        T, C, B = ml.levels[0].T, ml.levels[0].C, ml.levels[0].B
+
+        # an estimate left on A by earlier smoothing is not used
+        np.random.seed(0)
+        P = jacobi_prolongation_smoother(A, T, C, B)
+        rho = rho_D_inv_A(A)
+        np.random.seed(0)
+        assert_array_almost_equal(jacobi_prolongation_smoother(A, T, C, B).toarray(),
+                                  P.toarray(), decimal=12)
+
+        # a given estimate is used
+        P = jacobi_prolongation_smoother(A, T, C, B, rho=rho)
+        D_inv_A = A / A.diagonal()[:, None]
+        assert_array_almost_equal(P.toarray(), (T - (4.0/3.0/rho) * D_inv_A @ T).toarray())
+
 # class TestSatisfyConstraints(TestCase):
 #    def test_scalar(self):
 #
@@ -5,24 +5,33 @@ from . import (evolution_strength, graph, krylov, linalg, relaxation,
 
 from .evolution_strength import (apply_absolute_distance_filter, apply_distance_filter,
                                  min_blocks, evolution_strength_helper,
-                                 incomplete_mat_mult_csr)
+                                 incomplete_mat_mult_csr, energy_based_strength_helper,
+                                 algebraic_distance_csr, affinity_distance_csr)
 from .graph import (maximal_independent_set_serial, maximal_independent_set_parallel,
                     vertex_coloring_mis, vertex_coloring_jones_plassmann,
                     vertex_coloring_LDF,
                     bellman_ford, bellman_ford_balanced,
-                    floyd_warshall, center_nodes, most_interior_nodes,
+                    dijkstra, dijkstra_balanced,
+                    floyd_warshall, center_nodes, center_nodes_dijkstra,
+                    rebalance_measures, rebalance_centers,
+                    most_interior_nodes,
                     maximal_independent_set_k_parallel,
-                    breadth_first_search, connected_components)
+                    breadth_first_search, connected_components,
+                    partition_graph, counter_based_uniform)
 
 from .krylov import (apply_householders, householder_hornerscheme, apply_givens)
-from .linalg import (pinv_array, csc_scale_columns, csc_scale_rows, filter_matrix_rows)
+from .linalg import (pinv_array, pinv_hermitian_array, lu_factor_array, lu_inv_array,
+                     csc_scale_columns, csc_scale_rows, filter_matrix_rows,
+                     csr_matvec_transpose, bsr_matvec_transpose, stencil_matvec)
 from .relaxation import (gauss_seidel, sor_gauss_seidel, bsr_gauss_seidel,
                          gauss_seidel_indexed,
                          jacobi, bsr_jacobi,
                          jacobi_ne, gauss_seidel_ne, gauss_seidel_nr,
                          block_jacobi, block_gauss_seidel,
                          extract_subblocks, overlapping_schwarz_csr,
-                         jacobi_indexed, bsr_jacobi_indexed, block_jacobi_indexed)
+                         jacobi_indexed, bsr_jacobi_indexed, block_jacobi_indexed,
+                         spai_csr, block_jacobi_tiled, block_jacobi_lu,
+                         jacobi_multivector, stencil_jacobi, stencil_gauss_seidel)
 from .ruge_stuben import (classical_strength_of_connection_abs,
                           classical_strength_of_connection_min,
                           maximum_row_value,
@@ -30,14 +39,24 @@ from .ruge_stuben import (classical_strength_of_connection_abs,
                           cljp_naive_splitting,
                           rs_direct_interpolation_pass1, rs_direct_interpolation_pass2,
                           cr_helper,
+                          cr_sweep,
+                          binormalize,
                           rs_classical_interpolation_pass1,
                           rs_classical_interpolation_pass2,
-                          remove_strong_FF_connections)
+                          remove_strong_FF_connections,
+                          rs_aggressive_strength_pass1, rs_aggressive_strength_pass2,
+                          rs_multipass_interpolation_pass1,
+                          rs_multipass_interpolation_pass2,
+                          rs_extended_interpolation_pass1,
+                          rs_extended_interpolation_pass2)
 from .smoothed_aggregation import (symmetric_strength_of_connection, standard_aggregation,
-                                   naive_aggregation, pairwise_aggregation,
+                                   naive_aggregation, mis2_aggregation,
+                                   pairwise_aggregation, pairwise_aggregation_multi,
+                                   aggregation_prolong, aggregation_restrict,
                                    fit_candidates,
-                                   satisfy_constraints_helper, calc_BtB,
-                                   incomplete_mat_mult_bsr, truncate_rows_csr)
+                                   satisfy_constraints_helper, satisfy_constraints_bsr,
+                                   calc_BtB, calc_BtBinv, incomplete_mat_mult_bsr,
+                                   incomplete_mat_mult_bsr_constrained, truncate_rows_csr)
 
 from .air import (one_point_interpolation, approx_ideal_restriction_pass1,
                   approx_ideal_restriction_pass2, block_approx_ideal_restriction_pass2)
@@ -56,29 +75,45 @@ __all__ = [
     'min_blocks',
     'evolution_strength_helper',
     'incomplete_mat_mult_csr',
+    'energy_based_strength_helper',
+    'algebraic_distance_csr',
+    'affinity_distance_csr',
     # graph
     'maximal_independent_set_serial',
     'maximal_independent_set_parallel',
+    'counter_based_uniform',
     'vertex_coloring_mis',
     'vertex_coloring_jones_plassmann',
     'vertex_coloring_LDF',
     'bellman_ford',
     'bellman_ford_balanced',
+    'dijkstra',
+    'dijkstra_balanced',
     'floyd_warshall',
     'center_nodes',
+    'center_nodes_dijkstra',
+    'rebalance_measures',
+    'rebalance_centers',
     'most_interior_nodes',
     'maximal_independent_set_k_parallel',
     'breadth_first_search',
     'connected_components',
+    'partition_graph',
     # krylov
     'apply_householders',
     'householder_hornerscheme',
     'apply_givens',
     # linalg
     'pinv_array',
+    'pinv_hermitian_array',
+    'lu_factor_array',
+    'lu_inv_array',
     'csc_scale_columns',
     'csc_scale_rows',
     'filter_matrix_rows',
+    'csr_matvec_transpose',
+    'bsr_matvec_transpose',
+    'stencil_matvec',
     # relaxation
     'gauss_seidel',
     'sor_gauss_seidel',
@@ -96,6 +131,12 @@ __all__ = [
     'jacobi_indexed',
     'bsr_jacobi_indexed',
     'block_jacobi_indexed',
+    'spai_csr',
+    'block_jacobi_tiled',
+    'block_jacobi_lu',
+    'jacobi_multivector',
+    'stencil_jacobi',
+    'stencil_gauss_seidel',
     # ruge_stuben
     'classical_strength_of_connection_abs',
     'classical_strength_of_connection_min',
@@ -106,18 +147,33 @@ __all__ = [
     'rs_direct_interpolation_pass1',
     'rs_direct_interpolation_pass2',
     'cr_helper',
+    'cr_sweep',
+    'binormalize',
     'rs_classical_interpolation_pass1',
     'rs_classical_interpolation_pass2',
     'remove_strong_FF_connections',
+    'rs_aggressive_strength_pass1',
+    'rs_aggressive_strength_pass2',
+    'rs_multipass_interpolation_pass1',
+    'rs_multipass_interpolation_pass2',
+    'rs_extended_interpolation_pass1',
+    'rs_extended_interpolation_pass2',
     # smoothed_aggregation
     'symmetric_strength_of_connection',
     'standard_aggregation',
     'naive_aggregation',
+    'mis2_aggregation',
     'pairwise_aggregation',
+    'pairwise_aggregation_multi',
+    'aggregation_prolong',
+    'aggregation_restrict',
     'fit_candidates',
     'satisfy_constraints_helper',
+    'satisfy_constraints_bsr',
     'calc_BtB',
+    'calc_BtBinv',
     'incomplete_mat_mult_bsr',
+    'incomplete_mat_mult_bsr_constrained',
     'truncate_rows_csr',
     # air
     'one_point_interpolation',
@@ -43,13 +43,13 @@
  *
  */
 template<class I, class T>
-void one_point_interpolation(      I Pp[],    const int Pp_size,
-                                   I Pj[],   const int Pj_size,
-                                   T Px[],   const int Px_size,
-                             const I Cp[],  const int Cp_size,
-                             const I Cj[], const int Cj_size,
-                             const T Cx[],    const int Cx_size,
-                             const I splitting[], const int splitting_size)
+void one_point_interpolation(      I Pp[],    const std::ptrdiff_t Pp_size,
+                                   I Pj[],   const std::ptrdiff_t Pj_size,
+                                   T Px[],   const std::ptrdiff_t Px_size,
+                             const I Cp[],  const std::ptrdiff_t Cp_size,
+                             const I Cj[], const std::ptrdiff_t Cj_size,
+                             const T Cx[],    const std::ptrdiff_t Cx_size,
+                             const I splitting[], const std::ptrdiff_t splitting_size)
 {
     I n = Pp_size-1;
 
@@ -121,11 +121,11 @@ void one_point_interpolation(      I Pp[],    const int Pp_size,
  *     Nothing, Rp[] modified in place.
  */
 template<class I>
-void approx_ideal_restriction_pass1(      I Rp[], const int Rp_size,
-                                    const I Cp[], const int Cp_size,
-                                    const I Cj[], const int Cj_size,
-                                    const I Cpts[], const int Cpts_size,
-                                    const I splitting[], const int splitting_size,
+void approx_ideal_restriction_pass1(      I Rp[], const std::ptrdiff_t Rp_size,
+                                    const I Cp[], const std::ptrdiff_t Cp_size,
+                                    const I Cj[], const std::ptrdiff_t Cj_size,
+                                    const I Cpts[], const std::ptrdiff_t Cpts_size,
+                                    const I splitting[], const std::ptrdiff_t splitting_size,
                                     const I distance = 2)
 {
     I nnz = 0;
@@ -209,17 +209,17 @@ void approx_ideal_restriction_pass1(      I Rp[], const int Rp_size,
  *
  */
 template<class I, class T>
-void approx_ideal_restriction_pass2(const I Rp[], const int Rp_size,
-                                          I Rj[], const int Rj_size,
-                                          T Rx[], const int Rx_size,
-                                    const I Ap[], const int Ap_size,
-                                    const I Aj[], const int Aj_size,
-                                    const T Ax[], const int Ax_size,
-                                    const I Cp[], const int Cp_size,
-                                    const I Cj[], const int Cj_size,
-                                    const T Cx[], const int Cx_size,
-                                    const I Cpts[], const int Cpts_size,
-                                    const I splitting[], const int splitting_size,
+void approx_ideal_restriction_pass2(const I Rp[], const std::ptrdiff_t Rp_size,
+                                          I Rj[], const std::ptrdiff_t Rj_size,
+                                          T Rx[], const std::ptrdiff_t Rx_size,
+                                    const I Ap[], const std::ptrdiff_t Ap_size,
+                                    const I Aj[], const std::ptrdiff_t Aj_size,
+                                    const T Ax[], const std::ptrdiff_t Ax_size,
+                                    const I Cp[], const std::ptrdiff_t Cp_size,
+                                    const I Cj[], const std::ptrdiff_t Cj_size,
+                                    const T Cx[], const std::ptrdiff_t Cx_size,
+                                    const I Cpts[], const std::ptrdiff_t Cpts_size,
+                                    const I splitting[], const std::ptrdiff_t splitting_size,
                                     const I distance = 2,
                                     const I use_gmres = 0,
                                     const I maxiter = 10,
@@ -376,17 +376,17 @@ void approx_ideal_restriction_pass2(const I Rp[], const int Rp_size,
  *
  */
 template<class I, class T>
-void block_approx_ideal_restriction_pass2(const I Rp[], const int Rp_size,
-                                                I Rj[], const int Rj_size,
-                                                T Rx[], const int Rx_size,
-                                          const I Ap[], const int Ap_size,
-                                          const I Aj[], const int Aj_size,
-                                          const T Ax[], const int Ax_size,
-                                          const I Cp[], const int Cp_size,
-                                          const I Cj[], const int Cj_size,
-                                          const T Cx[], const int Cx_size,
-                                          const I Cpts[], const int Cpts_size,
-                                          const I splitting[], const int splitting_size,
+void block_approx_ideal_restriction_pass2(const I Rp[], const std::ptrdiff_t Rp_size,
+                                                I Rj[], const std::ptrdiff_t Rj_size,
+                                                T Rx[], const std::ptrdiff_t Rx_size,
+                                          const I Ap[], const std::ptrdiff_t Ap_size,
+                                          const I Aj[], const std::ptrdiff_t Aj_size,
+                                          const T Ax[], const std::ptrdiff_t Ax_size,
+                                          const I Cp[], const std::ptrdiff_t Cp_size,
+                                          const I Cj[], const std::ptrdiff_t Cj_size,
+                                          const T Cx[], const std::ptrdiff_t Cx_size,
+                                          const I Cpts[], const std::ptrdiff_t Cpts_size,
+                                          const I splitting[], const std::ptrdiff_t splitting_size,
                                           const I blocksize,
                                           const I distance = 2,
                                           const I use_gmres = 0,
@@ -34,6 +34,8 @@ py::array_t<I> & splitting
     const T *_Cx = py_Cx.data();
     const I *_splitting = py_splitting.data();
 
+    py::gil_scoped_release release;
+
     return one_point_interpolation<I, T>(
                       _Pp, Pp.shape(0),
                       _Pj, Pj.shape(0),
@@ -66,6 +68,8 @@ py::array_t<I> & splitting,
     const I *_Cpts = py_Cpts.data();
     const I *_splitting = py_splitting.data();
 
+    py::gil_scoped_release release;
+
     return approx_ideal_restriction_pass1<I>(
                       _Rp, Rp.shape(0),
                       _Cp, Cp.shape(0),
@@ -118,6 +122,8 @@ py::array_t<I> & splitting,
     const I *_Cpts = py_Cpts.data();
     const I *_splitting = py_splitting.data();
 
+    py::gil_scoped_release release;
+
     return approx_ideal_restriction_pass2<I, T>(
                       _Rp, Rp.shape(0),
                       _Rj, Rj.shape(0),
@@ -180,6 +186,8 @@ py::array_t<I> & splitting,
     const I *_Cpts = py_Cpts.data();
     const I *_splitting = py_splitting.data();
 
+    py::gil_scoped_release release;
+
     return block_approx_ideal_restriction_pass2<I, T>(
                       _Rp, Rp.shape(0),
                       _Rj, Rj.shape(0),
@@ -218,6 +226,10 @@ PYBIND11_MODULE(air, m) {
     m.def("one_point_interpolation", &_one_point_interpolation<int, float>,
         py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("splitting").noconvert());
     m.def("one_point_interpolation", &_one_point_interpolation<int, double>,
+        py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("splitting").noconvert());
+    m.def("one_point_interpolation", &_one_point_interpolation<std::int64_t, float>,
+        py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("splitting").noconvert());
+    m.def("one_point_interpolation", &_one_point_interpolation<std::int64_t, double>,
         py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("splitting").noconvert(),
 R"pbdoc(
 Interpolate C-points and each F-point from its strongest connected C-neighbor.
@@ -243,6 +255,8 @@ None
     Nothing, Rj[] modified in place.)pbdoc");
 
     m.def("approx_ideal_restriction_pass1", &_approx_ideal_restriction_pass1<int>,
+        py::arg("Rp").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"));
+    m.def("approx_ideal_restriction_pass1", &_approx_ideal_restriction_pass1<std::int64_t>,
         py::arg("Rp").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"),
 R"pbdoc(
 Build row_pointer for approximate ideal restriction in CSR or BSR form.
@@ -270,6 +284,10 @@ None
     m.def("approx_ideal_restriction_pass2", &_approx_ideal_restriction_pass2<int, float>,
         py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
     m.def("approx_ideal_restriction_pass2", &_approx_ideal_restriction_pass2<int, double>,
+        py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
+    m.def("approx_ideal_restriction_pass2", &_approx_ideal_restriction_pass2<std::int64_t, float>,
+        py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
+    m.def("approx_ideal_restriction_pass2", &_approx_ideal_restriction_pass2<std::int64_t, double>,
         py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"),
 R"pbdoc(
 Build column indices and data array for approximate ideal restriction in CSR format.
@@ -319,6 +337,10 @@ Rx[] must be passed in initialized to zero.)pbdoc");
     m.def("block_approx_ideal_restriction_pass2", &_block_approx_ideal_restriction_pass2<int, float>,
         py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("blocksize"), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
     m.def("block_approx_ideal_restriction_pass2", &_block_approx_ideal_restriction_pass2<int, double>,
+        py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("blocksize"), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
+    m.def("block_approx_ideal_restriction_pass2", &_block_approx_ideal_restriction_pass2<std::int64_t, float>,
+        py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("blocksize"), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"));
+    m.def("block_approx_ideal_restriction_pass2", &_block_approx_ideal_restriction_pass2<std::int64_t, double>,
         py::arg("Rp").noconvert(), py::arg("Rj").noconvert(), py::arg("Rx").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cp").noconvert(), py::arg("Cj").noconvert(), py::arg("Cx").noconvert(), py::arg("Cpts").noconvert(), py::arg("splitting").noconvert(), py::arg("blocksize"), py::arg("distance"), py::arg("use_gmres"), py::arg("maxiter"), py::arg("precondition"),
 R"pbdoc(
 Build column indices and data array for approximate ideal restriction in BSR format.
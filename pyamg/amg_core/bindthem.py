@@ -78,7 +78,8 @@ def build_function(func):
         - a pointer or array p is followed by int p_size
         - all arrays are templated
         - non arrays are basic types: int, double, complex, etc
-        - all functions are straight up c++
+        - all functions are straight up c++, so the GIL is released
+          while they run
     """
 
     indent = '    '
@@ -157,9 +158,12 @@ def build_function(func):
         fdef += indent
         fdef += a[0] + a[1] + ' *_' + a[2] + ' = py_' + a[2] + data
 
-    # get the template signature
+    # release the GIL for the call, the kernels only touch the raw arrays
     if len(arraylist) > 0:
         fdef += '\n'
+    fdef += indent + 'py::gil_scoped_release release;\n\n'
+
+    # get the template signature
     if func['template']:
         template = func['template']
         template = template.replace('template', '').replace(
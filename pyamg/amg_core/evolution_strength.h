@@ -5,6 +5,7 @@
 #include <algorithm>
 #include <cmath>
 #include <limits>
+#include <vector>
 
 #include "smoothed_aggregation.h"
 
@@ -62,9 +63,9 @@
 template<class I, class T>
 void apply_absolute_distance_filter(const I n_row,
                                     const T epsilon,
-                                    const I Sp[], const int Sp_size,
-                                    const I Sj[], const int Sj_size,
-                                          T Sx[], const int Sx_size)
+                                    const I Sp[], const std::ptrdiff_t Sp_size,
+                                    const I Sj[], const std::ptrdiff_t Sj_size,
+                                          T Sx[], const std::ptrdiff_t Sx_size)
 {
     //Loop over rows
     for(I i = 0; i < n_row; i++)
@@ -140,9 +141,9 @@ void apply_absolute_distance_filter(const I n_row,
 template<class I, class T>
 void apply_distance_filter(const I n_row,
                            const T epsilon,
-                           const I Sp[], const int Sp_size,
-                           const I Sj[], const int Sj_size,
-                                 T Sx[], const int Sx_size)
+                           const I Sp[], const std::ptrdiff_t Sp_size,
+                           const I Sj[], const std::ptrdiff_t Sj_size,
+                                 T Sx[], const std::ptrdiff_t Sx_size)
 {
     //Loop over rows
     for(I i = 0; i < n_row; i++)
@@ -171,6 +172,202 @@ void apply_distance_filter(const I n_row,
     }
 }
 
+/*
+ * Apply the relative drop tolerance of apply_distance_filter to one row of
+ * distances, where zero entries are ignored.
+ */
+template<class I, class T>
+inline void distance_filter_row(const I row_start,
+                                const I row_end,
+                                const T epsilon,
+                                      T Sx[])
+{
+    T min_offdiagonal = std::numeric_limits<T>::max();
+    for(I jj = row_start; jj < row_end; jj++){
+        if(Sx[jj] != 0.0){
+            min_offdiagonal = std::min(min_offdiagonal, Sx[jj]);
+        }
+    }
+
+    const T threshold = epsilon*min_offdiagonal;
+    for(I jj = row_start; jj < row_end; jj++){
+        if(Sx[jj] >= threshold){
+            Sx[jj] = 0.0;
+        }
+    }
+}
+
+/*
+ * Compute filtered algebraic distances at the sparsity pattern of A.
+ *
+ * For each off-diagonal nonzero A[i,j], the algebraic distance between the
+ * test vectors at points i and j is
+ *
+ *     d_ij = ( 1/R sum_r |x[i,r] - x[j,r]|^p )^(1/p),
+ *
+ * or ``max_r |x[i,r] - x[j,r]|`` if p is infinite.  Each row is then filtered
+ * as in apply_distance_filter, i.e., d_ij is kept only if
+ * ``d_ij < epsilon * min_k d_ik``.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Dimension of A.
+ * Ap, Aj, Ax : array
+ *     CSR representation of A.
+ * x : array
+ *     Test vectors, (n_row x R) in row-major ordering.
+ * R : int
+ *     Number of test vectors.
+ * p : float
+ *     The p-norm of the measure, may be infinite.
+ * epsilon : float
+ *     Drop tolerance.
+ * Sx : array
+ *     Output array of distances, same length as Ax.
+ *
+ * Returns
+ * -------
+ * None
+ *     Sx is modified in place.  Diagonal entries, explicit zeros of A, zero
+ *     distances, and weak connections are set to zero.
+ *
+ * See Also
+ * --------
+ * algebraic_distance
+ *
+ */
+template<class I, class T>
+void algebraic_distance_csr(const I n_row,
+                            const I Ap[], const std::ptrdiff_t Ap_size,
+                            const I Aj[], const std::ptrdiff_t Aj_size,
+                            const T Ax[], const std::ptrdiff_t Ax_size,
+                            const T  x[], const std::ptrdiff_t  x_size,
+                            const I R,
+                            const T p,
+                            const T epsilon,
+                                  T Sx[], const std::ptrdiff_t Sx_size)
+{
+    const bool pinf = std::isinf(p);
+
+    for(I i = 0; i < n_row; i++){
+        const T * xi = x + (std::size_t) i*R;
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            Sx[jj] = 0.0;
+            if(i == j || Ax[jj] == 0.0){
+                continue;
+            }
+
+            const T * xj = x + (std::size_t) j*R;
+            T d = 0.0;
+            if(pinf){
+                for(I r = 0; r < R; r++){
+                    d = std::max(d, std::abs(xi[r] - xj[r]));
+                }
+            }
+            else if(p == 2){
+                for(I r = 0; r < R; r++){
+                    d += (xi[r] - xj[r])*(xi[r] - xj[r]);
+                }
+                d = std::sqrt(d / R);
+            }
+            else if(p == 1){
+                for(I r = 0; r < R; r++){
+                    d += std::abs(xi[r] - xj[r]);
+                }
+                d = d / R;
+            }
+            else{
+                for(I r = 0; r < R; r++){
+                    d += std::pow(std::abs(xi[r] - xj[r]), p);
+                }
+                d = std::pow(d / R, 1 / p);
+            }
+            Sx[jj] = d;
+        }
+
+        distance_filter_row(Ap[i], Ap[i+1], epsilon, Sx);
+    }
+}
+
+/*
+ * Compute filtered affinity distances at the sparsity pattern of A.
+ *
+ * For each off-diagonal nonzero A[i,j], the affinity distance between the
+ * test vectors at points i and j is
+ *
+ *     d_ij = 1 - (x_i . x_j)^2 / ((x_i . x_i) (x_j . x_j)),
+ *
+ * where x_i is row i of the test vectors.  Each row is then filtered as in
+ * apply_distance_filter, i.e., d_ij is kept only if
+ * ``d_ij < epsilon * min_k d_ik``.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Dimension of A.
+ * Ap, Aj, Ax : array
+ *     CSR representation of A.
+ * x : array
+ *     Test vectors, (n_row x R) in row-major ordering.
+ * R : int
+ *     Number of test vectors.
+ * epsilon : float
+ *     Drop tolerance.
+ * Sx : array
+ *     Output array of distances, same length as Ax.
+ *
+ * Returns
+ * -------
+ * None
+ *     Sx is modified in place.  Diagonal entries, explicit zeros of A, zero
+ *     distances, and weak connections are set to zero.
+ *
+ * See Also
+ * --------
+ * affinity_distance
+ *
+ */
+template<class I, class T>
+void affinity_distance_csr(const I n_row,
+                           const I Ap[], const std::ptrdiff_t Ap_size,
+                           const I Aj[], const std::ptrdiff_t Aj_size,
+                           const T Ax[], const std::ptrdiff_t Ax_size,
+                           const T  x[], const std::ptrdiff_t  x_size,
+                           const I R,
+                           const T epsilon,
+                                 T Sx[], const std::ptrdiff_t Sx_size)
+{
+    for(I i = 0; i < n_row; i++){
+        const T * xi = x + (std::size_t) i*R;
+        T xixi = 0.0;
+        for(I r = 0; r < R; r++){
+            xixi += xi[r]*xi[r];
+        }
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            Sx[jj] = 0.0;
+            if(i == j || Ax[jj] == 0.0){
+                continue;
+            }
+
+            const T * xj = x + (std::size_t) j*R;
+            T xixj = 0.0;
+            T xjxj = 0.0;
+            for(I r = 0; r < R; r++){
+                xixj += xi[r]*xj[r];
+                xjxj += xj[r]*xj[r];
+            }
+            Sx[jj] = 1 - (xixj*xixj) / (xixi*xjxj);
+        }
+
+        distance_filter_row(Ap[i], Ap[i+1], epsilon, Sx);
+    }
+}
+
 /*
  * Find the size of the smallest entry in each block.
  *
@@ -220,8 +417,8 @@ void apply_distance_filter(const I n_row,
 template<class I, class T>
 void min_blocks(const I n_blocks,
                 const I blocksize,
-                const T Sx[], const int Sx_size,
-                      T Tx[], const int Tx_size)
+                const T Sx[], const std::ptrdiff_t Sx_size,
+                      T Tx[], const std::ptrdiff_t Tx_size)
 {
     const T * block = Sx;
 
@@ -327,13 +524,13 @@ void min_blocks(const I n_blocks,
  *
  */
 template<class I, class T, class F>
-void evolution_strength_helper(      T Sx[], const int Sx_size,
-                               const I Sp[], const int Sp_size,
-                               const I Sj[], const int Sj_size,
+void evolution_strength_helper(      T Sx[], const std::ptrdiff_t Sx_size,
+                               const I Sp[], const std::ptrdiff_t Sp_size,
+                               const I Sj[], const std::ptrdiff_t Sj_size,
                                const I nrows,
-                               const T x[], const int x_size,
-                               const T y[], const int y_size,
-                               const T b[], const int b_size,
+                               const T x[], const std::ptrdiff_t x_size,
+                               const T y[], const std::ptrdiff_t y_size,
+                               const T b[], const std::ptrdiff_t b_size,
                                const I BDBCols,
                                const I NullDim,
                                const F tol)
@@ -458,8 +655,8 @@ void evolution_strength_helper(      T Sx[], const int Sx_size,
         //Write first NullDim Entries of RHS
         //  Bi^H*D_A*z ==> RHS
         gemm( DBi, NullDim, length, 'F',
-                z, length,       1, 'F',
-              RHS, NullDim,      1, 'F',
+                z, length,    (I)1, 'F',
+              RHS, NullDim,   (I)1, 'F',
               'T');
         //Double the first NullDim entries in RHS
         for(I j = 0; j < NullDim; j++)
@@ -472,8 +669,8 @@ void evolution_strength_helper(      T Sx[], const int Sx_size,
 
         //Find best approximation to z in span(Bi), Bi*RHS[0:NullDim] ==> zhat
         gemm(  Bi,   length, NullDim, 'F',
-              RHS,  NullDim,       1, 'F',
-             zhat,   length,       1, 'F',
+              RHS,  NullDim,    (I)1, 'F',
+             zhat,   length,    (I)1, 'F',
               'T');
 
         //Need to filter out numerically zero values in zhat, because the sign of each
@@ -686,15 +883,15 @@ T my_inner(const I Ap[], const I Aj[], const T Ax[],
  *
  */
 template<class I, class T, class F>
-void incomplete_mat_mult_csr(const I Ap[], const int Ap_size,
-                             const I Aj[], const int Aj_size,
-                             const T Ax[], const int Ax_size,
-                             const I Bp[], const int Bp_size,
-                             const I Bj[], const int Bj_size,
-                             const T Bx[], const int Bx_size,
-                             const I Sp[], const int Sp_size,
-                             const I Sj[], const int Sj_size,
-                                   T Sx[], const int Sx_size,
+void incomplete_mat_mult_csr(const I Ap[], const std::ptrdiff_t Ap_size,
+                             const I Aj[], const std::ptrdiff_t Aj_size,
+                             const T Ax[], const std::ptrdiff_t Ax_size,
+                             const I Bp[], const std::ptrdiff_t Bp_size,
+                             const I Bj[], const std::ptrdiff_t Bj_size,
+                             const T Bx[], const std::ptrdiff_t Bx_size,
+                             const I Sp[], const std::ptrdiff_t Sp_size,
+                             const I Sj[], const std::ptrdiff_t Sj_size,
+                                   T Sx[], const std::ptrdiff_t Sx_size,
                              const I num_rows)
 {
     for(I row = 0; row < num_rows; row++)
@@ -711,4 +908,165 @@ void incomplete_mat_mult_csr(const I Ap[], const int Ap_size,
     }
 }
 
+/*
+ * Compute energy-based strength-of-connection values at the sparsity
+ * pattern of A.
+ *
+ * For each row i, the i-th column of an approximate inverse of A is
+ * formed with k+1 steps of weighted Jacobi applied to the unit vector e_i
+ * (zero initial guess),
+ *
+ *     v <- v + omega D^{-1} (e_i - A v),
+ *
+ * touching only the local neighborhood of i.  With ``E = <v, v>_A`` and
+ * ``v_j`` equal to v with entry j zeroed, the energy of each ``v_j`` follows
+ * from a rank-one update of E,
+ *
+ *     <v_j, v_j>_A = E - conj(v_j) (A v)_j - conj((A^H v)_j) v_j + |v_j|^2 A_jj,
+ *
+ * and the strength value for A[i,j] is ``sqrt(<v_j, v_j>_A / E) - 1``.
+ * Values below -0.01 are considered weak and set to zero, otherwise the
+ * absolute value is stored.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Dimension of A.
+ * Ap, Aj, Ax : array
+ *     CSR representation of A.
+ * AHp, AHj, AHx : array
+ *     CSR representation of the conjugate transpose of A.
+ * omega : float
+ *     Weighted-Jacobi parameter.
+ * k : int
+ *     Number of relaxation steps is k+1.
+ * Sx : array
+ *     Output array of strength values, same length as Ax.
+ *
+ * Returns
+ * -------
+ * Nothing, Sx is modified in place.
+ *
+ * See Also
+ * --------
+ * energy_based_strength_of_connection
+ *
+ * Notes
+ * -----
+ * The cost per row is proportional to the number of nonzeros of A in the
+ * (k+1)-neighborhood of the row, instead of a global matrix-vector product
+ * per nonzero.
+ *
+ */
+template<class I, class T, class F>
+void energy_based_strength_helper(const I n_row,
+                                  const I Ap[], const std::ptrdiff_t Ap_size,
+                                  const I Aj[], const std::ptrdiff_t Aj_size,
+                                  const T Ax[], const std::ptrdiff_t Ax_size,
+                                  const I AHp[], const std::ptrdiff_t AHp_size,
+                                  const I AHj[], const std::ptrdiff_t AHj_size,
+                                  const T AHx[], const std::ptrdiff_t AHx_size,
+                                  const F omega,
+                                  const I k,
+                                        F Sx[], const std::ptrdiff_t Sx_size)
+{
+    const T zero = 0.0;
+
+    // diagonal and weighted inverse diagonal of A
+    std::vector<T> diag(n_row, zero);
+    std::vector<T> wDinv(n_row, zero);
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] == i){ diag[i] += Ax[jj]; }
+        }
+        if(diag[i] != zero){ wDinv[i] = ((T) omega)/diag[i]; }
+    }
+
+    std::vector<T> v(n_row, zero);      // local column of the approximate inverse
+    std::vector<T> y(n_row, zero);      // next Jacobi iterate
+    std::vector<I> mark(n_row, -1);     // mark[r] == i if r is in the support
+    std::vector<I> supp;                // support of v (and candidates)
+
+    for(I i = 0; i < n_row; i++){
+        supp.clear();
+        supp.push_back(i);
+        mark[i] = i;
+
+        for(I step = 0; step <= k; step++){
+            // grow the support by the rows coupled to the current support
+            if(step > 0){
+                const std::size_t nsupp = supp.size();
+                for(std::size_t s = 0; s < nsupp; s++){
+                    const I c = supp[s];
+                    for(I jj = AHp[c]; jj < AHp[c+1]; jj++){
+                        const I r = AHj[jj];
+                        if(mark[r] != i){
+                            mark[r] = i;
+                            supp.push_back(r);
+                        }
+                    }
+                }
+            }
+
+            // one weighted-Jacobi step on the support
+            for(std::size_t s = 0; s < supp.size(); s++){
+                const I r = supp[s];
+                T Av = zero;
+                for(I jj = Ap[r]; jj < Ap[r+1]; jj++){
+                    Av += Ax[jj]*v[Aj[jj]];
+                }
+                T e = (r == i) ? 1.0 : 0.0;
+                y[r] = v[r] + wDinv[r]*(e - Av);
+            }
+            for(std::size_t s = 0; s < supp.size(); s++){
+                v[supp[s]] = y[supp[s]];
+            }
+        }
+
+        // A v on the support, and the energy E = <v, v>_A
+        T E = zero;
+        for(std::size_t s = 0; s < supp.size(); s++){
+            const I r = supp[s];
+            T Av = zero;
+            for(I jj = Ap[r]; jj < Ap[r+1]; jj++){
+                Av += Ax[jj]*v[Aj[jj]];
+            }
+            y[r] = Av;
+            E += conjugate(v[r])*Av;
+        }
+        const F denom = real(E);
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            Sx[jj] = 0.0;
+            if(mark[j] != i || v[j] == zero || denom <= 0.0){
+                // v_j = v, so there is no change in energy
+                continue;
+            }
+
+            T AHv = zero;
+            for(I kk = AHp[j]; kk < AHp[j+1]; kk++){
+                AHv += AHx[kk]*v[AHj[kk]];
+            }
+            const F Ej = real(E - conjugate(v[j])*y[j] - conjugate(AHv)*v[j]
+                              + conjugate(v[j])*v[j]*diag[j]);
+            if(Ej < 0.0){
+                continue;
+            }
+
+            const F val = std::sqrt(Ej/denom) - 1.0;
+            // Negative values generally imply a weak connection
+            if(val > -0.01){
+                Sx[jj] = std::abs(val);
+            }
+        }
+
+        // reset the work arrays on the support
+        for(std::size_t s = 0; s < supp.size(); s++){
+            v[supp[s]] = zero;
+            y[supp[s]] = zero;
+        }
+    }
+}
+
 #endif
@@ -24,6 +24,8 @@ void _apply_absolute_distance_filter(
     const I *_Sj = py_Sj.data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return apply_absolute_distance_filter<I, T>(
                     n_row,
                   epsilon,
@@ -49,6 +51,8 @@ void _apply_distance_filter(
     const I *_Sj = py_Sj.data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return apply_distance_filter<I, T>(
                     n_row,
                   epsilon,
@@ -58,6 +62,82 @@ void _apply_distance_filter(
                                        );
 }
 
+template<class I, class T>
+void _algebraic_distance_csr(
+            const I n_row,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & x,
+                const I R,
+                const T p,
+          const T epsilon,
+      py::array_t<T> & Sx
+                             )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.unchecked();
+    auto py_Sx = Sx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const T *_x = py_x.data();
+    T *_Sx = py_Sx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return algebraic_distance_csr<I, T>(
+                    n_row,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _x, x.shape(0),
+                        R,
+                        p,
+                  epsilon,
+                      _Sx, Sx.shape(0)
+                                        );
+}
+
+template<class I, class T>
+void _affinity_distance_csr(
+            const I n_row,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & x,
+                const I R,
+          const T epsilon,
+      py::array_t<T> & Sx
+                            )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.unchecked();
+    auto py_Sx = Sx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const T *_x = py_x.data();
+    T *_Sx = py_Sx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return affinity_distance_csr<I, T>(
+                    n_row,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _x, x.shape(0),
+                        R,
+                  epsilon,
+                      _Sx, Sx.shape(0)
+                                       );
+}
+
 template<class I, class T>
 void _min_blocks(
          const I n_blocks,
@@ -71,6 +151,8 @@ void _min_blocks(
     const T *_Sx = py_Sx.data();
     T *_Tx = py_Tx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return min_blocks<I, T>(
                  n_blocks,
                 blocksize,
@@ -106,6 +188,8 @@ void _evolution_strength_helper(
     const T *_y = py_y.data();
     const T *_b = py_b.data();
 
+    py::gil_scoped_release release;
+
     return evolution_strength_helper<I, T, F>(
                       _Sx, Sx.shape(0),
                       _Sp, Sp.shape(0),
@@ -153,6 +237,8 @@ void _incomplete_mat_mult_csr(
     const I *_Sj = py_Sj.data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return incomplete_mat_mult_csr<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -167,6 +253,51 @@ void _incomplete_mat_mult_csr(
                                             );
 }
 
+template<class I, class T, class F>
+void _energy_based_strength_helper(
+            const I n_row,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+     py::array_t<I> & AHp,
+     py::array_t<I> & AHj,
+     py::array_t<T> & AHx,
+            const F omega,
+                const I k,
+      py::array_t<F> & Sx
+                                   )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_AHp = AHp.unchecked();
+    auto py_AHj = AHj.unchecked();
+    auto py_AHx = AHx.unchecked();
+    auto py_Sx = Sx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_AHp = py_AHp.data();
+    const I *_AHj = py_AHj.data();
+    const T *_AHx = py_AHx.data();
+    F *_Sx = py_Sx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return energy_based_strength_helper<I, T, F>(
+                    n_row,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                     _AHp, AHp.shape(0),
+                     _AHj, AHj.shape(0),
+                     _AHx, AHx.shape(0),
+                    omega,
+                        k,
+                      _Sx, Sx.shape(0)
+                                                 );
+}
+
 PYBIND11_MODULE(evolution_strength, m) {
     m.doc() = R"pbdoc(
     Pybind11 bindings for evolution_strength.h
@@ -175,9 +306,12 @@ PYBIND11_MODULE(evolution_strength, m) {
     -------
     apply_absolute_distance_filter
     apply_distance_filter
+    algebraic_distance_csr
+    affinity_distance_csr
     min_blocks
     evolution_strength_helper
     incomplete_mat_mult_csr
+    energy_based_strength_helper
     )pbdoc";
 
     py::options options;
@@ -186,6 +320,10 @@ PYBIND11_MODULE(evolution_strength, m) {
     m.def("apply_absolute_distance_filter", &_apply_absolute_distance_filter<int, float>,
         py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("apply_absolute_distance_filter", &_apply_absolute_distance_filter<int, double>,
+        py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("apply_absolute_distance_filter", &_apply_absolute_distance_filter<std::int64_t, float>,
+        py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("apply_absolute_distance_filter", &_apply_absolute_distance_filter<std::int64_t, double>,
         py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Return a filtered strength-of-connection matrix by applying a drop tolerance.
@@ -240,6 +378,10 @@ Examples
     m.def("apply_distance_filter", &_apply_distance_filter<int, float>,
         py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("apply_distance_filter", &_apply_distance_filter<int, double>,
+        py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("apply_distance_filter", &_apply_distance_filter<std::int64_t, float>,
+        py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("apply_distance_filter", &_apply_distance_filter<std::int64_t, double>,
         py::arg("n_row"), py::arg("epsilon"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Return a filtered strength-of-connection matrix by applying a drop tolerance.
@@ -292,9 +434,105 @@ Examples
 >>> apply_distance_filter(3, 1.9, S.indptr, S.indices, S.data)
 >>> print "Matrix after Applying Filter\n" + str(S.todense()))pbdoc");
 
+    m.def("algebraic_distance_csr", &_algebraic_distance_csr<int, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("p"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("algebraic_distance_csr", &_algebraic_distance_csr<int, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("p"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("algebraic_distance_csr", &_algebraic_distance_csr<std::int64_t, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("p"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("algebraic_distance_csr", &_algebraic_distance_csr<std::int64_t, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("p"), py::arg("epsilon"), py::arg("Sx").noconvert(),
+R"pbdoc(
+Compute filtered algebraic distances at the sparsity pattern of A.
+
+For each off-diagonal nonzero A[i,j], the algebraic distance between the
+test vectors at points i and j is
+
+    d_ij = ( 1/R sum_r |x[i,r] - x[j,r]|^p )^(1/p),
+
+or ``max_r |x[i,r] - x[j,r]|`` if p is infinite.  Each row is then filtered
+as in apply_distance_filter, i.e., d_ij is kept only if
+``d_ij < epsilon * min_k d_ik``.
+
+Parameters
+----------
+n_row : int
+    Dimension of A.
+Ap, Aj, Ax : array
+    CSR representation of A.
+x : array
+    Test vectors, (n_row x R) in row-major ordering.
+R : int
+    Number of test vectors.
+p : float
+    The p-norm of the measure, may be infinite.
+epsilon : float
+    Drop tolerance.
+Sx : array
+    Output array of distances, same length as Ax.
+
+Returns
+-------
+None
+    Sx is modified in place.  Diagonal entries, explicit zeros of A, zero
+    distances, and weak connections are set to zero.
+
+See Also
+--------
+algebraic_distance)pbdoc");
+
+    m.def("affinity_distance_csr", &_affinity_distance_csr<int, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("affinity_distance_csr", &_affinity_distance_csr<int, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("affinity_distance_csr", &_affinity_distance_csr<std::int64_t, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("epsilon"), py::arg("Sx").noconvert());
+    m.def("affinity_distance_csr", &_affinity_distance_csr<std::int64_t, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("R"), py::arg("epsilon"), py::arg("Sx").noconvert(),
+R"pbdoc(
+Compute filtered affinity distances at the sparsity pattern of A.
+
+For each off-diagonal nonzero A[i,j], the affinity distance between the
+test vectors at points i and j is
+
+    d_ij = 1 - (x_i . x_j)^2 / ((x_i . x_i) (x_j . x_j)),
+
+where x_i is row i of the test vectors.  Each row is then filtered as in
+apply_distance_filter, i.e., d_ij is kept only if
+``d_ij < epsilon * min_k d_ik``.
+
+Parameters
+----------
+n_row : int
+    Dimension of A.
+Ap, Aj, Ax : array
+    CSR representation of A.
+x : array
+    Test vectors, (n_row x R) in row-major ordering.
+R : int
+    Number of test vectors.
+epsilon : float
+    Drop tolerance.
+Sx : array
+    Output array of distances, same length as Ax.
+
+Returns
+-------
+None
+    Sx is modified in place.  Diagonal entries, explicit zeros of A, zero
+    distances, and weak connections are set to zero.
+
+See Also
+--------
+affinity_distance)pbdoc");
+
     m.def("min_blocks", &_min_blocks<int, float>,
         py::arg("n_blocks"), py::arg("blocksize"), py::arg("Sx").noconvert(), py::arg("Tx").noconvert());
     m.def("min_blocks", &_min_blocks<int, double>,
+        py::arg("n_blocks"), py::arg("blocksize"), py::arg("Sx").noconvert(), py::arg("Tx").noconvert());
+    m.def("min_blocks", &_min_blocks<std::int64_t, float>,
+        py::arg("n_blocks"), py::arg("blocksize"), py::arg("Sx").noconvert(), py::arg("Tx").noconvert());
+    m.def("min_blocks", &_min_blocks<std::int64_t, double>,
         py::arg("n_blocks"), py::arg("blocksize"), py::arg("Sx").noconvert(), py::arg("Tx").noconvert(),
 R"pbdoc(
 Find the size of the smallest entry in each block.
@@ -348,6 +586,14 @@ Examples
     m.def("evolution_strength_helper", &_evolution_strength_helper<int, std::complex<float>, float>,
         py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"));
     m.def("evolution_strength_helper", &_evolution_strength_helper<int, std::complex<double>, double>,
+        py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"));
+    m.def("evolution_strength_helper", &_evolution_strength_helper<std::int64_t, float, float>,
+        py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"));
+    m.def("evolution_strength_helper", &_evolution_strength_helper<std::int64_t, double, double>,
+        py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"));
+    m.def("evolution_strength_helper", &_evolution_strength_helper<std::int64_t, std::complex<float>, float>,
+        py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"));
+    m.def("evolution_strength_helper", &_evolution_strength_helper<std::int64_t, std::complex<double>, double>,
         py::arg("Sx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("nrows"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("b").noconvert(), py::arg("BDBCols"), py::arg("NullDim"), py::arg("tol"),
 R"pbdoc(
 Create strength-of-connection matrix based on constrained min problem.
@@ -436,6 +682,14 @@ of multiple near-nullspace modes.)pbdoc");
     m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"));
     m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"));
+    m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"));
+    m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"));
+    m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"));
+    m.def("incomplete_mat_mult_csr", &_incomplete_mat_mult_csr<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("num_rows"),
 R"pbdoc(
 Calculate A*B = S, but only at a pre-existing sparsity.
@@ -506,5 +760,70 @@ Examples
 >>> print "Incomplete Matrix-Matrix Multiplication\n" + str(AB.todense())
 >>> print "Complete Matrix-Matrix Multiplication\n" + str((A*B).todense()))pbdoc");
 
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<int, float, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<int, double, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<int, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert());
+    m.def("energy_based_strength_helper", &_energy_based_strength_helper<std::int64_t, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("AHp").noconvert(), py::arg("AHj").noconvert(), py::arg("AHx").noconvert(), py::arg("omega"), py::arg("k"), py::arg("Sx").noconvert(),
+R"pbdoc(
+Compute energy-based strength-of-connection values at the sparsity
+pattern of A.
+
+For each row i, the i-th column of an approximate inverse of A is
+formed with k+1 steps of weighted Jacobi applied to the unit vector e_i
+(zero initial guess),
+
+    v <- v + omega D^{-1} (e_i - A v),
+
+touching only the local neighborhood of i.  With ``E = <v, v>_A`` and
+``v_j`` equal to v with entry j zeroed, the energy of each ``v_j`` follows
+from a rank-one update of E,
+
+    <v_j, v_j>_A = E - conj(v_j) (A v)_j - conj((A^H v)_j) v_j + |v_j|^2 A_jj,
+
+and the strength value for A[i,j] is ``sqrt(<v_j, v_j>_A / E) - 1``.
+Values below -0.01 are considered weak and set to zero, otherwise the
+absolute value is stored.
+
+Parameters
+----------
+n_row : int
+    Dimension of A.
+Ap, Aj, Ax : array
+    CSR representation of A.
+AHp, AHj, AHx : array
+    CSR representation of the conjugate transpose of A.
+omega : float
+    Weighted-Jacobi parameter.
+k : int
+    Number of relaxation steps is k+1.
+Sx : array
+    Output array of strength values, same length as Ax.
+
+Returns
+-------
+Nothing, Sx is modified in place.
+
+See Also
+--------
+energy_based_strength_of_connection
+
+Notes
+-----
+The cost per row is proportional to the number of nonzeros of A in the
+(k+1)-neighborhood of the row, instead of a global matrix-vector product
+per nonzero.)pbdoc");
+
 }
 
@@ -5,8 +5,14 @@
 #include <stack>
 #include <cassert>
 #include <limits>
+#include <cstddef>
 #include <vector>
 #include <iostream>
+#include <queue>
+#include <functional>
+#include <random>
+#include <cmath>
+#include <cstdint>
 
 // Usage
 // printv(d, d_size, "d");
@@ -69,12 +75,12 @@ inline void coreassert(const bool istrue, const std::string &errormsg){
  */
 template<class I, class T>
 I maximal_independent_set_serial(const I num_rows,
-                                 const I Ap[], const int Ap_size,
-                                 const I Aj[], const int Aj_size,
+                                 const I Ap[], const std::ptrdiff_t Ap_size,
+                                 const I Aj[], const std::ptrdiff_t Aj_size,
                                  const T active,
                                  const T  C,
                                  const T  F,
-                                       T  x[], const int  x_size)
+                                       T  x[], const std::ptrdiff_t  x_size)
 {
     I N = 0;
 
@@ -96,6 +102,55 @@ I maximal_independent_set_serial(const I num_rows,
     return N;
 }
 
+/*
+ * Counter-based uniform random number in [0, 1).
+ *
+ * The value is a hash (the splitmix64 finalizer) of the seed and the index
+ * i, so that it does not depend on the order in which the values are drawn.
+ */
+inline double counter_uniform(const std::uint64_t seed, const std::uint64_t i)
+{
+    std::uint64_t z = seed * 0xD1342543DE82EF95ULL + (i + 1) * 0x9E3779B97F4A7C15ULL;
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    z = z ^ (z >> 31);
+    return (double)(z >> 11) / 9007199254740992.0;  // 2^53
+}
+
+/*
+ * Counter-based random weights.
+ *
+ * Parameters
+ * ----------
+ * n : int
+ *     Number of weights.
+ * seed : int
+ *     Random seed.
+ * x : array, inplace
+ *     Uniform random weights in [0, 1).
+ *
+ * Returns
+ * -------
+ * None
+ *     x is modified in place.
+ *
+ * Notes
+ * -----
+ * Weight i depends only on seed and i, so that the weights of a subset of
+ * the vertices (or of a partition of the vertices) are the same as when
+ * drawn for all vertices at once.
+ *
+ */
+template<class I, class T>
+void counter_based_uniform(const I n,
+                           const I seed,
+                                 T x[], const std::ptrdiff_t x_size)
+{
+    for(I i = 0; i < n; i++){
+        x[i] = (T)counter_uniform((std::uint64_t)seed, (std::uint64_t)i);
+    }
+}
+
 /*
  * Parallel maximal independent set.
  *
@@ -135,16 +190,20 @@ I maximal_independent_set_serial(const I num_rows,
  * be assigned the value C or F depending on whether they are in the
  * MIS or not.
  *
+ * Without a limit on the iterations, the MIS is the greedy MIS in order of
+ * decreasing y (ties broken by index), independent of the order in which
+ * the vertices are visited.
+ *
  */
 template<class I, class T, class R>
 I maximal_independent_set_parallel(const I num_rows,
-                                   const I Ap[], const int Ap_size,
-                                   const I Aj[], const int Aj_size,
+                                   const I Ap[], const std::ptrdiff_t Ap_size,
+                                   const I Aj[], const std::ptrdiff_t Aj_size,
                                    const T active,
                                    const T  C,
                                    const T  F,
-                                         T  x[], const int  x_size,
-                                   const R  y[], const int  y_size,
+                                         T  x[], const std::ptrdiff_t  x_size,
+                                   const R  y[], const std::ptrdiff_t  y_size,
                                    const I  max_iters)
 {
     I N = 0;
@@ -217,9 +276,9 @@ I maximal_independent_set_parallel(const I num_rows,
  */
 template<class I, class T>
 T vertex_coloring_mis(const I num_rows,
-                      const I Ap[], const int Ap_size,
-                      const I Aj[], const int Aj_size,
-                            T  x[], const int  x_size)
+                      const I Ap[], const std::ptrdiff_t Ap_size,
+                      const I Aj[], const std::ptrdiff_t Aj_size,
+                            T  x[], const std::ptrdiff_t  x_size)
 {
     std::fill( x, x + num_rows, -1);
 
@@ -246,9 +305,9 @@ T vertex_coloring_mis(const I num_rows,
  */
 template<class I, class T>
 void vertex_coloring_first_fit(const I num_rows,
-                               const I Ap[], const int Ap_size,
-                               const I Aj[], const int Aj_size,
-                                     T  x[], const int  x_size,
+                               const I Ap[], const std::ptrdiff_t Ap_size,
+                               const I Aj[], const std::ptrdiff_t Aj_size,
+                                     T  x[], const std::ptrdiff_t  x_size,
                                const T  K)
 {
     for(I i = 0; i < num_rows; i++){
@@ -295,10 +354,10 @@ void vertex_coloring_first_fit(const I num_rows,
  */
 template<class I, class T, class R>
 T vertex_coloring_jones_plassmann(const I num_rows,
-                                  const I Ap[], const int Ap_size,
-                                  const I Aj[], const int Aj_size,
-                                        T  x[], const int  x_size,
-                                        R  z[], const int  z_size)
+                                  const I Ap[], const std::ptrdiff_t Ap_size,
+                                  const I Aj[], const std::ptrdiff_t Aj_size,
+                                        T  x[], const std::ptrdiff_t  x_size,
+                                        R  z[], const std::ptrdiff_t  z_size)
 {
     std::fill( x, x + num_rows, -1);
 
@@ -310,7 +369,7 @@ T vertex_coloring_jones_plassmann(const I num_rows,
     T K = 0; //iteration number
 
     while(N < num_rows){
-        N += maximal_independent_set_parallel(num_rows,Ap,Ap_size,Aj,Aj_size,-1,K,-2,x,x_size,z,z_size,1);
+        N += maximal_independent_set_parallel(num_rows,Ap,Ap_size,Aj,Aj_size,(T)-1,K,(T)-2,x,x_size,z,z_size,(I)1);
         for(I i = 0; i < num_rows; i++){
             if(x[i] == -2)
                 x[i] = -1;
@@ -349,10 +408,10 @@ T vertex_coloring_jones_plassmann(const I num_rows,
  */
 template<class I, class T, class R>
 T vertex_coloring_LDF(const I num_rows,
-                      const I Ap[], const int Ap_size,
-                      const I Aj[], const int Aj_size,
-                            T  x[], const int  x_size,
-                      const R  y[], const int  y_size)
+                      const I Ap[], const std::ptrdiff_t Ap_size,
+                      const I Aj[], const std::ptrdiff_t Aj_size,
+                            T  x[], const std::ptrdiff_t  x_size,
+                      const R  y[], const std::ptrdiff_t  y_size)
 {
     std::fill( x, x + num_rows, -1);
 
@@ -374,7 +433,7 @@ T vertex_coloring_LDF(const I num_rows,
             weights[i] = y[i] + num_neighbors;
         }
 
-        N += maximal_independent_set_parallel(num_rows,Ap,Ap_size,Aj,Aj_size,-1,K,-2,x,x_size,&weights[0],num_rows,1);
+        N += maximal_independent_set_parallel(num_rows,Ap,Ap_size,Aj,Aj_size,(T)-1,K,(T)-2,x,x_size,&weights[0],num_rows,(I)1);
         for(I i = 0; i < num_rows; i++){
             if(x[i] == -2)
                 x[i] = -1;
@@ -434,14 +493,14 @@ T vertex_coloring_LDF(const I num_rows,
  */
 template<class I, class T>
 void floyd_warshall(const I num_nodes,
-                    const I Ap[], const int Ap_size,
-                    const I Aj[], const int Aj_size,
-                    const T Ax[], const int Ax_size,
-                          T D[],  const int D_size,
-                          I P[],  const int P_size,
-                    const I C[],  const int C_size,
-                    const I L[],  const int L_size,
-                    const I m[], const int m_size,
+                    const I Ap[], const std::ptrdiff_t Ap_size,
+                    const I Aj[], const std::ptrdiff_t Aj_size,
+                    const T Ax[], const std::ptrdiff_t Ax_size,
+                          T D[],  const std::ptrdiff_t D_size,
+                          I P[],  const std::ptrdiff_t P_size,
+                    const I C[],  const std::ptrdiff_t C_size,
+                    const I L[],  const std::ptrdiff_t L_size,
+                    const I m[], const std::ptrdiff_t m_size,
                     const I a,
                     const I N
                     )
@@ -528,21 +587,21 @@ void floyd_warshall(const I num_nodes,
 // - N is the cluster size
 template<class I, class T>
 bool center_nodes(const I num_nodes,
-                  const I Ap[], const int Ap_size,
-                  const I Aj[], const int Aj_size,
-                  const T Ax[], const int Ax_size,
-                      I Cptr[], const int Cptr_size,// to set up FW
-                         T D[],  const int D_size,  // for FW
-                         I P[],  const int P_size,  // for FW
-                         I C[],  const int C_size,  // for FW
-                         I L[],  const int L_size,  // for FW
-                         T q[],  const int q_size,  // to hold D**2
-                         I c[],  const int c_size,  // from BF
-                         T d[],  const int d_size,  // from BF
-                         I m[],  const int m_size,  // from BF
-                         I p[],  const int p_size,  // from BF
-                         I pc[], const int pc_size, // from BF
-                         I s[],  const int s_size)  // from BF
+                  const I Ap[], const std::ptrdiff_t Ap_size,
+                  const I Aj[], const std::ptrdiff_t Aj_size,
+                  const T Ax[], const std::ptrdiff_t Ax_size,
+                      I Cptr[], const std::ptrdiff_t Cptr_size,// to set up FW
+                         T D[],  const std::ptrdiff_t D_size,  // for FW
+                         I P[],  const std::ptrdiff_t P_size,  // for FW
+                         I C[],  const std::ptrdiff_t C_size,  // for FW
+                         I L[],  const std::ptrdiff_t L_size,  // for FW
+                         T q[],  const std::ptrdiff_t q_size,  // to hold D**2
+                         I c[],  const std::ptrdiff_t c_size,  // from BF
+                         T d[],  const std::ptrdiff_t d_size,  // from BF
+                         I m[],  const std::ptrdiff_t m_size,  // from BF
+                         I p[],  const std::ptrdiff_t p_size,  // from BF
+                         I pc[], const std::ptrdiff_t pc_size, // from BF
+                         I s[],  const std::ptrdiff_t s_size)  // from BF
 {
   I num_clusters = c_size;
   bool changed = false; // return a change on d or p
@@ -625,6 +684,437 @@ bool center_nodes(const I num_nodes,
   return changed;
 }
 
+/*
+ * Shortest distances from a source to the nodes of its own cluster.
+ *
+ * dist must be infinite on the cluster on entry; the nodes reached are
+ * appended to visited, in order of increasing distance, so that the caller
+ * can reset dist.
+ */
+template<class I, class T>
+void cluster_dijkstra(const I Ap[], const I Aj[], const T Ax[],
+                      const I m[], const I source,
+                      T dist[], I pred[],
+                      std::vector<I>& visited)
+{
+  typedef std::pair<T,I> entry;
+  std::priority_queue<entry, std::vector<entry>, std::greater<entry> > heap;
+  const I a = m[source];
+
+  dist[source] = 0;
+  pred[source] = source;
+  heap.push(entry(0, source));
+
+  while(!heap.empty()){
+    const T di = heap.top().first;
+    const I i = heap.top().second;
+    heap.pop();
+    if(di > dist[i]){           // stale entry
+      continue;
+    }
+    visited.push_back(i);
+    for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+      const I j = Aj[jj];
+      if(m[j] != a){
+        continue;
+      }
+      const T dj = di + Ax[jj];
+      if(dj < dist[j]){
+        dist[j] = dj;
+        pred[j] = i;
+        heap.push(entry(dj, j));
+      }
+    }
+  }
+}
+
+// Update center nodes for a cluster without dense distance matrices
+//
+// Computes the same centers as center_nodes (the node minimizing the sum
+// of squared distances to the rest of its cluster), but runs one Dijkstra
+// search per node restricted to the cluster instead of Floyd-Warshall.
+// This needs O(n) storage, and O(s E_a log s) work for a cluster of size s
+// with E_a internal edges, instead of O(s^2) storage and O(s^3) work.
+//
+// Parameters
+// ----------
+//   num_nodes  : (IN) number of nodes (number of rows in A)
+//   Ap[]       : (IN) CSR row pointer for A                              (num_nodes x 1)
+//   Aj[]       : (IN) CSR column index for A                             (num_edges x 1)
+//   Ax[]       : (IN) CSR data array (edge weights)                      (num_edges x 1)
+//    c         : (INOUT) cluster center                                  (num_clusters x 1)
+//    d         : (INOUT) distance to cluster center                      (num_nodes x 1)
+//    m         : (IN) cluster index                                      (num_nodes x 1)
+//    p         : (INOUT) predecessor on shortest path to center          (num_nodes x 1)
+//    pc        : (INOUT) predecessor count                               (num_nodes x 1)
+//    s         : (IN) cluster size                                       (num_clusters x 1)
+//
+// Returns
+// -------
+// changed : flag to indicate a change in arrays d or p
+//
+// See Also
+// --------
+// center_nodes
+template<class I, class T>
+bool center_nodes_dijkstra(const I num_nodes,
+                           const I Ap[], const std::ptrdiff_t Ap_size,
+                           const I Aj[], const std::ptrdiff_t Aj_size,
+                           const T Ax[], const std::ptrdiff_t Ax_size,
+                                 I  c[], const std::ptrdiff_t  c_size,
+                                 T  d[], const std::ptrdiff_t  d_size,
+                           const I  m[], const std::ptrdiff_t  m_size,
+                                 I  p[], const std::ptrdiff_t  p_size,
+                                 I pc[], const std::ptrdiff_t pc_size,
+                           const I  s[], const std::ptrdiff_t  s_size)
+{
+  const I num_clusters = c_size;
+  bool changed = false;
+  const double tol = 1e-14; // precision tolerance
+
+  // sort the nodes into clusters
+  std::vector<I> Cptr(num_clusters + 1, 0);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){ Cptr[m[i] + 1]++; }
+  }
+  for(I a = 0; a < num_clusters; a++){ Cptr[a+1] += Cptr[a]; }
+  std::vector<I> C(Cptr[num_clusters]);
+  std::vector<I> next(Cptr.begin(), Cptr.end() - 1);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){ C[next[m[i]]++] = i; }
+  }
+
+  std::vector<T> dist(num_nodes, std::numeric_limits<T>::infinity());
+  std::vector<I> pred(num_nodes, -1);
+  std::vector<I> visited;
+
+  for(I a = 0; a < num_clusters; a++){
+    // sum of square distances to the other nodes, for each node in the cluster
+    I best = c[a];
+    T qbest = std::numeric_limits<T>::infinity();
+    std::vector<T> q(Cptr[a+1] - Cptr[a]);
+    for(I _i = Cptr[a]; _i < Cptr[a+1]; _i++){
+      const I i = C[_i];
+      visited.clear();
+      cluster_dijkstra(Ap, Aj, Ax, m, i, &dist[0], &pred[0], visited);
+
+      T qi = 0;
+      for(std::size_t k = 0; k < visited.size(); k++){
+        qi += dist[visited[k]] * dist[visited[k]];
+        dist[visited[k]] = std::numeric_limits<T>::infinity();
+      }
+      if((I) visited.size() < Cptr[a+1] - Cptr[a]){
+        qi = std::numeric_limits<T>::infinity();   // cluster is not connected
+      }
+      q[_i - Cptr[a]] = qi;
+      if(i == c[a]){ qbest = qi; }
+    }
+
+    // is a node (strictly) better than the current center?
+    for(I _j = Cptr[a]; _j < Cptr[a+1]; _j++){
+      if(q[_j - Cptr[a]] < qbest - tol){
+        best = C[_j];
+        qbest = q[_j - Cptr[a]];
+      }
+    }
+
+    if(best != c[a]){           // if we've found a new center, then...
+      c[a] = best;
+      visited.clear();
+      cluster_dijkstra(Ap, Aj, Ax, m, best, &dist[0], &pred[0], visited);
+      for(I _j = Cptr[a]; _j < Cptr[a+1]; _j++){
+        const I j = C[_j];
+        d[j] = dist[j];         // new distance from best->j
+
+        pc[p[j]]--;             // update predecessor count (old j)
+        p[j] = pred[j];         // set predecessor
+        pc[p[j]]++;             // update predecessor count (new j)
+
+        dist[j] = std::numeric_limits<T>::infinity();
+        pred[j] = -1;
+      }
+      changed = true;
+    }
+  }
+  return changed;
+}
+
+/*
+ * Elimination and split measures for rebalancing balanced Lloyd clusters.
+ *
+ * For each cluster a with nodes V_a and current distances d to the center:
+ *
+ * - the elimination penalty E[a] is the increase in the sum of squared
+ *   distances if a is removed and its nodes are reached from the
+ *   neighboring clusters instead,
+ * - the split improvement S[a] is the decrease in the sum of squared
+ *   distances if a is split between the best pair of centers c1[a], c2[a].
+ *
+ * Parameters
+ * ----------
+ * num_nodes : int
+ *     Number of nodes (number of rows in A).
+ * Ap : array
+ *     CSR row pointer for A, (num_nodes, 1).
+ * Aj : array
+ *     CSR column index for A, (num_edges, 1).
+ * Ax : array
+ *     CSR data array (edge weights), (num_edges, 1).
+ * d : array
+ *     Distance to cluster center, (num_nodes, 1).
+ * m : array
+ *     Cluster index, (num_nodes, 1).
+ * E : array, inplace
+ *     Elimination penalty, (num_clusters, 1).
+ * S : array, inplace
+ *     Split improvement, (num_clusters, 1).
+ * c1 : array, inplace
+ *     First center of the best split, (num_clusters, 1).
+ * c2 : array, inplace
+ *     Second center of the best split, (num_clusters, 1).
+ *
+ * Notes
+ * -----
+ * - There are no checks within this kernel
+ * - Ax > 0 is assumed
+ * - Distances within a cluster use only the edges of the cluster.  The
+ *   elimination distances come from one multi-source Dijkstra search per
+ *   cluster, seeded with d[k] + A[k,j] over the edges k->j entering the
+ *   cluster.  The split improvement needs the distances between all pairs
+ *   of nodes of a cluster, which are computed one cluster at a time with a
+ *   Dijkstra search per node, so the storage is O(n + s^2) for a largest
+ *   cluster of size s and the work is linear in the number of clusters.
+ *
+ * See Also
+ * --------
+ * rebalance_centers
+ *
+ */
+template<class I, class T>
+void rebalance_measures(const I num_nodes,
+                        const I Ap[], const std::ptrdiff_t Ap_size,
+                        const I Aj[], const std::ptrdiff_t Aj_size,
+                        const T Ax[], const std::ptrdiff_t Ax_size,
+                        const T  d[], const std::ptrdiff_t  d_size,
+                        const I  m[], const std::ptrdiff_t  m_size,
+                              T  E[], const std::ptrdiff_t  E_size,
+                              T  S[], const std::ptrdiff_t  S_size,
+                              I c1[], const std::ptrdiff_t c1_size,
+                              I c2[], const std::ptrdiff_t c2_size)
+{
+  typedef std::pair<T,I> entry;
+  const I num_clusters = E_size;
+  const T inf = std::numeric_limits<T>::infinity();
+
+  // sort the nodes into clusters, in increasing order within each cluster
+  std::vector<I> Cptr(num_clusters + 1, 0);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){ Cptr[m[i] + 1]++; }
+  }
+  for(I a = 0; a < num_clusters; a++){ Cptr[a+1] += Cptr[a]; }
+  std::vector<I> C(Cptr[num_clusters]);
+  std::vector<I> L(num_nodes, -1);
+  std::vector<I> next(Cptr.begin(), Cptr.end() - 1);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){
+      L[i] = next[m[i]] - Cptr[m[i]];
+      C[next[m[i]]++] = i;
+    }
+  }
+
+  // entry distance of each node: min d[k] + A[k,j] over edges k->j from other clusters
+  std::vector<T> entry_dist(num_nodes, inf);
+  for(I k = 0; k < num_nodes; k++){
+    for(I jj = Ap[k]; jj < Ap[k+1]; jj++){
+      const I j = Aj[jj];
+      if(m[k] != m[j]){
+        entry_dist[j] = std::min(entry_dist[j], d[k] + Ax[jj]);
+      }
+    }
+  }
+
+  std::vector<T> dist(num_nodes, inf);
+  std::vector<I> pred(num_nodes, -1);
+  std::vector<I> visited;
+  std::vector<T> D;
+
+  for(I a = 0; a < num_clusters; a++){
+    const I N = Cptr[a+1] - Cptr[a];
+    const I * Va = &C[0] + Cptr[a];
+
+    T dsq = 0;
+    for(I _i = 0; _i < N; _i++){ dsq += d[Va[_i]] * d[Va[_i]]; }
+
+    // elimination penalty: Dijkstra within the cluster from the entry distances
+    std::priority_queue<entry, std::vector<entry>, std::greater<entry> > heap;
+    for(I _i = 0; _i < N; _i++){
+      const I i = Va[_i];
+      dist[i] = entry_dist[i];
+      if(dist[i] < inf){ heap.push(entry(dist[i], i)); }
+    }
+    while(!heap.empty()){
+      const T di = heap.top().first;
+      const I i = heap.top().second;
+      heap.pop();
+      if(di > dist[i]){ continue; }
+      for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+        const I j = Aj[jj];
+        if(m[j] == a && di + Ax[jj] < dist[j]){
+          dist[j] = di + Ax[jj];
+          heap.push(entry(dist[j], j));
+        }
+      }
+    }
+    E[a] = 0;
+    for(I _i = 0; _i < N; _i++){
+      E[a] += dist[Va[_i]] * dist[Va[_i]];
+      dist[Va[_i]] = inf;
+    }
+    E[a] -= dsq;
+
+    // split improvement: distances between all pairs in the cluster
+    D.assign((std::size_t) N * N, inf);
+    for(I _i = 0; _i < N; _i++){
+      visited.clear();
+      cluster_dijkstra(Ap, Aj, Ax, m, Va[_i], &dist[0], &pred[0], visited);
+      for(std::size_t k = 0; k < visited.size(); k++){
+        const I j = visited[k];
+        D[(std::size_t) _i * N + L[j]] = dist[j];
+        dist[j] = inf;
+      }
+    }
+
+    T Smin = inf;
+    c1[a] = -1;
+    c2[a] = -1;
+    for(I _i = 0; _i < N; _i++){
+      const T * Di = &D[0] + (std::size_t) _i * N;
+      for(I _j = _i; _j < N; _j++){   // (i,j) and (j,i) are the same split
+        const T * Dj = &D[0] + (std::size_t) _j * N;
+        T Snew = 0;
+        for(I _k = 0; _k < N; _k++){
+          const T dk = std::min(Di[_k], Dj[_k]);
+          Snew += dk * dk;
+        }
+        if(Snew < Smin){
+          Smin = Snew;
+          c1[a] = Va[_i];
+          c2[a] = Va[_j];
+        }
+      }
+    }
+    S[a] = dsq - Smin;
+  }
+}
+
+/*
+ * Greedy selection of the clusters to eliminate and split.
+ *
+ * Pairs the cluster with the smallest elimination penalty with the
+ * cluster with the largest split improvement, for as long as the penalty
+ * does not exceed the improvement.  The eliminated cluster takes the
+ * first new center of the split, and the split cluster the second.
+ * Clusters adjacent to a modified cluster are not modified again.
+ *
+ * Parameters
+ * ----------
+ * num_nodes : int
+ *     Number of nodes (number of rows in A).
+ * Ap : array
+ *     CSR row pointer for A, (num_nodes, 1).
+ * Aj : array
+ *     CSR column index for A, (num_edges, 1).
+ * m : array
+ *     Cluster index, (num_nodes, 1).
+ * E : array
+ *     Elimination penalty, (num_clusters, 1).
+ * S : array
+ *     Split improvement, (num_clusters, 1).
+ * c1 : array
+ *     First center of the best split, (num_clusters, 1).
+ * c2 : array
+ *     Second center of the best split, (num_clusters, 1).
+ * c : array, inplace
+ *     Cluster centers, (num_clusters, 1).
+ *
+ * Returns
+ * -------
+ * bool
+ *     True if any center changed.
+ *
+ * See Also
+ * --------
+ * rebalance_measures
+ *
+ */
+template<class I, class T>
+bool rebalance_centers(const I num_nodes,
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                       const I  m[], const std::ptrdiff_t  m_size,
+                       const T  E[], const std::ptrdiff_t  E_size,
+                       const T  S[], const std::ptrdiff_t  S_size,
+                       const I c1[], const std::ptrdiff_t c1_size,
+                       const I c2[], const std::ptrdiff_t c2_size,
+                             I  c[], const std::ptrdiff_t  c_size)
+{
+  const I num_clusters = c_size;
+
+  // sort the nodes into clusters
+  std::vector<I> Cptr(num_clusters + 1, 0);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){ Cptr[m[i] + 1]++; }
+  }
+  for(I a = 0; a < num_clusters; a++){ Cptr[a+1] += Cptr[a]; }
+  std::vector<I> C(Cptr[num_clusters]);
+  std::vector<I> next(Cptr.begin(), Cptr.end() - 1);
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] >= 0){ C[next[m[i]]++] = i; }
+  }
+
+  // sort both ascending, ties by cluster index
+  std::vector< std::pair<T,I> > Esort(num_clusters), Ssort(num_clusters);
+  for(I a = 0; a < num_clusters; a++){
+    Esort[a] = std::make_pair(E[a], a);
+    Ssort[a] = std::make_pair(S[a], a);
+  }
+  std::sort(Esort.begin(), Esort.end());
+  std::sort(Ssort.begin(), Ssort.end());
+
+  std::vector<bool> M(num_clusters, true);  // is the cluster modifiable?
+  bool changed = false;
+
+  I i_e = 0;                // elimination index
+  I i_s = num_clusters - 1; // splitting index
+  while(i_e < num_clusters && i_s >= 0){
+    const I a_e = Esort[i_e].second;
+    const I a_s = Ssort[i_s].second;
+
+    if(!M[a_e] || a_e == a_s){ i_e++; continue; }
+    if(!M[a_s]){ i_s--; continue; }
+    if(E[a_e] > S[a_s]){ break; }
+
+    // lock a_e, a_s, and their neighbors
+    const I modified[2] = {a_e, a_s};
+    for(I t = 0; t < 2; t++){
+      const I a = modified[t];
+      M[a] = false;
+      for(I ii = Cptr[a]; ii < Cptr[a+1]; ii++){
+        const I i = C[ii];
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+          if(m[Aj[jj]] >= 0){ M[m[Aj[jj]]] = false; }
+        }
+      }
+    }
+
+    c[a_e] = c1[a_s];       // redefine centers
+    c[a_s] = c2[a_s];
+    changed = true;
+  }
+
+  return changed;
+}
+
 /*
  * Apply one iteration of Bellman-Ford iteration on a distance graph stored in CSR format.
  *
@@ -669,13 +1159,13 @@ bool center_nodes(const I num_nodes,
  */
 template<class I, class T>
 void bellman_ford(const I num_nodes,
-                  const I Ap[], const int Ap_size,
-                  const I Aj[], const int Aj_size,
-                  const T Ax[], const int Ax_size,
-                  const I c[],  const int c_size,
-                        T d[],  const int d_size,
-                        I m[],  const int m_size,
-                        I p[],  const int p_size)
+                  const I Ap[], const std::ptrdiff_t Ap_size,
+                  const I Aj[], const std::ptrdiff_t Aj_size,
+                  const T Ax[], const std::ptrdiff_t Ax_size,
+                  const I c[],  const std::ptrdiff_t c_size,
+                        T d[],  const std::ptrdiff_t d_size,
+                        I m[],  const std::ptrdiff_t m_size,
+                        I p[],  const std::ptrdiff_t p_size)
 {
   bool done = false;
 
@@ -734,15 +1224,15 @@ void bellman_ford(const I num_nodes,
 //  pyamg.graph.bellman_ford
 template<class I, class T>
 bool bellman_ford_balanced(const I num_nodes,
-                           const I Ap[], const int Ap_size,
-                           const I Aj[], const int Aj_size,
-                           const T Ax[], const int Ax_size,
-                           const I  c[], const int c_size,
-                                 T  d[], const int  d_size,
-                                 I  m[], const int  m_size,
-                                 I  p[], const int  p_size,
-                                 I pc[], const int pc_size,
-                                 I  s[], const int  s_size,
+                           const I Ap[], const std::ptrdiff_t Ap_size,
+                           const I Aj[], const std::ptrdiff_t Aj_size,
+                           const T Ax[], const std::ptrdiff_t Ax_size,
+                           const I  c[], const std::ptrdiff_t c_size,
+                                 T  d[], const std::ptrdiff_t  d_size,
+                                 I  m[], const std::ptrdiff_t  m_size,
+                                 I  p[], const std::ptrdiff_t  p_size,
+                                 I pc[], const std::ptrdiff_t pc_size,
+                                 I  s[], const std::ptrdiff_t  s_size,
                            const bool tiebreaking)
 {
   bool done;            // did we make any changes during this iteration?
@@ -806,6 +1296,205 @@ bool bellman_ford_balanced(const I num_nodes,
   return changed;
 }
 
+/*
+ * Multi-source Dijkstra on a distance graph stored in CSR format.
+ *
+ * Drop-in replacement for bellman_ford: every node with a finite initial
+ * distance is a source, and nodes are settled in order of increasing
+ * distance using a binary heap, so the cost is O(E log n) instead of
+ * O(E * diameter).
+ *
+ * Parameters
+ * ----------
+ * num_nodes : int
+ *     Number of nodes (number of rows in A).
+ * Ap : array
+ *     CSR row pointer.
+ * Aj : array
+ *     CSR index array.
+ * Ax : array
+ *     CSR data array (edge lengths).
+ * c : array
+ *     Cluster center.
+ * d : array, inplace
+ *     Distance to nearest center.
+ * m : array, inplace
+ *     Cluster index for each node.
+ * p : array, inplace
+ *     Predecssor on the shortest path to center.
+ *
+ * Notes
+ * -----
+ * - There are no checks within this kernel.
+ * - Ax is assumed to be positive
+ * - Initializations are the same as for bellman_ford.
+ *
+ * See Also
+ * --------
+ * pyamg.graph.bellman_ford
+ *
+ * References
+ * ----------
+ * .. [1] Dijkstra's algorithm Wikipedia: https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
+ *
+ */
+template<class I, class T>
+void dijkstra(const I num_nodes,
+              const I Ap[], const std::ptrdiff_t Ap_size,
+              const I Aj[], const std::ptrdiff_t Aj_size,
+              const T Ax[], const std::ptrdiff_t Ax_size,
+              const I c[],  const std::ptrdiff_t c_size,
+                    T d[],  const std::ptrdiff_t d_size,
+                    I m[],  const std::ptrdiff_t m_size,
+                    I p[],  const std::ptrdiff_t p_size)
+{
+  typedef std::pair<T,I> entry;
+  std::priority_queue<entry, std::vector<entry>, std::greater<entry> > heap;
+
+  for(I i = 0; i < num_nodes; i++){
+    if(d[i] < std::numeric_limits<T>::infinity()){
+      heap.push(entry(d[i], i));
+    }
+  }
+
+  while(!heap.empty()){
+    const T di = heap.top().first;
+    const I i = heap.top().second;
+    heap.pop();
+    if(di > d[i]){              // stale entry
+      continue;
+    }
+    for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+      const I j = Aj[jj];
+      const T dj = di + Ax[jj];
+      if(dj < d[j]){
+        d[j] = dj;
+        m[j] = m[i];
+        p[j] = i;
+        heap.push(entry(dj, j));
+      }
+    }
+  }
+}
+
+//  Dijkstra with a heuristic to balance cluster sizes
+//
+//  Computes the same balanced clustering as bellman_ford_balanced, but
+//  restarts from the centers and settles nodes in order of increasing
+//  distance.  Distance ties are broken by assigning a node to the cluster
+//  with the fewest points, provided no other node uses it as predecessor.
+//
+//  Parameters
+//  ----------
+//   num_nodes  : (IN) number of nodes (number of rows in A)
+//   Ap[]       : (IN) CSR row pointer for A                              (num_nodes x 1)
+//   Aj[]       : (IN) CSR column index for A                             (num_edges x 1)
+//   Ax[]       : (IN) CSR data array (edge weights)                      (num_edges x 1)
+//    c         : (IN) cluster center                                     (num_clusters x 1)
+//    d         : (INOUT) distance to cluster center                      (num_nodes x 1)
+//    m         : (INOUT) cluster index                                   (num_nodes x 1)
+//    p         : (INOUT) predecessor on shortest path to center          (num_nodes x 1)
+//    pc        : (INOUT) number of predecessors                          (num_nodes x 1)
+//    s         : (INOUT) cluster size                                    (num_clusters x 1)
+//
+//  Returns
+//  -------
+//  changed : flag to indicate a change in m or p
+//
+//  Notes
+//  -----
+//  - There are no checks within this kernel.
+//  - Ax > 0 is assumed
+//  - d, m, p, pc, s are reinitialized from the centers c
+//
+//  See Also
+//  --------
+//  bellman_ford_balanced
+template<class I, class T>
+bool dijkstra_balanced(const I num_nodes,
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                       const T Ax[], const std::ptrdiff_t Ax_size,
+                       const I  c[], const std::ptrdiff_t c_size,
+                             T  d[], const std::ptrdiff_t  d_size,
+                             I  m[], const std::ptrdiff_t  m_size,
+                             I  p[], const std::ptrdiff_t  p_size,
+                             I pc[], const std::ptrdiff_t pc_size,
+                             I  s[], const std::ptrdiff_t  s_size,
+                       const bool tiebreaking)
+{
+  typedef std::pair<T,I> entry;
+  const double tol = 1e-14; // precision tolerance
+  const I num_clusters = c_size;
+
+  std::vector<I> m_old(m, m + num_nodes);
+  std::vector<I> p_old(p, p + num_nodes);
+
+  std::fill(d, d + num_nodes, std::numeric_limits<T>::infinity());
+  std::fill(m, m + num_nodes, -1);
+  std::fill(p, p + num_nodes, -1);
+  std::fill(pc, pc + num_nodes, 0);
+
+  std::priority_queue<entry, std::vector<entry>, std::greater<entry> > heap;
+  for(I a = 0; a < num_clusters; a++){
+    d[c[a]] = 0;
+    m[c[a]] = a;
+    p[c[a]] = c[a];
+    pc[c[a]] = 1;
+    s[a] = 1;
+    heap.push(entry(0, c[a]));
+  }
+
+  while(!heap.empty()){
+    const T di = heap.top().first;
+    const I i = heap.top().second;
+    heap.pop();
+    if(di > d[i]){              // stale entry
+      continue;
+    }
+    for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+      const I j = Aj[jj];
+      const T Aij = Ax[jj];
+      bool swap = false;
+
+      if(d[j] - (d[i] + Aij) > 2*tol){
+        swap = true;
+      }
+
+      if(m[j] > -1 && m[j] != m[i] && tiebreaking){
+        if(std::abs(d[i] + Aij - d[j]) < tol){
+          if((s[m[i]] + 1) < s[m[j]] && pc[j] == 0){
+            swap = true;
+          }
+        }
+      }
+
+      if(swap){
+        const bool shorter = d[j] - (d[i] + Aij) > 2*tol;
+        if(m[j] >= 0){
+          s[m[j]]--;
+          pc[p[j]]--;
+        }
+        m[j] = m[i];
+        d[j] = d[i] + Aij;
+        p[j] = i;
+        s[m[j]]++;
+        pc[i]++;
+        if(shorter){
+          heap.push(entry(d[j], j));
+        }
+      }
+    }
+  }
+
+  for(I i = 0; i < num_nodes; i++){
+    if(m[i] != m_old[i] || p[i] != p_old[i]){
+      return true;
+    }
+  }
+  return false;
+}
+
 /*
  * Find the most interior nodes.
  *
@@ -841,13 +1530,13 @@ bool bellman_ford_balanced(const I num_nodes,
  */
 template<class I, class T>
 bool most_interior_nodes(const I num_nodes,
-                   const I Ap[], const int Ap_size,
-                   const I Aj[], const int Aj_size,
-                   const T Ax[], const int Ax_size,
-                         I  c[], const int  c_size,
-                         T  d[], const int  d_size,
-                         I  m[], const int  m_size,
-                         I  p[], const int  p_size
+                   const I Ap[], const std::ptrdiff_t Ap_size,
+                   const I Aj[], const std::ptrdiff_t Aj_size,
+                   const T Ax[], const std::ptrdiff_t Ax_size,
+                         I  c[], const std::ptrdiff_t  c_size,
+                         T  d[], const std::ptrdiff_t  d_size,
+                         I  m[], const std::ptrdiff_t  m_size,
+                         I  p[], const std::ptrdiff_t  p_size
                         )
 {
   // find boundaries
@@ -870,8 +1559,8 @@ bool most_interior_nodes(const I num_nodes,
   // find the distance to the closest boundary point as marked in d
   // c is unused
   // m should be invariant under this operation
-  bellman_ford(num_nodes, Ap, Ap_size, Aj, Aj_size, Ax, Ax_size, c, c_size,
-               d, d_size, m, m_size, p, p_size);
+  dijkstra(num_nodes, Ap, Ap_size, Aj, Aj_size, Ax, Ax_size, c, c_size,
+           d, d_size, m, m_size, p, p_size);
 
   // determine the new centers: the node furthest from a boundary
   for(I i = 0; i < num_nodes; i++){
@@ -972,11 +1661,11 @@ void csr_propagate_max(const IndexType  num_rows,
  */
 template<class I, class T, class R>
 void maximal_independent_set_k_parallel(const I num_rows,
-                                        const I Ap[], const int Ap_size,
-                                        const I Aj[], const int Aj_size,
+                                        const I Ap[], const std::ptrdiff_t Ap_size,
+                                        const I Aj[], const std::ptrdiff_t Aj_size,
                                         const I  k,
-                                              T  x[], const int  x_size,
-                                        const R  y[], const int  y_size,
+                                              T  x[], const std::ptrdiff_t  x_size,
+                                        const R  y[], const std::ptrdiff_t  y_size,
                                         const I  max_iters)
 {
     std::vector<bool> active(num_rows,true);
@@ -1072,11 +1761,11 @@ void maximal_independent_set_k_parallel(const I num_rows,
  *
  */
 template <class I>
-void breadth_first_search(const I Ap[], const int Ap_size,
-                          const I Aj[], const int Aj_size,
+void breadth_first_search(const I Ap[], const std::ptrdiff_t Ap_size,
+                          const I Aj[], const std::ptrdiff_t Aj_size,
                           const I seed,
-                                I order[], const int order_size,
-                                I level[], const int level_size)
+                                I order[], const std::ptrdiff_t order_size,
+                                I level[], const std::ptrdiff_t level_size)
 {
     // initialize seed
     order[0]    = seed;
@@ -1139,9 +1828,9 @@ void breadth_first_search(const I Ap[], const int Ap_size,
  */
 template <class I>
 I connected_components(const I num_nodes,
-                       const I Ap[], const int Ap_size,
-                       const I Aj[], const int Aj_size,
-                             I components[], const int components_size)
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                             I components[], const std::ptrdiff_t components_size)
 {
     std::fill(components, components + num_nodes, -1);
     std::stack<I> DFS;
@@ -1175,4 +1864,517 @@ I connected_components(const I num_nodes,
     return component;
 }
 
+/*
+ *  Helpers for partition_graph.  Each level of the multilevel hierarchy
+ *  is an undirected graph stored in CSR format (xadj, adjncy, adjwgt)
+ *  without self loops, together with integer vertex weights vwgt.
+ */
+
+/*
+ * Coarsen a graph by heavy edge matching.
+ *
+ * Vertices are visited in random order and each unmatched vertex is
+ * matched with the unmatched neighbor sharing the heaviest edge, provided
+ * the combined vertex weight does not exceed maxvwgt.  Matched pairs are
+ * contracted into the coarse graph (cxadj, cadjncy, cadjwgt, cvwgt) and
+ * cmap records the coarse vertex of each fine vertex.
+ *
+ * Returns the number of coarse vertices.
+ */
+template<class I, class T, class R>
+I partition_coarsen(const std::vector<I>& xadj,
+                    const std::vector<I>& adjncy,
+                    const std::vector<T>& adjwgt,
+                    const std::vector<I>& vwgt,
+                    const I maxvwgt,
+                    R& rng,
+                    std::vector<I>& cmap,
+                    std::vector<I>& cxadj,
+                    std::vector<I>& cadjncy,
+                    std::vector<T>& cadjwgt,
+                    std::vector<I>& cvwgt)
+{
+    const I n = (I) xadj.size() - 1;
+
+    std::vector<I> perm(n);
+    for(I i = 0; i < n; i++){ perm[i] = i; }
+    std::shuffle(perm.begin(), perm.end(), rng);
+
+    // heavy edge matching
+    std::vector<I> match(n, -1);
+    for(I ii = 0; ii < n; ii++){
+        const I u = perm[ii];
+        if(match[u] != -1){ continue; }
+
+        I best = u;
+        T best_wgt = 0;
+        for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+            const I v = adjncy[jj];
+            if(match[v] != -1 || vwgt[u] + vwgt[v] > maxvwgt){ continue; }
+            if(best == u || adjwgt[jj] > best_wgt){
+                best = v;
+                best_wgt = adjwgt[jj];
+            }
+        }
+        match[u] = best;
+        match[best] = u;
+    }
+
+    // number the coarse vertices in order of their smallest fine vertex
+    cmap.assign(n, -1);
+    I nc = 0;
+    for(I u = 0; u < n; u++){
+        if(cmap[u] == -1){
+            cmap[u] = nc;
+            cmap[match[u]] = nc;
+            nc++;
+        }
+    }
+
+    // contract the matched pairs
+    cxadj.assign(nc + 1, 0);
+    cvwgt.assign(nc, 0);
+    cadjncy.clear();
+    cadjwgt.clear();
+    std::vector<I> pos(nc, -1);
+    for(I u = 0; u < n; u++){
+        if(match[u] < u){ continue; }  // visit each pair from its smallest vertex
+        const I c = cmap[u];
+        const I row_start = (I) cadjncy.size();
+        const I pair[2] = {u, match[u]};
+        for(I k = 0; k < (u == match[u] ? 1 : 2); k++){
+            const I w = pair[k];
+            cvwgt[c] += vwgt[w];
+            for(I jj = xadj[w]; jj < xadj[w+1]; jj++){
+                const I cv = cmap[adjncy[jj]];
+                if(cv == c){ continue; }
+                if(pos[cv] < row_start){
+                    pos[cv] = (I) cadjncy.size();
+                    cadjncy.push_back(cv);
+                    cadjwgt.push_back(adjwgt[jj]);
+                } else {
+                    cadjwgt[pos[cv]] += adjwgt[jj];
+                }
+            }
+        }
+        cxadj[c+1] = (I) cadjncy.size();
+    }
+
+    return nc;
+}
+
+/*
+ * Initial partition by greedy graph growing.
+ *
+ * Parts are grown one at a time from a seed taken in breadth first order,
+ * absorbing the frontier vertex with the strongest connection to the part
+ * until the part reaches its share of the remaining vertex weight.  Any
+ * vertices left over are attached to the neighboring part they are most
+ * strongly connected to.
+ */
+template<class I, class T>
+void partition_grow(const std::vector<I>& xadj,
+                    const std::vector<I>& adjncy,
+                    const std::vector<T>& adjwgt,
+                    const std::vector<I>& vwgt,
+                    const I nparts,
+                    std::vector<I>& parts)
+{
+    const I n = (I) xadj.size() - 1;
+
+    // breadth first ordering of all components
+    std::vector<I> order;
+    order.reserve(n);
+    std::vector<bool> seen(n, false);
+    for(I s = 0; s < n; s++){
+        if(seen[s]){ continue; }
+        std::size_t head = order.size();
+        order.push_back(s);
+        seen[s] = true;
+        while(head < order.size()){
+            const I u = order[head++];
+            for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                const I v = adjncy[jj];
+                if(!seen[v]){
+                    seen[v] = true;
+                    order.push_back(v);
+                }
+            }
+        }
+    }
+
+    I remaining = 0;
+    for(I i = 0; i < n; i++){ remaining += vwgt[i]; }
+
+    parts.assign(n, -1);
+    std::vector<T> gain(n, 0);
+    std::vector<I> stamp(n, -1);
+    std::priority_queue< std::pair<T,I> > frontier;
+
+    I next = 0;
+    I p = 0;
+    for(; p < nparts; p++){
+        while(next < n && parts[order[next]] != -1){ next++; }
+        if(next == n){ break; }
+
+        const double target = (double) remaining / (nparts - p);
+        const I seed = order[next];
+
+        frontier = std::priority_queue< std::pair<T,I> >();
+        stamp[seed] = p;
+        gain[seed] = 0;
+        frontier.push(std::make_pair(gain[seed], seed));
+
+        I pw = 0;
+        while(!frontier.empty() && pw < target){
+            const T g = frontier.top().first;
+            const I u = frontier.top().second;
+            frontier.pop();
+            if(parts[u] != -1 || g != gain[u]){ continue; }
+
+            // stop early if the part is closer to its target without u
+            if(pw > 0 && pw + vwgt[u] - target > target - pw){ break; }
+
+            parts[u] = p;
+            pw += vwgt[u];
+            for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                const I v = adjncy[jj];
+                if(parts[v] != -1){ continue; }
+                if(stamp[v] != p){
+                    stamp[v] = p;
+                    gain[v] = 0;
+                }
+                gain[v] += adjwgt[jj];
+                frontier.push(std::make_pair(gain[v], v));
+            }
+        }
+        remaining -= pw;
+    }
+
+    // attach leftover vertices to their most strongly connected neighbor part
+    bool changed = true;
+    while(changed){
+        changed = false;
+        for(I u = 0; u < n; u++){
+            if(parts[u] != -1){ continue; }
+            I best = -1;
+            T best_wgt = 0;
+            for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                const I q = parts[adjncy[jj]];
+                if(q == -1){ continue; }
+                T w = 0;
+                for(I kk = xadj[u]; kk < xadj[u+1]; kk++){
+                    if(parts[adjncy[kk]] == q){ w += adjwgt[kk]; }
+                }
+                if(best == -1 || w > best_wgt){
+                    best = q;
+                    best_wgt = w;
+                }
+            }
+            if(best != -1){
+                parts[u] = best;
+                changed = true;
+            }
+        }
+    }
+
+    // vertices unreachable from any part join the last part
+    for(I u = 0; u < n; u++){
+        if(parts[u] == -1){ parts[u] = std::max<I>(p - 1, 0); }
+    }
+}
+
+/*
+ * Greedy k-way boundary refinement.
+ *
+ * Boundary vertices are visited in random order and moved to the adjacent
+ * part that most reduces the edge cut, subject to the part weight limit
+ * maxpw.  Moves with zero gain are accepted when they improve the balance,
+ * and vertices of overweight parts may be moved with negative gain.  A
+ * part is never emptied.
+ */
+template<class I, class T, class R>
+void partition_refine(const std::vector<I>& xadj,
+                      const std::vector<I>& adjncy,
+                      const std::vector<T>& adjwgt,
+                      const std::vector<I>& vwgt,
+                      const I nparts,
+                      const I maxpw,
+                      const I npasses,
+                      R& rng,
+                      std::vector<I>& parts)
+{
+    const I n = (I) xadj.size() - 1;
+
+    std::vector<I> pw(nparts, 0);
+    for(I u = 0; u < n; u++){ pw[parts[u]] += vwgt[u]; }
+
+    std::vector<I> perm(n);
+    for(I i = 0; i < n; i++){ perm[i] = i; }
+
+    std::vector<T> conn(nparts, 0);
+    std::vector<bool> is_touched(nparts, false);
+    std::vector<I> touched;
+
+    for(I pass = 0; pass < npasses; pass++){
+        std::shuffle(perm.begin(), perm.end(), rng);
+        I moves = 0;
+
+        for(I ii = 0; ii < n; ii++){
+            const I u = perm[ii];
+            const I p = parts[u];
+
+            T internal = 0;
+            touched.clear();
+            for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                const I q = parts[adjncy[jj]];
+                if(q == p){
+                    internal += adjwgt[jj];
+                } else {
+                    if(!is_touched[q]){
+                        is_touched[q] = true;
+                        touched.push_back(q);
+                    }
+                    conn[q] += adjwgt[jj];
+                }
+            }
+
+            I best = -1;
+            T best_gain = 0;
+            if(pw[p] > vwgt[u]){
+                const bool overweight = pw[p] > maxpw;
+                for(std::size_t k = 0; k < touched.size(); k++){
+                    const I q = touched[k];
+                    if(pw[q] + vwgt[u] > maxpw){ continue; }
+                    const T g = conn[q] - internal;
+                    const bool balances = pw[q] + vwgt[u] < pw[p];
+                    if(!(overweight || g > 0 || (g == 0 && balances))){ continue; }
+                    if(best == -1 || g > best_gain || (g == best_gain && pw[q] < pw[best])){
+                        best = q;
+                        best_gain = g;
+                    }
+                }
+            }
+
+            for(std::size_t k = 0; k < touched.size(); k++){
+                conn[touched[k]] = 0;
+                is_touched[touched[k]] = false;
+            }
+
+            if(best != -1){
+                parts[u] = best;
+                pw[p] -= vwgt[u];
+                pw[best] += vwgt[u];
+                moves++;
+            }
+        }
+
+        if(moves == 0){ break; }
+    }
+}
+
+/*
+ * Make each part connected.
+ *
+ * Every connected piece of a part other than its largest is merged into
+ * the neighboring part it is most strongly connected to.
+ */
+template<class I, class T>
+void partition_make_contiguous(const std::vector<I>& xadj,
+                               const std::vector<I>& adjncy,
+                               const std::vector<T>& adjwgt,
+                               const I nparts,
+                               std::vector<I>& parts)
+{
+    const I n = (I) xadj.size() - 1;
+
+    std::vector<I> comp(n);
+    std::vector<I> order(n);
+    std::vector<I> comp_ptr;
+    std::vector<I> largest(nparts);
+    std::vector<T> conn(nparts, 0);
+
+    for(I iter = 0; iter < 10; iter++){
+        // pieces of each part, in breadth first order
+        std::fill(comp.begin(), comp.end(), -1);
+        comp_ptr.assign(1, 0);
+        I N = 0;
+        for(I s = 0; s < n; s++){
+            if(comp[s] != -1){ continue; }
+            const I c = (I) comp_ptr.size() - 1;
+            I head = N;
+            order[N++] = s;
+            comp[s] = c;
+            while(head < N){
+                const I u = order[head++];
+                for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                    const I v = adjncy[jj];
+                    if(comp[v] == -1 && parts[v] == parts[u]){
+                        comp[v] = c;
+                        order[N++] = v;
+                    }
+                }
+            }
+            comp_ptr.push_back(N);
+        }
+
+        const I ncomp = (I) comp_ptr.size() - 1;
+        if(ncomp <= nparts){ break; }
+
+        std::fill(largest.begin(), largest.end(), -1);
+        for(I c = 0; c < ncomp; c++){
+            const I p = parts[order[comp_ptr[c]]];
+            if(largest[p] == -1 ||
+               comp_ptr[c+1] - comp_ptr[c] > comp_ptr[largest[p]+1] - comp_ptr[largest[p]]){
+                largest[p] = c;
+            }
+        }
+
+        bool changed = false;
+        for(I c = 0; c < ncomp; c++){
+            const I p = parts[order[comp_ptr[c]]];
+            if(largest[p] == c){ continue; }
+
+            I best = -1;
+            for(I ii = comp_ptr[c]; ii < comp_ptr[c+1]; ii++){
+                const I u = order[ii];
+                for(I jj = xadj[u]; jj < xadj[u+1]; jj++){
+                    const I q = parts[adjncy[jj]];
+                    if(q == p){ continue; }
+                    conn[q] += adjwgt[jj];
+                    if(best == -1 || conn[q] > conn[best]){ best = q; }
+                }
+            }
+            for(I ii = comp_ptr[c]; ii < comp_ptr[c+1]; ii++){
+                const I u = order[ii];
+                for(I jj = xadj[u]; jj < xadj[u+1]; jj++){ conn[parts[adjncy[jj]]] = 0; }
+            }
+
+            if(best != -1){
+                for(I ii = comp_ptr[c]; ii < comp_ptr[c+1]; ii++){ parts[order[ii]] = best; }
+                changed = true;
+            }
+        }
+
+        if(!changed){ break; }
+    }
+}
+
+/*
+ * Partition a graph into connected parts of nearly equal size.
+ *
+ * Multilevel partitioner in the spirit of METIS: the graph is coarsened
+ * by heavy edge matching, the coarsest graph is partitioned by greedy
+ * graph growing, and the partition is projected back through the levels
+ * with greedy boundary refinement at each level.  Finally, each part is
+ * made connected.
+ *
+ * Parameters
+ * ----------
+ * num_nodes : int
+ *     Number of vertices.
+ * Ap : array
+ *     CSR row pointer.
+ * Aj : array
+ *     CSR index array.
+ * Ax : array
+ *     CSR data array (edge weights, nonnegative).
+ * nparts : int
+ *     Number of parts.
+ * seed : int
+ *     Seed of the random number generator.
+ * parts : array, num_nodes, inplace
+ *     Part label of each vertex, in [0, nparts).
+ *
+ * Returns
+ * -------
+ * None
+ *     In place.
+ *
+ * Notes
+ * -----
+ * The graph is assumed symmetric; diagonal entries are ignored.  Parts are
+ * balanced to within 3% of num_nodes / nparts, up to the vertices moved to
+ * make the parts connected, so some parts may end up empty.
+ *
+ * References
+ * ----------
+ * .. [1] Karypis, G., and Kumar, V., "A fast and high quality multilevel
+ *    scheme for partitioning irregular graphs", SIAM J. Sci. Comput.,
+ *    20(1), 359-392, 1998.
+ *
+ */
+template<class I, class T>
+void partition_graph(const I num_nodes,
+                     const I Ap[], const std::ptrdiff_t Ap_size,
+                     const I Aj[], const std::ptrdiff_t Aj_size,
+                     const T Ax[], const std::ptrdiff_t Ax_size,
+                     const I nparts,
+                     const I seed,
+                           I parts[], const std::ptrdiff_t parts_size)
+{
+    if(nparts <= 1 || num_nodes <= nparts){
+        for(I i = 0; i < num_nodes; i++){ parts[i] = (nparts <= 1) ? 0 : i; }
+        return;
+    }
+
+    std::mt19937 rng((unsigned int) seed);
+
+    // finest level, without self loops
+    std::vector< std::vector<I> > xadj(1), adjncy(1), vwgt(1), cmap;
+    std::vector< std::vector<T> > adjwgt(1);
+    xadj[0].assign(num_nodes + 1, 0);
+    for(I i = 0; i < num_nodes; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] != i){
+                adjncy[0].push_back(Aj[jj]);
+                adjwgt[0].push_back(Ax[jj]);
+            }
+        }
+        xadj[0][i+1] = (I) adjncy[0].size();
+    }
+    vwgt[0].assign(num_nodes, 1);
+
+    // coarsen
+    const I coarsen_to = std::max<I>(2 * nparts, 40);
+    const I maxvwgt = std::max<I>(1, (3 * num_nodes) / (2 * coarsen_to));
+    I n = num_nodes;
+    while(n > coarsen_to){
+        std::vector<I> cm, cxadj, cadjncy, cvwgt;
+        std::vector<T> cadjwgt;
+        const I nc = partition_coarsen(xadj.back(), adjncy.back(), adjwgt.back(), vwgt.back(),
+                                       maxvwgt, rng, cm, cxadj, cadjncy, cadjwgt, cvwgt);
+        if(nc > 0.95 * n){ break; }
+        cmap.push_back(cm);
+        xadj.push_back(cxadj);
+        adjncy.push_back(cadjncy);
+        adjwgt.push_back(cadjwgt);
+        vwgt.push_back(cvwgt);
+        n = nc;
+    }
+
+    // partition the coarsest graph
+    const I nlevels = (I) xadj.size();
+    std::vector<I> p;
+    partition_grow(xadj.back(), adjncy.back(), adjwgt.back(), vwgt.back(), nparts, p);
+
+    // uncoarsen and refine
+    const double ubfactor = 1.03;
+    const I target = (I) std::ceil(ubfactor * num_nodes / nparts);
+    for(I lvl = nlevels - 1; lvl >= 0; lvl--){
+        if(lvl < nlevels - 1){
+            std::vector<I> fine(xadj[lvl].size() - 1);
+            for(std::size_t u = 0; u < fine.size(); u++){ fine[u] = p[cmap[lvl][u]]; }
+            p.swap(fine);
+        }
+        const I heaviest = *std::max_element(vwgt[lvl].begin(), vwgt[lvl].end());
+        partition_refine(xadj[lvl], adjncy[lvl], adjwgt[lvl], vwgt[lvl],
+                         nparts, target + heaviest - 1, (I) 8, rng, p);
+    }
+
+    partition_make_contiguous(xadj[0], adjncy[0], adjwgt[0], nparts, p);
+
+    std::copy(p.begin(), p.end(), parts);
+}
+
 #endif
@@ -26,6 +26,8 @@ I _maximal_independent_set_serial(
     const I *_Aj = py_Aj.data();
     T *_x = py_x.mutable_data();
 
+    py::gil_scoped_release release;
+
     return maximal_independent_set_serial<I, T>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -37,6 +39,25 @@ I _maximal_independent_set_serial(
                                                 );
 }
 
+template<class I, class T>
+void _counter_based_uniform(
+                const I n,
+             const I seed,
+       py::array_t<T> & x
+                            )
+{
+    auto py_x = x.mutable_unchecked();
+    T *_x = py_x.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return counter_based_uniform<I, T>(
+                        n,
+                     seed,
+                       _x, x.shape(0)
+                                       );
+}
+
 template<class I, class T, class R>
 I _maximal_independent_set_parallel(
          const I num_rows,
@@ -59,6 +80,8 @@ I _maximal_independent_set_parallel(
     T *_x = py_x.mutable_data();
     const R *_y = py_y.data();
 
+    py::gil_scoped_release release;
+
     return maximal_independent_set_parallel<I, T, R>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -87,6 +110,8 @@ T _vertex_coloring_mis(
     const I *_Aj = py_Aj.data();
     T *_x = py_x.mutable_data();
 
+    py::gil_scoped_release release;
+
     return vertex_coloring_mis<I, T>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -113,6 +138,8 @@ T _vertex_coloring_jones_plassmann(
     T *_x = py_x.mutable_data();
     R *_z = py_z.mutable_data();
 
+    py::gil_scoped_release release;
+
     return vertex_coloring_jones_plassmann<I, T, R>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -140,6 +167,8 @@ T _vertex_coloring_LDF(
     T *_x = py_x.mutable_data();
     const R *_y = py_y.data();
 
+    py::gil_scoped_release release;
+
     return vertex_coloring_LDF<I, T, R>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -181,6 +210,8 @@ void _floyd_warshall(
     const I *_L = py_L.data();
     const I *_m = py_m.data();
 
+    py::gil_scoped_release release;
+
     return floyd_warshall<I, T>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -247,6 +278,8 @@ bool _center_nodes(
     I *_pc = py_pc.mutable_data();
     I *_s = py_s.mutable_data();
 
+    py::gil_scoped_release release;
+
     return center_nodes<I, T>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -267,6 +300,149 @@ bool _center_nodes(
                               );
 }
 
+template<class I, class T>
+bool _center_nodes_dijkstra(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<I> & c,
+       py::array_t<T> & d,
+       py::array_t<I> & m,
+       py::array_t<I> & p,
+      py::array_t<I> & pc,
+       py::array_t<I> & s
+                            )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_c = c.mutable_unchecked();
+    auto py_d = d.mutable_unchecked();
+    auto py_m = m.unchecked();
+    auto py_p = p.mutable_unchecked();
+    auto py_pc = pc.mutable_unchecked();
+    auto py_s = s.unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    I *_c = py_c.mutable_data();
+    T *_d = py_d.mutable_data();
+    const I *_m = py_m.data();
+    I *_p = py_p.mutable_data();
+    I *_pc = py_pc.mutable_data();
+    const I *_s = py_s.data();
+
+    py::gil_scoped_release release;
+
+    return center_nodes_dijkstra<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _c, c.shape(0),
+                       _d, d.shape(0),
+                       _m, m.shape(0),
+                       _p, p.shape(0),
+                      _pc, pc.shape(0),
+                       _s, s.shape(0)
+                                       );
+}
+
+template<class I, class T>
+void _rebalance_measures(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & d,
+       py::array_t<I> & m,
+       py::array_t<T> & E,
+       py::array_t<T> & S,
+      py::array_t<I> & c1,
+      py::array_t<I> & c2
+                         )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_d = d.unchecked();
+    auto py_m = m.unchecked();
+    auto py_E = E.mutable_unchecked();
+    auto py_S = S.mutable_unchecked();
+    auto py_c1 = c1.mutable_unchecked();
+    auto py_c2 = c2.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const T *_d = py_d.data();
+    const I *_m = py_m.data();
+    T *_E = py_E.mutable_data();
+    T *_S = py_S.mutable_data();
+    I *_c1 = py_c1.mutable_data();
+    I *_c2 = py_c2.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rebalance_measures<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _d, d.shape(0),
+                       _m, m.shape(0),
+                       _E, E.shape(0),
+                       _S, S.shape(0),
+                      _c1, c1.shape(0),
+                      _c2, c2.shape(0)
+                                    );
+}
+
+template<class I, class T>
+bool _rebalance_centers(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+       py::array_t<I> & m,
+       py::array_t<T> & E,
+       py::array_t<T> & S,
+      py::array_t<I> & c1,
+      py::array_t<I> & c2,
+       py::array_t<I> & c
+                        )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_m = m.unchecked();
+    auto py_E = E.unchecked();
+    auto py_S = S.unchecked();
+    auto py_c1 = c1.unchecked();
+    auto py_c2 = c2.unchecked();
+    auto py_c = c.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const I *_m = py_m.data();
+    const T *_E = py_E.data();
+    const T *_S = py_S.data();
+    const I *_c1 = py_c1.data();
+    const I *_c2 = py_c2.data();
+    I *_c = py_c.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rebalance_centers<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                       _m, m.shape(0),
+                       _E, E.shape(0),
+                       _S, S.shape(0),
+                      _c1, c1.shape(0),
+                      _c2, c2.shape(0),
+                       _c, c.shape(0)
+                                   );
+}
+
 template<class I, class T>
 void _bellman_ford(
         const I num_nodes,
@@ -294,6 +470,8 @@ void _bellman_ford(
     I *_m = py_m.mutable_data();
     I *_p = py_p.mutable_data();
 
+    py::gil_scoped_release release;
+
     return bellman_ford<I, T>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -340,6 +518,8 @@ bool _bellman_ford_balanced(
     I *_pc = py_pc.mutable_data();
     I *_s = py_s.mutable_data();
 
+    py::gil_scoped_release release;
+
     return bellman_ford_balanced<I, T>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -355,6 +535,98 @@ bool _bellman_ford_balanced(
                                        );
 }
 
+template<class I, class T>
+void _dijkstra(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<I> & c,
+       py::array_t<T> & d,
+       py::array_t<I> & m,
+       py::array_t<I> & p
+               )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_c = c.unchecked();
+    auto py_d = d.mutable_unchecked();
+    auto py_m = m.mutable_unchecked();
+    auto py_p = p.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_c = py_c.data();
+    T *_d = py_d.mutable_data();
+    I *_m = py_m.mutable_data();
+    I *_p = py_p.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return dijkstra<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _c, c.shape(0),
+                       _d, d.shape(0),
+                       _m, m.shape(0),
+                       _p, p.shape(0)
+                          );
+}
+
+template<class I, class T>
+bool _dijkstra_balanced(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<I> & c,
+       py::array_t<T> & d,
+       py::array_t<I> & m,
+       py::array_t<I> & p,
+      py::array_t<I> & pc,
+       py::array_t<I> & s,
+   const bool tiebreaking
+                        )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_c = c.unchecked();
+    auto py_d = d.mutable_unchecked();
+    auto py_m = m.mutable_unchecked();
+    auto py_p = p.mutable_unchecked();
+    auto py_pc = pc.mutable_unchecked();
+    auto py_s = s.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_c = py_c.data();
+    T *_d = py_d.mutable_data();
+    I *_m = py_m.mutable_data();
+    I *_p = py_p.mutable_data();
+    I *_pc = py_pc.mutable_data();
+    I *_s = py_s.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return dijkstra_balanced<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _c, c.shape(0),
+                       _d, d.shape(0),
+                       _m, m.shape(0),
+                       _p, p.shape(0),
+                      _pc, pc.shape(0),
+                       _s, s.shape(0),
+              tiebreaking
+                                   );
+}
+
 template<class I, class T>
 bool _most_interior_nodes(
         const I num_nodes,
@@ -382,6 +654,8 @@ bool _most_interior_nodes(
     I *_m = py_m.mutable_data();
     I *_p = py_p.mutable_data();
 
+    py::gil_scoped_release release;
+
     return most_interior_nodes<I, T>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -414,6 +688,8 @@ void _maximal_independent_set_k_parallel(
     T *_x = py_x.mutable_data();
     const R *_y = py_y.data();
 
+    py::gil_scoped_release release;
+
     return maximal_independent_set_k_parallel<I, T, R>(
                  num_rows,
                       _Ap, Ap.shape(0),
@@ -443,6 +719,8 @@ void _breadth_first_search(
     I *_order = py_order.mutable_data();
     I *_level = py_level.mutable_data();
 
+    py::gil_scoped_release release;
+
     return breadth_first_search <I>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -467,6 +745,8 @@ py::array_t<I> & components
     const I *_Aj = py_Aj.data();
     I *_components = py_components.mutable_data();
 
+    py::gil_scoped_release release;
+
     return connected_components <I>(
                 num_nodes,
                       _Ap, Ap.shape(0),
@@ -475,6 +755,39 @@ py::array_t<I> & components
                                     );
 }
 
+template<class I, class T>
+void _partition_graph(
+        const I num_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+           const I nparts,
+             const I seed,
+   py::array_t<I> & parts
+                      )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_parts = parts.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    I *_parts = py_parts.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return partition_graph<I, T>(
+                num_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                   nparts,
+                     seed,
+                   _parts, parts.shape(0)
+                                 );
+}
+
 PYBIND11_MODULE(graph, m) {
     m.doc() = R"pbdoc(
     Pybind11 bindings for graph.h
@@ -483,24 +796,34 @@ PYBIND11_MODULE(graph, m) {
     -------
     coreassert
     maximal_independent_set_serial
+    counter_uniform
+    counter_based_uniform
     maximal_independent_set_parallel
     vertex_coloring_mis
     vertex_coloring_jones_plassmann
     vertex_coloring_LDF
     floyd_warshall
     center_nodes
+    center_nodes_dijkstra
+    rebalance_measures
+    rebalance_centers
     bellman_ford
     bellman_ford_balanced
+    dijkstra
+    dijkstra_balanced
     most_interior_nodes
     maximal_independent_set_k_parallel
     breadth_first_search
     connected_components
+    partition_graph
     )pbdoc";
 
     py::options options;
     options.disable_function_signatures();
 
     m.def("maximal_independent_set_serial", &_maximal_independent_set_serial<int, int>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("active"), py::arg("C"), py::arg("F"), py::arg("x").noconvert());
+    m.def("maximal_independent_set_serial", &_maximal_independent_set_serial<std::int64_t, std::int64_t>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("active"), py::arg("C"), py::arg("F"), py::arg("x").noconvert(),
 R"pbdoc(
 Serial maximal independent set.
@@ -537,7 +860,40 @@ when determining the MIS.  Upon return, all active vertices will
 be assigned the value C or F depending on whether they are in the
 MIS or not.)pbdoc");
 
+    m.def("counter_based_uniform", &_counter_based_uniform<int, float>,
+        py::arg("n"), py::arg("seed"), py::arg("x").noconvert());
+    m.def("counter_based_uniform", &_counter_based_uniform<int, double>,
+        py::arg("n"), py::arg("seed"), py::arg("x").noconvert());
+    m.def("counter_based_uniform", &_counter_based_uniform<std::int64_t, float>,
+        py::arg("n"), py::arg("seed"), py::arg("x").noconvert());
+    m.def("counter_based_uniform", &_counter_based_uniform<std::int64_t, double>,
+        py::arg("n"), py::arg("seed"), py::arg("x").noconvert(),
+R"pbdoc(
+Counter-based random weights.
+
+Parameters
+----------
+n : int
+    Number of weights.
+seed : int
+    Random seed.
+x : array, inplace
+    Uniform random weights in [0, 1).
+
+Returns
+-------
+None
+    x is modified in place.
+
+Notes
+-----
+Weight i depends only on seed and i, so that the weights of a subset of
+the vertices (or of a partition of the vertices) are the same as when
+drawn for all vertices at once.)pbdoc");
+
     m.def("maximal_independent_set_parallel", &_maximal_independent_set_parallel<int, int, double>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("active"), py::arg("C"), py::arg("F"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("max_iters"));
+    m.def("maximal_independent_set_parallel", &_maximal_independent_set_parallel<std::int64_t, std::int64_t, double>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("active"), py::arg("C"), py::arg("F"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("max_iters"),
 R"pbdoc(
 Parallel maximal independent set.
@@ -576,9 +932,15 @@ Notes
 Only the vertices with values with x[i] == active are considered
 when determining the MIS.  Upon return, all active vertices will
 be assigned the value C or F depending on whether they are in the
-MIS or not.)pbdoc");
+MIS or not.
+
+Without a limit on the iterations, the MIS is the greedy MIS in order of
+decreasing y (ties broken by index), independent of the order in which
+the vertices are visited.)pbdoc");
 
     m.def("vertex_coloring_mis", &_vertex_coloring_mis<int, int>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert());
+    m.def("vertex_coloring_mis", &_vertex_coloring_mis<std::int64_t, std::int64_t>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(),
 R"pbdoc(
 Compute a vertex coloring for a graph stored in CSR format.
@@ -593,6 +955,8 @@ Compute a vertex coloring for a graph stored in CSR format.
  of the i-th vertex.)pbdoc");
 
     m.def("vertex_coloring_jones_plassmann", &_vertex_coloring_jones_plassmann<int, int, double>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert());
+    m.def("vertex_coloring_jones_plassmann", &_vertex_coloring_jones_plassmann<std::int64_t, std::int64_t, double>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(),
 R"pbdoc(
 Compute a vertex coloring of a graph using the Jones-Plassmann algorithm.
@@ -622,6 +986,8 @@ References
    http://citeseer.ist.psu.edu/jones92parallel.html)pbdoc");
 
     m.def("vertex_coloring_LDF", &_vertex_coloring_LDF<int, int, double>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("vertex_coloring_LDF", &_vertex_coloring_LDF<std::int64_t, std::int64_t, double>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
 R"pbdoc(
 Compute a vertex coloring of a graph using parallel Largest-Degree-First (LDF).
@@ -651,6 +1017,12 @@ References
     m.def("floyd_warshall", &_floyd_warshall<int, float>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("m").noconvert(), py::arg("a"), py::arg("N"));
     m.def("floyd_warshall", &_floyd_warshall<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("m").noconvert(), py::arg("a"), py::arg("N"));
+    m.def("floyd_warshall", &_floyd_warshall<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("m").noconvert(), py::arg("a"), py::arg("N"));
+    m.def("floyd_warshall", &_floyd_warshall<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("m").noconvert(), py::arg("a"), py::arg("N"));
+    m.def("floyd_warshall", &_floyd_warshall<std::int64_t, double>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("m").noconvert(), py::arg("a"), py::arg("N"),
 R"pbdoc(
 Floyd-Warshall on a subgraph or cluster of nodes in A.
@@ -702,6 +1074,12 @@ References
     m.def("center_nodes", &_center_nodes<int, float>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cptr").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("q").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
     m.def("center_nodes", &_center_nodes<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cptr").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("q").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes", &_center_nodes<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cptr").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("q").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes", &_center_nodes<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cptr").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("q").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes", &_center_nodes<std::int64_t, double>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Cptr").noconvert(), py::arg("D").noconvert(), py::arg("P").noconvert(), py::arg("C").noconvert(), py::arg("L").noconvert(), py::arg("q").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(),
 R"pbdoc(
 Update center nodes for a cluster
@@ -748,11 +1126,172 @@ Notes
 - pass pointer to start of each C[start,...., start+N]
 - N is the cluster size)pbdoc");
 
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert());
+    m.def("center_nodes_dijkstra", &_center_nodes_dijkstra<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(),
+R"pbdoc(
+Update center nodes for a cluster without dense distance matrices
+
+Computes the same centers as center_nodes (the node minimizing the sum
+of squared distances to the rest of its cluster), but runs one Dijkstra
+search per node restricted to the cluster instead of Floyd-Warshall.
+This needs O(n) storage, and O(s E_a log s) work for a cluster of size s
+with E_a internal edges, instead of O(s^2) storage and O(s^3) work.
+
+Parameters
+----------
+  num_nodes  : (IN) number of nodes (number of rows in A)
+  Ap[]       : (IN) CSR row pointer for A                              (num_nodes x 1)
+  Aj[]       : (IN) CSR column index for A                             (num_edges x 1)
+  Ax[]       : (IN) CSR data array (edge weights)                      (num_edges x 1)
+   c         : (INOUT) cluster center                                  (num_clusters x 1)
+   d         : (INOUT) distance to cluster center                      (num_nodes x 1)
+   m         : (IN) cluster index                                      (num_nodes x 1)
+   p         : (INOUT) predecessor on shortest path to center          (num_nodes x 1)
+   pc        : (INOUT) predecessor count                               (num_nodes x 1)
+   s         : (IN) cluster size                                       (num_clusters x 1)
+
+Returns
+-------
+changed : flag to indicate a change in arrays d or p
+
+See Also
+--------
+center_nodes)pbdoc");
+
+    m.def("rebalance_measures", &_rebalance_measures<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert());
+    m.def("rebalance_measures", &_rebalance_measures<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert());
+    m.def("rebalance_measures", &_rebalance_measures<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert());
+    m.def("rebalance_measures", &_rebalance_measures<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert());
+    m.def("rebalance_measures", &_rebalance_measures<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert());
+    m.def("rebalance_measures", &_rebalance_measures<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(),
+R"pbdoc(
+Elimination and split measures for rebalancing balanced Lloyd clusters.
+
+For each cluster a with nodes V_a and current distances d to the center:
+
+- the elimination penalty E[a] is the increase in the sum of squared
+  distances if a is removed and its nodes are reached from the
+  neighboring clusters instead,
+- the split improvement S[a] is the decrease in the sum of squared
+  distances if a is split between the best pair of centers c1[a], c2[a].
+
+Parameters
+----------
+num_nodes : int
+    Number of nodes (number of rows in A).
+Ap : array
+    CSR row pointer for A, (num_nodes, 1).
+Aj : array
+    CSR column index for A, (num_edges, 1).
+Ax : array
+    CSR data array (edge weights), (num_edges, 1).
+d : array
+    Distance to cluster center, (num_nodes, 1).
+m : array
+    Cluster index, (num_nodes, 1).
+E : array, inplace
+    Elimination penalty, (num_clusters, 1).
+S : array, inplace
+    Split improvement, (num_clusters, 1).
+c1 : array, inplace
+    First center of the best split, (num_clusters, 1).
+c2 : array, inplace
+    Second center of the best split, (num_clusters, 1).
+
+Notes
+-----
+- There are no checks within this kernel
+- Ax > 0 is assumed
+- Distances within a cluster use only the edges of the cluster.  The
+  elimination distances come from one multi-source Dijkstra search per
+  cluster, seeded with d[k] + A[k,j] over the edges k->j entering the
+  cluster.  The split improvement needs the distances between all pairs
+  of nodes of a cluster, which are computed one cluster at a time with a
+  Dijkstra search per node, so the storage is O(n + s^2) for a largest
+  cluster of size s and the work is linear in the number of clusters.
+
+See Also
+--------
+rebalance_centers)pbdoc");
+
+    m.def("rebalance_centers", &_rebalance_centers<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert());
+    m.def("rebalance_centers", &_rebalance_centers<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert());
+    m.def("rebalance_centers", &_rebalance_centers<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert());
+    m.def("rebalance_centers", &_rebalance_centers<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert());
+    m.def("rebalance_centers", &_rebalance_centers<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert());
+    m.def("rebalance_centers", &_rebalance_centers<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("m").noconvert(), py::arg("E").noconvert(), py::arg("S").noconvert(), py::arg("c1").noconvert(), py::arg("c2").noconvert(), py::arg("c").noconvert(),
+R"pbdoc(
+Greedy selection of the clusters to eliminate and split.
+
+Pairs the cluster with the smallest elimination penalty with the
+cluster with the largest split improvement, for as long as the penalty
+does not exceed the improvement.  The eliminated cluster takes the
+first new center of the split, and the split cluster the second.
+Clusters adjacent to a modified cluster are not modified again.
+
+Parameters
+----------
+num_nodes : int
+    Number of nodes (number of rows in A).
+Ap : array
+    CSR row pointer for A, (num_nodes, 1).
+Aj : array
+    CSR column index for A, (num_edges, 1).
+m : array
+    Cluster index, (num_nodes, 1).
+E : array
+    Elimination penalty, (num_clusters, 1).
+S : array
+    Split improvement, (num_clusters, 1).
+c1 : array
+    First center of the best split, (num_clusters, 1).
+c2 : array
+    Second center of the best split, (num_clusters, 1).
+c : array, inplace
+    Cluster centers, (num_clusters, 1).
+
+Returns
+-------
+bool
+    True if any center changed.
+
+See Also
+--------
+rebalance_measures)pbdoc");
+
     m.def("bellman_ford", &_bellman_ford<int, int>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
     m.def("bellman_ford", &_bellman_ford<int, float>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
     m.def("bellman_ford", &_bellman_ford<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("bellman_ford", &_bellman_ford<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("bellman_ford", &_bellman_ford<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("bellman_ford", &_bellman_ford<std::int64_t, double>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(),
 R"pbdoc(
 Apply one iteration of Bellman-Ford iteration on a distance graph stored in CSR format.
@@ -800,6 +1339,12 @@ References
     m.def("bellman_ford_balanced", &_bellman_ford_balanced<int, float>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
     m.def("bellman_ford_balanced", &_bellman_ford_balanced<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("bellman_ford_balanced", &_bellman_ford_balanced<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("bellman_ford_balanced", &_bellman_ford_balanced<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("bellman_ford_balanced", &_bellman_ford_balanced<std::int64_t, double>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"),
 R"pbdoc(
 Bellman-Ford with a heuristic to balance cluster sizes
@@ -838,11 +1383,117 @@ Bellman-Ford with a heuristic to balance cluster sizes
  --------
  pyamg.graph.bellman_ford)pbdoc");
 
+    m.def("dijkstra", &_dijkstra<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("dijkstra", &_dijkstra<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("dijkstra", &_dijkstra<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("dijkstra", &_dijkstra<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("dijkstra", &_dijkstra<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("dijkstra", &_dijkstra<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(),
+R"pbdoc(
+Multi-source Dijkstra on a distance graph stored in CSR format.
+
+Drop-in replacement for bellman_ford: every node with a finite initial
+distance is a source, and nodes are settled in order of increasing
+distance using a binary heap, so the cost is O(E log n) instead of
+O(E * diameter).
+
+Parameters
+----------
+num_nodes : int
+    Number of nodes (number of rows in A).
+Ap : array
+    CSR row pointer.
+Aj : array
+    CSR index array.
+Ax : array
+    CSR data array (edge lengths).
+c : array
+    Cluster center.
+d : array, inplace
+    Distance to nearest center.
+m : array, inplace
+    Cluster index for each node.
+p : array, inplace
+    Predecssor on the shortest path to center.
+
+Notes
+-----
+- There are no checks within this kernel.
+- Ax is assumed to be positive
+- Initializations are the same as for bellman_ford.
+
+See Also
+--------
+pyamg.graph.bellman_ford
+
+References
+----------
+.. [1] Dijkstra's algorithm Wikipedia: https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm)pbdoc");
+
+    m.def("dijkstra_balanced", &_dijkstra_balanced<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("dijkstra_balanced", &_dijkstra_balanced<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("dijkstra_balanced", &_dijkstra_balanced<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("dijkstra_balanced", &_dijkstra_balanced<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("dijkstra_balanced", &_dijkstra_balanced<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"));
+    m.def("dijkstra_balanced", &_dijkstra_balanced<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(), py::arg("pc").noconvert(), py::arg("s").noconvert(), py::arg("tiebreaking"),
+R"pbdoc(
+Dijkstra with a heuristic to balance cluster sizes
+
+ Computes the same balanced clustering as bellman_ford_balanced, but
+ restarts from the centers and settles nodes in order of increasing
+ distance.  Distance ties are broken by assigning a node to the cluster
+ with the fewest points, provided no other node uses it as predecessor.
+
+ Parameters
+ ----------
+  num_nodes  : (IN) number of nodes (number of rows in A)
+  Ap[]       : (IN) CSR row pointer for A                              (num_nodes x 1)
+  Aj[]       : (IN) CSR column index for A                             (num_edges x 1)
+  Ax[]       : (IN) CSR data array (edge weights)                      (num_edges x 1)
+   c         : (IN) cluster center                                     (num_clusters x 1)
+   d         : (INOUT) distance to cluster center                      (num_nodes x 1)
+   m         : (INOUT) cluster index                                   (num_nodes x 1)
+   p         : (INOUT) predecessor on shortest path to center          (num_nodes x 1)
+   pc        : (INOUT) number of predecessors                          (num_nodes x 1)
+   s         : (INOUT) cluster size                                    (num_clusters x 1)
+
+ Returns
+ -------
+ changed : flag to indicate a change in m or p
+
+ Notes
+ -----
+ - There are no checks within this kernel.
+ - Ax > 0 is assumed
+ - d, m, p, pc, s are reinitialized from the centers c
+
+ See Also
+ --------
+ bellman_ford_balanced)pbdoc");
+
     m.def("most_interior_nodes", &_most_interior_nodes<int, int>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
     m.def("most_interior_nodes", &_most_interior_nodes<int, float>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
     m.def("most_interior_nodes", &_most_interior_nodes<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("most_interior_nodes", &_most_interior_nodes<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("most_interior_nodes", &_most_interior_nodes<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert());
+    m.def("most_interior_nodes", &_most_interior_nodes<std::int64_t, double>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("c").noconvert(), py::arg("d").noconvert(), py::arg("m").noconvert(), py::arg("p").noconvert(),
 R"pbdoc(
 Find the most interior nodes.
@@ -877,6 +1528,8 @@ References
    PhD thesis (UIUC), August 2008.)pbdoc");
 
     m.def("maximal_independent_set_k_parallel", &_maximal_independent_set_k_parallel<int, int, double>,
+        py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("k"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("max_iters"));
+    m.def("maximal_independent_set_k_parallel", &_maximal_independent_set_k_parallel<std::int64_t, std::int64_t, double>,
         py::arg("num_rows"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("k"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("max_iters"),
 R"pbdoc(
 Compute MIS-k.
@@ -913,6 +1566,8 @@ to the set without destroying this property.  A standard MIS
 is therefore a MIS-1.)pbdoc");
 
     m.def("breadth_first_search", &_breadth_first_search<int>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("seed"), py::arg("order").noconvert(), py::arg("level").noconvert());
+    m.def("breadth_first_search", &_breadth_first_search<std::int64_t>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("seed"), py::arg("order").noconvert(), py::arg("level").noconvert(),
 R"pbdoc(
 Breadth first search.
@@ -943,6 +1598,8 @@ Notes
 The values of the level must be initialized to -1.)pbdoc");
 
     m.def("connected_components", &_connected_components<int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("components").noconvert());
+    m.def("connected_components", &_connected_components<std::int64_t>,
         py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("components").noconvert(),
 R"pbdoc(
 Compute the connected components of a graph stored in CSR format.
@@ -968,5 +1625,60 @@ Notes
 Vertices belonging to each component are marked with a unique integer
 in the range [0,K), where K is the number of components.)pbdoc");
 
+    m.def("partition_graph", &_partition_graph<int, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert());
+    m.def("partition_graph", &_partition_graph<int, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert());
+    m.def("partition_graph", &_partition_graph<int, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert());
+    m.def("partition_graph", &_partition_graph<std::int64_t, int>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert());
+    m.def("partition_graph", &_partition_graph<std::int64_t, float>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert());
+    m.def("partition_graph", &_partition_graph<std::int64_t, double>,
+        py::arg("num_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("nparts"), py::arg("seed"), py::arg("parts").noconvert(),
+R"pbdoc(
+Partition a graph into connected parts of nearly equal size.
+
+Multilevel partitioner in the spirit of METIS: the graph is coarsened
+by heavy edge matching, the coarsest graph is partitioned by greedy
+graph growing, and the partition is projected back through the levels
+with greedy boundary refinement at each level.  Finally, each part is
+made connected.
+
+Parameters
+----------
+num_nodes : int
+    Number of vertices.
+Ap : array
+    CSR row pointer.
+Aj : array
+    CSR index array.
+Ax : array
+    CSR data array (edge weights, nonnegative).
+nparts : int
+    Number of parts.
+seed : int
+    Seed of the random number generator.
+parts : array, num_nodes, inplace
+    Part label of each vertex, in [0, nparts).
+
+Returns
+-------
+None
+    In place.
+
+Notes
+-----
+The graph is assumed symmetric; diagonal entries are ignored.  Parts are
+balanced to within 3% of num_nodes / nparts, up to the vertices moved to
+make the parts connected, so some parts may end up empty.
+
+References
+----------
+.. [1] Karypis, G., and Kumar, V., "A fast and high quality multilevel
+   scheme for partitioning irregular graphs", SIAM J. Sci. Comput.,
+   20(1), 359-392, 1998.)pbdoc");
+
 }
 
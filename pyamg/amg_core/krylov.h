@@ -35,8 +35,8 @@
  *
  */
 template<class I, class T, class F>
-void apply_householders(      T z[], const int z_size,
-                        const T B[], const int B_size,
+void apply_householders(      T z[], const std::ptrdiff_t z_size,
+                        const T B[], const std::ptrdiff_t B_size,
                         const I n,
                         const I start,
                         const I stop,
@@ -104,9 +104,9 @@ void apply_householders(      T z[], const int z_size,
  *
  */
 template<class I, class T, class F>
-void householder_hornerscheme(       T z[], const int z_size,
-                               const T B[], const int B_size,
-                               const T y[], const int y_size,
+void householder_hornerscheme(       T z[], const std::ptrdiff_t z_size,
+                               const T B[], const std::ptrdiff_t B_size,
+                               const T y[], const std::ptrdiff_t y_size,
                                const I n,
                                const I start,
                                const I stop,
@@ -156,8 +156,8 @@ void householder_hornerscheme(       T z[], const int z_size,
  *
  */
 template<class I, class T, class F>
-void apply_givens(const T B[], const int B_size,
-                        T x[], const int x_size,
+void apply_givens(const T B[], const std::ptrdiff_t B_size,
+                        T x[], const std::ptrdiff_t x_size,
                   const I n,
                   const I nrot)
 {
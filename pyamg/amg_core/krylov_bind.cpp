@@ -23,6 +23,8 @@ void _apply_householders(
     T *_z = py_z.mutable_data();
     const T *_B = py_B.data();
 
+    py::gil_scoped_release release;
+
     return apply_householders<I, T, F>(
                        _z, z.shape(0),
                        _B, B.shape(0),
@@ -51,6 +53,8 @@ void _householder_hornerscheme(
     const T *_B = py_B.data();
     const T *_y = py_y.data();
 
+    py::gil_scoped_release release;
+
     return householder_hornerscheme<I, T, F>(
                        _z, z.shape(0),
                        _B, B.shape(0),
@@ -75,6 +79,8 @@ void _apply_givens(
     const T *_B = py_B.data();
     T *_x = py_x.mutable_data();
 
+    py::gil_scoped_release release;
+
     return apply_givens<I, T, F>(
                        _B, B.shape(0),
                        _x, x.shape(0),
@@ -104,6 +110,14 @@ PYBIND11_MODULE(krylov, m) {
     m.def("apply_householders", &_apply_householders<int, std::complex<float>, float>,
         py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
     m.def("apply_householders", &_apply_householders<int, std::complex<double>, double>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("apply_householders", &_apply_householders<std::int64_t, float, float>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("apply_householders", &_apply_householders<std::int64_t, double, double>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("apply_householders", &_apply_householders<std::int64_t, std::complex<float>, float>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("apply_householders", &_apply_householders<std::int64_t, std::complex<double>, double>,
         py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"),
 R"pbdoc(
 Apply Householder reflectors in B to z.
@@ -143,6 +157,14 @@ Principle calling routines are gmres and fgmres.)pbdoc");
     m.def("householder_hornerscheme", &_householder_hornerscheme<int, std::complex<float>, float>,
         py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
     m.def("householder_hornerscheme", &_householder_hornerscheme<int, std::complex<double>, double>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("householder_hornerscheme", &_householder_hornerscheme<std::int64_t, float, float>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("householder_hornerscheme", &_householder_hornerscheme<std::int64_t, double, double>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("householder_hornerscheme", &_householder_hornerscheme<std::int64_t, std::complex<float>, float>,
+        py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"));
+    m.def("householder_hornerscheme", &_householder_hornerscheme<std::int64_t, std::complex<double>, double>,
         py::arg("z").noconvert(), py::arg("B").noconvert(), py::arg("y").noconvert(), py::arg("n"), py::arg("start"), py::arg("stop"), py::arg("step"),
 R"pbdoc(
 Householder Horner Scheme.
@@ -198,6 +220,14 @@ See pages 164-167 in Saad, "Iterative Methods for Sparse Linear Systems".)pbdoc"
     m.def("apply_givens", &_apply_givens<int, std::complex<float>, float>,
         py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"));
     m.def("apply_givens", &_apply_givens<int, std::complex<double>, double>,
+        py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"));
+    m.def("apply_givens", &_apply_givens<std::int64_t, float, float>,
+        py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"));
+    m.def("apply_givens", &_apply_givens<std::int64_t, double, double>,
+        py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"));
+    m.def("apply_givens", &_apply_givens<std::int64_t, std::complex<float>, float>,
+        py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"));
+    m.def("apply_givens", &_apply_givens<std::int64_t, std::complex<double>, double>,
         py::arg("B").noconvert(), py::arg("x").noconvert(), py::arg("n"), py::arg("nrot"),
 R"pbdoc(
 Apply the first nrot Givens rotations in B to x.
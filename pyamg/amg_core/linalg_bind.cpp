@@ -19,6 +19,8 @@ void _pinv_array(
     auto py_AA = AA.mutable_unchecked();
     T *_AA = py_AA.mutable_data();
 
+    py::gil_scoped_release release;
+
     return pinv_array<I, T, F>(
                       _AA, AA.shape(0),
                         m,
@@ -27,6 +29,77 @@ void _pinv_array(
                                );
 }
 
+template<class I, class T, class F>
+void _pinv_hermitian_array(
+      py::array_t<T> & AA,
+                const I m,
+                const I n,
+              const F tol
+                           )
+{
+    auto py_AA = AA.mutable_unchecked();
+    T *_AA = py_AA.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return pinv_hermitian_array<I, T, F>(
+                      _AA, AA.shape(0),
+                        m,
+                        n,
+                      tol
+                                         );
+}
+
+template<class I, class T, class F>
+I _lu_factor_array(
+      py::array_t<T> & AA,
+     py::array_t<I> & piv,
+                const I m,
+                const I n,
+              const F tol
+                   )
+{
+    auto py_AA = AA.mutable_unchecked();
+    auto py_piv = piv.mutable_unchecked();
+    T *_AA = py_AA.mutable_data();
+    I *_piv = py_piv.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return lu_factor_array<I, T, F>(
+                      _AA, AA.shape(0),
+                     _piv, piv.shape(0),
+                        m,
+                        n,
+                      tol
+                                    );
+}
+
+template<class I, class T, class F>
+I _lu_inv_array(
+      py::array_t<T> & AA,
+    py::array_t<I> & flag,
+                const I m,
+                const I n,
+              const F tol
+                )
+{
+    auto py_AA = AA.mutable_unchecked();
+    auto py_flag = flag.mutable_unchecked();
+    T *_AA = py_AA.mutable_data();
+    I *_flag = py_flag.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return lu_inv_array<I, T, F>(
+                      _AA, AA.shape(0),
+                    _flag, flag.shape(0),
+                        m,
+                        n,
+                      tol
+                                 );
+}
+
 template <class I, class T>
 void _csc_scale_columns(
             const I n_row,
@@ -46,6 +119,8 @@ void _csc_scale_columns(
     T *_Ax = py_Ax.mutable_data();
     const T *_Xx = py_Xx.data();
 
+    py::gil_scoped_release release;
+
     return csc_scale_columns <I, T>(
                     n_row,
                     n_col,
@@ -75,6 +150,8 @@ void _csc_scale_rows(
     T *_Ax = py_Ax.mutable_data();
     const T *_Xx = py_Xx.data();
 
+    py::gil_scoped_release release;
+
     return csc_scale_rows <I, T>(
                     n_row,
                     n_col,
@@ -85,6 +162,115 @@ void _csc_scale_rows(
                                  );
 }
 
+template <class I, class T>
+void _csr_matvec_transpose(
+            const I n_row,
+            const I n_col,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<T> & Xx,
+      py::array_t<T> & Yx,
+             const I conj
+                           )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Xx = Xx.unchecked();
+    auto py_Yx = Yx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const T *_Xx = py_Xx.data();
+    T *_Yx = py_Yx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return csr_matvec_transpose <I, T>(
+                    n_row,
+                    n_col,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Xx, Xx.shape(0),
+                      _Yx, Yx.shape(0),
+                     conj
+                                       );
+}
+
+template <class I, class T>
+void _bsr_matvec_transpose(
+           const I n_brow,
+           const I n_bcol,
+                const I R,
+                const I C,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<T> & Xx,
+      py::array_t<T> & Yx,
+             const I conj
+                           )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Xx = Xx.unchecked();
+    auto py_Yx = Yx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const T *_Xx = py_Xx.data();
+    T *_Yx = py_Yx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return bsr_matvec_transpose <I, T>(
+                   n_brow,
+                   n_bcol,
+                        R,
+                        C,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Xx, Xx.shape(0),
+                      _Yx, Yx.shape(0),
+                     conj
+                                       );
+}
+
+template <class I, class T>
+void _stencil_matvec(
+    py::array_t<I> & grid,
+ py::array_t<I> & offsets,
+  py::array_t<T> & values,
+       py::array_t<T> & x,
+       py::array_t<T> & y
+                     )
+{
+    auto py_grid = grid.unchecked();
+    auto py_offsets = offsets.unchecked();
+    auto py_values = values.unchecked();
+    auto py_x = x.unchecked();
+    auto py_y = y.mutable_unchecked();
+    const I *_grid = py_grid.data();
+    const I *_offsets = py_offsets.data();
+    const T *_values = py_values.data();
+    const T *_x = py_x.data();
+    T *_y = py_y.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return stencil_matvec <I, T>(
+                    _grid, grid.shape(0),
+                 _offsets, offsets.shape(0),
+                  _values, values.shape(0),
+                       _x, x.shape(0),
+                       _y, y.shape(0)
+                                 );
+}
+
 template<class I, class T, class F>
 void _filter_matrix_rows(
             const I n_row,
@@ -102,6 +288,8 @@ void _filter_matrix_rows(
     const I *_Aj = py_Aj.data();
     T *_Ax = py_Ax.mutable_data();
 
+    py::gil_scoped_release release;
+
     return filter_matrix_rows<I, T, F>(
                     n_row,
                     theta,
@@ -150,8 +338,14 @@ PYBIND11_MODULE(linalg, m) {
     zero_imag
     zero_imag
     pinv_array
+    pinv_hermitian_array
+    lu_factor_array
+    lu_inv_array
     csc_scale_columns
     csc_scale_rows
+    csr_matvec_transpose
+    bsr_matvec_transpose
+    stencil_matvec
     filter_matrix_rows
     )pbdoc";
 
@@ -165,6 +359,14 @@ PYBIND11_MODULE(linalg, m) {
     m.def("pinv_array", &_pinv_array<int, std::complex<float>, float>,
         py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"));
     m.def("pinv_array", &_pinv_array<int, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"));
+    m.def("pinv_array", &_pinv_array<std::int64_t, float, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"));
+    m.def("pinv_array", &_pinv_array<std::int64_t, double, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"));
+    m.def("pinv_array", &_pinv_array<std::int64_t, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"));
+    m.def("pinv_array", &_pinv_array<std::int64_t, std::complex<double>, double>,
         py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("TransA"),
 R"pbdoc(
 Replace each block of A with a Moore-Penrose pseudoinverse of that block.
@@ -212,11 +414,150 @@ Examples
 >>> print "Changing flag to \'F\' results in different Inverse\n" + str(np.dot(A[0], Ac[0]))
 >>> print "A holds the inverse of the transpose\n" + str(np.dot(A[0], Ac[0].T)))pbdoc");
 
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<int, float, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<int, double, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<int, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<int, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<std::int64_t, float, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<std::int64_t, double, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<std::int64_t, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("pinv_hermitian_array", &_pinv_hermitian_array<std::int64_t, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"),
+R"pbdoc(
+Replace each Hermitian block of A with its Moore-Penrose pseudoinverse.
+
+Parameters
+----------
+AA : array
+    An array of m Hermitian blocks, each of size n x n, in row-major form.
+m : int
+    Number of blocks.
+n : int
+    Dimension of each block.
+tol : float
+    Eigenvalues with ``|lambda| <= tol * max(|lambda|)`` are treated as zero.
+
+Returns
+-------
+None
+    AA is modified in place with the pseudoinverse replacing each block.
+
+Notes
+-----
+Each block is diagonalized with the cyclic Jacobi eigenvalue method,
+``A = V diag(lambda) V^H``.  The singular values of a Hermitian matrix are
+the ``|lambda|``, so the rank decision matches a pseudoinverse computed
+from the SVD with relative cutoff tol, e.g., LAPACK gelss with
+``rcond = tol``.  For small blocks, this avoids the per-block overhead of
+calling LAPACK.)pbdoc");
+
+    m.def("lu_factor_array", &_lu_factor_array<int, float, float>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<int, double, double>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<int, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<int, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<std::int64_t, float, float>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<std::int64_t, double, double>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<std::int64_t, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_factor_array", &_lu_factor_array<std::int64_t, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("piv").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"),
+R"pbdoc(
+Compute the LU factorization of each block of a 3D array in place.
+
+Parameters
+----------
+AA : array
+    An array of m blocks, each of size n x n, in row-major form.
+piv : array
+    Array of size m*n, holding the row pivots of each block.
+m : int
+    Number of blocks.
+n : int
+    Dimension of each block.
+tol : float
+    A block is treated as singular if a pivot is smaller than tol
+    times its largest entry in magnitude.
+
+Returns
+-------
+int
+    Number of singular blocks.  Singular blocks are left unchanged
+    and marked with piv[i*n] = -1.
+
+Notes
+-----
+LU factors and pivots follow the row-major analog of LAPACK getrf,
+with L stored below the diagonal (unit diagonal omitted) and U on
+and above the diagonal.)pbdoc");
+
+    m.def("lu_inv_array", &_lu_inv_array<int, float, float>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<int, double, double>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<int, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<int, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<std::int64_t, float, float>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<std::int64_t, double, double>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<std::int64_t, std::complex<float>, float>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"));
+    m.def("lu_inv_array", &_lu_inv_array<std::int64_t, std::complex<double>, double>,
+        py::arg("AA").noconvert(), py::arg("flag").noconvert(), py::arg("m"), py::arg("n"), py::arg("tol"),
+R"pbdoc(
+Invert each block of a 3D array in place using LU factorization.
+
+Parameters
+----------
+AA : array
+    An array of m blocks, each of size n x n, in row-major form.
+flag : array
+    Array of size m, set to 1 for singular blocks and 0 otherwise.
+m : int
+    Number of blocks.
+n : int
+    Dimension of each block.
+tol : float
+    A block is treated as singular if a pivot is smaller than tol
+    times its largest entry in magnitude.
+
+Returns
+-------
+int
+    Number of singular blocks.  Singular blocks are left unchanged,
+    e.g., for a pseudo-inverse to be computed by the caller.
+
+Notes
+-----
+The cost is about 2n^3 operations per block, compared to a one-sided
+Jacobi SVD in pinv_array.)pbdoc");
+
     m.def("csc_scale_columns", &_csc_scale_columns<int, int>,
         py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
     m.def("csc_scale_columns", &_csc_scale_columns<int, float>,
         py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
     m.def("csc_scale_columns", &_csc_scale_columns<int, double>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_columns", &_csc_scale_columns<std::int64_t, int>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_columns", &_csc_scale_columns<std::int64_t, float>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_columns", &_csc_scale_columns<std::int64_t, double>,
         py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(),
 R"pbdoc(
 Scale the columns of a CSC matrix *in place*.
@@ -233,6 +574,12 @@ https://github.com/scipy/scipy/blob/master/scipy/sparse/sparsetools/csr.h)pbdoc"
     m.def("csc_scale_rows", &_csc_scale_rows<int, float>,
         py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
     m.def("csc_scale_rows", &_csc_scale_rows<int, double>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_rows", &_csc_scale_rows<std::int64_t, int>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_rows", &_csc_scale_rows<std::int64_t, float>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert());
+    m.def("csc_scale_rows", &_csc_scale_rows<std::int64_t, double>,
         py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(),
 R"pbdoc(
 Scale the rows of a CSC matrix *in place*.
@@ -244,6 +591,152 @@ References
 ----------
 https://github.com/scipy/scipy/blob/master/scipy/sparse/sparsetools/csr.h)pbdoc");
 
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<int, float>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<int, double>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<int, std::complex<float>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<int, std::complex<double>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<std::int64_t, float>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<std::int64_t, double>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<std::int64_t, std::complex<float>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("csr_matvec_transpose", &_csr_matvec_transpose<std::int64_t, std::complex<double>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"),
+R"pbdoc(
+Multiply a vector by the (conjugate) transpose of a CSR matrix.
+
+..
+  Y = A^T X   or   Y = A^H X
+
+Parameters
+----------
+n_row : int
+    Number of rows in A.
+n_col : int
+    Number of columns in A.
+Ap : array
+    CSR row pointer.
+Aj : array
+    CSR index array.
+Ax : array
+    CSR data array.
+Xx : array, n_row
+    Input vector.
+Yx : array, n_col, inplace
+    Output vector.
+conj : int
+    If nonzero, multiply by the conjugate transpose.
+
+Returns
+-------
+None
+    Nothing, Yx is modified in place.
+
+Notes
+-----
+The rows of A are scattered into Y, so no transpose of A is formed.)pbdoc");
+
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<int, float>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<int, double>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<int, std::complex<float>>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<int, std::complex<double>>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<std::int64_t, float>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<std::int64_t, double>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<std::int64_t, std::complex<float>>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"));
+    m.def("bsr_matvec_transpose", &_bsr_matvec_transpose<std::int64_t, std::complex<double>>,
+        py::arg("n_brow"), py::arg("n_bcol"), py::arg("R"), py::arg("C"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xx").noconvert(), py::arg("Yx").noconvert(), py::arg("conj"),
+R"pbdoc(
+Multiply a vector by the (conjugate) transpose of a BSR matrix.
+
+..
+  Y = A^T X   or   Y = A^H X
+
+Parameters
+----------
+n_brow : int
+    Number of block rows in A.
+n_bcol : int
+    Number of block columns in A.
+R : int
+    Number of rows in each block.
+C : int
+    Number of columns in each block.
+Ap : array
+    BSR row pointer.
+Aj : array
+    BSR index array.
+Ax : array
+    BSR data array (row-major blocks).
+Xx : array, n_brow*R
+    Input vector.
+Yx : array, n_bcol*C, inplace
+    Output vector.
+conj : int
+    If nonzero, multiply by the conjugate transpose.
+
+Returns
+-------
+None
+    Nothing, Yx is modified in place.)pbdoc");
+
+    m.def("stencil_matvec", &_stencil_matvec<int, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<int, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<int, std::complex<float>>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<int, std::complex<double>>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<std::int64_t, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<std::int64_t, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<std::int64_t, std::complex<float>>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("stencil_matvec", &_stencil_matvec<std::int64_t, std::complex<double>>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
+R"pbdoc(
+Multiply a vector by the matrix of a constant stencil on a regular grid.
+
+..
+  y = A x
+
+where row i of A applies the stencil at grid point i, and entries of the
+stencil that fall outside the grid are dropped, as in
+``pyamg.gallery.stencil_grid``.  The grid is traversed one line along the
+last axis at a time, so that the inner loop is a unit stride update for
+each stencil entry.
+
+Parameters
+----------
+grid : array, ndim
+    Grid dimensions.
+offsets : array, n_entries*ndim
+    Offset of each nonzero stencil entry from the stencil center.
+values : array, n_entries
+    Value of each nonzero stencil entry.
+x : array, prod(grid)
+    Input vector.
+y : array, prod(grid), inplace
+    Output vector.
+
+Returns
+-------
+None
+    Nothing, y is modified in place.)pbdoc");
+
     m.def("filter_matrix_rows", &_filter_matrix_rows<int, float, float>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
     m.def("filter_matrix_rows", &_filter_matrix_rows<int, double, double>,
@@ -251,6 +744,14 @@ https://github.com/scipy/scipy/blob/master/scipy/sparse/sparsetools/csr.h)pbdoc"
     m.def("filter_matrix_rows", &_filter_matrix_rows<int, std::complex<float>, float>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
     m.def("filter_matrix_rows", &_filter_matrix_rows<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
+    m.def("filter_matrix_rows", &_filter_matrix_rows<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
+    m.def("filter_matrix_rows", &_filter_matrix_rows<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
+    m.def("filter_matrix_rows", &_filter_matrix_rows<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"));
+    m.def("filter_matrix_rows", &_filter_matrix_rows<std::int64_t, std::complex<double>, double>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("lump"),
 R"pbdoc(
 Filter matrix rows by diagonal entry.
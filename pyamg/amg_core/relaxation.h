@@ -1,6 +1,9 @@
 #ifndef RELAXATION_H
 #define RELAXATION_H
 
+#include <vector>
+#include <algorithm>
+
 #include "linalg.h"
 
 /*
@@ -46,11 +49,11 @@
  *
  */
 template<class I, class T, class F>
-void gauss_seidel(const I Ap[], const int Ap_size,
-                  const I Aj[], const int Aj_size,
-                  const T Ax[], const int Ax_size,
-                        T  x[], const int  x_size,
-                  const T  b[], const int  b_size,
+void gauss_seidel(const I Ap[], const std::ptrdiff_t Ap_size,
+                  const I Aj[], const std::ptrdiff_t Aj_size,
+                  const T Ax[], const std::ptrdiff_t Ax_size,
+                        T  x[], const std::ptrdiff_t  x_size,
+                  const T  b[], const std::ptrdiff_t  b_size,
                   const I row_start,
                   const I row_stop,
                   const I row_step)
@@ -114,11 +117,11 @@ void gauss_seidel(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void sor_gauss_seidel(const I Ap[], const int Ap_size,
-                  const I Aj[], const int Aj_size,
-                  const T Ax[], const int Ax_size,
-                        T  x[], const int  x_size,
-                  const T  b[], const int  b_size,
+void sor_gauss_seidel(const I Ap[], const std::ptrdiff_t Ap_size,
+                  const I Aj[], const std::ptrdiff_t Aj_size,
+                  const T Ax[], const std::ptrdiff_t Ax_size,
+                        T  x[], const std::ptrdiff_t  x_size,
+                  const T  b[], const std::ptrdiff_t  b_size,
                   const I row_start,
                   const I row_stop,
                   const I row_step,
@@ -183,11 +186,11 @@ void sor_gauss_seidel(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void bsr_gauss_seidel(const I Ap[], const int Ap_size,
-                      const I Aj[], const int Aj_size,
-                      const T Ax[], const int Ax_size,
-                            T  x[], const int  x_size,
-                      const T  b[], const int  b_size,
+void bsr_gauss_seidel(const I Ap[], const std::ptrdiff_t Ap_size,
+                      const I Aj[], const std::ptrdiff_t Aj_size,
+                      const T Ax[], const std::ptrdiff_t Ax_size,
+                            T  x[], const std::ptrdiff_t  x_size,
+                      const T  b[], const std::ptrdiff_t  b_size,
                       const I row_start,
                       const I row_stop,
                       const I row_step,
@@ -233,8 +236,8 @@ void bsr_gauss_seidel(const I Ap[], const int Ap_size,
             else {
                 // do a dense multiply of this block times x and accumulate in rsum
                 gemm(&(Ax[jj*B2]),  blocksize, blocksize, 'F',
-                     &(x[col]),     blocksize,   1,       'F',
-                     &(Axloc[0]),   blocksize,   1,       'F',
+                     &(x[col]),     blocksize,   (I)1,       'F',
+                     &(Axloc[0]),   blocksize,   (I)1,       'F',
                      'T');
                 for(I m = 0; m < blocksize; m++) {
                     rsum[m] -= Axloc[m]; }
@@ -307,16 +310,16 @@ void bsr_gauss_seidel(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void jacobi(const I Ap[], const int Ap_size,
-            const I Aj[], const int Aj_size,
-            const T Ax[], const int Ax_size,
-                  T  x[], const int  x_size,
-            const T  b[], const int  b_size,
-                  T temp[], const int temp_size,
+void jacobi(const I Ap[], const std::ptrdiff_t Ap_size,
+            const I Aj[], const std::ptrdiff_t Aj_size,
+            const T Ax[], const std::ptrdiff_t Ax_size,
+                  T  x[], const std::ptrdiff_t  x_size,
+            const T  b[], const std::ptrdiff_t  b_size,
+                  T temp[], const std::ptrdiff_t temp_size,
             const I row_start,
             const I row_stop,
             const I row_step,
-            const T omega[], const int omega_size)
+            const T omega[], const std::ptrdiff_t omega_size)
 {
     T one = 1.0;
     T omega2 = omega[0];
@@ -346,6 +349,89 @@ void jacobi(const I Ap[], const int Ap_size,
 }
 
 
+/*
+ * Weighted Jacobi iteration on a block of vectors with zero right-hand side.
+ *
+ * Perform several iterations of Jacobi relaxation on A X = 0, where A is
+ * stored in CSR format and X holds R vectors stored row-wise, i.e., X is an
+ * (n x R) array in C (row-major) ordering.  All R vectors are relaxed in the
+ * same sweep over A.  Damping is controlled by the omega parameter.
+ *
+ * Parameters
+ * ----------
+ * Ap : array
+ *     CSR row pointer.
+ * Aj : array
+ *     CSR index array.
+ * Ax : array
+ *     CSR data array.
+ * x : array
+ *     Block of vectors, (n x R) in row-major ordering.
+ * temp : array
+ *     Temporary array the same size as x.
+ * R : int
+ *     Number of vectors.
+ * iterations : int
+ *     Number of Jacobi iterations.
+ * omega : float
+ *     Damping parameter.
+ *
+ * Returns
+ * -------
+ * None
+ *     Array x will be modified inplace.
+ *
+ * Notes
+ * -----
+ * Rows with a zero diagonal are left unchanged, as in jacobi.
+ *
+ */
+template<class I, class T>
+void jacobi_multivector(const I Ap[], const std::ptrdiff_t Ap_size,
+                        const I Aj[], const std::ptrdiff_t Aj_size,
+                        const T Ax[], const std::ptrdiff_t Ax_size,
+                              T  x[], const std::ptrdiff_t  x_size,
+                              T temp[], const std::ptrdiff_t temp_size,
+                        const I R,
+                        const I iterations,
+                        const T omega)
+{
+    const I n = Ap_size - 1;
+    std::vector<T> rsum(R);
+
+    for(I iter = 0; iter < iterations; iter++){
+        std::copy(x, x + (std::size_t) n*R, temp);
+
+        for(I i = 0; i < n; i++){
+            T diag = 0;
+            std::fill(rsum.begin(), rsum.end(), (T) 0);
+
+            for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+                const I j = Aj[jj];
+                if (i == j){
+                    diag = Ax[jj];
+                }
+                else{
+                    const T a = Ax[jj];
+                    const T * xj = temp + (std::size_t) j*R;
+                    for(I r = 0; r < R; r++){
+                        rsum[r] += a*xj[r];
+                    }
+                }
+            }
+
+            if (diag != (T) 0.0){
+                T * xi = x + (std::size_t) i*R;
+                const T * ti = temp + (std::size_t) i*R;
+                for(I r = 0; r < R; r++){
+                    xi[r] = (1 - omega) * ti[r] - omega * (rsum[r]/diag);
+                }
+            }
+        }
+    }
+}
+
+
 /*
  * Indexed weighted Jacobi iteration.
  *
@@ -380,13 +466,13 @@ void jacobi(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void jacobi_indexed(const I Ap[], const int Ap_size,
-                    const I Aj[], const int Aj_size,
-                    const T Ax[], const int Ax_size,
-                          T  x[], const int  x_size,
-                    const T  b[], const int  b_size,
-                    const I indices[], const int indices_size,
-                    const T omega[], const int omega_size)
+void jacobi_indexed(const I Ap[], const std::ptrdiff_t Ap_size,
+                    const I Aj[], const std::ptrdiff_t Aj_size,
+                    const T Ax[], const std::ptrdiff_t Ax_size,
+                          T  x[], const std::ptrdiff_t  x_size,
+                    const T  b[], const std::ptrdiff_t  b_size,
+                    const I indices[], const std::ptrdiff_t indices_size,
+                    const T omega[], const std::ptrdiff_t omega_size)
 {
     T one = 1.0;
     T omega2 = omega[0];
@@ -470,17 +556,17 @@ void jacobi_indexed(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void bsr_jacobi(const I Ap[], const int Ap_size,
-                const I Aj[], const int Aj_size,
-                const T Ax[], const int Ax_size,
-                      T  x[], const int  x_size,
-                const T  b[], const int  b_size,
-                      T temp[], const int temp_size,
+void bsr_jacobi(const I Ap[], const std::ptrdiff_t Ap_size,
+                const I Aj[], const std::ptrdiff_t Aj_size,
+                const T Ax[], const std::ptrdiff_t Ax_size,
+                      T  x[], const std::ptrdiff_t  x_size,
+                const T  b[], const std::ptrdiff_t  b_size,
+                      T temp[], const std::ptrdiff_t temp_size,
                 const I row_start,
                 const I row_stop,
                 const I row_step,
                 const I blocksize,
-                const T omega[], const int omega_size)
+                const T omega[], const std::ptrdiff_t omega_size)
 {
     I B2 = blocksize*blocksize;
     T *rsum = new T[blocksize];
@@ -502,9 +588,11 @@ void bsr_jacobi(const I Ap[], const int Ap_size,
         step_end = blocksize;
     }
 
-    // copy x to temp
-    for(I i = 0; i < abs(row_stop-row_start)*blocksize; i += step) {
-        temp[i] = x[i];
+    // copy x to temp for the rows of the sweep
+    for(I i = row_start; i != row_stop; i += row_step) {
+        for(I k = 0; k < blocksize; k++) {
+            temp[i*blocksize + k] = x[i*blocksize + k];
+        }
     }
 
     for(I i = row_start; i != row_stop; i += row_step) {
@@ -529,8 +617,8 @@ void bsr_jacobi(const I Ap[], const int Ap_size,
             else {
                 // do a dense multiply of this block times x and accumulate in rsum
                 gemm(&(Ax[jj*B2]),  blocksize, blocksize, 'F',
-                     &(temp[col]),  blocksize,   1,       'F',
-                     &(Axloc[0]),   blocksize,   1,       'F',
+                     &(temp[col]),  blocksize,   (I)1,       'F',
+                     &(Axloc[0]),   blocksize,   (I)1,       'F',
                      'T');
                 for(I m = 0; m < blocksize; m++) {
                     rsum[m] -= Axloc[m]; }
@@ -600,14 +688,14 @@ void bsr_jacobi(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void bsr_jacobi_indexed(const I Ap[], const int Ap_size,
-                        const I Aj[], const int Aj_size,
-                        const T Ax[], const int Ax_size,
-                              T  x[], const int  x_size,
-                        const T  b[], const int  b_size,
-                        const I indices[], const int indices_size,
+void bsr_jacobi_indexed(const I Ap[], const std::ptrdiff_t Ap_size,
+                        const I Aj[], const std::ptrdiff_t Aj_size,
+                        const T Ax[], const std::ptrdiff_t Ax_size,
+                              T  x[], const std::ptrdiff_t  x_size,
+                        const T  b[], const std::ptrdiff_t  b_size,
+                        const I indices[], const std::ptrdiff_t indices_size,
                         const I blocksize,
-                        const T omega[], const int omega_size)
+                        const T omega[], const std::ptrdiff_t omega_size)
 {
     I B2 = blocksize*blocksize;
     T *rsum = new T[blocksize];
@@ -646,8 +734,8 @@ void bsr_jacobi_indexed(const I Ap[], const int Ap_size,
             else {
                 // do a dense multiply of this block times x and accumulate in rsum
                 gemm(&(Ax[jj*B2]),  blocksize, blocksize, 'F',
-                     &(temp[col]),  blocksize,   1,       'F',
-                     &(Axloc[0]),   blocksize,   1,       'F',
+                     &(temp[col]),  blocksize,   (I)1,       'F',
+                     &(Axloc[0]),   blocksize,   (I)1,       'F',
                      'T');
                 for(I m = 0; m < blocksize; m++) {
                     rsum[m] -= Axloc[m];
@@ -734,12 +822,12 @@ void bsr_jacobi_indexed(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void gauss_seidel_indexed(const I Ap[], const int Ap_size,
-                          const I Aj[], const int Aj_size,
-                          const T Ax[], const int Ax_size,
-                                T  x[], const int  x_size,
-                          const T  b[], const int  b_size,
-                          const I Id[], const int Id_size,
+void gauss_seidel_indexed(const I Ap[], const std::ptrdiff_t Ap_size,
+                          const I Aj[], const std::ptrdiff_t Aj_size,
+                          const T Ax[], const std::ptrdiff_t Ax_size,
+                                T  x[], const std::ptrdiff_t  x_size,
+                          const T  b[], const std::ptrdiff_t  b_size,
+                          const I Id[], const std::ptrdiff_t Id_size,
                           const I row_start,
                           const I row_stop,
                           const I row_step)
@@ -808,17 +896,17 @@ void gauss_seidel_indexed(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void jacobi_ne(const I Ap[], const int Ap_size,
-               const I Aj[], const int Aj_size,
-               const T Ax[], const int Ax_size,
-                     T  x[], const int  x_size,
-               const T  b[], const int  b_size,
-               const T Tx[], const int Tx_size,
-                     T temp[], const int temp_size,
+void jacobi_ne(const I Ap[], const std::ptrdiff_t Ap_size,
+               const I Aj[], const std::ptrdiff_t Aj_size,
+               const T Ax[], const std::ptrdiff_t Ax_size,
+                     T  x[], const std::ptrdiff_t  x_size,
+               const T  b[], const std::ptrdiff_t  b_size,
+               const T Tx[], const std::ptrdiff_t Tx_size,
+                     T temp[], const std::ptrdiff_t temp_size,
                const I row_start,
                const I row_stop,
                const I row_step,
-               const T omega[], const int omega_size)
+               const T omega[], const std::ptrdiff_t omega_size)
 {
     //rename
     const T * delta = Tx;
@@ -872,15 +960,15 @@ void jacobi_ne(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void gauss_seidel_ne(const I Ap[], const int Ap_size,
-                     const I Aj[], const int Aj_size,
-                     const T Ax[], const int Ax_size,
-                           T  x[], const int  x_size,
-                     const T  b[], const int  b_size,
+void gauss_seidel_ne(const I Ap[], const std::ptrdiff_t Ap_size,
+                     const I Aj[], const std::ptrdiff_t Aj_size,
+                     const T Ax[], const std::ptrdiff_t Ax_size,
+                           T  x[], const std::ptrdiff_t  x_size,
+                     const T  b[], const std::ptrdiff_t  b_size,
                      const I row_start,
                      const I row_stop,
                      const I row_step,
-                     const T Tx[], const int Tx_size,
+                     const T Tx[], const std::ptrdiff_t Tx_size,
                      const F omega)
 {
     //rename
@@ -936,15 +1024,15 @@ void gauss_seidel_ne(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void gauss_seidel_nr(const I Ap[], const int Ap_size,
-                     const I Aj[], const int Aj_size,
-                     const T Ax[], const int Ax_size,
-                           T  x[], const int  x_size,
-                           T  z[], const int  z_size,
+void gauss_seidel_nr(const I Ap[], const std::ptrdiff_t Ap_size,
+                     const I Aj[], const std::ptrdiff_t Aj_size,
+                     const T Ax[], const std::ptrdiff_t Ax_size,
+                           T  x[], const std::ptrdiff_t  x_size,
+                           T  z[], const std::ptrdiff_t  z_size,
                      const I col_start,
                      const I col_stop,
                      const I col_step,
-                     const T Tx[], const int Tx_size,
+                     const T Tx[], const std::ptrdiff_t Tx_size,
                      const F omega)
 {
     //rename
@@ -1019,17 +1107,17 @@ void gauss_seidel_nr(const I Ap[], const int Ap_size,
  *     Result in place.
  */
 template<class I, class T, class F>
-void block_jacobi(const I Ap[], const int Ap_size,
-                  const I Aj[], const int Aj_size,
-                  const T Ax[], const int Ax_size,
-                        T  x[], const int  x_size,
-                  const T  b[], const int  b_size,
-                  const T Tx[], const int Tx_size,
-                        T temp[], const int temp_size,
+void block_jacobi(const I Ap[], const std::ptrdiff_t Ap_size,
+                  const I Aj[], const std::ptrdiff_t Aj_size,
+                  const T Ax[], const std::ptrdiff_t Ax_size,
+                        T  x[], const std::ptrdiff_t  x_size,
+                  const T  b[], const std::ptrdiff_t  b_size,
+                  const T Tx[], const std::ptrdiff_t Tx_size,
+                        T temp[], const std::ptrdiff_t temp_size,
                   const I row_start,
                   const I row_stop,
                   const I row_step,
-                  const T omega[], const int omega_size,
+                  const T omega[], const std::ptrdiff_t omega_size,
                   const I blocksize)
 {
     // Rename
@@ -1062,8 +1150,8 @@ void block_jacobi(const I Ap[], const int Ap_size,
             }
             else {
                 gemm(&(Ax[jj*blocksize_sq]), blocksize, blocksize, 'F',
-                     &(temp[j*blocksize]),   blocksize, 1,         'F',
-                     &(v[0]),                blocksize, 1,         'F',
+                     &(temp[j*blocksize]),   blocksize, (I)1,         'F',
+                     &(v[0]),                blocksize, (I)1,         'F',
                      'T');
                 for(I k = 0; k < blocksize; k++) {
                     rsum[k] += v[k]; }
@@ -1077,8 +1165,8 @@ void block_jacobi(const I Ap[], const int Ap_size,
             rsum[k] = b[iblocksize + k] - rsum[k]; }
 
         gemm(&(Dinv[i*blocksize_sq]), blocksize, blocksize, 'F',
-             &(rsum[0]),              blocksize, 1,         'F',
-             &(v[0]),                 blocksize, 1,         'F',
+             &(rsum[0]),              blocksize, (I)1,         'F',
+             &(v[0]),                 blocksize, (I)1,         'F',
              'T');
 
         for(I k = 0; k < blocksize; k++) {
@@ -1090,6 +1178,120 @@ void block_jacobi(const I Ap[], const int Ap_size,
 }
 
 
+/*
+ * Block Jacobi iteration with LU factored diagonal blocks.
+ *
+ * Perform one iteration of block Jacobi relaxation on the linear
+ * system Ax = b, where A is stored in BSR format and x and b are
+ * column vectors.  The diagonal blocks are applied through their LU
+ * factors, as computed by lu_factor_array, instead of explicit
+ * inverses.  Damping is controlled by the omega parameter.
+ *
+ * Parameters
+ * ----------
+ * Ap : array
+ *     BSR row pointer.
+ * Aj : array
+ *     BSR index array.
+ * Ax : array
+ *     BSR data array, blocks assumed square.
+ * x : array
+ *     Approximate solution.
+ * b : array
+ *     Right hand side.
+ * LU : array
+ *     LU factors of each diagonal block of A stored
+ *     as a (n/blocksize, blocksize, blocksize) array.
+ * piv : array
+ *     Row pivots of each factorization, size n.  If piv[i*blocksize]
+ *     is -1, block i of LU holds an explicit (pseudo-)inverse.
+ * temp : array
+ *     Temporary vector the same size as x.
+ * row_start : int
+ *     Beginning of the sweep.
+ * row_stop : int
+ *     End of the sweep (i.e. one past the last unknown).
+ * row_step : int
+ *     Stride used during the sweep (may be negative).
+ * omega : float
+ *     Damping parameter.
+ * blocksize : int
+ *     Dimension of square blocks in BSR matrix A.
+ *
+ * Returns
+ * -------
+ * None
+ *     Result in place.
+ */
+template<class I, class T, class F>
+void block_jacobi_lu(const I Ap[], const std::ptrdiff_t Ap_size,
+                     const I Aj[], const std::ptrdiff_t Aj_size,
+                     const T Ax[], const std::ptrdiff_t Ax_size,
+                           T  x[], const std::ptrdiff_t  x_size,
+                     const T  b[], const std::ptrdiff_t  b_size,
+                     const T LU[], const std::ptrdiff_t LU_size,
+                     const I piv[], const std::ptrdiff_t piv_size,
+                           T temp[], const std::ptrdiff_t temp_size,
+                     const I row_start,
+                     const I row_stop,
+                     const I row_step,
+                     const T omega[], const std::ptrdiff_t omega_size,
+                     const I blocksize)
+{
+    T one = 1.0;
+    T zero = 0.0;
+    T omega2 = omega[0];
+    std::vector<T> rsum(blocksize);
+    std::vector<T> v(blocksize);
+    I blocksize_sq = blocksize*blocksize;
+
+    // Copy x to temp vector
+    for(I i = row_start*blocksize; i != row_stop*blocksize; i += row_step*blocksize) {
+        std::copy(&(x[i]), &(x[i+blocksize]), &(temp[i]));
+    }
+
+    // Begin block Jacobi sweep
+    for(I i = row_start; i != row_stop; i += row_step) {
+        I iblocksize = i*blocksize;
+        std::fill(rsum.begin(), rsum.end(), zero);
+
+        // Carry out a block dot product between block row i and x
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            I j = Aj[jj];
+            if (i == j) {
+                continue;
+            }
+            const T * block = &(Ax[jj*blocksize_sq]);
+            for(I k = 0; k < blocksize; k++) {
+                for(I c = 0; c < blocksize; c++) {
+                    rsum[k] += block[k*blocksize + c]*temp[j*blocksize + c];
+                }
+            }
+        }
+        for(I k = 0; k < blocksize; k++) {
+            rsum[k] = b[iblocksize + k] - rsum[k]; }
+
+        // v = D_i^{-1} rsum
+        const T * D = &(LU[i*blocksize_sq]);
+        if (piv[iblocksize] < 0) {
+            for(I k = 0; k < blocksize; k++) {
+                v[k] = zero;
+                for(I c = 0; c < blocksize; c++) {
+                    v[k] += D[k*blocksize + c]*rsum[c];
+                }
+            }
+        }
+        else {
+            std::copy(rsum.begin(), rsum.end(), v.begin());
+            lu_solve_block(D, &(piv[iblocksize]), &(v[0]), blocksize);
+        }
+
+        for(I k = 0; k < blocksize; k++) {
+            x[iblocksize + k] = (one - omega2)*temp[iblocksize + k] + omega2*v[k]; }
+    }
+}
+
+
 /*
  * Indexed Block Jacobi iteration.
  *
@@ -1127,14 +1329,14 @@ void block_jacobi(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void block_jacobi_indexed(const I Ap[], const int Ap_size,
-                          const I Aj[], const int Aj_size,
-                          const T Ax[], const int Ax_size,
-                                T  x[], const int  x_size,
-                          const T  b[], const int  b_size,
-                          const T Tx[], const int Tx_size,
-                          const I indices[], const int indices_size,
-                          const T omega[], const int omega_size,
+void block_jacobi_indexed(const I Ap[], const std::ptrdiff_t Ap_size,
+                          const I Aj[], const std::ptrdiff_t Aj_size,
+                          const T Ax[], const std::ptrdiff_t Ax_size,
+                                T  x[], const std::ptrdiff_t  x_size,
+                          const T  b[], const std::ptrdiff_t  b_size,
+                          const T Tx[], const std::ptrdiff_t Tx_size,
+                          const I indices[], const std::ptrdiff_t indices_size,
+                          const T omega[], const std::ptrdiff_t omega_size,
                           const I blocksize)
 {
     // Rename
@@ -1168,8 +1370,8 @@ void block_jacobi_indexed(const I Ap[], const int Ap_size,
             }
             else {
                 gemm(&(Ax[jj*blocksize_sq]), blocksize, blocksize, 'F',
-                     &(temp[j*blocksize]),   blocksize, 1,         'F',
-                     &(v[0]),                blocksize, 1,         'F',
+                     &(temp[j*blocksize]),   blocksize, (I)1,         'F',
+                     &(v[0]),                blocksize, (I)1,         'F',
                      'T');
                 for(I k=0; k<blocksize; k++) {
                     rsum[k] += v[k];
@@ -1184,8 +1386,8 @@ void block_jacobi_indexed(const I Ap[], const int Ap_size,
 
         // Apply D^{-1} for this block row to b - Ax
         gemm(&(Dinv[row*blocksize_sq]), blocksize, blocksize, 'F',
-             &(rsum[0]),              blocksize, 1,         'F',
-             &(v[0]),                 blocksize, 1,         'F',
+             &(rsum[0]),              blocksize, (I)1,         'F',
+             &(v[0]),                 blocksize, (I)1,         'F',
              'T');
 
         // Update each element in ith block
@@ -1240,12 +1442,12 @@ void block_jacobi_indexed(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void block_gauss_seidel(const I Ap[], const int Ap_size,
-                        const I Aj[], const int Aj_size,
-                        const T Ax[], const int Ax_size,
-                              T  x[], const int  x_size,
-                        const T  b[], const int  b_size,
-                        const T Tx[], const int Tx_size,
+void block_gauss_seidel(const I Ap[], const std::ptrdiff_t Ap_size,
+                        const I Aj[], const std::ptrdiff_t Aj_size,
+                        const T Ax[], const std::ptrdiff_t Ax_size,
+                              T  x[], const std::ptrdiff_t  x_size,
+                        const T  b[], const std::ptrdiff_t  b_size,
+                        const T Tx[], const std::ptrdiff_t Tx_size,
                         const I row_start,
                         const I row_stop,
                         const I row_step,
@@ -1274,8 +1476,8 @@ void block_gauss_seidel(const I Ap[], const int Ap_size,
             }
             else {
                 gemm(&(Ax[jj*blocksize_sq]), blocksize, blocksize, 'F',
-                     &(x[j*blocksize]),      blocksize, 1,         'F',
-                     &(v[0]),                blocksize, 1,         'F',
+                     &(x[j*blocksize]),      blocksize, (I)1,         'F',
+                     &(v[0]),                blocksize, (I)1,         'F',
                      'T');
                 for(I k = 0; k < blocksize; k++) {
                     rsum[k] += v[k]; }
@@ -1288,8 +1490,8 @@ void block_gauss_seidel(const I Ap[], const int Ap_size,
             rsum[k] = b[iblocksize + k] - rsum[k]; }
 
         gemm(&(Dinv[i*blocksize_sq]), blocksize, blocksize, 'F',
-             &(rsum[0]),              blocksize, 1,         'F',
-             &(x[iblocksize]),        blocksize, 1,         'F',
+             &(rsum[0]),              blocksize, (I)1,         'F',
+             &(x[iblocksize]),        blocksize, (I)1,         'F',
              'T');
     }
 
@@ -1330,13 +1532,13 @@ void block_gauss_seidel(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void extract_subblocks(const I Ap[], const int Ap_size,
-                       const I Aj[], const int Aj_size,
-                       const T Ax[], const int Ax_size,
-                             T Tx[], const int Tx_size,
-                       const I Tp[], const int Tp_size,
-                       const I Sj[], const int Sj_size,
-                       const I Sp[], const int Sp_size,
+void extract_subblocks(const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                       const T Ax[], const std::ptrdiff_t Ax_size,
+                             T Tx[], const std::ptrdiff_t Tx_size,
+                       const I Tp[], const std::ptrdiff_t Tp_size,
+                       const I Sj[], const std::ptrdiff_t Sj_size,
+                       const I Sp[], const std::ptrdiff_t Sp_size,
                        const I nsdomains,
                        const I nrows)
 {
@@ -1443,15 +1645,15 @@ void extract_subblocks(const I Ap[], const int Ap_size,
  *
  */
 template<class I, class T, class F>
-void overlapping_schwarz_csr(const I Ap[], const int Ap_size,
-                             const I Aj[], const int Aj_size,
-                             const T Ax[], const int Ax_size,
-                                   T  x[], const int  x_size,
-                             const T  b[], const int  b_size,
-                             const T Tx[], const int Tx_size,
-                             const I Tp[], const int Tp_size,
-                             const I Sj[], const int Sj_size,
-                             const I Sp[], const int Sp_size,
+void overlapping_schwarz_csr(const I Ap[], const std::ptrdiff_t Ap_size,
+                             const I Aj[], const std::ptrdiff_t Aj_size,
+                             const T Ax[], const std::ptrdiff_t Ax_size,
+                                   T  x[], const std::ptrdiff_t  x_size,
+                             const T  b[], const std::ptrdiff_t  b_size,
+                             const T Tx[], const std::ptrdiff_t Tx_size,
+                             const I Tp[], const std::ptrdiff_t Tp_size,
+                             const I Sj[], const std::ptrdiff_t Sj_size,
+                             const I Sp[], const std::ptrdiff_t Sp_size,
                                    I nsdomains,
                                    I nrows,
                                    I row_start,
@@ -1492,8 +1694,8 @@ void overlapping_schwarz_csr(const I Ap[], const int Ap_size,
 
         // Multiply block residual with block inverse of A
         gemm(&(Tx[Tp[domptr]]), size_domain, size_domain, 'F',
-             &(rsum[0]),      size_domain,   1,         'F',
-             &(Dinv_rsum[0]), size_domain,   1,         'F',
+             &(rsum[0]),      size_domain,   (I)1,         'F',
+             &(Dinv_rsum[0]), size_domain,   (I)1,         'F',
              'F');
 
         // Add to x
@@ -1517,4 +1719,495 @@ void overlapping_schwarz_csr(const I Ap[], const int Ap_size,
 }
 
 
+/*
+ * Sparse approximate inverse (SPAI) with a prescribed sparsity pattern.
+ *
+ * Compute the rows of M that minimize || I - M A ||_F, where M is
+ * restricted to the sparsity pattern given by Mp and Mj.  Row i of M
+ * is the solution of the small least squares problem
+ *
+ *     min || A(J, K)^T m - e_i(K) ||_2,
+ *
+ * where J is the pattern of row i of M and K is the set of columns
+ * reached by the rows J of A.  Each least squares problem is solved
+ * with a dense QR factorization.
+ *
+ * Parameters
+ * ----------
+ * Ap : array
+ *     CSR row pointer.
+ * Aj : array
+ *     CSR index array.
+ * Ax : array
+ *     CSR data array.
+ * Mp : array
+ *     CSR row pointer for the pattern of M.
+ * Mj : array
+ *     CSR index array for the pattern of M.
+ * Mx : array
+ *     CSR data array for M, same length as Mj.
+ *
+ * Returns
+ * -------
+ * None
+ *     Mx will be modified in place.
+ *
+ * Notes
+ * -----
+ * A is assumed square.  If the diagonal of row i is not reached by
+ * the rows J of A, row i of M is set to zero.  Only real-valued
+ * matrices are supported, see least_squares.
+ *
+ */
+template<class I, class T>
+void spai_csr(const I Ap[], const std::ptrdiff_t Ap_size,
+              const I Aj[], const std::ptrdiff_t Aj_size,
+              const T Ax[], const std::ptrdiff_t Ax_size,
+              const I Mp[], const std::ptrdiff_t Mp_size,
+              const I Mj[], const std::ptrdiff_t Mj_size,
+                    T Mx[], const std::ptrdiff_t Mx_size)
+{
+    const I n = Ap_size - 1;
+    const I is_col_major = 1;
+
+    // Position of each column of A in the current set K, or -1
+    std::vector<I> Kpos(n, -1);
+    std::vector<I> K;
+    std::vector<T> A0;
+    std::vector<T> b0;
+    std::vector<T> m0;
+
+    for(I i = 0; i < n; i++) {
+        const I row_start = Mp[i];
+        const I row_end = Mp[i+1];
+        I size_J = row_end - row_start;
+        if (size_J == 0) {
+            continue;
+        }
+
+        // Collect the set K of columns reached by the rows J
+        for(I jj = row_start; jj < row_end; jj++) {
+            const I j = Mj[jj];
+            for(I kk = Ap[j]; kk < Ap[j+1]; kk++) {
+                const I k = Aj[kk];
+                if (Kpos[k] == -1) {
+                    Kpos[k] = K.size();
+                    K.push_back(k);
+                }
+            }
+        }
+        I size_K = K.size();
+
+        // Form A(J, K)^T in column-major and the right hand side e_i(K)
+        A0.assign(size_K*size_J, 0);
+        b0.assign(size_K, 0);
+        m0.assign(std::max(size_K, size_J), 0);
+        for(I jj = row_start; jj < row_end; jj++) {
+            const I j = Mj[jj];
+            const I col = jj - row_start;
+            for(I kk = Ap[j]; kk < Ap[j+1]; kk++) {
+                A0[col_major(Kpos[Aj[kk]], col, size_K)] += Ax[kk];
+            }
+        }
+
+        if (Kpos[i] != -1) {
+            b0[Kpos[i]] = 1.0;
+            least_squares(&A0[0], &b0[0], &m0[0], size_K, size_J, is_col_major);
+        }
+
+        for(I jj = row_start; jj < row_end; jj++) {
+            Mx[jj] = m0[jj - row_start];
+        }
+
+        // Reset the column markers for the next row
+        for(I k = 0; k < size_K; k++) {
+            Kpos[K[k]] = -1;
+        }
+        K.clear();
+    }
+}
+
+/*
+ * Temporal-blocked (tiled) weighted Jacobi iteration.
+ *
+ * Perform several sweeps of (block) Jacobi relaxation on the linear
+ * system Ax = b, x <- x + omega Dinv (b - A x), where A is stored in
+ * BSR format.  Rows are processed in tiles of tilesize block rows.
+ * Each tile is extended by a halo of iterations*bandwidth block rows
+ * and all sweeps are carried out on the tile before moving on, so that
+ * the rows of A belonging to a tile are read from main memory once
+ * and reused from cache for every sweep.  Values in the halo are
+ * recomputed by neighboring tiles.
+ *
+ * Parameters
+ * ----------
+ * Ap : array
+ *     BSR row pointer.
+ * Aj : array
+ *     BSR index array.
+ * Ax : array
+ *     BSR data array, blocks assumed square.
+ * x : array
+ *     Approximate solution.
+ * b : array
+ *     Right hand side.
+ * Tx : array
+ *     Inverse of each diagonal block of A stored
+ *     as a (n/blocksize, blocksize, blocksize) array.
+ * temp : array
+ *     Temporary vector the same size as x.
+ * iterations : int
+ *     Number of Jacobi sweeps.
+ * tilesize : int
+ *     Number of block rows in each tile.
+ * bandwidth : int
+ *     Upper bound on |i - j| over all nonzero blocks (i, j) of A.
+ * omega : float
+ *     Damping parameter.
+ * blocksize : int
+ *     Dimension of square blocks in BSR matrix A.
+ *
+ * Returns
+ * -------
+ * None
+ *     Array x will be modified in place.
+ *
+ * Notes
+ * -----
+ * With blocksize 1, A may be passed in CSR format.  Point-wise Jacobi
+ * on a BSR matrix is obtained by passing the inverse of the (point)
+ * diagonal of A as diagonal blocks in Tx.
+ *
+ * The result agrees with iterations sweeps of block_jacobi only if the
+ * bandwidth bound holds.
+ *
+ */
+template<class I, class T, class F>
+void block_jacobi_tiled(const I Ap[], const std::ptrdiff_t Ap_size,
+                        const I Aj[], const std::ptrdiff_t Aj_size,
+                        const T Ax[], const std::ptrdiff_t Ax_size,
+                              T  x[], const std::ptrdiff_t  x_size,
+                        const T  b[], const std::ptrdiff_t  b_size,
+                        const T Tx[], const std::ptrdiff_t Tx_size,
+                              T temp[], const std::ptrdiff_t temp_size,
+                        const I iterations,
+                        const I tilesize,
+                        const I bandwidth,
+                        const T omega[], const std::ptrdiff_t omega_size,
+                        const I blocksize)
+{
+    // Rename
+    const T * Dinv = Tx;
+
+    const I n = Ap_size - 1;
+    const I B2 = blocksize*blocksize;
+    const I halo = iterations*bandwidth;
+    const T omega2 = omega[0];
+
+    if (n <= 0 || iterations <= 0 || tilesize <= 0) {
+        return;
+    }
+
+    // Copy x to temp, all tiles start from the same iterate
+    std::copy(&(x[0]), &(x[n*blocksize]), &(temp[0]));
+
+    std::vector<T> cur((tilesize + 2*halo)*blocksize);
+    std::vector<T> nxt((tilesize + 2*halo)*blocksize);
+    std::vector<T> rsum(blocksize);
+
+    for(I r0 = 0; r0 < n; r0 += tilesize) {
+        const I r1 = std::min(r0 + tilesize, n);
+
+        // Region of temp needed by the first sweep
+        const I lo0 = std::max(r0 - halo, (I) 0);
+        const I hi0 = std::min(r1 + halo, n);
+        std::copy(&(temp[lo0*blocksize]), &(temp[hi0*blocksize]), cur.begin());
+
+        for(I k = 1; k <= iterations; k++) {
+            // Rows that are still exact after sweep k
+            const I lo = std::max(r0 - (iterations - k)*bandwidth, (I) 0);
+            const I hi = std::min(r1 + (iterations - k)*bandwidth, n);
+
+            if (blocksize == 1) {
+                // Scalar rows, e.g., A in CSR format
+                const T * xloc = &(cur[0]) - lo0;
+                T * yloc = &(nxt[0]) - lo0;
+                for(I i = lo; i < hi; i++) {
+                    T r = b[i];
+                    for(I jj = Ap[i]; jj < Ap[i+1]; jj++) {
+                        r -= Ax[jj]*xloc[Aj[jj]];
+                    }
+                    yloc[i] = xloc[i] + omega2*Dinv[i]*r;
+                }
+                std::swap(cur, nxt);
+                continue;
+            }
+
+            for(I i = lo; i < hi; i++) {
+                const I iloc = (i - lo0)*blocksize;
+
+                // rsum = b_i - A_i,: cur
+                for(I m = 0; m < blocksize; m++) {
+                    rsum[m] = b[i*blocksize + m];
+                }
+                for(I jj = Ap[i]; jj < Ap[i+1]; jj++) {
+                    const T * block = &(Ax[jj*B2]);
+                    const T * xloc = &(cur[(Aj[jj] - lo0)*blocksize]);
+                    for(I m = 0; m < blocksize; m++) {
+                        T sum = 0.0;
+                        for(I c = 0; c < blocksize; c++) {
+                            sum += block[m*blocksize + c]*xloc[c];
+                        }
+                        rsum[m] -= sum;
+                    }
+                }
+
+                // nxt_i = cur_i + omega Dinv_i rsum
+                const T * D = &(Dinv[i*B2]);
+                for(I m = 0; m < blocksize; m++) {
+                    T sum = 0.0;
+                    for(I c = 0; c < blocksize; c++) {
+                        sum += D[m*blocksize + c]*rsum[c];
+                    }
+                    nxt[iloc + m] = cur[iloc + m] + omega2*sum;
+                }
+            }
+            std::swap(cur, nxt);
+        }
+
+        // Write back the rows owned by this tile
+        std::copy(cur.begin() + (r0 - lo0)*blocksize,
+                  cur.begin() + (r1 - lo0)*blocksize,
+                  &(x[r0*blocksize]));
+    }
+}
+
+/*
+ * Helper for the stencil kernels: the diagonal of the stencil matrix, i.e.,
+ * the value of the center entry of the stencil, or zero if it has none.
+ */
+template<class I, class T>
+T stencil_center(const I ndim, const I offsets[], const T values[], const I n_entries)
+{
+    T center = 0;
+    for(I e = 0; e < n_entries; e++){
+        bool is_center = true;
+        for(I k = 0; k < ndim; k++){
+            if(offsets[e * ndim + k] != 0){ is_center = false; }
+        }
+        if(is_center){ center += values[e]; }
+    }
+    return center;
+}
+
+
+/*
+ * Helper for the stencil kernels: ceil(a / m) for m > 0.
+ */
+template<class I>
+inline I stencil_ceil_div(const I a, const I m)
+{
+    return a > 0 ? (a + m - 1) / m : -((-a) / m);
+}
+
+
+/*
+ * Weighted Jacobi iteration for a constant stencil on a regular grid.
+ *
+ * Perform one iteration of Jacobi relaxation on the linear system Ax = b,
+ * where A is the matrix of a stencil on a regular grid, as in
+ * stencil_matvec.  The grid is traversed one line along the last axis at a
+ * time, and each off-center stencil entry is applied to the whole line.
+ *
+ * Parameters
+ * ----------
+ * grid : array, ndim
+ *     Grid dimensions.
+ * offsets : array, n_entries*ndim
+ *     Offset of each nonzero stencil entry from the stencil center.
+ * values : array, n_entries
+ *     Value of each nonzero stencil entry.
+ * x : array
+ *     Approximate solution.
+ * b : array
+ *     Right hand side.
+ * temp : array
+ *     Temporary vector the same size as x.
+ * omega : float
+ *     Damping parameter.
+ *
+ * Returns
+ * -------
+ * None
+ *     Array x will be modified inplace.  If the center of the stencil is
+ *     zero, x is unchanged.
+ *
+ */
+template<class I, class T, class F>
+void stencil_jacobi(const I    grid[], const std::ptrdiff_t    grid_size,
+                    const I offsets[], const std::ptrdiff_t offsets_size,
+                    const T  values[], const std::ptrdiff_t  values_size,
+                          T       x[], const std::ptrdiff_t       x_size,
+                    const T       b[], const std::ptrdiff_t       b_size,
+                          T    temp[], const std::ptrdiff_t    temp_size,
+                    const T   omega[], const std::ptrdiff_t   omega_size)
+{
+    const I ndim = grid_size;
+    const I n_entries = values_size;
+    const I n = grid[ndim - 1];
+    const I n_lines = x_size / n;
+    const T one = 1.0;
+    const T omega2 = omega[0];
+
+    const T diag = stencil_center(ndim, offsets, values, n_entries);
+    if(diag == (F) 0.0){ return; }
+
+    const std::vector<I> flat = stencil_flat_offsets(ndim, grid, offsets, n_entries);
+    std::vector<I> idx(ndim, 0);
+    std::vector<I> active(n_entries);
+
+    std::copy(x, x + x_size, temp);
+    for(I line = 0; line < n_lines; line++){
+        const I base = line * n;
+        stencil_line_entries(ndim, grid, offsets, n_entries, &idx[0], &active[0]);
+
+        // x = b - (A - D) temp on this line
+        std::copy(b + base, b + base + n, x + base);
+        for(I e = 0; e < n_entries; e++){
+            if(!active[e] || flat[e] == 0){ continue; }
+            const I o = offsets[e * ndim + ndim - 1];
+            const I lo = std::max<I>(0, -o);
+            const I hi = std::min<I>(n, n - o);
+            const T v = values[e];
+            const I shift = base + flat[e];
+            for(I j = lo; j < hi; j++){
+                x[base + j] -= v * temp[shift + j];
+            }
+        }
+
+        for(I j = base; j < base + n; j++){
+            x[j] = (one - omega2) * temp[j] + omega2 * (x[j] / diag);
+        }
+        stencil_next_line(ndim, grid, &idx[0]);
+    }
+}
+
+
+/*
+ * Multicolor Gauss-Seidel iteration for a constant stencil on a regular grid.
+ *
+ * Perform one weighted Gauss-Seidel update of the grid points of one
+ * color on the linear system Ax = b, where A is the matrix of a stencil on
+ * a regular grid, as in stencil_matvec.  The color of the point with grid
+ * indices idx is
+ *
+ * ..
+ *   (sum_k weights[k] * (idx[k] % mods[k])) % num_colors
+ *
+ * and the coloring must be such that no stencil entry couples two points
+ * of the same color, so that the points of one color may be updated in any
+ * order.  The points of the color on each grid line along the last axis are
+ * updated together, one stencil entry at a time.  For example, the red-black coloring has ``mods`` equal to 2 and
+ * ``weights`` equal to 1 along each axis, and ``num_colors = 2``.
+ *
+ * Parameters
+ * ----------
+ * grid : array, ndim
+ *     Grid dimensions.
+ * offsets : array, n_entries*ndim
+ *     Offset of each nonzero stencil entry from the stencil center.
+ * values : array, n_entries
+ *     Value of each nonzero stencil entry.
+ * x : array
+ *     Approximate solution.
+ * b : array
+ *     Right hand side.
+ * mods : array, ndim
+ *     Period of the coloring along each axis.
+ * weights : array, ndim
+ *     Weight of each axis in the color.
+ * num_colors : int
+ *     Number of colors.
+ * color : int
+ *     Color of the points to update.
+ * omega : float
+ *     Damping parameter.
+ *
+ * Returns
+ * -------
+ * None
+ *     Array x will be modified inplace.  If the center of the stencil is
+ *     zero, x is unchanged.
+ *
+ */
+template<class I, class T, class F>
+void stencil_gauss_seidel(const I    grid[], const std::ptrdiff_t    grid_size,
+                          const I offsets[], const std::ptrdiff_t offsets_size,
+                          const T  values[], const std::ptrdiff_t  values_size,
+                                T       x[], const std::ptrdiff_t       x_size,
+                          const T       b[], const std::ptrdiff_t       b_size,
+                          const I    mods[], const std::ptrdiff_t    mods_size,
+                          const I weights[], const std::ptrdiff_t weights_size,
+                          const I num_colors,
+                          const I color,
+                          const T   omega[], const std::ptrdiff_t   omega_size)
+{
+    const I ndim = grid_size;
+    const I n_entries = values_size;
+    const I n = grid[ndim - 1];
+    const I n_lines = x_size / n;
+    const I m = mods[ndim - 1];
+    const T one = 1.0;
+    const T omega2 = omega[0];
+
+    const T diag = stencil_center(ndim, offsets, values, n_entries);
+    if(diag == (F) 0.0){ return; }
+
+    const std::vector<I> flat = stencil_flat_offsets(ndim, grid, offsets, n_entries);
+    std::vector<I> idx(ndim, 0);
+    std::vector<I> active(n_entries);
+
+    std::vector<T> rsum(n);
+
+    for(I line = 0; line < n_lines; line++){
+        const I base = line * n;
+        stencil_line_entries(ndim, grid, offsets, n_entries, &idx[0], &active[0]);
+
+        I lead = 0;
+        for(I k = 0; k < ndim - 1; k++){
+            lead += weights[k] * (idx[k] % mods[k]);
+        }
+
+        // The points j = r, r + m, ... of the line have the same color and
+        // are not coupled, so each stencil entry is applied to all of them
+        // before they are updated.
+        for(I r = 0; r < std::min<I>(m, n); r++){
+            if((lead + weights[ndim - 1] * r) % num_colors != color){ continue; }
+            const I count = (n - r + m - 1) / m;
+
+            for(I t = 0; t < count; t++){
+                rsum[t] = b[base + r + t * m];
+            }
+            for(I e = 0; e < n_entries; e++){
+                if(!active[e] || flat[e] == 0){ continue; }
+                // neighbours j + o inside the line, for j = r + t m
+                const I o = offsets[e * ndim + ndim - 1];
+                const I t_lo = std::max<I>(0, stencil_ceil_div(-o - r, m));
+                const I t_hi = std::min<I>(count, stencil_ceil_div(n - o - r, m));
+                const T v = values[e];
+                const I shift = base + flat[e] + r;
+                for(I t = t_lo; t < t_hi; t++){
+                    rsum[t] -= v * x[shift + t * m];
+                }
+            }
+            for(I t = 0; t < count; t++){
+                const I i = base + r + t * m;
+                x[i] = (one - omega2) * x[i] + omega2 * (rsum[t] / diag);
+            }
+        }
+        stencil_next_line(ndim, grid, &idx[0]);
+    }
+}
+
+
 #endif
@@ -31,6 +31,8 @@ void _gauss_seidel(
     T *_x = py_x.mutable_data();
     const T *_b = py_b.data();
 
+    py::gil_scoped_release release;
+
     return gauss_seidel<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -67,6 +69,8 @@ void _sor_gauss_seidel(
     T *_x = py_x.mutable_data();
     const T *_b = py_b.data();
 
+    py::gil_scoped_release release;
+
     return sor_gauss_seidel<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -104,6 +108,8 @@ void _bsr_gauss_seidel(
     T *_x = py_x.mutable_data();
     const T *_b = py_b.data();
 
+    py::gil_scoped_release release;
+
     return bsr_gauss_seidel<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -146,6 +152,8 @@ void _jacobi(
     T *_temp = py_temp.mutable_data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return jacobi<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -160,6 +168,43 @@ void _jacobi(
                            );
 }
 
+template<class I, class T>
+void _jacobi_multivector(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & x,
+    py::array_t<T> & temp,
+                const I R,
+       const I iterations,
+            const T omega
+                         )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_temp = temp.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    T *_x = py_x.mutable_data();
+    T *_temp = py_temp.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return jacobi_multivector<I, T>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _x, x.shape(0),
+                    _temp, temp.shape(0),
+                        R,
+               iterations,
+                    omega
+                                    );
+}
+
 template<class I, class T, class F>
 void _jacobi_indexed(
       py::array_t<I> & Ap,
@@ -186,6 +231,8 @@ void _jacobi_indexed(
     const I *_indices = py_indices.data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return jacobi_indexed<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -227,6 +274,8 @@ void _bsr_jacobi(
     T *_temp = py_temp.mutable_data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return bsr_jacobi<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -269,6 +318,8 @@ void _bsr_jacobi_indexed(
     const I *_indices = py_indices.data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return bsr_jacobi_indexed<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -307,6 +358,8 @@ void _gauss_seidel_indexed(
     const T *_b = py_b.data();
     const I *_Id = py_Id.data();
 
+    py::gil_scoped_release release;
+
     return gauss_seidel_indexed<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -352,6 +405,8 @@ void _jacobi_ne(
     T *_temp = py_temp.mutable_data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return jacobi_ne<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -394,6 +449,8 @@ void _gauss_seidel_ne(
     const T *_b = py_b.data();
     const T *_Tx = py_Tx.data();
 
+    py::gil_scoped_release release;
+
     return gauss_seidel_ne<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -435,6 +492,8 @@ void _gauss_seidel_nr(
     T *_z = py_z.mutable_data();
     const T *_Tx = py_Tx.data();
 
+    py::gil_scoped_release release;
+
     return gauss_seidel_nr<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -482,6 +541,8 @@ void _block_jacobi(
     T *_temp = py_temp.mutable_data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return block_jacobi<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -498,6 +559,61 @@ void _block_jacobi(
                                  );
 }
 
+template<class I, class T, class F>
+void _block_jacobi_lu(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & x,
+       py::array_t<T> & b,
+      py::array_t<T> & LU,
+     py::array_t<I> & piv,
+    py::array_t<T> & temp,
+        const I row_start,
+         const I row_stop,
+         const I row_step,
+   py::array_t<T> & omega,
+        const I blocksize
+                      )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_b = b.unchecked();
+    auto py_LU = LU.unchecked();
+    auto py_piv = piv.unchecked();
+    auto py_temp = temp.mutable_unchecked();
+    auto py_omega = omega.unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    T *_x = py_x.mutable_data();
+    const T *_b = py_b.data();
+    const T *_LU = py_LU.data();
+    const I *_piv = py_piv.data();
+    T *_temp = py_temp.mutable_data();
+    const T *_omega = py_omega.data();
+
+    py::gil_scoped_release release;
+
+    return block_jacobi_lu<I, T, F>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _x, x.shape(0),
+                       _b, b.shape(0),
+                      _LU, LU.shape(0),
+                     _piv, piv.shape(0),
+                    _temp, temp.shape(0),
+                row_start,
+                 row_stop,
+                 row_step,
+                   _omega, omega.shape(0),
+                blocksize
+                                    );
+}
+
 template<class I, class T, class F>
 void _block_jacobi_indexed(
       py::array_t<I> & Ap,
@@ -528,6 +644,8 @@ void _block_jacobi_indexed(
     const I *_indices = py_indices.data();
     const T *_omega = py_omega.data();
 
+    py::gil_scoped_release release;
+
     return block_jacobi_indexed<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -568,6 +686,8 @@ void _block_gauss_seidel(
     const T *_b = py_b.data();
     const T *_Tx = py_Tx.data();
 
+    py::gil_scoped_release release;
+
     return block_gauss_seidel<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -610,6 +730,8 @@ void _extract_subblocks(
     const I *_Sj = py_Sj.data();
     const I *_Sp = py_Sp.data();
 
+    py::gil_scoped_release release;
+
     return extract_subblocks<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -660,6 +782,8 @@ void _overlapping_schwarz_csr(
     const I *_Sj = py_Sj.data();
     const I *_Sp = py_Sp.data();
 
+    py::gil_scoped_release release;
+
     return overlapping_schwarz_csr<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -678,6 +802,178 @@ void _overlapping_schwarz_csr(
                                             );
 }
 
+template<class I, class T>
+void _spai_csr(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<I> & Mp,
+      py::array_t<I> & Mj,
+      py::array_t<T> & Mx
+               )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Mp = Mp.unchecked();
+    auto py_Mj = Mj.unchecked();
+    auto py_Mx = Mx.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_Mp = py_Mp.data();
+    const I *_Mj = py_Mj.data();
+    T *_Mx = py_Mx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return spai_csr<I, T>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Mp, Mp.shape(0),
+                      _Mj, Mj.shape(0),
+                      _Mx, Mx.shape(0)
+                          );
+}
+
+template<class I, class T, class F>
+void _block_jacobi_tiled(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & x,
+       py::array_t<T> & b,
+      py::array_t<T> & Tx,
+    py::array_t<T> & temp,
+       const I iterations,
+         const I tilesize,
+        const I bandwidth,
+   py::array_t<T> & omega,
+        const I blocksize
+                         )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_b = b.unchecked();
+    auto py_Tx = Tx.unchecked();
+    auto py_temp = temp.mutable_unchecked();
+    auto py_omega = omega.unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    T *_x = py_x.mutable_data();
+    const T *_b = py_b.data();
+    const T *_Tx = py_Tx.data();
+    T *_temp = py_temp.mutable_data();
+    const T *_omega = py_omega.data();
+
+    py::gil_scoped_release release;
+
+    return block_jacobi_tiled<I, T, F>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _x, x.shape(0),
+                       _b, b.shape(0),
+                      _Tx, Tx.shape(0),
+                    _temp, temp.shape(0),
+               iterations,
+                 tilesize,
+                bandwidth,
+                   _omega, omega.shape(0),
+                blocksize
+                                       );
+}
+
+template<class I, class T, class F>
+void _stencil_jacobi(
+    py::array_t<I> & grid,
+ py::array_t<I> & offsets,
+  py::array_t<T> & values,
+       py::array_t<T> & x,
+       py::array_t<T> & b,
+    py::array_t<T> & temp,
+   py::array_t<T> & omega
+                     )
+{
+    auto py_grid = grid.unchecked();
+    auto py_offsets = offsets.unchecked();
+    auto py_values = values.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_b = b.unchecked();
+    auto py_temp = temp.mutable_unchecked();
+    auto py_omega = omega.unchecked();
+    const I *_grid = py_grid.data();
+    const I *_offsets = py_offsets.data();
+    const T *_values = py_values.data();
+    T *_x = py_x.mutable_data();
+    const T *_b = py_b.data();
+    T *_temp = py_temp.mutable_data();
+    const T *_omega = py_omega.data();
+
+    py::gil_scoped_release release;
+
+    return stencil_jacobi<I, T, F>(
+                    _grid, grid.shape(0),
+                 _offsets, offsets.shape(0),
+                  _values, values.shape(0),
+                       _x, x.shape(0),
+                       _b, b.shape(0),
+                    _temp, temp.shape(0),
+                   _omega, omega.shape(0)
+                                   );
+}
+
+template<class I, class T, class F>
+void _stencil_gauss_seidel(
+    py::array_t<I> & grid,
+ py::array_t<I> & offsets,
+  py::array_t<T> & values,
+       py::array_t<T> & x,
+       py::array_t<T> & b,
+    py::array_t<I> & mods,
+ py::array_t<I> & weights,
+       const I num_colors,
+            const I color,
+   py::array_t<T> & omega
+                           )
+{
+    auto py_grid = grid.unchecked();
+    auto py_offsets = offsets.unchecked();
+    auto py_values = values.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_b = b.unchecked();
+    auto py_mods = mods.unchecked();
+    auto py_weights = weights.unchecked();
+    auto py_omega = omega.unchecked();
+    const I *_grid = py_grid.data();
+    const I *_offsets = py_offsets.data();
+    const T *_values = py_values.data();
+    T *_x = py_x.mutable_data();
+    const T *_b = py_b.data();
+    const I *_mods = py_mods.data();
+    const I *_weights = py_weights.data();
+    const T *_omega = py_omega.data();
+
+    py::gil_scoped_release release;
+
+    return stencil_gauss_seidel<I, T, F>(
+                    _grid, grid.shape(0),
+                 _offsets, offsets.shape(0),
+                  _values, values.shape(0),
+                       _x, x.shape(0),
+                       _b, b.shape(0),
+                    _mods, mods.shape(0),
+                 _weights, weights.shape(0),
+               num_colors,
+                    color,
+                   _omega, omega.shape(0)
+                                         );
+}
+
 PYBIND11_MODULE(relaxation, m) {
     m.doc() = R"pbdoc(
     Pybind11 bindings for relaxation.h
@@ -688,6 +984,7 @@ PYBIND11_MODULE(relaxation, m) {
     sor_gauss_seidel
     bsr_gauss_seidel
     jacobi
+    jacobi_multivector
     jacobi_indexed
     bsr_jacobi
     bsr_jacobi_indexed
@@ -696,10 +993,15 @@ PYBIND11_MODULE(relaxation, m) {
     gauss_seidel_ne
     gauss_seidel_nr
     block_jacobi
+    block_jacobi_lu
     block_jacobi_indexed
     block_gauss_seidel
     extract_subblocks
     overlapping_schwarz_csr
+    spai_csr
+    block_jacobi_tiled
+    stencil_jacobi
+    stencil_gauss_seidel
     )pbdoc";
 
     py::options options;
@@ -712,6 +1014,14 @@ PYBIND11_MODULE(relaxation, m) {
     m.def("gauss_seidel", &_gauss_seidel<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
     m.def("gauss_seidel", &_gauss_seidel<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel", &_gauss_seidel<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel", &_gauss_seidel<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel", &_gauss_seidel<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel", &_gauss_seidel<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"),
 R"pbdoc(
 Gauss-Seidel iteration.
@@ -761,6 +1071,14 @@ implemented with ``gauss_seidel(Ap, Aj, Ax, x, b, N, -1, -1)``.)pbdoc");
     m.def("sor_gauss_seidel", &_sor_gauss_seidel<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"));
     m.def("sor_gauss_seidel", &_sor_gauss_seidel<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"));
+    m.def("sor_gauss_seidel", &_sor_gauss_seidel<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"));
+    m.def("sor_gauss_seidel", &_sor_gauss_seidel<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"));
+    m.def("sor_gauss_seidel", &_sor_gauss_seidel<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"));
+    m.def("sor_gauss_seidel", &_sor_gauss_seidel<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega"),
 R"pbdoc(
 SOR iteration.
@@ -806,6 +1124,14 @@ Nearly identical to ``gauss_seidel`` with a relaxation parameter ``omega``.)pbdo
     m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
     m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("bsr_gauss_seidel", &_bsr_gauss_seidel<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"),
 R"pbdoc(
 Gauss-Seidel iteration with BSR arrays.
@@ -851,6 +1177,14 @@ None
     m.def("jacobi", &_jacobi<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
     m.def("jacobi", &_jacobi<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi", &_jacobi<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi", &_jacobi<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi", &_jacobi<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi", &_jacobi<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(),
 R"pbdoc(
 Weighted Jacobi iteration.
@@ -891,6 +1225,50 @@ Returns
 None
     Array x will be modified inplace.)pbdoc");
 
+    m.def("jacobi_multivector", &_jacobi_multivector<int, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("temp").noconvert(), py::arg("R"), py::arg("iterations"), py::arg("omega"));
+    m.def("jacobi_multivector", &_jacobi_multivector<int, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("temp").noconvert(), py::arg("R"), py::arg("iterations"), py::arg("omega"));
+    m.def("jacobi_multivector", &_jacobi_multivector<std::int64_t, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("temp").noconvert(), py::arg("R"), py::arg("iterations"), py::arg("omega"));
+    m.def("jacobi_multivector", &_jacobi_multivector<std::int64_t, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("temp").noconvert(), py::arg("R"), py::arg("iterations"), py::arg("omega"),
+R"pbdoc(
+Weighted Jacobi iteration on a block of vectors with zero right-hand side.
+
+Perform several iterations of Jacobi relaxation on A X = 0, where A is
+stored in CSR format and X holds R vectors stored row-wise, i.e., X is an
+(n x R) array in C (row-major) ordering.  All R vectors are relaxed in the
+same sweep over A.  Damping is controlled by the omega parameter.
+
+Parameters
+----------
+Ap : array
+    CSR row pointer.
+Aj : array
+    CSR index array.
+Ax : array
+    CSR data array.
+x : array
+    Block of vectors, (n x R) in row-major ordering.
+temp : array
+    Temporary array the same size as x.
+R : int
+    Number of vectors.
+iterations : int
+    Number of Jacobi iterations.
+omega : float
+    Damping parameter.
+
+Returns
+-------
+None
+    Array x will be modified inplace.
+
+Notes
+-----
+Rows with a zero diagonal are left unchanged, as in jacobi.)pbdoc");
+
     m.def("jacobi_indexed", &_jacobi_indexed<int, float, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
     m.def("jacobi_indexed", &_jacobi_indexed<int, double, double>,
@@ -898,6 +1276,14 @@ None
     m.def("jacobi_indexed", &_jacobi_indexed<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
     m.def("jacobi_indexed", &_jacobi_indexed<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
+    m.def("jacobi_indexed", &_jacobi_indexed<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
+    m.def("jacobi_indexed", &_jacobi_indexed<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
+    m.def("jacobi_indexed", &_jacobi_indexed<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert());
+    m.def("jacobi_indexed", &_jacobi_indexed<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(),
 R"pbdoc(
 Indexed weighted Jacobi iteration.
@@ -938,6 +1324,14 @@ None
     m.def("bsr_jacobi", &_bsr_jacobi<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert());
     m.def("bsr_jacobi", &_bsr_jacobi<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi", &_bsr_jacobi<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi", &_bsr_jacobi<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi", &_bsr_jacobi<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi", &_bsr_jacobi<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"), py::arg("omega").noconvert(),
 R"pbdoc(
 Weighted Jacobi iteration on BSR arrays.
@@ -987,6 +1381,14 @@ None
     m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert());
     m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert());
+    m.def("bsr_jacobi_indexed", &_bsr_jacobi_indexed<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("indices").noconvert(), py::arg("blocksize"), py::arg("omega").noconvert(),
 R"pbdoc(
 Indexed weighted Jacobi on BSR arrays.
@@ -1030,6 +1432,14 @@ None
     m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
     m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("gauss_seidel_indexed", &_gauss_seidel_indexed<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Id").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"),
 R"pbdoc(
 Indexed Gauss-Seidel iteration.
@@ -1083,6 +1493,14 @@ of the index array Id which is to be considered.)pbdoc");
     m.def("jacobi_ne", &_jacobi_ne<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
     m.def("jacobi_ne", &_jacobi_ne<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi_ne", &_jacobi_ne<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi_ne", &_jacobi_ne<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi_ne", &_jacobi_ne<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert());
+    m.def("jacobi_ne", &_jacobi_ne<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(),
 R"pbdoc(
 Jacobi NE iteration.
@@ -1130,6 +1548,14 @@ None
     m.def("gauss_seidel_ne", &_gauss_seidel_ne<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"));
     m.def("gauss_seidel_ne", &_gauss_seidel_ne<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_ne", &_gauss_seidel_ne<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_ne", &_gauss_seidel_ne<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_ne", &_gauss_seidel_ne<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_ne", &_gauss_seidel_ne<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("Tx").noconvert(), py::arg("omega"),
 R"pbdoc(
 Gauss-Seidel NE iteration.
@@ -1169,6 +1595,14 @@ None
     m.def("gauss_seidel_nr", &_gauss_seidel_nr<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"));
     m.def("gauss_seidel_nr", &_gauss_seidel_nr<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_nr", &_gauss_seidel_nr<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_nr", &_gauss_seidel_nr<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_nr", &_gauss_seidel_nr<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"));
+    m.def("gauss_seidel_nr", &_gauss_seidel_nr<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("z").noconvert(), py::arg("col_start"), py::arg("col_stop"), py::arg("col_step"), py::arg("Tx").noconvert(), py::arg("omega"),
 R"pbdoc(
 Gauss-Seidel NR iteration.
@@ -1207,6 +1641,14 @@ None
     m.def("block_jacobi", &_block_jacobi<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
     m.def("block_jacobi", &_block_jacobi<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi", &_block_jacobi<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi", &_block_jacobi<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi", &_block_jacobi<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi", &_block_jacobi<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"),
 R"pbdoc(
 Block Jacobi iteration.
@@ -1247,6 +1689,67 @@ omega : float
 blocksize : int
     Dimension of square blocks in BSR matrix A.
 
+Returns
+-------
+None
+    Result in place.)pbdoc");
+
+    m.def("block_jacobi_lu", &_block_jacobi_lu<int, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<int, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<int, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_lu", &_block_jacobi_lu<std::int64_t, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("LU").noconvert(), py::arg("piv").noconvert(), py::arg("temp").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("omega").noconvert(), py::arg("blocksize"),
+R"pbdoc(
+Block Jacobi iteration with LU factored diagonal blocks.
+
+Perform one iteration of block Jacobi relaxation on the linear
+system Ax = b, where A is stored in BSR format and x and b are
+column vectors.  The diagonal blocks are applied through their LU
+factors, as computed by lu_factor_array, instead of explicit
+inverses.  Damping is controlled by the omega parameter.
+
+Parameters
+----------
+Ap : array
+    BSR row pointer.
+Aj : array
+    BSR index array.
+Ax : array
+    BSR data array, blocks assumed square.
+x : array
+    Approximate solution.
+b : array
+    Right hand side.
+LU : array
+    LU factors of each diagonal block of A stored
+    as a (n/blocksize, blocksize, blocksize) array.
+piv : array
+    Row pivots of each factorization, size n.  If piv[i*blocksize]
+    is -1, block i of LU holds an explicit (pseudo-)inverse.
+temp : array
+    Temporary vector the same size as x.
+row_start : int
+    Beginning of the sweep.
+row_stop : int
+    End of the sweep (i.e. one past the last unknown).
+row_step : int
+    Stride used during the sweep (may be negative).
+omega : float
+    Damping parameter.
+blocksize : int
+    Dimension of square blocks in BSR matrix A.
+
 Returns
 -------
 None
@@ -1259,6 +1762,14 @@ None
     m.def("block_jacobi_indexed", &_block_jacobi_indexed<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"));
     m.def("block_jacobi_indexed", &_block_jacobi_indexed<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_indexed", &_block_jacobi_indexed<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_indexed", &_block_jacobi_indexed<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_indexed", &_block_jacobi_indexed<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_indexed", &_block_jacobi_indexed<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("indices").noconvert(), py::arg("omega").noconvert(), py::arg("blocksize"),
 R"pbdoc(
 Indexed Block Jacobi iteration.
@@ -1302,6 +1813,14 @@ None
     m.def("block_gauss_seidel", &_block_gauss_seidel<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
     m.def("block_gauss_seidel", &_block_gauss_seidel<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("block_gauss_seidel", &_block_gauss_seidel<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("block_gauss_seidel", &_block_gauss_seidel<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("block_gauss_seidel", &_block_gauss_seidel<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"));
+    m.def("block_gauss_seidel", &_block_gauss_seidel<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"), py::arg("blocksize"),
 R"pbdoc(
 Block Gauss-Seidel iteration.
@@ -1349,6 +1868,14 @@ None
     m.def("extract_subblocks", &_extract_subblocks<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"));
     m.def("extract_subblocks", &_extract_subblocks<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"));
+    m.def("extract_subblocks", &_extract_subblocks<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"));
+    m.def("extract_subblocks", &_extract_subblocks<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"));
+    m.def("extract_subblocks", &_extract_subblocks<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"));
+    m.def("extract_subblocks", &_extract_subblocks<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"),
 R"pbdoc(
 Extract diagonal blocks from A and insert into a linear array.
@@ -1388,6 +1915,14 @@ None
     m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
     m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"));
+    m.def("overlapping_schwarz_csr", &_overlapping_schwarz_csr<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("Tp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sp").noconvert(), py::arg("nsdomains"), py::arg("nrows"), py::arg("row_start"), py::arg("row_stop"), py::arg("row_step"),
 R"pbdoc(
 Overlapping Schwarz iteration.
@@ -1435,5 +1970,231 @@ Returns
 None
     Array x will be modified inplace.)pbdoc");
 
+    m.def("spai_csr", &_spai_csr<int, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Mp").noconvert(), py::arg("Mj").noconvert(), py::arg("Mx").noconvert());
+    m.def("spai_csr", &_spai_csr<int, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Mp").noconvert(), py::arg("Mj").noconvert(), py::arg("Mx").noconvert());
+    m.def("spai_csr", &_spai_csr<std::int64_t, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Mp").noconvert(), py::arg("Mj").noconvert(), py::arg("Mx").noconvert());
+    m.def("spai_csr", &_spai_csr<std::int64_t, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Mp").noconvert(), py::arg("Mj").noconvert(), py::arg("Mx").noconvert(),
+R"pbdoc(
+Sparse approximate inverse (SPAI) with a prescribed sparsity pattern.
+
+Compute the rows of M that minimize || I - M A ||_F, where M is
+restricted to the sparsity pattern given by Mp and Mj.  Row i of M
+is the solution of the small least squares problem
+
+    min || A(J, K)^T m - e_i(K) ||_2,
+
+where J is the pattern of row i of M and K is the set of columns
+reached by the rows J of A.  Each least squares problem is solved
+with a dense QR factorization.
+
+Parameters
+----------
+Ap : array
+    CSR row pointer.
+Aj : array
+    CSR index array.
+Ax : array
+    CSR data array.
+Mp : array
+    CSR row pointer for the pattern of M.
+Mj : array
+    CSR index array for the pattern of M.
+Mx : array
+    CSR data array for M, same length as Mj.
+
+Returns
+-------
+None
+    Mx will be modified in place.
+
+Notes
+-----
+A is assumed square.  If the diagonal of row i is not reached by
+the rows J of A, row i of M is set to zero.  Only real-valued
+matrices are supported, see least_squares.)pbdoc");
+
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<int, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<int, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<int, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"));
+    m.def("block_jacobi_tiled", &_block_jacobi_tiled<std::int64_t, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("Tx").noconvert(), py::arg("temp").noconvert(), py::arg("iterations"), py::arg("tilesize"), py::arg("bandwidth"), py::arg("omega").noconvert(), py::arg("blocksize"),
+R"pbdoc(
+Temporal-blocked (tiled) weighted Jacobi iteration.
+
+Perform several sweeps of (block) Jacobi relaxation on the linear
+system Ax = b, x <- x + omega Dinv (b - A x), where A is stored in
+BSR format.  Rows are processed in tiles of tilesize block rows.
+Each tile is extended by a halo of iterations*bandwidth block rows
+and all sweeps are carried out on the tile before moving on, so that
+the rows of A belonging to a tile are read from main memory once
+and reused from cache for every sweep.  Values in the halo are
+recomputed by neighboring tiles.
+
+Parameters
+----------
+Ap : array
+    BSR row pointer.
+Aj : array
+    BSR index array.
+Ax : array
+    BSR data array, blocks assumed square.
+x : array
+    Approximate solution.
+b : array
+    Right hand side.
+Tx : array
+    Inverse of each diagonal block of A stored
+    as a (n/blocksize, blocksize, blocksize) array.
+temp : array
+    Temporary vector the same size as x.
+iterations : int
+    Number of Jacobi sweeps.
+tilesize : int
+    Number of block rows in each tile.
+bandwidth : int
+    Upper bound on |i - j| over all nonzero blocks (i, j) of A.
+omega : float
+    Damping parameter.
+blocksize : int
+    Dimension of square blocks in BSR matrix A.
+
+Returns
+-------
+None
+    Array x will be modified in place.
+
+Notes
+-----
+With blocksize 1, A may be passed in CSR format.  Point-wise Jacobi
+on a BSR matrix is obtained by passing the inverse of the (point)
+diagonal of A as diagonal blocks in Tx.
+
+The result agrees with iterations sweeps of block_jacobi only if the
+bandwidth bound holds.)pbdoc");
+
+    m.def("stencil_jacobi", &_stencil_jacobi<int, float, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<int, double, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<int, std::complex<float>, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<int, std::complex<double>, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<std::int64_t, float, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<std::int64_t, double, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<std::int64_t, std::complex<float>, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert());
+    m.def("stencil_jacobi", &_stencil_jacobi<std::int64_t, std::complex<double>, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("temp").noconvert(), py::arg("omega").noconvert(),
+R"pbdoc(
+Weighted Jacobi iteration for a constant stencil on a regular grid.
+
+Perform one iteration of Jacobi relaxation on the linear system Ax = b,
+where A is the matrix of a stencil on a regular grid, as in
+stencil_matvec.  The grid is traversed one line along the last axis at a
+time, and each off-center stencil entry is applied to the whole line.
+
+Parameters
+----------
+grid : array, ndim
+    Grid dimensions.
+offsets : array, n_entries*ndim
+    Offset of each nonzero stencil entry from the stencil center.
+values : array, n_entries
+    Value of each nonzero stencil entry.
+x : array
+    Approximate solution.
+b : array
+    Right hand side.
+temp : array
+    Temporary vector the same size as x.
+omega : float
+    Damping parameter.
+
+Returns
+-------
+None
+    Array x will be modified inplace.  If the center of the stencil is
+    zero, x is unchanged.)pbdoc");
+
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<int, float, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<int, double, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<int, std::complex<float>, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<int, std::complex<double>, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<std::int64_t, float, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<std::int64_t, double, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<std::int64_t, std::complex<float>, float>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert());
+    m.def("stencil_gauss_seidel", &_stencil_gauss_seidel<std::int64_t, std::complex<double>, double>,
+        py::arg("grid").noconvert(), py::arg("offsets").noconvert(), py::arg("values").noconvert(), py::arg("x").noconvert(), py::arg("b").noconvert(), py::arg("mods").noconvert(), py::arg("weights").noconvert(), py::arg("num_colors"), py::arg("color"), py::arg("omega").noconvert(),
+R"pbdoc(
+Multicolor Gauss-Seidel iteration for a constant stencil on a regular grid.
+
+Perform one weighted Gauss-Seidel update of the grid points of one
+color on the linear system Ax = b, where A is the matrix of a stencil on
+a regular grid, as in stencil_matvec.  The color of the point with grid
+indices idx is
+
+..
+  (sum_k weights[k] * (idx[k] % mods[k])) % num_colors
+
+and the coloring must be such that no stencil entry couples two points
+of the same color, so that the points of one color may be updated in any
+order.  The points of the color on each grid line along the last axis are
+updated together, one stencil entry at a time.  For example, the red-black coloring has ``mods`` equal to 2 and
+``weights`` equal to 1 along each axis, and ``num_colors = 2``.
+
+Parameters
+----------
+grid : array, ndim
+    Grid dimensions.
+offsets : array, n_entries*ndim
+    Offset of each nonzero stencil entry from the stencil center.
+values : array, n_entries
+    Value of each nonzero stencil entry.
+x : array
+    Approximate solution.
+b : array
+    Right hand side.
+mods : array, ndim
+    Period of the coloring along each axis.
+weights : array, ndim
+    Weight of each axis in the color.
+num_colors : int
+    Number of colors.
+color : int
+    Color of the points to update.
+omega : float
+    Damping parameter.
+
+Returns
+-------
+None
+    Array x will be modified inplace.  If the center of the stencil is
+    zero, x is unchanged.)pbdoc");
+
 }
 
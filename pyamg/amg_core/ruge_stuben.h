@@ -8,9 +8,11 @@
 #include <cassert>
 #include <limits>
 #include <algorithm>
+#include <queue>
 
 #include "linalg.h"
 #include "graph.h"
+#include "relaxation.h"
 
 #define F_NODE 0
 #define C_NODE 1
@@ -63,12 +65,12 @@
 template<class I, class T, class F>
 void classical_strength_of_connection_abs(const I n_row,
                                           const F theta,
-                                          const I Ap[], const int Ap_size,
-                                          const I Aj[], const int Aj_size,
-                                          const T Ax[], const int Ax_size,
-                                                I Sp[], const int Sp_size,
-                                                I Sj[], const int Sj_size,
-                                                T Sx[], const int Sx_size)
+                                          const I Ap[], const std::ptrdiff_t Ap_size,
+                                          const I Aj[], const std::ptrdiff_t Aj_size,
+                                          const T Ax[], const std::ptrdiff_t Ax_size,
+                                                I Sp[], const std::ptrdiff_t Sp_size,
+                                                I Sj[], const std::ptrdiff_t Sj_size,
+                                                T Sx[], const std::ptrdiff_t Sx_size)
 {
     I nnz = 0;
     Sp[0] = 0;
@@ -156,12 +158,12 @@ void classical_strength_of_connection_abs(const I n_row,
 template<class I, class T>
 void classical_strength_of_connection_min(const I n_row,
                                           const T theta,
-                                          const I Ap[], const int Ap_size,
-                                          const I Aj[], const int Aj_size,
-                                          const T Ax[], const int Ax_size,
-                                                I Sp[], const int Sp_size,
-                                                I Sj[], const int Sj_size,
-                                                T Sx[], const int Sx_size)
+                                          const I Ap[], const std::ptrdiff_t Ap_size,
+                                          const I Aj[], const std::ptrdiff_t Aj_size,
+                                          const T Ax[], const std::ptrdiff_t Ax_size,
+                                                I Sp[], const std::ptrdiff_t Sp_size,
+                                                I Sj[], const std::ptrdiff_t Sj_size,
+                                                T Sx[], const std::ptrdiff_t Sx_size)
 {
     I nnz = 0;
     Sp[0] = 0;
@@ -228,10 +230,10 @@ void classical_strength_of_connection_min(const I n_row,
  */
 template<class I, class T, class F>
 void maximum_row_value(const I n_row,
-                              T x[], const int  x_size,
-                       const I Ap[], const int Ap_size,
-                       const I Aj[], const int Aj_size,
-                       const T Ax[], const int Ax_size)
+                              T x[], const std::ptrdiff_t  x_size,
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                       const T Ax[], const std::ptrdiff_t Ax_size)
 {
 
     for(I i = 0; i < n_row; i++){
@@ -283,12 +285,12 @@ void maximum_row_value(const I n_row,
  */
 template<class I>
 void rs_cf_splitting(const I n_nodes,
-                     const I Sp[], const int Sp_size,
-                     const I Sj[], const int Sj_size,
-                     const I Tp[], const int Tp_size,
-                     const I Tj[], const int Tj_size,
-                     const I influence[], const int influence_size,
-                           I splitting[], const int splitting_size)
+                     const I Sp[], const std::ptrdiff_t Sp_size,
+                     const I Sj[], const std::ptrdiff_t Sj_size,
+                     const I Tp[], const std::ptrdiff_t Tp_size,
+                     const I Tj[], const std::ptrdiff_t Tj_size,
+                     const I influence[], const std::ptrdiff_t influence_size,
+                           I splitting[], const std::ptrdiff_t splitting_size)
 {
     std::vector<I> lambda(n_nodes,0);
 
@@ -482,9 +484,9 @@ void rs_cf_splitting(const I n_nodes,
  */
 template<class I>
 void rs_cf_splitting_pass2(const I n_nodes,
-                           const I Sp[], const int Sp_size,
-                           const I Sj[], const int Sj_size,
-                                 I splitting[], const int splitting_size)
+                           const I Sp[], const std::ptrdiff_t Sp_size,
+                           const I Sj[], const std::ptrdiff_t Sj_size,
+                                 I splitting[], const std::ptrdiff_t splitting_size)
 {
     // For each F-point
     for (I row=0; row<n_nodes; row++) {
@@ -562,6 +564,8 @@ void rs_cf_splitting_pass2(const I n_nodes,
  *     Array to store the C/F splitting.
  * colorflag : int
  *     Flag to indicate coloring.
+ * seed : int
+ *     Seed of the random weights.
  *
  * Returns
  * -------
@@ -573,21 +577,27 @@ void rs_cf_splitting_pass2(const I n_nodes,
  * The splitting array must be preallocated.
  * CLJP naive since it requires the transpose.
  *
+ * The random weights are counter-based (see counter_uniform), and each
+ * selection and weight update step depends only on the state at the start
+ * of the step, so that the splitting does not depend on the order in which
+ * the vertices are processed.
+ *
  */
 template<class I>
 void cljp_naive_splitting(const I n,
-                          const I Sp[], const int Sp_size,
-                          const I Sj[], const int Sj_size,
-                          const I Tp[], const int Tp_size,
-                          const I Tj[], const int Tj_size,
-                                I splitting[], const int splitting_size,
-                          const I colorflag)
+                          const I Sp[], const std::ptrdiff_t Sp_size,
+                          const I Sj[], const std::ptrdiff_t Sj_size,
+                          const I Tp[], const std::ptrdiff_t Tp_size,
+                          const I Tj[], const std::ptrdiff_t Tj_size,
+                                I splitting[], const std::ptrdiff_t splitting_size,
+                          const I colorflag,
+                          const I seed)
 {
   // initialize sizes
   int ncolors;
   I unassigned = n;
   I nD;
-  int nnz = Sp[n];
+  I nnz = Sp[n];
 
   // initialize vectors
   // complexity = 5n
@@ -598,7 +608,7 @@ void cljp_naive_splitting(const I n,
   std::vector<I> D(n,0);      // marked nodes  in the ind set
   std::vector<I> Dlist(n,0);      // marked nodes  in the ind set
   std::fill(splitting, splitting + n, U_NODE);
-  int * c_dep_cache = new int[n];
+  I * c_dep_cache = new I[n];
   std::fill_n(c_dep_cache, n, -1);
 
   // INITIALIZE WEIGHTS
@@ -615,9 +625,8 @@ void cljp_naive_splitting(const I n,
     }
   }
   else {
-    srand(2448422);
     for(I i=0; i < n; i++){
-      weight[i] = double(rand())/RAND_MAX;
+      weight[i] = counter_uniform((std::uint64_t)seed, (std::uint64_t)i);
     }
   }
 
@@ -775,10 +784,10 @@ void cljp_naive_splitting(const I n,
  */
 template<class I>
 void rs_direct_interpolation_pass1(const I n_nodes,
-                                   const I Sp[], const int Sp_size,
-                                   const I Sj[], const int Sj_size,
-                                   const I splitting[], const int splitting_size,
-                                         I Pp[], const int Pp_size)
+                                   const I Sp[], const std::ptrdiff_t Sp_size,
+                                   const I Sj[], const std::ptrdiff_t Sj_size,
+                                   const I splitting[], const std::ptrdiff_t splitting_size,
+                                         I Pp[], const std::ptrdiff_t Pp_size)
 {
     I nnz = 0;
     Pp[0] = 0;
@@ -830,16 +839,16 @@ void rs_direct_interpolation_pass1(const I n_nodes,
  */
 template<class I, class T>
 void rs_direct_interpolation_pass2(const I n_nodes,
-                                   const I Ap[], const int Ap_size,
-                                   const I Aj[], const int Aj_size,
-                                   const T Ax[], const int Ax_size,
-                                   const I Sp[], const int Sp_size,
-                                   const I Sj[], const int Sj_size,
-                                   const T Sx[], const int Sx_size,
-                                   const I splitting[], const int splitting_size,
-                                   const I Pp[], const int Pp_size,
-                                         I Pj[], const int Pj_size,
-                                         T Px[], const int Px_size)
+                                   const I Ap[], const std::ptrdiff_t Ap_size,
+                                   const I Aj[], const std::ptrdiff_t Aj_size,
+                                   const T Ax[], const std::ptrdiff_t Ax_size,
+                                   const I Sp[], const std::ptrdiff_t Sp_size,
+                                   const I Sj[], const std::ptrdiff_t Sj_size,
+                                   const T Sx[], const std::ptrdiff_t Sx_size,
+                                   const I splitting[], const std::ptrdiff_t splitting_size,
+                                   const I Pp[], const std::ptrdiff_t Pp_size,
+                                         I Pj[], const std::ptrdiff_t Pj_size,
+                                         T Px[], const std::ptrdiff_t Px_size)
 {
 
     for(I i = 0; i < n_nodes; i++){
@@ -939,13 +948,13 @@ void rs_direct_interpolation_pass2(const I n_nodes,
  *
  */
 template<class I, class T>
-void cr_helper(const I Ap[], const int Ap_size,
-               const I Aj[], const int Aj_size,
-               const T  B[], const int  B_size,
-                     T         e[], const int e_size,
-                     I   indices[], const int indices_size,
-                     I splitting[], const int splitting_size,
-                     T     gamma[], const int gamma_size,
+void cr_helper(const I Ap[], const std::ptrdiff_t Ap_size,
+               const I Aj[], const std::ptrdiff_t Aj_size,
+               const T  B[], const std::ptrdiff_t  B_size,
+                     T         e[], const std::ptrdiff_t e_size,
+                     I   indices[], const std::ptrdiff_t indices_size,
+                     I splitting[], const std::ptrdiff_t splitting_size,
+                     T     gamma[], const std::ptrdiff_t gamma_size,
                const T thetacs)
 {
     I n = splitting_size;
@@ -991,28 +1000,37 @@ void cr_helper(const I Ap[], const int Ap_size,
         omega[pt] = num_neighbors + gamma[pt];
     }
 
-    // Form maximum independent set
-    while (true) {
+    // Form maximum independent set.  Candidates are kept in a max-heap of
+    // (weight, -position in U), so that ties go to the first point in U.
+    // Weights only increase or drop to zero, so an entry is stale if its
+    // weight differs from the current one.
+    std::vector<I> Upos(n, 0);
+    std::priority_queue<std::pair<T,I> > heap;
+    for (I i=0; i<set_size; i++) {
+        I pt = Uindex[i];
+        Upos[pt] = i;
+        heap.push(std::make_pair(omega[pt], -i));
+    }
+    std::vector<I> neighbors;
+    while (!heap.empty()) {
         // 1. Add point i in U with maximal weight to C
-        T max_weight = 0;
-        I new_pt = -1;
-        for (I i=0; i<set_size; i++) {
-            I pt = Uindex[i];
-            if (omega[pt] > max_weight) {
-                max_weight = omega[pt];
-                new_pt = pt;
-            }
-        }
+        const T max_weight = heap.top().first;
+        const I new_pt = Uindex[-heap.top().second];
+        heap.pop();
         // If all points have zero weight (index set is empty) break loop
-        if (new_pt < 0) {
+        if (max_weight <= 0) {
             break;
         }
+        if (max_weight != omega[new_pt]) {
+            continue;
+        }
         splitting[new_pt] = 1;
         gamma[new_pt] = 0;
+        omega[new_pt] = 0;
 
         // 2. Remove from candidate set all nodes connected to
         // new C-point by marking weight zero.
-        std::vector<I> neighbors;
+        neighbors.clear();
         I A_ind0 = Ap[new_pt];
         I A_ind1 = Ap[new_pt+1];
         for (I i=A_ind0; i<A_ind1; i++) {
@@ -1032,6 +1050,7 @@ void cr_helper(const I Ap[], const int Ap_size,
                 I temp = Aj[j];
                 if (omega[temp] != 0) {
                     omega[temp] += 1;
+                    heap.push(std::make_pair(omega[temp], -Upos[temp]));
                 }
             }
         }
@@ -1056,6 +1075,233 @@ void cr_helper(const I Ap[], const int Ap_size,
     }
 }
 
+/* Relaxation sweeps of compatible relaxation.
+ *
+ * Relax on A e = 0 until either very fast convergence, rho < 0.1*thetacr,
+ * is observed, or at least nu sweeps have been performed and the relative
+ * change in rho is below 0.1.
+ *
+ * Parameters
+ * ----------
+ * Ap : array
+ *     Row pointer for sparse matrix in CSR format.
+ * Aj : array
+ *     Column indices for sparse matrix in CSR format.
+ * Ax : array
+ *     Data array for sparse matrix in CSR format.
+ * e : array, inplace
+ *     Target vector, relaxed in place.  Entries at C-points are set to zero.
+ * Findex : array
+ *     F indices of the current splitting.
+ * Cindex : array
+ *     C indices of the current splitting.
+ * nu : int
+ *     Minimum number of relaxation sweeps.
+ * thetacr : float
+ *     Desired convergence factor.
+ * concurrent : int
+ *     If nonzero, relax with Gauss-Seidel on the F-points only (concurrent
+ *     CR); otherwise, relax on all points and set e to zero at the C-points
+ *     after each sweep (habituated CR).
+ *
+ * Returns
+ * -------
+ * rho : float
+ *     Convergence factor of the last sweep.
+ *
+ */
+template<class I, class T>
+T cr_sweep(const I Ap[], const std::ptrdiff_t Ap_size,
+           const I Aj[], const std::ptrdiff_t Aj_size,
+           const T Ax[], const std::ptrdiff_t Ax_size,
+                 T  e[], const std::ptrdiff_t  e_size,
+           const I Findex[], const std::ptrdiff_t Findex_size,
+           const I Cindex[], const std::ptrdiff_t Cindex_size,
+           const I nu,
+           const T thetacr,
+           const I concurrent)
+{
+    const I n = e_size;
+    std::vector<T> z(n, 0);
+
+    for (I i=0; i<Cindex_size; i++) {
+        e[Cindex[i]] = 0;
+    }
+    T enorm = 0;
+    for (I i=0; i<n; i++) {
+        enorm += e[i]*e[i];
+    }
+    enorm = std::sqrt(enorm);
+    T rhok = 1;
+    I it = 0;
+
+    while (true) {
+        if (concurrent) {
+            gauss_seidel_indexed<I,T,T>(Ap, Ap_size, Aj, Aj_size, Ax, Ax_size, e, e_size,
+                                        &z[0], n, Findex, Findex_size,
+                                        (I)0, (I)Findex_size, (I)1);
+        }
+        else {
+            gauss_seidel<I,T,T>(Ap, Ap_size, Aj, Aj_size, Ax, Ax_size, e, e_size,
+                                &z[0], n, (I)0, n, (I)1);
+            for (I i=0; i<Cindex_size; i++) {
+                e[Cindex[i]] = 0;
+            }
+        }
+
+        T enorm_old = enorm;
+        enorm = 0;
+        for (I i=0; i<n; i++) {
+            enorm += e[i]*e[i];
+        }
+        enorm = std::sqrt(enorm);
+        T rhok_old = rhok;
+        it++;
+
+        // e is already zero
+        if (enorm_old == 0) {
+            return 0;
+        }
+        rhok = enorm / enorm_old;
+
+        // criteria 1 -- fast convergence
+        if (rhok < 0.1 * thetacr) {
+            break;
+        }
+
+        // criteria 2 -- at least nu iters, small relative change in CF (<0.1)
+        if ((std::abs(rhok - rhok_old) / rhok < 0.1) && (it >= nu)) {
+            break;
+        }
+    }
+
+    return rhok;
+}
+
+
+/* Row sum standard deviation s(x)/betabar of binormalization, with
+ * beta = B x, see equation (7) in Livne / Golub (2004).
+ */
+template<class I, class T>
+inline T rowsum_stdev(const T x[], const T beta[], const I n)
+{
+    T betabar = 0;
+    for (I i=0; i<n; i++) {
+        betabar += x[i]*beta[i];
+    }
+    betabar /= n;
+
+    T stdev = 0;
+    for (I i=0; i<n; i++) {
+        T r = x[i]*beta[i] - betabar;
+        stdev += r*r;
+    }
+    return std::sqrt(stdev / n) / betabar;
+}
+
+
+/* Binormalization of a symmetric matrix.
+ *
+ * Compute x such that the rows of diag(x) B diag(x), with B = A.*A, have
+ * equal sums, by the coordinate updates of equation (12) in Livne / Golub
+ * (2004).  Then diag(sqrt(x)) A diag(sqrt(x)) has rows of equal 2-norm.
+ *
+ * Parameters
+ * ----------
+ * Bp : array
+ *     Column pointer for B = A.*A in CSC format.
+ * Bj : array
+ *     Row indices for B in CSC format.
+ * Bx : array
+ *     Data array for B in CSC format.
+ * x : array, inplace
+ *     Initial guess, overwritten with the scaling.
+ * tol : float
+ *     Tolerance for the relative standard deviation of the row sums.
+ * maxiter : int
+ *     Maximum number of sweeps over x.
+ *
+ * Returns
+ * -------
+ * int
+ *     Number of sweeps, or -1 if B is nearly un-binormalizable, in which
+ *     case x is left partially updated.
+ *
+ * Notes
+ * -----
+ * B is assumed symmetric, so that column i of B is also row i.
+ *
+ */
+template<class I, class T>
+I binormalize(const I Bp[], const std::ptrdiff_t Bp_size,
+              const I Bj[], const std::ptrdiff_t Bj_size,
+              const T Bx[], const std::ptrdiff_t Bx_size,
+                    T  x[], const std::ptrdiff_t  x_size,
+              const T tol,
+              const I maxiter)
+{
+    const I n = x_size;
+
+    // 1. diagonal of B
+    std::vector<T> d(n, 0);
+    for (I i=0; i<n; i++) {
+        for (I jj=Bp[i]; jj<Bp[i+1]; jj++) {
+            if (Bj[jj] == i) {
+                d[i] += Bx[jj];
+            }
+        }
+    }
+
+    // 2. beta = B x
+    std::vector<T> beta(n, 0);
+    for (I i=0; i<n; i++) {
+        for (I jj=Bp[i]; jj<Bp[i+1]; jj++) {
+            beta[Bj[jj]] += Bx[jj]*x[i];
+        }
+    }
+    T betabar = 0;
+    for (I i=0; i<n; i++) {
+        betabar += x[i]*beta[i];
+    }
+    betabar /= n;
+    T stdev = rowsum_stdev(x, &beta[0], n);
+
+    // 3.
+    I it = 0;
+    while (stdev > tol && it < maxiter) {
+        for (I i=0; i<n; i++) {
+            // solve equation x_i, keeping x_j's fixed, see equation (12)
+            T c2 = (n-1)*d[i];
+            T c1 = (n-2)*(beta[i] - d[i]*x[i]);
+            T c0 = -d[i]*x[i]*x[i] + 2*beta[i]*x[i] - n*betabar;
+
+            if (-c0 < 1e-14) {
+                return -1;
+            }
+
+            T xnew = (2*c0)/(-c1 - std::sqrt(c1*c1 - 4*c0*c2));
+            T dx = xnew - x[i];
+
+            T dot_Bcol = 0;
+            for (I jj=Bp[i]; jj<Bp[i+1]; jj++) {
+                dot_Bcol += x[Bj[jj]]*Bx[jj];
+            }
+
+            betabar += (T(1.0)/n)*dx*(dot_Bcol + beta[i] + d[i]*dx);
+            for (I jj=Bp[i]; jj<Bp[i+1]; jj++) {
+                beta[Bj[jj]] += dx*Bx[jj];
+            }
+
+            x[i] = xnew;
+        }
+
+        stdev = rowsum_stdev(x, &beta[0], n);
+        it++;
+    }
+
+    return it;
+}
+
 /* First pass of classical AMG interpolation.
  *
  * Build row pointer for P based on SOC matrix and CF-splitting.
@@ -1081,10 +1327,10 @@ void cr_helper(const I Ap[], const int Ap_size,
  */
 template<class I>
 void rs_classical_interpolation_pass1(const I n_nodes,
-                                      const I Sp[], const int Sp_size,
-                                      const I Sj[], const int Sj_size,
-                                      const I splitting[], const int splitting_size,
-                                            I Pp[], const int Pp_size)
+                                      const I Sp[], const std::ptrdiff_t Sp_size,
+                                      const I Sj[], const std::ptrdiff_t Sj_size,
+                                      const I splitting[], const std::ptrdiff_t splitting_size,
+                                            I Pp[], const std::ptrdiff_t Pp_size)
 {
     I nnz = 0;
     Pp[0] = 0;
@@ -1131,10 +1377,10 @@ void rs_classical_interpolation_pass1(const I n_nodes,
  */
 template<class I, class T>
 void remove_strong_FF_connections(const I n_nodes,
-                                  const I Sp[], const int Sp_size,
-                                  const I Sj[], const int Sj_size,
-                                        T Sx[], const int Sx_size,
-                                  const I splitting[], const int splitting_size)
+                                  const I Sp[], const std::ptrdiff_t Sp_size,
+                                  const I Sj[], const std::ptrdiff_t Sj_size,
+                                        T Sx[], const std::ptrdiff_t Sx_size,
+                                  const I splitting[], const std::ptrdiff_t splitting_size)
 {
     // For each F-point
     for (I row=0; row<n_nodes; row++) {
@@ -1237,16 +1483,16 @@ void remove_strong_FF_connections(const I n_nodes,
  */
 template<class I, class T>
 void rs_classical_interpolation_pass2(const I n_nodes,
-                                      const I Ap[], const int Ap_size,
-                                      const I Aj[], const int Aj_size,
-                                      const T Ax[], const int Ax_size,
-                                      const I Sp[], const int Sp_size,
-                                      const I Sj[], const int Sj_size,
-                                      const T Sx[], const int Sx_size,
-                                      const I splitting[], const int splitting_size,
-                                      const I Pp[], const int Pp_size,
-                                            I Pj[], const int Pj_size,
-                                            T Px[], const int Px_size,
+                                      const I Ap[], const std::ptrdiff_t Ap_size,
+                                      const I Aj[], const std::ptrdiff_t Aj_size,
+                                      const T Ax[], const std::ptrdiff_t Ax_size,
+                                      const I Sp[], const std::ptrdiff_t Sp_size,
+                                      const I Sj[], const std::ptrdiff_t Sj_size,
+                                      const T Sx[], const std::ptrdiff_t Sx_size,
+                                      const I splitting[], const std::ptrdiff_t splitting_size,
+                                      const I Pp[], const std::ptrdiff_t Pp_size,
+                                            I Pj[], const std::ptrdiff_t Pj_size,
+                                            T Px[], const std::ptrdiff_t Px_size,
                                       const bool modified)
 {
     for (I i = 0; i < n_nodes; i++) {
@@ -1382,4 +1628,619 @@ void rs_classical_interpolation_pass2(const I n_nodes,
     }
 }
 
+
+/*
+ * Distance-two strength of connection between C-points, pass 1.
+ *
+ * Count the nonzeros in each row of the strength matrix used for the second
+ * stage of aggressive coarsening.  C-point j is strongly connected to C-point
+ * i if there are at least num_paths strong paths of length at most two from
+ * i to j, i.e., i -> j or i -> k -> j for any node k.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Sp : array
+ *     Strength matrix row pointer array.
+ * Sj : array
+ *     Strength matrix column index array.
+ * splitting : array
+ *     C/F splitting of the first stage.
+ * num_paths : int
+ *     Number of paths required for a strong connection (1 for A1, 2 for A2).
+ * Tp : array, inplace
+ *     Row pointer array of the distance-two strength matrix, with one row
+ *     per C-point.
+ *
+ * Returns
+ * -------
+ * None
+ *     Tp is modified in place.
+ *
+ * References
+ * ----------
+ * .. [1] K. Stuben, "An Introduction to Algebraic Multigrid," in
+ *    Multigrid, U. Trottenberg, C. W. Oosterlee, A. Schuller, (2001),
+ *    Appendix A, Sec. A.7.1.
+ *
+ */
+template<class I>
+void rs_aggressive_strength_pass1(const I n_nodes,
+                                  const I Sp[], const std::ptrdiff_t Sp_size,
+                                  const I Sj[], const std::ptrdiff_t Sj_size,
+                                  const I splitting[], const std::ptrdiff_t splitting_size,
+                                  const I num_paths,
+                                        I Tp[], const std::ptrdiff_t Tp_size)
+{
+    std::vector<I> marker(n_nodes, -1);
+    std::vector<I> count(n_nodes, 0);
+
+    I nnz = 0;
+    I nc = 0;
+    Tp[0] = 0;
+    for(I i = 0; i < n_nodes; i++){
+        if(splitting[i] != C_NODE){ continue; }
+
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            const I k = Sj[jj];
+            if(k == i){ continue; }
+            // direct path i -> k
+            if(marker[k] != i){ marker[k] = i; count[k] = 0; }
+            count[k]++;
+            if(splitting[k] == C_NODE && count[k] == num_paths){ nnz++; }
+            // paths i -> k -> j
+            for(I kk = Sp[k]; kk < Sp[k+1]; kk++){
+                const I j = Sj[kk];
+                if(j == i || j == k){ continue; }
+                if(marker[j] != i){ marker[j] = i; count[j] = 0; }
+                count[j]++;
+                if(splitting[j] == C_NODE && count[j] == num_paths){ nnz++; }
+            }
+        }
+        Tp[++nc] = nnz;
+    }
+}
+
+
+/*
+ * Distance-two strength of connection between C-points, pass 2.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Sp : array
+ *     Strength matrix row pointer array.
+ * Sj : array
+ *     Strength matrix column index array.
+ * splitting : array
+ *     C/F splitting of the first stage.
+ * num_paths : int
+ *     Number of paths required for a strong connection (1 for A1, 2 for A2).
+ * Tp : array
+ *     Row pointer array from rs_aggressive_strength_pass1.
+ * Tj : array, inplace
+ *     Column index array, numbered by C-point.
+ *
+ * Returns
+ * -------
+ * None
+ *     Tj is modified in place.
+ *
+ */
+template<class I>
+void rs_aggressive_strength_pass2(const I n_nodes,
+                                  const I Sp[], const std::ptrdiff_t Sp_size,
+                                  const I Sj[], const std::ptrdiff_t Sj_size,
+                                  const I splitting[], const std::ptrdiff_t splitting_size,
+                                  const I num_paths,
+                                  const I Tp[], const std::ptrdiff_t Tp_size,
+                                        I Tj[], const std::ptrdiff_t Tj_size)
+{
+    std::vector<I> map(n_nodes);
+    for(I i = 0, sum = 0; i < n_nodes; i++){
+        map[i] = sum;
+        sum   += (splitting[i] == C_NODE);
+    }
+
+    std::vector<I> marker(n_nodes, -1);
+    std::vector<I> count(n_nodes, 0);
+
+    I nnz = 0;
+    for(I i = 0; i < n_nodes; i++){
+        if(splitting[i] != C_NODE){ continue; }
+
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            const I k = Sj[jj];
+            if(k == i){ continue; }
+            if(marker[k] != i){ marker[k] = i; count[k] = 0; }
+            count[k]++;
+            if(splitting[k] == C_NODE && count[k] == num_paths){ Tj[nnz++] = map[k]; }
+            for(I kk = Sp[k]; kk < Sp[k+1]; kk++){
+                const I j = Sj[kk];
+                if(j == i || j == k){ continue; }
+                if(marker[j] != i){ marker[j] = i; count[j] = 0; }
+                count[j]++;
+                if(splitting[j] == C_NODE && count[j] == num_paths){ Tj[nnz++] = map[j]; }
+            }
+        }
+    }
+}
+
+
+/*
+ * Multipass interpolation pass 1.
+ *
+ * Assign each F-point to a pass and build the row pointer for P.  C-points
+ * are in pass 0.  An F-point is in pass k if it has no strong connection to
+ * a point of passes 0, ..., k-2, but has one to a point of pass k-1.  The
+ * interpolatory set of an F-point is the union of the interpolatory sets of
+ * its strong neighbors in earlier passes.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Sp : array
+ *     Strength matrix row pointer array.
+ * Sj : array
+ *     Strength matrix column index array.
+ * splitting : array
+ *     C/F splitting.
+ * passes : array, inplace
+ *     Pass of each node, or -1 for F-points without a strong path to a
+ *     C-point, which are not interpolated.
+ * Pp : array, inplace
+ *     Row pointer array.
+ *
+ * Returns
+ * -------
+ * None
+ *     passes and Pp are modified in place.
+ *
+ * References
+ * ----------
+ * .. [1] K. Stuben, "An Introduction to Algebraic Multigrid," in
+ *    Multigrid, U. Trottenberg, C. W. Oosterlee, A. Schuller, (2001),
+ *    Appendix A, Sec. A.7.1.3.
+ *
+ */
+template<class I>
+void rs_multipass_interpolation_pass1(const I n_nodes,
+                                      const I Sp[], const std::ptrdiff_t Sp_size,
+                                      const I Sj[], const std::ptrdiff_t Sj_size,
+                                      const I splitting[], const std::ptrdiff_t splitting_size,
+                                            I passes[], const std::ptrdiff_t passes_size,
+                                            I Pp[], const std::ptrdiff_t Pp_size)
+{
+    // interpolatory set of each row, stored in the order the rows are built
+    std::vector<I> start(n_nodes, 0), length(n_nodes, 0);
+    std::vector<I> Qj;
+    std::vector<I> unassigned, current;
+
+    for(I i = 0; i < n_nodes; i++){
+        if(splitting[i] == C_NODE){
+            passes[i] = 0;
+            start[i]  = (I)Qj.size();
+            length[i] = 1;
+            Qj.push_back(i);
+        } else {
+            passes[i] = -1;
+            unassigned.push_back(i);
+        }
+    }
+
+    std::vector<I> marker(n_nodes, -1);
+    for(I pass = 1; !unassigned.empty(); pass++){
+        // points of this pass, from the passes of the previous points only
+        current.clear();
+        I remaining = 0;
+        for(std::size_t n = 0; n < unassigned.size(); n++){
+            const I i = unassigned[n];
+            bool found = false;
+            for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+                const I j = Sj[jj];
+                if(j != i && passes[j] >= 0){ found = true; break; }
+            }
+            if(found){
+                current.push_back(i);
+            } else {
+                unassigned[remaining++] = i;
+            }
+        }
+        unassigned.resize(remaining);
+        if(current.empty()){ break; }
+
+        for(std::size_t n = 0; n < current.size(); n++){
+            const I i = current[n];
+            start[i] = (I)Qj.size();
+            for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+                const I j = Sj[jj];
+                if(j == i || passes[j] < 0){ continue; }
+                for(I q = start[j]; q < start[j] + length[j]; q++){
+                    if(marker[Qj[q]] != i){
+                        marker[Qj[q]] = i;
+                        Qj.push_back(Qj[q]);
+                    }
+                }
+            }
+            length[i] = (I)Qj.size() - start[i];
+        }
+        for(std::size_t n = 0; n < current.size(); n++){
+            passes[current[n]] = pass;
+        }
+    }
+
+    Pp[0] = 0;
+    for(I i = 0; i < n_nodes; i++){
+        Pp[i+1] = Pp[i] + length[i];
+    }
+}
+
+
+/*
+ * Multipass interpolation pass 2.
+ *
+ * Fill in the nonzero entries of P.  The points of pass 1 use direct
+ * interpolation from their strong C-neighbors.  The points of later passes
+ * substitute the interpolation of their strong neighbors of earlier passes,
+ * with the same scaling as direct interpolation.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Ap : array
+ *     Row pointer for matrix A.
+ * Aj : array
+ *     Column indices for matrix A.
+ * Ax : array
+ *     Data array for matrix A.
+ * Sp : array
+ *     Row pointer for SOC matrix, C.
+ * Sj : array
+ *     Column indices for SOC matrix, C.
+ * Sx : array
+ *     Data array for SOC matrix, C -- MUST HAVE VALUES OF A.
+ * splitting : array
+ *     Boolean array with 1 denoting C-points and 0 F-points.
+ * passes : array
+ *     Pass of each node from rs_multipass_interpolation_pass1.
+ * Pp : array
+ *     Row pointer for matrix P.
+ * Pj : array, inplace
+ *     Column indices for matrix P.
+ * Px : array, inplace
+ *     Data array for matrix P.
+ *
+ * Returns
+ * -------
+ * None
+ *     Arrays Pj and Px modified in place.
+ *
+ */
+template<class I, class T>
+void rs_multipass_interpolation_pass2(const I n_nodes,
+                                      const I Ap[], const std::ptrdiff_t Ap_size,
+                                      const I Aj[], const std::ptrdiff_t Aj_size,
+                                      const T Ax[], const std::ptrdiff_t Ax_size,
+                                      const I Sp[], const std::ptrdiff_t Sp_size,
+                                      const I Sj[], const std::ptrdiff_t Sj_size,
+                                      const T Sx[], const std::ptrdiff_t Sx_size,
+                                      const I splitting[], const std::ptrdiff_t splitting_size,
+                                      const I passes[], const std::ptrdiff_t passes_size,
+                                      const I Pp[], const std::ptrdiff_t Pp_size,
+                                            I Pj[], const std::ptrdiff_t Pj_size,
+                                            T Px[], const std::ptrdiff_t Px_size)
+{
+    // order the rows by pass, so that the rows of earlier passes are complete
+    I num_passes = 0;
+    for(I i = 0; i < n_nodes; i++){ num_passes = std::max(num_passes, passes[i] + 1); }
+    std::vector<I> pass_ptr(num_passes + 1, 0);
+    for(I i = 0; i < n_nodes; i++){
+        if(passes[i] >= 0){ pass_ptr[passes[i] + 1]++; }
+    }
+    for(I k = 0; k < num_passes; k++){ pass_ptr[k+1] += pass_ptr[k]; }
+    std::vector<I> order(pass_ptr[num_passes]);
+    for(I i = 0; i < n_nodes; i++){
+        if(passes[i] >= 0){ order[pass_ptr[passes[i]]++] = i; }
+    }
+
+    std::vector<I> marker(n_nodes, -1);
+    std::vector<T> values(n_nodes, 0);
+
+    for(std::size_t n = 0; n < order.size(); n++){
+        const I i = order[n];
+        if(splitting[i] == C_NODE){
+            Pj[Pp[i]] = i;
+            Px[Pp[i]] = 1;
+            continue;
+        }
+
+        // strong connections to earlier passes
+        T sum_strong_pos = 0, sum_strong_neg = 0;
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            const I j = Sj[jj];
+            if(j != i && passes[j] >= 0 && passes[j] < passes[i]){
+                if(Sx[jj] < 0)
+                    sum_strong_neg += Sx[jj];
+                else
+                    sum_strong_pos += Sx[jj];
+            }
+        }
+
+        T sum_all_pos = 0, sum_all_neg = 0;
+        T diag = 0;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] == i){
+                diag += Ax[jj];
+            } else {
+                if(Ax[jj] < 0)
+                    sum_all_neg += Ax[jj];
+                else
+                    sum_all_pos += Ax[jj];
+            }
+        }
+
+        T alpha = sum_strong_neg == 0 ? 0 : sum_all_neg / sum_strong_neg;
+        T beta  = sum_strong_pos == 0 ? 0 : sum_all_pos / sum_strong_pos;
+        if(sum_strong_pos == 0){
+            diag += sum_all_pos;
+        }
+        const T neg_coeff = -alpha/diag;
+        const T pos_coeff = -beta/diag;
+
+        // substitute the interpolation of the strong neighbors
+        I nnz = Pp[i];
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            const I j = Sj[jj];
+            if(j == i || passes[j] < 0 || passes[j] >= passes[i]){ continue; }
+            const T coeff = (Sx[jj] < 0 ? neg_coeff : pos_coeff) * Sx[jj];
+            for(I q = Pp[j]; q < Pp[j+1]; q++){
+                const I c = Pj[q];
+                if(marker[c] != i){
+                    marker[c] = i;
+                    values[c] = 0;
+                    Pj[nnz++] = c;
+                }
+                values[c] += coeff * Px[q];
+            }
+        }
+        for(I q = Pp[i]; q < nnz; q++){
+            Px[q] = values[Pj[q]];
+        }
+    }
+
+    std::vector<I> map(n_nodes);
+    for(I i = 0, sum = 0; i < n_nodes; i++){
+        map[i]  = sum;
+        sum    += splitting[i];
+    }
+    for(I i = 0; i < Pp[n_nodes]; i++){
+        Pj[i] = map[Pj[i]];
+    }
+}
+
+
+/*
+ * Extended+i interpolation pass 1.
+ *
+ * Build the row pointer for P.  The interpolatory set of an F-point i is
+ * the set of strong C-neighbors of i and of the strong F-neighbors of i.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Sp : array
+ *     Strength matrix row pointer array.
+ * Sj : array
+ *     Strength matrix column index array.
+ * splitting : array
+ *     C/F splitting.
+ * Pp : array, inplace
+ *     Row pointer array.
+ *
+ * Returns
+ * -------
+ * None
+ *     Pp is modified in place.
+ *
+ * References
+ * ----------
+ * .. [1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
+ *    H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).
+ *
+ */
+template<class I>
+void rs_extended_interpolation_pass1(const I n_nodes,
+                                     const I Sp[], const std::ptrdiff_t Sp_size,
+                                     const I Sj[], const std::ptrdiff_t Sj_size,
+                                     const I splitting[], const std::ptrdiff_t splitting_size,
+                                           I Pp[], const std::ptrdiff_t Pp_size)
+{
+    std::vector<I> marker(n_nodes, -1);
+
+    I nnz = 0;
+    Pp[0] = 0;
+    for(I i = 0; i < n_nodes; i++){
+        if(splitting[i] == C_NODE){
+            nnz++;
+        } else {
+            for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+                const I j = Sj[jj];
+                if(j == i){ continue; }
+                if(splitting[j] == C_NODE){
+                    if(marker[j] != i){ marker[j] = i; nnz++; }
+                } else {
+                    for(I kk = Sp[j]; kk < Sp[j+1]; kk++){
+                        const I k = Sj[kk];
+                        if(splitting[k] == C_NODE && marker[k] != i){
+                            marker[k] = i;
+                            nnz++;
+                        }
+                    }
+                }
+            }
+        }
+        Pp[i+1] = nnz;
+    }
+}
+
+
+/*
+ * Extended+i interpolation pass 2.
+ *
+ * Fill in the nonzero entries of P with Eq. (4.10) of [1].  For an F-point
+ * i with interpolatory set C_i, strong F-neighbors F_i and weak neighbors
+ * W_i outside C_i::
+ *
+ *     w_ij = -1/d_i (a_ij + sum_{k in F_i} a_ik abar_kj / sum_{l in C_i + {i}} abar_kl)
+ *     d_i  = a_ii + sum_{n in W_i} a_in
+ *                 + sum_{k in F_i} a_ik abar_ki / sum_{l in C_i + {i}} abar_kl
+ *
+ * where abar_kl = a_kl if its sign differs from a_kk, and 0 otherwise.  A
+ * strong F-neighbor k without such connections to C_i + {i} is treated as a
+ * weak neighbor.
+ *
+ * Parameters
+ * ----------
+ * n_nodes : int
+ *     Number of nodes.
+ * Ap : array
+ *     Row pointer for matrix A.
+ * Aj : array
+ *     Column indices for matrix A.
+ * Ax : array
+ *     Data array for matrix A.
+ * Sp : array
+ *     Row pointer for SOC matrix, C.
+ * Sj : array
+ *     Column indices for SOC matrix, C.
+ * splitting : array
+ *     Boolean array with 1 denoting C-points and 0 F-points.
+ * Pp : array
+ *     Row pointer for matrix P.
+ * Pj : array, inplace
+ *     Column indices for matrix P.
+ * Px : array, inplace
+ *     Data array for matrix P.
+ *
+ * Returns
+ * -------
+ * None
+ *     Arrays Pj and Px modified in place.
+ *
+ * References
+ * ----------
+ * .. [1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
+ *    H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).
+ *
+ */
+template<class I, class T>
+void rs_extended_interpolation_pass2(const I n_nodes,
+                                     const I Ap[], const std::ptrdiff_t Ap_size,
+                                     const I Aj[], const std::ptrdiff_t Aj_size,
+                                     const T Ax[], const std::ptrdiff_t Ax_size,
+                                     const I Sp[], const std::ptrdiff_t Sp_size,
+                                     const I Sj[], const std::ptrdiff_t Sj_size,
+                                     const I splitting[], const std::ptrdiff_t splitting_size,
+                                     const I Pp[], const std::ptrdiff_t Pp_size,
+                                           I Pj[], const std::ptrdiff_t Pj_size,
+                                           T Px[], const std::ptrdiff_t Px_size)
+{
+    // slot[j] >= Pp[i] is the position of column j in row i of P
+    std::vector<I> slot(n_nodes, -1);
+    // strong[k] == i marks the strong F-neighbors of i
+    std::vector<I> strong(n_nodes, -1);
+
+    for(I i = 0; i < n_nodes; i++){
+        if(splitting[i] == C_NODE){
+            Pj[Pp[i]] = i;
+            Px[Pp[i]] = 1;
+            continue;
+        }
+
+        // interpolatory set, in the order of pass 1
+        I nnz = Pp[i];
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            const I j = Sj[jj];
+            if(j == i){ continue; }
+            if(splitting[j] == C_NODE){
+                if(slot[j] < Pp[i]){ slot[j] = nnz; Pj[nnz] = j; Px[nnz] = 0; nnz++; }
+            } else {
+                strong[j] = i;
+                for(I kk = Sp[j]; kk < Sp[j+1]; kk++){
+                    const I k = Sj[kk];
+                    if(splitting[k] == C_NODE && slot[k] < Pp[i]){
+                        slot[k] = nnz; Pj[nnz] = k; Px[nnz] = 0; nnz++;
+                    }
+                }
+            }
+        }
+
+        // direct connections
+        T diag = 0;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            if(j == i){
+                diag += Ax[jj];
+            } else if(splitting[j] == C_NODE && slot[j] >= Pp[i]){
+                Px[slot[j]] += Ax[jj];
+            } else if(!(splitting[j] != C_NODE && strong[j] == i)){
+                diag += Ax[jj];
+            }
+        }
+
+        // distribute the strong F-connections
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I k = Aj[jj];
+            if(k == i || splitting[k] == C_NODE || strong[k] != i){ continue; }
+            const T a_ik = Ax[jj];
+
+            T a_kk = 0;
+            for(I kk = Ap[k]; kk < Ap[k+1]; kk++){
+                if(Aj[kk] == k){ a_kk += Ax[kk]; }
+            }
+
+            T denominator = 0;
+            for(I kk = Ap[k]; kk < Ap[k+1]; kk++){
+                const I l = Aj[kk];
+                if(signof(Ax[kk]) == signof(a_kk)){ continue; }
+                if(l == i || (splitting[l] == C_NODE && slot[l] >= Pp[i])){
+                    denominator += Ax[kk];
+                }
+            }
+            if(denominator == 0){
+                diag += a_ik;
+                continue;
+            }
+
+            for(I kk = Ap[k]; kk < Ap[k+1]; kk++){
+                const I l = Aj[kk];
+                if(signof(Ax[kk]) == signof(a_kk)){ continue; }
+                if(l == i){
+                    diag += a_ik * Ax[kk] / denominator;
+                } else if(splitting[l] == C_NODE && slot[l] >= Pp[i]){
+                    Px[slot[l]] += a_ik * Ax[kk] / denominator;
+                }
+            }
+        }
+
+        for(I jj = Pp[i]; jj < nnz; jj++){
+            Px[jj] = -Px[jj] / diag;
+        }
+    }
+
+    std::vector<I> map(n_nodes);
+    for(I i = 0, sum = 0; i < n_nodes; i++){
+        map[i]  = sum;
+        sum    += splitting[i];
+    }
+    for(I i = 0; i < Pp[n_nodes]; i++){
+        Pj[i] = map[Pj[i]];
+    }
+}
+
 #endif
@@ -33,6 +33,8 @@ void _classical_strength_of_connection_abs(
     I *_Sj = py_Sj.mutable_data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return classical_strength_of_connection_abs<I, T, F>(
                     n_row,
                     theta,
@@ -70,6 +72,8 @@ void _classical_strength_of_connection_min(
     I *_Sj = py_Sj.mutable_data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return classical_strength_of_connection_min<I, T>(
                     n_row,
                     theta,
@@ -100,6 +104,8 @@ void _maximum_row_value(
     const I *_Aj = py_Aj.data();
     const T *_Ax = py_Ax.data();
 
+    py::gil_scoped_release release;
+
     return maximum_row_value<I, T, F>(
                     n_row,
                        _x, x.shape(0),
@@ -133,6 +139,8 @@ py::array_t<I> & splitting
     const I *_influence = py_influence.data();
     I *_splitting = py_splitting.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_cf_splitting<I>(
                   n_nodes,
                       _Sp, Sp.shape(0),
@@ -159,6 +167,8 @@ py::array_t<I> & splitting
     const I *_Sj = py_Sj.data();
     I *_splitting = py_splitting.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_cf_splitting_pass2<I>(
                   n_nodes,
                       _Sp, Sp.shape(0),
@@ -175,7 +185,8 @@ void _cljp_naive_splitting(
       py::array_t<I> & Tp,
       py::array_t<I> & Tj,
 py::array_t<I> & splitting,
-        const I colorflag
+        const I colorflag,
+             const I seed
                            )
 {
     auto py_Sp = Sp.unchecked();
@@ -189,6 +200,8 @@ py::array_t<I> & splitting,
     const I *_Tj = py_Tj.data();
     I *_splitting = py_splitting.mutable_data();
 
+    py::gil_scoped_release release;
+
     return cljp_naive_splitting<I>(
                         n,
                       _Sp, Sp.shape(0),
@@ -196,7 +209,8 @@ py::array_t<I> & splitting,
                       _Tp, Tp.shape(0),
                       _Tj, Tj.shape(0),
                _splitting, splitting.shape(0),
-                colorflag
+                colorflag,
+                     seed
                                    );
 }
 
@@ -218,6 +232,8 @@ py::array_t<I> & splitting,
     const I *_splitting = py_splitting.data();
     I *_Pp = py_Pp.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_direct_interpolation_pass1<I>(
                   n_nodes,
                       _Sp, Sp.shape(0),
@@ -263,6 +279,8 @@ py::array_t<I> & splitting,
     I *_Pj = py_Pj.mutable_data();
     T *_Px = py_Px.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_direct_interpolation_pass2<I, T>(
                   n_nodes,
                       _Ap, Ap.shape(0),
@@ -305,6 +323,8 @@ py::array_t<I> & splitting,
     I *_splitting = py_splitting.mutable_data();
     T *_gamma = py_gamma.mutable_data();
 
+    py::gil_scoped_release release;
+
     return cr_helper<I, T>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -317,6 +337,78 @@ py::array_t<I> & splitting,
                            );
 }
 
+template<class I, class T>
+T _cr_sweep(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+       py::array_t<T> & e,
+  py::array_t<I> & Findex,
+  py::array_t<I> & Cindex,
+               const I nu,
+          const T thetacr,
+       const I concurrent
+            )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_e = e.mutable_unchecked();
+    auto py_Findex = Findex.unchecked();
+    auto py_Cindex = Cindex.unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    T *_e = py_e.mutable_data();
+    const I *_Findex = py_Findex.data();
+    const I *_Cindex = py_Cindex.data();
+
+    py::gil_scoped_release release;
+
+    return cr_sweep<I, T>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                       _e, e.shape(0),
+                  _Findex, Findex.shape(0),
+                  _Cindex, Cindex.shape(0),
+                       nu,
+                  thetacr,
+               concurrent
+                          );
+}
+
+template<class I, class T>
+I _binormalize(
+      py::array_t<I> & Bp,
+      py::array_t<I> & Bj,
+      py::array_t<T> & Bx,
+       py::array_t<T> & x,
+              const T tol,
+          const I maxiter
+               )
+{
+    auto py_Bp = Bp.unchecked();
+    auto py_Bj = Bj.unchecked();
+    auto py_Bx = Bx.unchecked();
+    auto py_x = x.mutable_unchecked();
+    const I *_Bp = py_Bp.data();
+    const I *_Bj = py_Bj.data();
+    const T *_Bx = py_Bx.data();
+    T *_x = py_x.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return binormalize<I, T>(
+                      _Bp, Bp.shape(0),
+                      _Bj, Bj.shape(0),
+                      _Bx, Bx.shape(0),
+                       _x, x.shape(0),
+                      tol,
+                  maxiter
+                             );
+}
+
 template<class I>
 void _rs_classical_interpolation_pass1(
           const I n_nodes,
@@ -335,6 +427,8 @@ py::array_t<I> & splitting,
     const I *_splitting = py_splitting.data();
     I *_Pp = py_Pp.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_classical_interpolation_pass1<I>(
                   n_nodes,
                       _Sp, Sp.shape(0),
@@ -362,6 +456,8 @@ py::array_t<I> & splitting
     T *_Sx = py_Sx.mutable_data();
     const I *_splitting = py_splitting.data();
 
+    py::gil_scoped_release release;
+
     return remove_strong_FF_connections<I, T>(
                   n_nodes,
                       _Sp, Sp.shape(0),
@@ -408,6 +504,8 @@ py::array_t<I> & splitting,
     I *_Pj = py_Pj.mutable_data();
     T *_Px = py_Px.mutable_data();
 
+    py::gil_scoped_release release;
+
     return rs_classical_interpolation_pass2<I, T>(
                   n_nodes,
                       _Ap, Ap.shape(0),
@@ -424,6 +522,240 @@ py::array_t<I> & splitting,
                                                   );
 }
 
+template<class I>
+void _rs_aggressive_strength_pass1(
+          const I n_nodes,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+py::array_t<I> & splitting,
+        const I num_paths,
+      py::array_t<I> & Tp
+                                   )
+{
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_Tp = Tp.mutable_unchecked();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const I *_splitting = py_splitting.data();
+    I *_Tp = py_Tp.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_aggressive_strength_pass1<I>(
+                  n_nodes,
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+               _splitting, splitting.shape(0),
+                num_paths,
+                      _Tp, Tp.shape(0)
+                                           );
+}
+
+template<class I>
+void _rs_aggressive_strength_pass2(
+          const I n_nodes,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+py::array_t<I> & splitting,
+        const I num_paths,
+      py::array_t<I> & Tp,
+      py::array_t<I> & Tj
+                                   )
+{
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_Tp = Tp.unchecked();
+    auto py_Tj = Tj.mutable_unchecked();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const I *_splitting = py_splitting.data();
+    const I *_Tp = py_Tp.data();
+    I *_Tj = py_Tj.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_aggressive_strength_pass2<I>(
+                  n_nodes,
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+               _splitting, splitting.shape(0),
+                num_paths,
+                      _Tp, Tp.shape(0),
+                      _Tj, Tj.shape(0)
+                                           );
+}
+
+template<class I>
+void _rs_multipass_interpolation_pass1(
+          const I n_nodes,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+py::array_t<I> & splitting,
+  py::array_t<I> & passes,
+      py::array_t<I> & Pp
+                                       )
+{
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_passes = passes.mutable_unchecked();
+    auto py_Pp = Pp.mutable_unchecked();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const I *_splitting = py_splitting.data();
+    I *_passes = py_passes.mutable_data();
+    I *_Pp = py_Pp.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_multipass_interpolation_pass1<I>(
+                  n_nodes,
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+               _splitting, splitting.shape(0),
+                  _passes, passes.shape(0),
+                      _Pp, Pp.shape(0)
+                                               );
+}
+
+template<class I, class T>
+void _rs_multipass_interpolation_pass2(
+          const I n_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+      py::array_t<T> & Sx,
+py::array_t<I> & splitting,
+  py::array_t<I> & passes,
+      py::array_t<I> & Pp,
+      py::array_t<I> & Pj,
+      py::array_t<T> & Px
+                                       )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_Sx = Sx.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_passes = passes.unchecked();
+    auto py_Pp = Pp.unchecked();
+    auto py_Pj = Pj.mutable_unchecked();
+    auto py_Px = Px.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const T *_Sx = py_Sx.data();
+    const I *_splitting = py_splitting.data();
+    const I *_passes = py_passes.data();
+    const I *_Pp = py_Pp.data();
+    I *_Pj = py_Pj.mutable_data();
+    T *_Px = py_Px.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_multipass_interpolation_pass2<I, T>(
+                  n_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+                      _Sx, Sx.shape(0),
+               _splitting, splitting.shape(0),
+                  _passes, passes.shape(0),
+                      _Pp, Pp.shape(0),
+                      _Pj, Pj.shape(0),
+                      _Px, Px.shape(0)
+                                                  );
+}
+
+template<class I>
+void _rs_extended_interpolation_pass1(
+          const I n_nodes,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+py::array_t<I> & splitting,
+      py::array_t<I> & Pp
+                                      )
+{
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_Pp = Pp.mutable_unchecked();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const I *_splitting = py_splitting.data();
+    I *_Pp = py_Pp.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_extended_interpolation_pass1<I>(
+                  n_nodes,
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+               _splitting, splitting.shape(0),
+                      _Pp, Pp.shape(0)
+                                              );
+}
+
+template<class I, class T>
+void _rs_extended_interpolation_pass2(
+          const I n_nodes,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+py::array_t<I> & splitting,
+      py::array_t<I> & Pp,
+      py::array_t<I> & Pj,
+      py::array_t<T> & Px
+                                      )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_splitting = splitting.unchecked();
+    auto py_Pp = Pp.unchecked();
+    auto py_Pj = Pj.mutable_unchecked();
+    auto py_Px = Px.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    const I *_splitting = py_splitting.data();
+    const I *_Pp = py_Pp.data();
+    I *_Pj = py_Pj.mutable_data();
+    T *_Px = py_Px.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return rs_extended_interpolation_pass2<I, T>(
+                  n_nodes,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+               _splitting, splitting.shape(0),
+                      _Pp, Pp.shape(0),
+                      _Pj, Pj.shape(0),
+                      _Px, Px.shape(0)
+                                                 );
+}
+
 PYBIND11_MODULE(ruge_stuben, m) {
     m.doc() = R"pbdoc(
     Pybind11 bindings for ruge_stuben.h
@@ -439,9 +771,17 @@ PYBIND11_MODULE(ruge_stuben, m) {
     rs_direct_interpolation_pass1
     rs_direct_interpolation_pass2
     cr_helper
+    cr_sweep
+    binormalize
     rs_classical_interpolation_pass1
     remove_strong_FF_connections
     rs_classical_interpolation_pass2
+    rs_aggressive_strength_pass1
+    rs_aggressive_strength_pass2
+    rs_multipass_interpolation_pass1
+    rs_multipass_interpolation_pass2
+    rs_extended_interpolation_pass1
+    rs_extended_interpolation_pass2
     )pbdoc";
 
     py::options options;
@@ -454,6 +794,14 @@ PYBIND11_MODULE(ruge_stuben, m) {
     m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<int, std::complex<float>, float>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_abs", &_classical_strength_of_connection_abs<std::int64_t, std::complex<double>, double>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Classical strength of connection.
@@ -500,6 +848,10 @@ storage for S as is used by A.)pbdoc");
     m.def("classical_strength_of_connection_min", &_classical_strength_of_connection_min<int, float>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("classical_strength_of_connection_min", &_classical_strength_of_connection_min<int, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_min", &_classical_strength_of_connection_min<std::int64_t, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("classical_strength_of_connection_min", &_classical_strength_of_connection_min<std::int64_t, double>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Classical strength of connection.
@@ -550,6 +902,14 @@ storage for S as is used by A.)pbdoc");
     m.def("maximum_row_value", &_maximum_row_value<int, std::complex<float>, float>,
         py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert());
     m.def("maximum_row_value", &_maximum_row_value<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert());
+    m.def("maximum_row_value", &_maximum_row_value<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert());
+    m.def("maximum_row_value", &_maximum_row_value<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert());
+    m.def("maximum_row_value", &_maximum_row_value<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert());
+    m.def("maximum_row_value", &_maximum_row_value<std::int64_t, std::complex<double>, double>,
         py::arg("n_row"), py::arg("x").noconvert(), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(),
 R"pbdoc(
 Compute the maximum in magnitude row value for a CSR matrix.
@@ -574,6 +934,8 @@ None
     and is modified in place.)pbdoc");
 
     m.def("rs_cf_splitting", &_rs_cf_splitting<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(), py::arg("influence").noconvert(), py::arg("splitting").noconvert());
+    m.def("rs_cf_splitting", &_rs_cf_splitting<std::int64_t>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(), py::arg("influence").noconvert(), py::arg("splitting").noconvert(),
 R"pbdoc(
 Ruge-Stuben splitting.
@@ -607,6 +969,8 @@ Notes
 The splitting array must be preallocated.)pbdoc");
 
     m.def("rs_cf_splitting_pass2", &_rs_cf_splitting_pass2<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert());
+    m.def("rs_cf_splitting_pass2", &_rs_cf_splitting_pass2<std::int64_t>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(),
 R"pbdoc(
 Ruge-Stuben splitting pass 2.
@@ -627,7 +991,9 @@ Notes
 The splitting array must be preallocated.)pbdoc");
 
     m.def("cljp_naive_splitting", &_cljp_naive_splitting<int>,
-        py::arg("n"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(), py::arg("splitting").noconvert(), py::arg("colorflag"),
+        py::arg("n"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(), py::arg("splitting").noconvert(), py::arg("colorflag"), py::arg("seed"));
+    m.def("cljp_naive_splitting", &_cljp_naive_splitting<std::int64_t>,
+        py::arg("n"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(), py::arg("splitting").noconvert(), py::arg("colorflag"), py::arg("seed"),
 R"pbdoc(
 Compute a CLJP splitting.
 
@@ -647,6 +1013,8 @@ splitting : array, inplace
     Array to store the C/F splitting.
 colorflag : int
     Flag to indicate coloring.
+seed : int
+    Seed of the random weights.
 
 Returns
 -------
@@ -656,9 +1024,16 @@ None
 Notes
 -----
 The splitting array must be preallocated.
-CLJP naive since it requires the transpose.)pbdoc");
+CLJP naive since it requires the transpose.
+
+The random weights are counter-based (see counter_uniform), and each
+selection and weight update step depends only on the state at the start
+of the step, so that the splitting does not depend on the order in which
+the vertices are processed.)pbdoc");
 
     m.def("rs_direct_interpolation_pass1", &_rs_direct_interpolation_pass1<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert());
+    m.def("rs_direct_interpolation_pass1", &_rs_direct_interpolation_pass1<std::int64_t>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(),
 R"pbdoc(
 Produce the Ruge-Stuben prolongator using "Direct Interpolation".
@@ -694,6 +1069,10 @@ See page 479 of Multigrid.)pbdoc");
     m.def("rs_direct_interpolation_pass2", &_rs_direct_interpolation_pass2<int, float>,
         py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
     m.def("rs_direct_interpolation_pass2", &_rs_direct_interpolation_pass2<int, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_direct_interpolation_pass2", &_rs_direct_interpolation_pass2<std::int64_t, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_direct_interpolation_pass2", &_rs_direct_interpolation_pass2<std::int64_t, double>,
         py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(),
 R"pbdoc(
 RS direct interpolation pass 2.
@@ -729,6 +1108,10 @@ None
     m.def("cr_helper", &_cr_helper<int, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("B").noconvert(), py::arg("e").noconvert(), py::arg("indices").noconvert(), py::arg("splitting").noconvert(), py::arg("gamma").noconvert(), py::arg("thetacs"));
     m.def("cr_helper", &_cr_helper<int, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("B").noconvert(), py::arg("e").noconvert(), py::arg("indices").noconvert(), py::arg("splitting").noconvert(), py::arg("gamma").noconvert(), py::arg("thetacs"));
+    m.def("cr_helper", &_cr_helper<std::int64_t, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("B").noconvert(), py::arg("e").noconvert(), py::arg("indices").noconvert(), py::arg("splitting").noconvert(), py::arg("gamma").noconvert(), py::arg("thetacs"));
+    m.def("cr_helper", &_cr_helper<std::int64_t, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("B").noconvert(), py::arg("e").noconvert(), py::arg("indices").noconvert(), py::arg("splitting").noconvert(), py::arg("gamma").noconvert(), py::arg("thetacs"),
 R"pbdoc(
 Helper function for compatible relaxation.
@@ -761,7 +1144,92 @@ Returns
 None
     Updated C/F-splitting and corresponding indices modified in place.)pbdoc");
 
+    m.def("cr_sweep", &_cr_sweep<int, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("e").noconvert(), py::arg("Findex").noconvert(), py::arg("Cindex").noconvert(), py::arg("nu"), py::arg("thetacr"), py::arg("concurrent"));
+    m.def("cr_sweep", &_cr_sweep<int, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("e").noconvert(), py::arg("Findex").noconvert(), py::arg("Cindex").noconvert(), py::arg("nu"), py::arg("thetacr"), py::arg("concurrent"));
+    m.def("cr_sweep", &_cr_sweep<std::int64_t, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("e").noconvert(), py::arg("Findex").noconvert(), py::arg("Cindex").noconvert(), py::arg("nu"), py::arg("thetacr"), py::arg("concurrent"));
+    m.def("cr_sweep", &_cr_sweep<std::int64_t, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("e").noconvert(), py::arg("Findex").noconvert(), py::arg("Cindex").noconvert(), py::arg("nu"), py::arg("thetacr"), py::arg("concurrent"),
+R"pbdoc(
+Relaxation sweeps of compatible relaxation.
+
+Relax on A e = 0 until either very fast convergence, rho < 0.1*thetacr,
+is observed, or at least nu sweeps have been performed and the relative
+change in rho is below 0.1.
+
+Parameters
+----------
+Ap : array
+    Row pointer for sparse matrix in CSR format.
+Aj : array
+    Column indices for sparse matrix in CSR format.
+Ax : array
+    Data array for sparse matrix in CSR format.
+e : array, inplace
+    Target vector, relaxed in place.  Entries at C-points are set to zero.
+Findex : array
+    F indices of the current splitting.
+Cindex : array
+    C indices of the current splitting.
+nu : int
+    Minimum number of relaxation sweeps.
+thetacr : float
+    Desired convergence factor.
+concurrent : int
+    If nonzero, relax with Gauss-Seidel on the F-points only (concurrent
+    CR); otherwise, relax on all points and set e to zero at the C-points
+    after each sweep (habituated CR).
+
+Returns
+-------
+rho : float
+    Convergence factor of the last sweep.)pbdoc");
+
+    m.def("binormalize", &_binormalize<int, float>,
+        py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("x").noconvert(), py::arg("tol"), py::arg("maxiter"));
+    m.def("binormalize", &_binormalize<int, double>,
+        py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("x").noconvert(), py::arg("tol"), py::arg("maxiter"));
+    m.def("binormalize", &_binormalize<std::int64_t, float>,
+        py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("x").noconvert(), py::arg("tol"), py::arg("maxiter"));
+    m.def("binormalize", &_binormalize<std::int64_t, double>,
+        py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("x").noconvert(), py::arg("tol"), py::arg("maxiter"),
+R"pbdoc(
+Binormalization of a symmetric matrix.
+
+Compute x such that the rows of diag(x) B diag(x), with B = A.*A, have
+equal sums, by the coordinate updates of equation (12) in Livne / Golub
+(2004).  Then diag(sqrt(x)) A diag(sqrt(x)) has rows of equal 2-norm.
+
+Parameters
+----------
+Bp : array
+    Column pointer for B = A.*A in CSC format.
+Bj : array
+    Row indices for B in CSC format.
+Bx : array
+    Data array for B in CSC format.
+x : array, inplace
+    Initial guess, overwritten with the scaling.
+tol : float
+    Tolerance for the relative standard deviation of the row sums.
+maxiter : int
+    Maximum number of sweeps over x.
+
+Returns
+-------
+int
+    Number of sweeps, or -1 if B is nearly un-binormalizable, in which
+    case x is left partially updated.
+
+Notes
+-----
+B is assumed symmetric, so that column i of B is also row i.)pbdoc");
+
     m.def("rs_classical_interpolation_pass1", &_rs_classical_interpolation_pass1<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert());
+    m.def("rs_classical_interpolation_pass1", &_rs_classical_interpolation_pass1<std::int64_t>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(),
 R"pbdoc(
 First pass of classical AMG interpolation.
@@ -789,6 +1257,10 @@ None
     m.def("remove_strong_FF_connections", &_remove_strong_FF_connections<int, float>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert());
     m.def("remove_strong_FF_connections", &_remove_strong_FF_connections<int, double>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert());
+    m.def("remove_strong_FF_connections", &_remove_strong_FF_connections<std::int64_t, float>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert());
+    m.def("remove_strong_FF_connections", &_remove_strong_FF_connections<std::int64_t, double>,
         py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(),
 R"pbdoc(
 Remove strong F-to-F connections.
@@ -819,6 +1291,10 @@ None
     m.def("rs_classical_interpolation_pass2", &_rs_classical_interpolation_pass2<int, float>,
         py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("modified"));
     m.def("rs_classical_interpolation_pass2", &_rs_classical_interpolation_pass2<int, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("modified"));
+    m.def("rs_classical_interpolation_pass2", &_rs_classical_interpolation_pass2<std::int64_t, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("modified"));
+    m.def("rs_classical_interpolation_pass2", &_rs_classical_interpolation_pass2<std::int64_t, double>,
         py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(), py::arg("modified"),
 R"pbdoc(
 RS classical interpolation pass 2.
@@ -873,5 +1349,250 @@ References
 ..[1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
       H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).)pbdoc");
 
+    m.def("rs_aggressive_strength_pass1", &_rs_aggressive_strength_pass1<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("num_paths"), py::arg("Tp").noconvert());
+    m.def("rs_aggressive_strength_pass1", &_rs_aggressive_strength_pass1<std::int64_t>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("num_paths"), py::arg("Tp").noconvert(),
+R"pbdoc(
+Distance-two strength of connection between C-points, pass 1.
+
+Count the nonzeros in each row of the strength matrix used for the second
+stage of aggressive coarsening.  C-point j is strongly connected to C-point
+i if there are at least num_paths strong paths of length at most two from
+i to j, i.e., i -> j or i -> k -> j for any node k.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Sp : array
+    Strength matrix row pointer array.
+Sj : array
+    Strength matrix column index array.
+splitting : array
+    C/F splitting of the first stage.
+num_paths : int
+    Number of paths required for a strong connection (1 for A1, 2 for A2).
+Tp : array, inplace
+    Row pointer array of the distance-two strength matrix, with one row
+    per C-point.
+
+Returns
+-------
+None
+    Tp is modified in place.
+
+References
+----------
+.. [1] K. Stuben, "An Introduction to Algebraic Multigrid," in
+   Multigrid, U. Trottenberg, C. W. Oosterlee, A. Schuller, (2001),
+   Appendix A, Sec. A.7.1.)pbdoc");
+
+    m.def("rs_aggressive_strength_pass2", &_rs_aggressive_strength_pass2<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("num_paths"), py::arg("Tp").noconvert(), py::arg("Tj").noconvert());
+    m.def("rs_aggressive_strength_pass2", &_rs_aggressive_strength_pass2<std::int64_t>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("num_paths"), py::arg("Tp").noconvert(), py::arg("Tj").noconvert(),
+R"pbdoc(
+Distance-two strength of connection between C-points, pass 2.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Sp : array
+    Strength matrix row pointer array.
+Sj : array
+    Strength matrix column index array.
+splitting : array
+    C/F splitting of the first stage.
+num_paths : int
+    Number of paths required for a strong connection (1 for A1, 2 for A2).
+Tp : array
+    Row pointer array from rs_aggressive_strength_pass1.
+Tj : array, inplace
+    Column index array, numbered by C-point.
+
+Returns
+-------
+None
+    Tj is modified in place.)pbdoc");
+
+    m.def("rs_multipass_interpolation_pass1", &_rs_multipass_interpolation_pass1<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert());
+    m.def("rs_multipass_interpolation_pass1", &_rs_multipass_interpolation_pass1<std::int64_t>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert(),
+R"pbdoc(
+Multipass interpolation pass 1.
+
+Assign each F-point to a pass and build the row pointer for P.  C-points
+are in pass 0.  An F-point is in pass k if it has no strong connection to
+a point of passes 0, ..., k-2, but has one to a point of pass k-1.  The
+interpolatory set of an F-point is the union of the interpolatory sets of
+its strong neighbors in earlier passes.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Sp : array
+    Strength matrix row pointer array.
+Sj : array
+    Strength matrix column index array.
+splitting : array
+    C/F splitting.
+passes : array, inplace
+    Pass of each node, or -1 for F-points without a strong path to a
+    C-point, which are not interpolated.
+Pp : array, inplace
+    Row pointer array.
+
+Returns
+-------
+None
+    passes and Pp are modified in place.
+
+References
+----------
+.. [1] K. Stuben, "An Introduction to Algebraic Multigrid," in
+   Multigrid, U. Trottenberg, C. W. Oosterlee, A. Schuller, (2001),
+   Appendix A, Sec. A.7.1.3.)pbdoc");
+
+    m.def("rs_multipass_interpolation_pass2", &_rs_multipass_interpolation_pass2<int, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_multipass_interpolation_pass2", &_rs_multipass_interpolation_pass2<int, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_multipass_interpolation_pass2", &_rs_multipass_interpolation_pass2<std::int64_t, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_multipass_interpolation_pass2", &_rs_multipass_interpolation_pass2<std::int64_t, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("splitting").noconvert(), py::arg("passes").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(),
+R"pbdoc(
+Multipass interpolation pass 2.
+
+Fill in the nonzero entries of P.  The points of pass 1 use direct
+interpolation from their strong C-neighbors.  The points of later passes
+substitute the interpolation of their strong neighbors of earlier passes,
+with the same scaling as direct interpolation.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Ap : array
+    Row pointer for matrix A.
+Aj : array
+    Column indices for matrix A.
+Ax : array
+    Data array for matrix A.
+Sp : array
+    Row pointer for SOC matrix, C.
+Sj : array
+    Column indices for SOC matrix, C.
+Sx : array
+    Data array for SOC matrix, C -- MUST HAVE VALUES OF A.
+splitting : array
+    Boolean array with 1 denoting C-points and 0 F-points.
+passes : array
+    Pass of each node from rs_multipass_interpolation_pass1.
+Pp : array
+    Row pointer for matrix P.
+Pj : array, inplace
+    Column indices for matrix P.
+Px : array, inplace
+    Data array for matrix P.
+
+Returns
+-------
+None
+    Arrays Pj and Px modified in place.)pbdoc");
+
+    m.def("rs_extended_interpolation_pass1", &_rs_extended_interpolation_pass1<int>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert());
+    m.def("rs_extended_interpolation_pass1", &_rs_extended_interpolation_pass1<std::int64_t>,
+        py::arg("n_nodes"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(),
+R"pbdoc(
+Extended+i interpolation pass 1.
+
+Build the row pointer for P.  The interpolatory set of an F-point i is
+the set of strong C-neighbors of i and of the strong F-neighbors of i.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Sp : array
+    Strength matrix row pointer array.
+Sj : array
+    Strength matrix column index array.
+splitting : array
+    C/F splitting.
+Pp : array, inplace
+    Row pointer array.
+
+Returns
+-------
+None
+    Pp is modified in place.
+
+References
+----------
+.. [1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
+   H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).)pbdoc");
+
+    m.def("rs_extended_interpolation_pass2", &_rs_extended_interpolation_pass2<int, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_extended_interpolation_pass2", &_rs_extended_interpolation_pass2<int, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_extended_interpolation_pass2", &_rs_extended_interpolation_pass2<std::int64_t, float>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert());
+    m.def("rs_extended_interpolation_pass2", &_rs_extended_interpolation_pass2<std::int64_t, double>,
+        py::arg("n_nodes"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("splitting").noconvert(), py::arg("Pp").noconvert(), py::arg("Pj").noconvert(), py::arg("Px").noconvert(),
+R"pbdoc(
+Extended+i interpolation pass 2.
+
+Fill in the nonzero entries of P with Eq. (4.10) of [1].  For an F-point
+i with interpolatory set C_i, strong F-neighbors F_i and weak neighbors
+W_i outside C_i::
+
+    w_ij = -1/d_i (a_ij + sum_{k in F_i} a_ik abar_kj / sum_{l in C_i + {i}} abar_kl)
+    d_i  = a_ii + sum_{n in W_i} a_in
+                + sum_{k in F_i} a_ik abar_ki / sum_{l in C_i + {i}} abar_kl
+
+where abar_kl = a_kl if its sign differs from a_kk, and 0 otherwise.  A
+strong F-neighbor k without such connections to C_i + {i} is treated as a
+weak neighbor.
+
+Parameters
+----------
+n_nodes : int
+    Number of nodes.
+Ap : array
+    Row pointer for matrix A.
+Aj : array
+    Column indices for matrix A.
+Ax : array
+    Data array for matrix A.
+Sp : array
+    Row pointer for SOC matrix, C.
+Sj : array
+    Column indices for SOC matrix, C.
+splitting : array
+    Boolean array with 1 denoting C-points and 0 F-points.
+Pp : array
+    Row pointer for matrix P.
+Pj : array, inplace
+    Column indices for matrix P.
+Px : array, inplace
+    Data array for matrix P.
+
+Returns
+-------
+None
+    Arrays Pj and Px modified in place.
+
+References
+----------
+.. [1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
+   H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).)pbdoc");
+
 }
 
@@ -55,12 +55,12 @@
 template<class I, class T, class F>
 void symmetric_strength_of_connection(const I n_row,
                                       const F theta,
-                                      const I Ap[], const int Ap_size,
-                                      const I Aj[], const int Aj_size,
-                                      const T Ax[], const int Ax_size,
-                                            I Sp[], const int Sp_size,
-                                            I Sj[], const int Sj_size,
-                                            T Sx[], const int Sx_size)
+                                      const I Ap[], const std::ptrdiff_t Ap_size,
+                                      const I Aj[], const std::ptrdiff_t Aj_size,
+                                      const T Ax[], const std::ptrdiff_t Ax_size,
+                                            I Sp[], const std::ptrdiff_t Sp_size,
+                                            I Sj[], const std::ptrdiff_t Sj_size,
+                                            T Sx[], const std::ptrdiff_t Sx_size)
 {
     //Sp,Sj form a CSR representation where the i-th row contains
     //the indices of all the strong connections from node i
@@ -136,10 +136,10 @@ void symmetric_strength_of_connection(const I n_row,
  */
 template <class I>
 I standard_aggregation(const I n_row,
-                       const I Ap[], const int Ap_size,
-                       const I Aj[], const int Aj_size,
-                             I  x[], const int  x_size,
-                             I  y[], const int  y_size)
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                             I  x[], const std::ptrdiff_t  x_size,
+                             I  y[], const std::ptrdiff_t  y_size)
 {
     // Bj[n] == -1 means i-th node has not been aggregated
     std::fill(x, x + n_row, 0);
@@ -268,10 +268,10 @@ I standard_aggregation(const I n_row,
  */
 template <class I>
 I naive_aggregation(const I n_row,
-                       const I Ap[], const int Ap_size,
-                       const I Aj[], const int Aj_size,
-                             I  x[], const int  x_size,
-                             I  y[], const int  y_size)
+                       const I Ap[], const std::ptrdiff_t Ap_size,
+                       const I Aj[], const std::ptrdiff_t Aj_size,
+                             I  x[], const std::ptrdiff_t  x_size,
+                             I  y[], const std::ptrdiff_t  y_size)
 {
     // x[n] == 0 means i-th node has not been aggregated
     std::fill(x, x + n_row, 0);
@@ -303,6 +303,209 @@ I naive_aggregation(const I n_row,
 
 
 
+/*
+ * Compute aggregates from a distance-2 maximal independent set.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Number of rows in A.
+ * Ap : array, n_row + 1
+ *     CSR row pointer.
+ * Aj : array, nnz
+ *     CSR column indices.
+ * mis : array, n_row
+ *     Roots of the aggregates: 1 for the nodes of a distance-2 MIS, 2 for
+ *     the nodes of a distance-2 MIS of the nodes that are not adjacent to
+ *     a node marked 1, and 0 otherwise.
+ * x : array, n_row, inplace
+ *     Aggregate numbers for each node.
+ * y : array, n_row, inplace
+ *     Will hold Cpts upon return.
+ *
+ * Returns
+ * -------
+ * int
+ *     The number of aggregates (``== max(x[:]) + 1``).
+ *
+ * Notes
+ * -----
+ * - It is assumed that A is symmetric.
+ * - A may contain diagonal entries (self loops)
+ * - Unaggregated (isolated) nodes are marked with a -1
+ *
+ * Each node marked 1 becomes the root of an aggregate.  The aggregates are
+ * grown in synchronous rounds: in the first round, every neighbor of a root
+ * joins its aggregate (since roots are at least three edges apart, there is
+ * only one).  In the second round, each node marked 2 with at least two
+ * unaggregated neighbors becomes a root and takes these neighbors.  In the
+ * following rounds, every unaggregated node joins the neighboring aggregate
+ * it has the most edges to, with ties broken by the smaller aggregate and
+ * then the lower aggregate number.  Each round only reads the state of the
+ * previous round, so the result does not depend on the order in which the
+ * nodes of a round are visited.
+ *
+ * See Also
+ * --------
+ * maximal_independent_set_k_parallel
+ *
+ */
+template <class I>
+I mis2_aggregation(const I n_row,
+                   const I  Ap[], const std::ptrdiff_t  Ap_size,
+                   const I  Aj[], const std::ptrdiff_t  Aj_size,
+                   const I mis[], const std::ptrdiff_t mis_size,
+                         I   x[], const std::ptrdiff_t   x_size,
+                         I   y[], const std::ptrdiff_t   y_size)
+{
+    std::fill(x, x + n_row, -1);
+
+    // number the roots, skipping isolated nodes
+    I num_aggregates = 0;
+    for(I i = 0; i < n_row; i++){
+        if(mis[i] != 1){ continue; }
+        bool has_neighbors = false;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] != i){ has_neighbors = true; break; }
+        }
+        if(has_neighbors){
+            x[i] = num_aggregates;
+            y[num_aggregates] = i;
+            num_aggregates++;
+        }
+    }
+
+    // round 1: neighbors of roots
+    std::vector<I> next(x, x + n_row);
+    for(I i = 0; i < n_row; i++){
+        if(mis[i]){ continue; }
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            if(mis[j] == 1 && x[j] >= 0){
+                next[i] = x[j];
+                break;
+            }
+        }
+    }
+    std::copy(next.begin(), next.end(), x);
+
+    // round 2: secondary roots with at least two unaggregated neighbors
+    // seed aggregates among the nodes left over from round 1
+    for(I i = 0; i < n_row; i++){
+        if(mis[i] != 2 || x[i] >= 0){ continue; }
+        I free_neighbors = 0;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] != i && x[Aj[jj]] < 0){ free_neighbors++; }
+        }
+        if(free_neighbors >= 2){
+            x[i] = next[i] = num_aggregates;
+            y[num_aggregates] = i;
+            num_aggregates++;
+        }
+    }
+    for(I i = 0; i < n_row; i++){
+        if(mis[i] == 1 || x[i] >= 0){ continue; }
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            if(mis[j] == 2 && x[j] >= 0){
+                next[i] = x[j];
+                break;
+            }
+        }
+    }
+    std::copy(next.begin(), next.end(), x);
+
+    std::vector<I> size(num_aggregates, 0);
+    for(I i = 0; i < n_row; i++){
+        if(x[i] >= 0){ size[x[i]]++; }
+    }
+
+    // following rounds: join the most connected neighboring aggregate
+    std::vector<I> count(num_aggregates, 0);
+    std::vector<I> touched;
+    bool changed = true;
+    while(changed){
+        changed = false;
+        for(I i = 0; i < n_row; i++){
+            if(x[i] >= 0 || mis[i] == 1){ continue; }
+
+            touched.clear();
+            for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+                const I a = x[Aj[jj]];
+                if(a < 0){ continue; }
+                if(count[a] == 0){ touched.push_back(a); }
+                count[a]++;
+            }
+
+            I best = -1;
+            for(std::size_t k = 0; k < touched.size(); k++){
+                const I a = touched[k];
+                if(best == -1 || count[a] > count[best] ||
+                   (count[a] == count[best] &&
+                    (size[a] < size[best] || (size[a] == size[best] && a < best)))){
+                    best = a;
+                }
+            }
+            for(std::size_t k = 0; k < touched.size(); k++){ count[touched[k]] = 0; }
+
+            if(best >= 0){
+                next[i] = best;
+                changed = true;
+            }
+        }
+        for(I i = 0; i < n_row; i++){
+            if(next[i] != x[i]){
+                x[i] = next[i];
+                size[x[i]]++;
+            }
+        }
+    }
+
+    // nodes with neighbors that could not be reached (nonsymmetric A)
+    // become aggregates of their own
+    for(I i = 0; i < n_row; i++){
+        if(x[i] >= 0 || mis[i] == 1){ continue; }
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if(Aj[jj] != i){
+                x[i] = num_aggregates;
+                y[num_aggregates] = i;
+                num_aggregates++;
+                break;
+            }
+        }
+    }
+
+    return num_aggregates;
+}
+
+
+/*
+ * Append node i to the end of bucket k (helper for pairwise_aggregation).
+ */
+template <class I>
+inline void pairwise_bucket_append(const I i, const I k,
+                                   std::vector<I>& head, std::vector<I>& tail,
+                                   std::vector<I>& prev, std::vector<I>& next)
+{
+    prev[i] = tail[k];
+    next[i] = -1;
+    if (tail[k] == -1) { head[k] = i; } else { next[tail[k]] = i; }
+    tail[k] = i;
+}
+
+/*
+ * Remove node i from bucket k (helper for pairwise_aggregation).
+ */
+template <class I>
+inline void pairwise_bucket_remove(const I i, const I k,
+                                   std::vector<I>& head, std::vector<I>& tail,
+                                   std::vector<I>& prev, std::vector<I>& next)
+{
+    if (prev[i] == -1) { head[k] = next[i]; } else { next[prev[i]] = next[i]; }
+    if (next[i] == -1) { tail[k] = prev[i]; } else { prev[next[i]] = prev[i]; }
+}
+
+
 /*
  * Compute aggregates for a matrix S stored in CSR format.
  *
@@ -334,11 +537,11 @@ I naive_aggregation(const I n_row,
  */
 template <class I, class T>
 I pairwise_aggregation(const I n_row,
-                       const I Sp[], const int Sp_size,
-                       const I Sj[], const int Sj_size,
-                       const T Sx[], const int Sx_size,
-                             I  x[], const int  x_size,
-                             I  y[], const int  y_size)
+                       const I Sp[], const std::ptrdiff_t Sp_size,
+                       const I Sj[], const std::ptrdiff_t Sj_size,
+                       const T Sx[], const std::ptrdiff_t Sx_size,
+                             I  x[], const std::ptrdiff_t  x_size,
+                             I  y[], const std::ptrdiff_t  y_size)
 {
     // x[n] == 0 means i-th node has not been aggregated
     std::fill(x, x + n_row, 0);
@@ -353,21 +556,23 @@ I pairwise_aggregation(const I n_row,
             }
         }
     }
-    std::multimap<I, I> mmap;
-    std::vector<decltype(mmap.begin())> mmap_iterators(n_row);
-
-    auto it = mmap.begin();
+    // nodes bucketed by m_i; each bucket is a linked list in insertion order
+    I max_m = 0;
+    for(I i = 0; i < n_row; i++){ max_m = std::max(max_m, m[i]); }
+    std::vector<I> head(max_m + 1, -1), tail(max_m + 1, -1);
+    std::vector<I> prev(n_row, -1), next(n_row, -1);
     for(I i = 0; i < n_row; i++){
-        it = mmap.insert({m[i], i});
-        mmap_iterators[i] = it;
+        pairwise_bucket_append(i, m[i], head, tail, prev, next);
     }
+    I min_m = 0;
 
     I next_aggregate = 1; // number of aggregates + 1
+    I remaining = n_row;
 
-    while (!mmap.empty()) {
-        // select minimum of m_i.
-        // Since mmap is a sorted container, first element is the minimum
-        I i = mmap.begin()->second;
+    while (remaining > 0) {
+        // select minimum of m_i, first inserted on ties
+        while (head[min_m] == -1) { min_m++; }
+        I i = head[min_m];
 
         const I row_start = Sp[i];
         const I row_end   = Sp[i+1];
@@ -396,31 +601,33 @@ I pairwise_aggregation(const I n_row,
         // y stores a list of the Cpts
         y[next_aggregate-1] = i;
         for (I jj = row_start; jj < row_end; jj++) {
-            if (x[Sj[jj]] == 0) {
-                // to change the key of a multimap, add a new entry and remove the old entry.
-                // finally update mmap_iterators with the iterator to the new entry
-                auto old_it = mmap_iterators[Sj[jj]];
-                auto new_it = mmap.insert({old_it->first-1, Sj[jj]});
-                mmap.erase(old_it);
-                mmap_iterators[Sj[jj]] = new_it;
+            const I k = Sj[jj];
+            if (x[k] == 0) {
+                // move k to the end of the next lower bucket
+                pairwise_bucket_remove(k, m[k], head, tail, prev, next);
+                m[k]--;
+                pairwise_bucket_append(k, m[k], head, tail, prev, next);
+                min_m = std::min(min_m, m[k]);
             }
         }
-        // Remove node i from mmap
-        mmap.erase(mmap_iterators[i]);
+        // Remove node i
+        pairwise_bucket_remove(i, m[i], head, tail, prev, next);
+        remaining--;
         if (found) {
-            x[j] = next_aggregate;
             const I row_start2 = Sp[j];
             const I row_end2   = Sp[j+1];
             for (I jj = row_start2; jj < row_end2; jj++) {
-                if (x[Sj[jj]] == 0) {
-                    auto old_it = mmap_iterators[Sj[jj]];
-                    auto new_it = mmap.insert({old_it->first-1, Sj[jj]});
-                    mmap.erase(old_it);
-                    mmap_iterators[Sj[jj]] = new_it;
+                const I k = Sj[jj];
+                if (x[k] == 0) {
+                    pairwise_bucket_remove(k, m[k], head, tail, prev, next);
+                    m[k]--;
+                    pairwise_bucket_append(k, m[k], head, tail, prev, next);
+                    min_m = std::min(min_m, m[k]);
                 }
             }
-            // Remove node j from mmap
-            mmap.erase(mmap_iterators[j]);
+            // Remove node j
+            pairwise_bucket_remove(j, m[j], head, tail, prev, next);
+            remaining--;
         }
         next_aggregate++;
     }
@@ -429,6 +636,292 @@ I pairwise_aggregation(const I n_row,
 }
 
 
+/*
+ * Compute aggregates from several passes of pairwise matching.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Number of block rows in A.
+ * blocksize : int
+ *     Size of the (square) blocks of A; 1 for a CSR matrix.
+ * Ap : array, n_row+1
+ *     BSR row pointer.
+ * Aj : array, nnz
+ *     BSR column indices.
+ * Ax : array, nnz*blocksize*blocksize
+ *     BSR data array (row-major blocks).
+ * theta : float
+ *     Strength tolerance of the classical strength of connection.
+ * matchings : int
+ *     Number of pairwise matchings.
+ * x : array, n_row, inplace
+ *     Aggregate numbers for each node.
+ * y : array, n_row, inplace
+ *     Will hold Cpts upon return.
+ *
+ * Returns
+ * -------
+ * int
+ *     The number of aggregates (``== max(x[:]) + 1``).
+ *
+ * Notes
+ * -----
+ * Each pass computes the classical strength of connection with the min
+ * norm (the minimum entry of each block) of the current matrix, and matches
+ * its nodes with pairwise_aggregation.  The matrix of the next pass is the
+ * Galerkin product T^T A T of the unsmoothed pairwise aggregation T, formed
+ * by summing the blocks of each pair of rows and columns.  The aggregates
+ * of the passes are composed, so x maps the nodes of A directly to the
+ * final aggregates.  Unlike pairwise_aggregation, x is numbered from zero.
+ *
+ */
+template <class I, class T>
+I pairwise_aggregation_multi(const I n_row,
+                             const I blocksize,
+                             const I Ap[], const std::ptrdiff_t Ap_size,
+                             const I Aj[], const std::ptrdiff_t Aj_size,
+                             const T Ax[], const std::ptrdiff_t Ax_size,
+                             const T theta,
+                             const I matchings,
+                                   I  x[], const std::ptrdiff_t  x_size,
+                                   I  y[], const std::ptrdiff_t  y_size)
+{
+    const I bs2 = blocksize * blocksize;
+
+    for(I i = 0; i < n_row; i++){
+        x[i] = i;
+        y[i] = i;
+    }
+    if(matchings < 1){ return n_row; }
+
+    // matrix of the current pass, A itself for the first pass
+    const I * Cp = Ap;
+    const I * Cj = Aj;
+    const T * Cx = Ax;
+    std::vector<I> Bp, Bj;
+    std::vector<T> Bx;
+    I n = n_row;
+
+    std::vector<I> Sp, Sj, agg, roots, members, member_ptr, marker;
+    std::vector<T> v, Sx;
+    for(I pass = 0; pass < matchings; pass++){
+        const I nnz = Cp[n];
+
+        // block min norm, small entries dropped
+        v.resize(nnz);
+        for(I jj = 0; jj < nnz; jj++){
+            const T * block = &Cx[(std::size_t)jj * bs2];
+            T val = *std::min_element(block, block + bs2);
+            if(blocksize > 1 && std::abs(val) < 1e-16){ val = 0; }
+            v[jj] = val;
+        }
+
+        // classical strength of connection (min norm), nonzeros in magnitude
+        Sp.assign(n + 1, 0);
+        Sj.resize(nnz + 1);
+        Sx.resize(nnz + 1);
+        I snnz = 0;
+        for(I i = 0; i < n; i++){
+            T max_offdiagonal = 0.0;
+            for(I jj = Cp[i]; jj < Cp[i+1]; jj++){
+                if(Cj[jj] != i){
+                    max_offdiagonal = std::max(max_offdiagonal, -v[jj]);
+                }
+            }
+            const T threshold = theta*max_offdiagonal;
+            for(I jj = Cp[i]; jj < Cp[i+1]; jj++){
+                if((Cj[jj] == i || -v[jj] >= threshold) && v[jj] != 0){
+                    Sj[snnz] = Cj[jj];
+                    Sx[snnz] = std::abs(v[jj]);
+                    snnz++;
+                }
+            }
+            Sp[i+1] = snnz;
+        }
+
+        // match the nodes of this pass
+        agg.resize(n + 1);
+        roots.resize(n + 1);
+        const I num_aggregates = pairwise_aggregation(n, &Sp[0], (int)Sp.size(),
+                                                      &Sj[0], (int)Sj.size(),
+                                                      &Sx[0], (int)Sx.size(),
+                                                      &agg[0], (int)agg.size(),
+                                                      &roots[0], (int)roots.size());
+        for(I i = 0; i < n; i++){ agg[i]--; }
+
+        // compose with the previous passes
+        for(I i = 0; i < n_row; i++){ x[i] = agg[x[i]]; }
+        for(I a = 0; a < num_aggregates; a++){ roots[a] = y[roots[a]]; }
+        std::copy(roots.begin(), roots.begin() + num_aggregates, y);
+
+        if(pass == matchings - 1 || num_aggregates == 0){
+            return num_aggregates;
+        }
+
+        // rows of each aggregate
+        member_ptr.assign(num_aggregates + 1, 0);
+        for(I i = 0; i < n; i++){ member_ptr[agg[i] + 1]++; }
+        for(I a = 0; a < num_aggregates; a++){ member_ptr[a+1] += member_ptr[a]; }
+        members.resize(n);
+        for(I i = 0; i < n; i++){ members[member_ptr[agg[i]]++] = i; }
+        for(I a = num_aggregates; a > 0; a--){ member_ptr[a] = member_ptr[a-1]; }
+        member_ptr[0] = 0;
+
+        // coarse matrix, summing the blocks of each pair
+        std::vector<I> Dp(num_aggregates + 1, 0);
+        std::vector<I> Dj;
+        std::vector<T> Dx;
+        Dj.reserve(nnz);
+        Dx.reserve((std::size_t)nnz * bs2);
+        marker.assign(num_aggregates, -1);
+        for(I a = 0; a < num_aggregates; a++){
+            const I row_start = (I)Dj.size();
+            for(I k = member_ptr[a]; k < member_ptr[a+1]; k++){
+                const I i = members[k];
+                for(I jj = Cp[i]; jj < Cp[i+1]; jj++){
+                    const I b = agg[Cj[jj]];
+                    if(marker[b] < row_start){
+                        marker[b] = (I)Dj.size();
+                        Dj.push_back(b);
+                        Dx.resize(Dx.size() + bs2, 0);
+                    }
+                    T * dst = &Dx[(std::size_t)marker[b] * bs2];
+                    const T * src = &Cx[(std::size_t)jj * bs2];
+                    for(I m = 0; m < bs2; m++){ dst[m] += src[m]; }
+                }
+            }
+            Dp[a+1] = (I)Dj.size();
+        }
+
+        Bp.swap(Dp);
+        Bj.swap(Dj);
+        Bx.swap(Dx);
+        Cp = &Bp[0];
+        Cj = Bj.empty() ? NULL : &Bj[0];
+        Cx = Bx.empty() ? NULL : &Bx[0];
+        n = num_aggregates;
+    }
+
+    return n;
+}
+
+
+/*
+ * Apply a prolongator with at most one nonzero per row.
+ *
+ * Computes ``y = P x``, where row i of P is zero if ``agg[i] < 0``, and
+ * otherwise has the single nonzero ``scale[i]`` (or 1) in column ``agg[i]``.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Number of rows in P.
+ * num_cols : int
+ *     Number of columns of x and y (row-major).
+ * agg : array, n_row
+ *     Column of the nonzero in each row of P.
+ * scale : array, n_row or 0
+ *     Value of the nonzero in each row of P; all ones if empty.
+ * x : array, num_aggregates*num_cols
+ *     Input vectors.
+ * y : array, n_row*num_cols, inplace
+ *     Output vectors.
+ *
+ * Returns
+ * -------
+ * Nothing, y will be modified in place
+ *
+ */
+template <class I, class T>
+void aggregation_prolong(const I n_row,
+                         const I num_cols,
+                         const I   agg[], const std::ptrdiff_t   agg_size,
+                         const T scale[], const std::ptrdiff_t scale_size,
+                         const T     x[], const std::ptrdiff_t     x_size,
+                               T     y[], const std::ptrdiff_t     y_size)
+{
+    if(num_cols == 1 && scale_size == 0){
+        for(I i = 0; i < n_row; i++){
+            y[i] = agg[i] < 0 ? T(0) : x[agg[i]];
+        }
+        return;
+    }
+    for(I i = 0; i < n_row; i++){
+        T * yi = y + (std::size_t)i * num_cols;
+        const I a = agg[i];
+        if(a < 0){
+            std::fill(yi, yi + num_cols, T(0));
+            continue;
+        }
+        const T * xa = x + (std::size_t)a * num_cols;
+        if(scale_size == 0){
+            std::copy(xa, xa + num_cols, yi);
+        } else {
+            const T s = scale[i];
+            for(I k = 0; k < num_cols; k++){ yi[k] = s * xa[k]; }
+        }
+    }
+}
+
+
+/*
+ * Apply the transpose of a prolongator with at most one nonzero per row.
+ *
+ * Computes ``y = P^T x`` by summing the (scaled) rows of x per aggregate,
+ * with P as in aggregation_prolong.  For the conjugate transpose, pass the
+ * conjugated scale.
+ *
+ * Parameters
+ * ----------
+ * n_row : int
+ *     Number of rows in P.
+ * num_cols : int
+ *     Number of columns of x and y (row-major).
+ * agg : array, n_row
+ *     Column of the nonzero in each row of P.
+ * scale : array, n_row or 0
+ *     Value of the nonzero in each row of P; all ones if empty.
+ * x : array, n_row*num_cols
+ *     Input vectors.
+ * y : array, num_aggregates*num_cols, inplace
+ *     Output vectors.
+ *
+ * Returns
+ * -------
+ * Nothing, y will be modified in place
+ *
+ */
+template <class I, class T>
+void aggregation_restrict(const I n_row,
+                          const I num_cols,
+                          const I   agg[], const std::ptrdiff_t   agg_size,
+                          const T scale[], const std::ptrdiff_t scale_size,
+                          const T     x[], const std::ptrdiff_t     x_size,
+                                T     y[], const std::ptrdiff_t     y_size)
+{
+    std::fill(y, y + y_size, T(0));
+    if(num_cols == 1 && scale_size == 0){
+        for(I i = 0; i < n_row; i++){
+            if(agg[i] >= 0){ y[agg[i]] += x[i]; }
+        }
+        return;
+    }
+    for(I i = 0; i < n_row; i++){
+        const I a = agg[i];
+        if(a < 0){ continue; }
+        const T * xi = x + (std::size_t)i * num_cols;
+        T * ya = y + (std::size_t)a * num_cols;
+        if(scale_size == 0){
+            for(I k = 0; k < num_cols; k++){ ya[k] += xi[k]; }
+        } else {
+            const T s = scale[i];
+            for(I k = 0; k < num_cols; k++){ ya[k] += s * xi[k]; }
+        }
+    }
+}
+
+
 /*
  * Helper function to fit candidate vectors.
  *
@@ -638,11 +1131,11 @@ void fit_candidates_real(const I n_row,
                          const I n_col,
                          const I   K1,
                          const I   K2,
-                         const I Ap[], const int Ap_size,
-                         const I Ai[], const int Ai_size,
-                               T Ax[], const int Ax_size,
-                         const T  B[], const int  B_size,
-                               T  R[], const int  R_size,
+                         const I Ap[], const std::ptrdiff_t Ap_size,
+                         const I Ai[], const std::ptrdiff_t Ai_size,
+                               T Ax[], const std::ptrdiff_t Ax_size,
+                         const T  B[], const std::ptrdiff_t  B_size,
+                               T  R[], const std::ptrdiff_t  R_size,
                          const T  tol)
 { fit_candidates_common(n_row, n_col, K1, K2, Ap, Ai, Ax, B, R, tol, real_dot<T>(), real_norm<T>()); }
 
@@ -651,11 +1144,11 @@ void fit_candidates_complex(const I n_row,
                             const I n_col,
                             const I   K1,
                             const I   K2,
-                            const I Ap[], const int Ap_size,
-                            const I Ai[], const int Ai_size,
-                                  T Ax[], const int Ax_size,
-                            const T  B[], const int  B_size,
-                                  T  R[], const int  R_size,
+                            const I Ap[], const std::ptrdiff_t Ap_size,
+                            const I Ai[], const std::ptrdiff_t Ai_size,
+                                  T Ax[], const std::ptrdiff_t Ax_size,
+                            const T  B[], const std::ptrdiff_t  B_size,
+                                  T  R[], const std::ptrdiff_t  R_size,
                             const S  tol)
 { fit_candidates_common(n_row, n_col, K1, K2, Ap, Ai, Ax, B, R, tol, complex_dot<T>(), complex_norm<S,T>()); }
 
@@ -723,12 +1216,12 @@ void satisfy_constraints_helper(const I rows_per_block,
                                 const I cols_per_block,
                                  const I num_block_rows,
                                  const I NullDim,
-                                 const T x[], const int x_size,
-                                 const T y[], const int y_size,
-                                 const T z[], const int z_size,
-                                 const I Sp[], const int Sp_size,
-                                 const I Sj[], const int Sj_size,
-                                       T Sx[], const int Sx_size)
+                                 const T x[], const std::ptrdiff_t x_size,
+                                 const T y[], const std::ptrdiff_t y_size,
+                                 const T z[], const std::ptrdiff_t z_size,
+                                 const I Sp[], const std::ptrdiff_t Sp_size,
+                                 const I Sj[], const std::ptrdiff_t Sj_size,
+                                       T Sx[], const std::ptrdiff_t Sx_size)
 {
     //Rename to something more familiar
     const T * Bt = x;
@@ -771,6 +1264,136 @@ void satisfy_constraints_helper(const I rows_per_block,
 }
 
 
+/*
+ * Project one block row of S so that (S B)_i = 0.
+ *
+ * Computes ``S_ij -= (S B)_i BtBinv_i B_j^H`` for each block j in block row
+ * i of S, as in satisfy_constraints_helper, but with ``(S B)_i`` formed
+ * from row i itself.  UB and W are workspace of size
+ * ``rows_per_block*NullDim``.
+ */
+template<class I, class T>
+inline void satisfy_constraints_row(const I i,
+                                    const I rows_per_block,
+                                    const I cols_per_block,
+                                    const I NullDim,
+                                    const T B[],
+                                    const T BtBinv[],
+                                    const I Sp[],
+                                    const I Sj[],
+                                          T Sx[],
+                                          T UB[],
+                                          T W[])
+{
+    const I RC = rows_per_block*cols_per_block;
+    const I RK = rows_per_block*NullDim;
+    const I CK = cols_per_block*NullDim;
+
+    // UB = S_i B
+    std::fill(UB, UB + RK, T(0));
+    for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+        const T * block = Sx + (std::size_t)jj * RC;
+        const T * Bj = B + (std::size_t)Sj[jj] * CK;
+        for(I r = 0; r < rows_per_block; r++){
+            for(I c = 0; c < cols_per_block; c++){
+                const T s = block[r*cols_per_block + c];
+                if(s == T(0)){ continue; }
+                for(I k = 0; k < NullDim; k++){
+                    UB[r*NullDim + k] += s * Bj[c*NullDim + k];
+                }
+            }
+        }
+    }
+
+    // W = UB BtBinv_i
+    const T * M = BtBinv + (std::size_t)i * NullDim * NullDim;
+    std::fill(W, W + RK, T(0));
+    for(I r = 0; r < rows_per_block; r++){
+        for(I a = 0; a < NullDim; a++){
+            const T u = UB[r*NullDim + a];
+            for(I b = 0; b < NullDim; b++){
+                W[r*NullDim + b] += u * M[a*NullDim + b];
+            }
+        }
+    }
+
+    // S_ij -= W B_j^H
+    for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+        T * block = Sx + (std::size_t)jj * RC;
+        const T * Bj = B + (std::size_t)Sj[jj] * CK;
+        for(I r = 0; r < rows_per_block; r++){
+            for(I c = 0; c < cols_per_block; c++){
+                T sum = 0;
+                for(I k = 0; k < NullDim; k++){
+                    sum += W[r*NullDim + k] * conjugate(Bj[c*NullDim + k]);
+                }
+                block[r*cols_per_block + c] -= sum;
+            }
+        }
+    }
+}
+
+
+/*
+ * Project a BSR matrix S in place so that S B = 0 within its sparsity pattern.
+ *
+ * Parameters
+ * ----------
+ * rows_per_block : int
+ *      Rows per block in the BSR matrix, S.
+ * cols_per_block : int
+ *      Cols per block in the BSR matrix, S.
+ * num_block_rows : int
+ *      Number of block rows, ``S.shape[0]/rows_per_block``.
+ * NullDim : int
+ *      Null-space dimension, i.e., the number of columns in B.
+ * B : array
+ *      Near-nullspace vectors, in row major.
+ * BtBinv : array
+ *      BtBinv, in row major, i.e. ``BtBinv[i] = pinv(B_i.H Bi)``, where
+ *      B_i is B restricted to the neighborhood of dof of i.
+ * Sp : array
+ *      Row pointer array for BSR matrix S.
+ * Sj : array
+ *      Col index array for BSR matrix S.
+ * Sx : array, inplace
+ *      Value array for BSR matrix S.
+ *
+ * Returns
+ * -------
+ * None
+ *     Sx is modified in place such that S*B = 0.
+ *
+ * See Also
+ * --------
+ * satisfy_constraints_helper
+ *
+ * Notes
+ * -----
+ * Equivalent to satisfy_constraints_helper with ``y = S*B``, but S*B is
+ * formed one block row at a time, so no dense N x NullDim product and no
+ * conjugated copy of B are needed.
+ */
+template<class I, class T, class F>
+void satisfy_constraints_bsr(const I rows_per_block,
+                             const I cols_per_block,
+                             const I num_block_rows,
+                             const I NullDim,
+                             const T      B[], const std::ptrdiff_t      B_size,
+                             const T BtBinv[], const std::ptrdiff_t BtBinv_size,
+                             const I     Sp[], const std::ptrdiff_t     Sp_size,
+                             const I     Sj[], const std::ptrdiff_t     Sj_size,
+                                   T     Sx[], const std::ptrdiff_t     Sx_size)
+{
+    std::vector<T> UB(rows_per_block*NullDim);
+    std::vector<T> W(rows_per_block*NullDim);
+    for(I i = 0; i < num_block_rows; i++){
+        satisfy_constraints_row(i, rows_per_block, cols_per_block, NullDim,
+                                B, BtBinv, Sp, Sj, Sx, &UB[0], &W[0]);
+    }
+}
+
+
 /*
  * Helper routine for energy_prolongation_smoother.
  *
@@ -829,11 +1452,11 @@ template<class I, class T, class F>
 void calc_BtB(const I NullDim,
               const I Nnodes,
               const I cols_per_block,
-              const T  b[], const int  b_size,
+              const T  b[], const std::ptrdiff_t  b_size,
               const I BsqCols,
-                    T  x[], const int  x_size,
-              const I Sp[], const int Sp_size,
-              const I Sj[], const int Sj_size)
+                    T  x[], const std::ptrdiff_t  x_size,
+              const I Sp[], const std::ptrdiff_t Sp_size,
+              const I Sj[], const std::ptrdiff_t Sj_size)
 {
     //Rename to something more familiar
     const T * Bsq = b;
@@ -906,6 +1529,89 @@ void calc_BtB(const I NullDim,
     delete[] work;
 }
 
+/*
+ * Compute pinv(B_i.H B_i) for each block row i of a BSR sparsity pattern S.
+ *
+ * Parameters
+ * ----------
+ * NullDim : int
+ *      Number of near nullspace vectors, i.e., the number of columns in B.
+ * Nnodes : int
+ *      Number of nodes, i.e. number of block rows in BSR matrix, S.
+ * cols_per_block : int
+ *      Columns per block in S.
+ * B : array
+ *      Near-nullspace vectors, in row major.
+ * Sp, Sj : array
+ *      BSR indptr and indices members for matrix, S.
+ * x : array, inplace
+ *      Nnodes x NullDim x NullDim output array, in row major.
+ * tol : float
+ *      Eigenvalues of B_i.H B_i with ``|lambda| <= tol * max(|lambda|)``
+ *      are treated as zero in the pseudoinverse.
+ *
+ * Returns
+ * -------
+ * None
+ *     ``x[i] = pinv(B_i.H B_i)`` where B_i is B[colindices,:], colindices =
+ *     all the nonzero column indices for block row i in S.
+ *
+ * See Also
+ * --------
+ * calc_BtB, pinv_hermitian_array
+ *
+ * Notes
+ * -----
+ * Principle calling routine is compute_BtBinv(...) in util/utils.py.  This
+ * fuses calc_BtB with the pseudoinverse of each block, so the products of the
+ * columns of B and the blocks B_i.H B_i are never stored separately.
+ *
+ */
+template<class I, class T, class F>
+void calc_BtBinv(const I NullDim,
+                 const I Nnodes,
+                 const I cols_per_block,
+                 const T  B[], const std::ptrdiff_t  B_size,
+                 const I Sp[], const std::ptrdiff_t Sp_size,
+                 const I Sj[], const std::ptrdiff_t Sj_size,
+                       T  x[], const std::ptrdiff_t  x_size,
+                 const F tol)
+{
+    const I NullDimSq = NullDim*NullDim;
+    std::vector<T> A(NullDimSq);
+    std::vector<T> Vt(NullDimSq);
+    std::vector<F> w(NullDim);
+
+    for(I i = 0; i < Nnodes; i++)
+    {
+        T * BtB = x + (std::size_t)i * NullDimSq;
+        std::fill(BtB, BtB + NullDimSq, T(0));
+
+        // Upper triangle of B_i.H B_i, one row of B_i at a time
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++)
+        {
+            const T * Bj = B + (std::size_t)Sj[jj] * cols_per_block * NullDim;
+            for(I c = 0; c < cols_per_block; c++)
+            {
+                const T * row = Bj + c*NullDim;
+                for(I a = 0; a < NullDim; a++)
+                {
+                    const T ra = conjugate(row[a]);
+                    for(I b = a; b < NullDim; b++)
+                    {   BtB[a*NullDim + b] += ra * row[b]; }
+                }
+            }
+        }
+        for(I a = 0; a < NullDim; a++)
+        {
+            for(I b = a + 1; b < NullDim; b++)
+            {   BtB[b*NullDim + a] = conjugate(BtB[a*NullDim + b]); }
+        }
+
+        pinv_hermitian_block(BtB, &(A[0]), &(Vt[0]), &(w[0]), NullDim, tol);
+    }
+}
+
 /* Mat-mul over a sparsity pattern.
  *
  * Calculate A*B = S, but only at the pre-existing sparsity
@@ -967,15 +1673,15 @@ void calc_BtB(const I NullDim,
  *
  */
 template<class I, class T, class F>
-void incomplete_mat_mult_bsr(const I Ap[], const int Ap_size,
-                             const I Aj[], const int Aj_size,
-                             const T Ax[], const int Ax_size,
-                             const I Bp[], const int Bp_size,
-                             const I Bj[], const int Bj_size,
-                             const T Bx[], const int Bx_size,
-                             const I Sp[], const int Sp_size,
-                             const I Sj[], const int Sj_size,
-                                   T Sx[], const int Sx_size,
+void incomplete_mat_mult_bsr(const I Ap[], const std::ptrdiff_t Ap_size,
+                             const I Aj[], const std::ptrdiff_t Aj_size,
+                             const T Ax[], const std::ptrdiff_t Ax_size,
+                             const I Bp[], const std::ptrdiff_t Bp_size,
+                             const I Bj[], const std::ptrdiff_t Bj_size,
+                             const T Bx[], const std::ptrdiff_t Bx_size,
+                             const I Sp[], const std::ptrdiff_t Sp_size,
+                             const I Sj[], const std::ptrdiff_t Sj_size,
+                                   T Sx[], const std::ptrdiff_t Sx_size,
                              const I n_brow,
                              const I n_bcol,
                              const I brow_A,
@@ -1041,6 +1747,140 @@ void incomplete_mat_mult_bsr(const I Ap[], const int Ap_size,
     }
 }
 
+/* Constrained mat-mul over a sparsity pattern.
+ *
+ * Calculate S = D A X at the pre-existing sparsity pattern of S, as in
+ * incomplete_mat_mult_bsr, and project each block row of S so that
+ * S B = 0, as in satisfy_constraints_bsr.
+ *
+ * Parameters
+ * ----------
+ * Ap, Aj, Ax : array
+ *      BSR matrix A.
+ * Xp, Xj, Xx : array
+ *      BSR matrix X.
+ * Sp, Sj : array
+ *      BSR row pointer and col index arrays of S.
+ * Sx : array, inplace
+ *      BSR value array of S, overwritten.
+ * n_brow : int
+ *      Number of block-rows in A.
+ * n_bcol : int
+ *      Number of block-cols in S.
+ * brow_A : int
+ *      Row blocksize for A.
+ * bcol_A : int
+ *      Column blocksize for A.
+ * bcol_X : int
+ *      Column blocksize for X.
+ * NullDim : int
+ *      Number of columns in B, or 0 to skip the projection.
+ * B : array
+ *      Near-nullspace vectors, in row major.
+ * BtBinv : array
+ *      ``BtBinv[i] = pinv(B_i.H Bi)``, in row major.
+ * D : array
+ *      Block diagonal scaling, ``n_brow`` blocks of size
+ *      ``brow_A x brow_A`` in row major, or empty for no scaling.
+ *
+ * Returns
+ * -------
+ * None
+ *     Sx is overwritten with the projected ``D A X`` on the pattern of S.
+ *
+ * Notes
+ * -----
+ * Principle calling routine is energy_prolongation_smoother(...) in
+ * smooth.py, where the search directions of the Krylov methods share the
+ * pattern of S.  Each block row of S is scaled and projected right after
+ * it is formed, in a single pass over S.
+ */
+template<class I, class T, class F>
+void incomplete_mat_mult_bsr_constrained(const I     Ap[], const std::ptrdiff_t     Ap_size,
+                                         const I     Aj[], const std::ptrdiff_t     Aj_size,
+                                         const T     Ax[], const std::ptrdiff_t     Ax_size,
+                                         const I     Xp[], const std::ptrdiff_t     Xp_size,
+                                         const I     Xj[], const std::ptrdiff_t     Xj_size,
+                                         const T     Xx[], const std::ptrdiff_t     Xx_size,
+                                         const I     Sp[], const std::ptrdiff_t     Sp_size,
+                                         const I     Sj[], const std::ptrdiff_t     Sj_size,
+                                               T     Sx[], const std::ptrdiff_t     Sx_size,
+                                         const I n_brow,
+                                         const I n_bcol,
+                                         const I brow_A,
+                                         const I bcol_A,
+                                         const I bcol_X,
+                                         const I NullDim,
+                                         const T      B[], const std::ptrdiff_t      B_size,
+                                         const T BtBinv[], const std::ptrdiff_t BtBinv_size,
+                                         const T      D[], const std::ptrdiff_t      D_size)
+{
+    std::vector<T*> S(n_bcol, (T *) NULL);
+
+    const I A_blocksize = brow_A*bcol_A;
+    const I X_blocksize = bcol_A*bcol_X;
+    const I S_blocksize = brow_A*bcol_X;
+    const bool scalar = (A_blocksize == 1 && X_blocksize == 1);
+
+    std::vector<T> block(S_blocksize);
+    std::vector<T> UB(brow_A*NullDim + 1);
+    std::vector<T> W(brow_A*NullDim + 1);
+
+    for(I i = 0; i < n_brow; i++){
+
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            T * Sk = Sx + (std::size_t)jj * S_blocksize;
+            std::fill(Sk, Sk + S_blocksize, T(0));
+            S[Sj[jj]] = Sk;
+        }
+
+        // S_i = A_i X, only at the pattern of S_i
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            for(I kk = Xp[j]; kk < Xp[j+1]; kk++){
+                T * Sk = S[Xj[kk]];
+                if(Sk == NULL){ continue; }
+                if(scalar){
+                    *Sk += Ax[jj]*Xx[kk];
+                }
+                else{
+                    gemm(&(Ax[(std::size_t)jj*A_blocksize]), brow_A, bcol_A, 'F',
+                         &(Xx[(std::size_t)kk*X_blocksize]), bcol_A, bcol_X, 'T',
+                         Sk,                                 brow_A, bcol_X, 'F',
+                         'F');
+                }
+            }
+        }
+
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            S[Sj[jj]] = NULL;
+        }
+
+        // S_i = D_i S_i
+        if(D_size > 0){
+            const T * Di = D + (std::size_t)i * brow_A * brow_A;
+            for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+                T * Sk = Sx + (std::size_t)jj * S_blocksize;
+                std::fill(block.begin(), block.end(), T(0));
+                for(I r = 0; r < brow_A; r++){
+                    for(I m = 0; m < brow_A; m++){
+                        const T d = Di[r*brow_A + m];
+                        for(I c = 0; c < bcol_X; c++){
+                            block[r*bcol_X + c] += d * Sk[m*bcol_X + c];
+                        }
+                    }
+                }
+                std::copy(block.begin(), block.end(), Sk);
+            }
+        }
+
+        if(NullDim > 0){
+            satisfy_constraints_row(i, brow_A, bcol_X, NullDim, B, BtBinv,
+                                    Sp, Sj, Sx, &UB[0], &W[0]);
+        }
+    }
+}
+
 /* Swap x[i] and x[j], and
  *      y[i] and y[j]
  * Use in the qsort_twoarrays function
@@ -1118,9 +1958,9 @@ void qsort_twoarrays( T x[], I y[], I left, I right )
 template<class I, class T, class F>
 void truncate_rows_csr(const I n_row,
                        const I k,
-                       const I Sp[],  const int Sp_size,
-                             I Sj[],  const int Sj_size,
-                             T Sx[],  const int Sx_size)
+                       const I Sp[],  const std::ptrdiff_t Sp_size,
+                             I Sj[],  const std::ptrdiff_t Sj_size,
+                             T Sx[],  const std::ptrdiff_t Sx_size)
 {
 
     // Loop over each row of A, sort based on the entries in Sx,
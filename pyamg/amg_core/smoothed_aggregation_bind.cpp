@@ -33,6 +33,8 @@ void _symmetric_strength_of_connection(
     I *_Sj = py_Sj.mutable_data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return symmetric_strength_of_connection<I, T, F>(
                     n_row,
                     theta,
@@ -63,6 +65,8 @@ I _standard_aggregation(
     I *_x = py_x.mutable_data();
     I *_y = py_y.mutable_data();
 
+    py::gil_scoped_release release;
+
     return standard_aggregation <I>(
                     n_row,
                       _Ap, Ap.shape(0),
@@ -90,6 +94,8 @@ I _naive_aggregation(
     I *_x = py_x.mutable_data();
     I *_y = py_y.mutable_data();
 
+    py::gil_scoped_release release;
+
     return naive_aggregation <I>(
                     n_row,
                       _Ap, Ap.shape(0),
@@ -99,6 +105,39 @@ I _naive_aggregation(
                                  );
 }
 
+template <class I>
+I _mis2_aggregation(
+            const I n_row,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+     py::array_t<I> & mis,
+       py::array_t<I> & x,
+       py::array_t<I> & y
+                    )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_mis = mis.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_y = y.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const I *_mis = py_mis.data();
+    I *_x = py_x.mutable_data();
+    I *_y = py_y.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return mis2_aggregation <I>(
+                    n_row,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                     _mis, mis.shape(0),
+                       _x, x.shape(0),
+                       _y, y.shape(0)
+                                );
+}
+
 template <class I, class T>
 I _pairwise_aggregation(
             const I n_row,
@@ -120,6 +159,8 @@ I _pairwise_aggregation(
     I *_x = py_x.mutable_data();
     I *_y = py_y.mutable_data();
 
+    py::gil_scoped_release release;
+
     return pairwise_aggregation <I, T>(
                     n_row,
                       _Sp, Sp.shape(0),
@@ -130,6 +171,107 @@ I _pairwise_aggregation(
                                        );
 }
 
+template <class I, class T>
+I _pairwise_aggregation_multi(
+            const I n_row,
+        const I blocksize,
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+            const T theta,
+        const I matchings,
+       py::array_t<I> & x,
+       py::array_t<I> & y
+                              )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_x = x.mutable_unchecked();
+    auto py_y = y.mutable_unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    I *_x = py_x.mutable_data();
+    I *_y = py_y.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return pairwise_aggregation_multi <I, T>(
+                    n_row,
+                blocksize,
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                    theta,
+                matchings,
+                       _x, x.shape(0),
+                       _y, y.shape(0)
+                                             );
+}
+
+template <class I, class T>
+void _aggregation_prolong(
+            const I n_row,
+         const I num_cols,
+     py::array_t<I> & agg,
+   py::array_t<T> & scale,
+       py::array_t<T> & x,
+       py::array_t<T> & y
+                          )
+{
+    auto py_agg = agg.unchecked();
+    auto py_scale = scale.unchecked();
+    auto py_x = x.unchecked();
+    auto py_y = y.mutable_unchecked();
+    const I *_agg = py_agg.data();
+    const T *_scale = py_scale.data();
+    const T *_x = py_x.data();
+    T *_y = py_y.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return aggregation_prolong <I, T>(
+                    n_row,
+                 num_cols,
+                     _agg, agg.shape(0),
+                   _scale, scale.shape(0),
+                       _x, x.shape(0),
+                       _y, y.shape(0)
+                                      );
+}
+
+template <class I, class T>
+void _aggregation_restrict(
+            const I n_row,
+         const I num_cols,
+     py::array_t<I> & agg,
+   py::array_t<T> & scale,
+       py::array_t<T> & x,
+       py::array_t<T> & y
+                           )
+{
+    auto py_agg = agg.unchecked();
+    auto py_scale = scale.unchecked();
+    auto py_x = x.unchecked();
+    auto py_y = y.mutable_unchecked();
+    const I *_agg = py_agg.data();
+    const T *_scale = py_scale.data();
+    const T *_x = py_x.data();
+    T *_y = py_y.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return aggregation_restrict <I, T>(
+                    n_row,
+                 num_cols,
+                     _agg, agg.shape(0),
+                   _scale, scale.shape(0),
+                       _x, x.shape(0),
+                       _y, y.shape(0)
+                                       );
+}
+
 template <class I, class T>
 void _fit_candidates_real(
             const I n_row,
@@ -155,6 +297,8 @@ void _fit_candidates_real(
     const T *_B = py_B.data();
     T *_R = py_R.mutable_data();
 
+    py::gil_scoped_release release;
+
     return fit_candidates_real <I, T>(
                     n_row,
                     n_col,
@@ -194,6 +338,8 @@ void _fit_candidates_complex(
     const T *_B = py_B.data();
     T *_R = py_R.mutable_data();
 
+    py::gil_scoped_release release;
+
     return fit_candidates_complex <I, S, T>(
                     n_row,
                     n_col,
@@ -235,6 +381,8 @@ void _satisfy_constraints_helper(
     const I *_Sj = py_Sj.data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return satisfy_constraints_helper<I, T, F>(
            rows_per_block,
            cols_per_block,
@@ -249,6 +397,45 @@ void _satisfy_constraints_helper(
                                                );
 }
 
+template<class I, class T, class F>
+void _satisfy_constraints_bsr(
+   const I rows_per_block,
+   const I cols_per_block,
+   const I num_block_rows,
+          const I NullDim,
+       py::array_t<T> & B,
+  py::array_t<T> & BtBinv,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+      py::array_t<T> & Sx
+                              )
+{
+    auto py_B = B.unchecked();
+    auto py_BtBinv = BtBinv.unchecked();
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_Sx = Sx.mutable_unchecked();
+    const T *_B = py_B.data();
+    const T *_BtBinv = py_BtBinv.data();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    T *_Sx = py_Sx.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return satisfy_constraints_bsr<I, T, F>(
+           rows_per_block,
+           cols_per_block,
+           num_block_rows,
+                  NullDim,
+                       _B, B.shape(0),
+                  _BtBinv, BtBinv.shape(0),
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+                      _Sx, Sx.shape(0)
+                                            );
+}
+
 template<class I, class T, class F>
 void _calc_BtB(
           const I NullDim,
@@ -270,6 +457,8 @@ void _calc_BtB(
     const I *_Sp = py_Sp.data();
     const I *_Sj = py_Sj.data();
 
+    py::gil_scoped_release release;
+
     return calc_BtB<I, T, F>(
                   NullDim,
                    Nnodes,
@@ -282,6 +471,41 @@ void _calc_BtB(
                              );
 }
 
+template<class I, class T, class F>
+void _calc_BtBinv(
+          const I NullDim,
+           const I Nnodes,
+   const I cols_per_block,
+       py::array_t<T> & B,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+       py::array_t<T> & x,
+              const F tol
+                  )
+{
+    auto py_B = B.unchecked();
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_x = x.mutable_unchecked();
+    const T *_B = py_B.data();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    T *_x = py_x.mutable_data();
+
+    py::gil_scoped_release release;
+
+    return calc_BtBinv<I, T, F>(
+                  NullDim,
+                   Nnodes,
+           cols_per_block,
+                       _B, B.shape(0),
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+                       _x, x.shape(0),
+                      tol
+                                );
+}
+
 template<class I, class T, class F>
 void _incomplete_mat_mult_bsr(
       py::array_t<I> & Ap,
@@ -319,6 +543,8 @@ void _incomplete_mat_mult_bsr(
     const I *_Sj = py_Sj.data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return incomplete_mat_mult_bsr<I, T, F>(
                       _Ap, Ap.shape(0),
                       _Aj, Aj.shape(0),
@@ -337,6 +563,77 @@ void _incomplete_mat_mult_bsr(
                                             );
 }
 
+template<class I, class T, class F>
+void _incomplete_mat_mult_bsr_constrained(
+      py::array_t<I> & Ap,
+      py::array_t<I> & Aj,
+      py::array_t<T> & Ax,
+      py::array_t<I> & Xp,
+      py::array_t<I> & Xj,
+      py::array_t<T> & Xx,
+      py::array_t<I> & Sp,
+      py::array_t<I> & Sj,
+      py::array_t<T> & Sx,
+           const I n_brow,
+           const I n_bcol,
+           const I brow_A,
+           const I bcol_A,
+           const I bcol_X,
+          const I NullDim,
+       py::array_t<T> & B,
+  py::array_t<T> & BtBinv,
+       py::array_t<T> & D
+                                          )
+{
+    auto py_Ap = Ap.unchecked();
+    auto py_Aj = Aj.unchecked();
+    auto py_Ax = Ax.unchecked();
+    auto py_Xp = Xp.unchecked();
+    auto py_Xj = Xj.unchecked();
+    auto py_Xx = Xx.unchecked();
+    auto py_Sp = Sp.unchecked();
+    auto py_Sj = Sj.unchecked();
+    auto py_Sx = Sx.mutable_unchecked();
+    auto py_B = B.unchecked();
+    auto py_BtBinv = BtBinv.unchecked();
+    auto py_D = D.unchecked();
+    const I *_Ap = py_Ap.data();
+    const I *_Aj = py_Aj.data();
+    const T *_Ax = py_Ax.data();
+    const I *_Xp = py_Xp.data();
+    const I *_Xj = py_Xj.data();
+    const T *_Xx = py_Xx.data();
+    const I *_Sp = py_Sp.data();
+    const I *_Sj = py_Sj.data();
+    T *_Sx = py_Sx.mutable_data();
+    const T *_B = py_B.data();
+    const T *_BtBinv = py_BtBinv.data();
+    const T *_D = py_D.data();
+
+    py::gil_scoped_release release;
+
+    return incomplete_mat_mult_bsr_constrained<I, T, F>(
+                      _Ap, Ap.shape(0),
+                      _Aj, Aj.shape(0),
+                      _Ax, Ax.shape(0),
+                      _Xp, Xp.shape(0),
+                      _Xj, Xj.shape(0),
+                      _Xx, Xx.shape(0),
+                      _Sp, Sp.shape(0),
+                      _Sj, Sj.shape(0),
+                      _Sx, Sx.shape(0),
+                   n_brow,
+                   n_bcol,
+                   brow_A,
+                   bcol_A,
+                   bcol_X,
+                  NullDim,
+                       _B, B.shape(0),
+                  _BtBinv, BtBinv.shape(0),
+                       _D, D.shape(0)
+                                                        );
+}
+
 template<class I, class T, class F>
 void _truncate_rows_csr(
             const I n_row,
@@ -353,6 +650,8 @@ void _truncate_rows_csr(
     I *_Sj = py_Sj.mutable_data();
     T *_Sx = py_Sx.mutable_data();
 
+    py::gil_scoped_release release;
+
     return truncate_rows_csr<I, T, F>(
                     n_row,
                         k,
@@ -371,12 +670,19 @@ PYBIND11_MODULE(smoothed_aggregation, m) {
     symmetric_strength_of_connection
     standard_aggregation
     naive_aggregation
+    mis2_aggregation
     pairwise_aggregation
+    pairwise_aggregation_multi
+    aggregation_prolong
+    aggregation_restrict
     fit_candidates_real
     fit_candidates_complex
     satisfy_constraints_helper
+    satisfy_constraints_bsr
     calc_BtB
+    calc_BtBinv
     incomplete_mat_mult_bsr
+    incomplete_mat_mult_bsr_constrained
     truncate_rows_csr
     )pbdoc";
 
@@ -390,6 +696,14 @@ PYBIND11_MODULE(smoothed_aggregation, m) {
     m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<int, std::complex<float>, float>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("symmetric_strength_of_connection", &_symmetric_strength_of_connection<std::int64_t, std::complex<double>, double>,
         py::arg("n_row"), py::arg("theta"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Compute symmetric strength of connection.
@@ -430,6 +744,8 @@ of A's nonzero values, a conservative bound is to allocate the same
 storage for S as is used by A.)pbdoc");
 
     m.def("standard_aggregation", &_standard_aggregation<int>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("standard_aggregation", &_standard_aggregation<std::int64_t>,
         py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
 R"pbdoc(
 Compute aggregates for a matrix A stored in CSR format.
@@ -459,6 +775,8 @@ Notes
 - Unaggregated nodes are marked with a -1)pbdoc");
 
     m.def("naive_aggregation", &_naive_aggregation<int>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("naive_aggregation", &_naive_aggregation<std::int64_t>,
         py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
 R"pbdoc(
 Compute aggregates for a matrix A stored in CSR format.
@@ -488,6 +806,56 @@ If it has been aggregated, skip over.  Otherwise, put dof
 and any unaggregated neighbors in an aggregate.  Results
 in possibly much higher complexities.)pbdoc");
 
+    m.def("mis2_aggregation", &_mis2_aggregation<int>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("mis").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("mis2_aggregation", &_mis2_aggregation<std::int64_t>,
+        py::arg("n_row"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("mis").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
+R"pbdoc(
+Compute aggregates from a distance-2 maximal independent set.
+
+Parameters
+----------
+n_row : int
+    Number of rows in A.
+Ap : array, n_row + 1
+    CSR row pointer.
+Aj : array, nnz
+    CSR column indices.
+mis : array, n_row
+    Roots of the aggregates: 1 for the nodes of a distance-2 MIS, 2 for
+    the nodes of a distance-2 MIS of the nodes that are not adjacent to
+    a node marked 1, and 0 otherwise.
+x : array, n_row, inplace
+    Aggregate numbers for each node.
+y : array, n_row, inplace
+    Will hold Cpts upon return.
+
+Returns
+-------
+int
+    The number of aggregates (``== max(x[:]) + 1``).
+
+Notes
+-----
+- It is assumed that A is symmetric.
+- A may contain diagonal entries (self loops)
+- Unaggregated (isolated) nodes are marked with a -1
+
+Each node marked 1 becomes the root of an aggregate.  The aggregates are
+grown in synchronous rounds: in the first round, every neighbor of a root
+joins its aggregate (since roots are at least three edges apart, there is
+only one).  In the second round, each node marked 2 with at least two
+unaggregated neighbors becomes a root and takes these neighbors.  In the
+following rounds, every unaggregated node joins the neighboring aggregate
+it has the most edges to, with ties broken by the smaller aggregate and
+then the lower aggregate number.  Each round only reads the state of the
+previous round, so the result does not depend on the order in which the
+nodes of a round are visited.
+
+See Also
+--------
+maximal_independent_set_k_parallel)pbdoc");
+
     m.def("pairwise_aggregation", &_pairwise_aggregation<int, int>,
         py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
     m.def("pairwise_aggregation", &_pairwise_aggregation<int, long>,
@@ -495,6 +863,14 @@ in possibly much higher complexities.)pbdoc");
     m.def("pairwise_aggregation", &_pairwise_aggregation<int, float>,
         py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
     m.def("pairwise_aggregation", &_pairwise_aggregation<int, double>,
+        py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation", &_pairwise_aggregation<std::int64_t, int>,
+        py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation", &_pairwise_aggregation<std::int64_t, long>,
+        py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation", &_pairwise_aggregation<std::int64_t, float>,
+        py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation", &_pairwise_aggregation<std::int64_t, double>,
         py::arg("n_row"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
 R"pbdoc(
 Compute aggregates for a matrix S stored in CSR format.
@@ -524,9 +900,143 @@ Notes
 S is the strength matrix. Assumes that the strength matrix is for
 classic strength with min norm.)pbdoc");
 
+    m.def("pairwise_aggregation_multi", &_pairwise_aggregation_multi<int, float>,
+        py::arg("n_row"), py::arg("blocksize"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("theta"), py::arg("matchings"), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation_multi", &_pairwise_aggregation_multi<int, double>,
+        py::arg("n_row"), py::arg("blocksize"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("theta"), py::arg("matchings"), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation_multi", &_pairwise_aggregation_multi<std::int64_t, float>,
+        py::arg("n_row"), py::arg("blocksize"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("theta"), py::arg("matchings"), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("pairwise_aggregation_multi", &_pairwise_aggregation_multi<std::int64_t, double>,
+        py::arg("n_row"), py::arg("blocksize"), py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("theta"), py::arg("matchings"), py::arg("x").noconvert(), py::arg("y").noconvert(),
+R"pbdoc(
+Compute aggregates from several passes of pairwise matching.
+
+Parameters
+----------
+n_row : int
+    Number of block rows in A.
+blocksize : int
+    Size of the (square) blocks of A; 1 for a CSR matrix.
+Ap : array, n_row+1
+    BSR row pointer.
+Aj : array, nnz
+    BSR column indices.
+Ax : array, nnz*blocksize*blocksize
+    BSR data array (row-major blocks).
+theta : float
+    Strength tolerance of the classical strength of connection.
+matchings : int
+    Number of pairwise matchings.
+x : array, n_row, inplace
+    Aggregate numbers for each node.
+y : array, n_row, inplace
+    Will hold Cpts upon return.
+
+Returns
+-------
+int
+    The number of aggregates (``== max(x[:]) + 1``).
+
+Notes
+-----
+Each pass computes the classical strength of connection with the min
+norm (the minimum entry of each block) of the current matrix, and matches
+its nodes with pairwise_aggregation.  The matrix of the next pass is the
+Galerkin product T^T A T of the unsmoothed pairwise aggregation T, formed
+by summing the blocks of each pair of rows and columns.  The aggregates
+of the passes are composed, so x maps the nodes of A directly to the
+final aggregates.  Unlike pairwise_aggregation, x is numbered from zero.)pbdoc");
+
+    m.def("aggregation_prolong", &_aggregation_prolong<int, float>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<int, double>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<int, std::complex<float>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<int, std::complex<double>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<std::int64_t, float>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<std::int64_t, double>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<std::int64_t, std::complex<float>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_prolong", &_aggregation_prolong<std::int64_t, std::complex<double>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
+R"pbdoc(
+Apply a prolongator with at most one nonzero per row.
+
+Computes ``y = P x``, where row i of P is zero if ``agg[i] < 0``, and
+otherwise has the single nonzero ``scale[i]`` (or 1) in column ``agg[i]``.
+
+Parameters
+----------
+n_row : int
+    Number of rows in P.
+num_cols : int
+    Number of columns of x and y (row-major).
+agg : array, n_row
+    Column of the nonzero in each row of P.
+scale : array, n_row or 0
+    Value of the nonzero in each row of P; all ones if empty.
+x : array, num_aggregates*num_cols
+    Input vectors.
+y : array, n_row*num_cols, inplace
+    Output vectors.
+
+Returns
+-------
+Nothing, y will be modified in place)pbdoc");
+
+    m.def("aggregation_restrict", &_aggregation_restrict<int, float>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<int, double>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<int, std::complex<float>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<int, std::complex<double>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<std::int64_t, float>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<std::int64_t, double>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<std::int64_t, std::complex<float>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert());
+    m.def("aggregation_restrict", &_aggregation_restrict<std::int64_t, std::complex<double>>,
+        py::arg("n_row"), py::arg("num_cols"), py::arg("agg").noconvert(), py::arg("scale").noconvert(), py::arg("x").noconvert(), py::arg("y").noconvert(),
+R"pbdoc(
+Apply the transpose of a prolongator with at most one nonzero per row.
+
+Computes ``y = P^T x`` by summing the (scaled) rows of x per aggregate,
+with P as in aggregation_prolong.  For the conjugate transpose, pass the
+conjugated scale.
+
+Parameters
+----------
+n_row : int
+    Number of rows in P.
+num_cols : int
+    Number of columns of x and y (row-major).
+agg : array, n_row
+    Column of the nonzero in each row of P.
+scale : array, n_row or 0
+    Value of the nonzero in each row of P; all ones if empty.
+x : array, n_row*num_cols
+    Input vectors.
+y : array, num_aggregates*num_cols, inplace
+    Output vectors.
+
+Returns
+-------
+Nothing, y will be modified in place)pbdoc");
+
     m.def("fit_candidates", &_fit_candidates_real<int, float>,
         py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
     m.def("fit_candidates", &_fit_candidates_real<int, double>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
+    m.def("fit_candidates", &_fit_candidates_real<std::int64_t, float>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
+    m.def("fit_candidates", &_fit_candidates_real<std::int64_t, double>,
         py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"),
 R"pbdoc(
 )pbdoc");
@@ -534,6 +1044,10 @@ R"pbdoc(
     m.def("fit_candidates", &_fit_candidates_complex<int, float, std::complex<float>>,
         py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
     m.def("fit_candidates", &_fit_candidates_complex<int, double, std::complex<double>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
+    m.def("fit_candidates", &_fit_candidates_complex<std::int64_t, float, std::complex<float>>,
+        py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"));
+    m.def("fit_candidates", &_fit_candidates_complex<std::int64_t, double, std::complex<double>>,
         py::arg("n_row"), py::arg("n_col"), py::arg("K1"), py::arg("K2"), py::arg("Ap").noconvert(), py::arg("Ai").noconvert(), py::arg("Ax").noconvert(), py::arg("B").noconvert(), py::arg("R").noconvert(), py::arg("tol"),
 R"pbdoc(
 )pbdoc");
@@ -545,6 +1059,14 @@ R"pbdoc(
     m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<int, std::complex<float>, float>,
         py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<int, std::complex<double>, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<std::int64_t, float, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<std::int64_t, double, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<std::int64_t, std::complex<float>, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_helper", &_satisfy_constraints_helper<std::int64_t, std::complex<double>, double>,
         py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("x").noconvert(), py::arg("y").noconvert(), py::arg("z").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Helper routine for satisfy_constraints routine.
@@ -604,6 +1126,62 @@ This implements the python code:
      UBi = UB[i]
      U.data[n] -= dot(UBi,dot(BtBinv[i],Bi.H)))pbdoc");
 
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<int, float, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<int, double, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<int, std::complex<float>, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<int, std::complex<double>, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<std::int64_t, float, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<std::int64_t, double, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<std::int64_t, std::complex<float>, float>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("satisfy_constraints_bsr", &_satisfy_constraints_bsr<std::int64_t, std::complex<double>, double>,
+        py::arg("rows_per_block"), py::arg("cols_per_block"), py::arg("num_block_rows"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
+R"pbdoc(
+Project a BSR matrix S in place so that S B = 0 within its sparsity pattern.
+
+Parameters
+----------
+rows_per_block : int
+     Rows per block in the BSR matrix, S.
+cols_per_block : int
+     Cols per block in the BSR matrix, S.
+num_block_rows : int
+     Number of block rows, ``S.shape[0]/rows_per_block``.
+NullDim : int
+     Null-space dimension, i.e., the number of columns in B.
+B : array
+     Near-nullspace vectors, in row major.
+BtBinv : array
+     BtBinv, in row major, i.e. ``BtBinv[i] = pinv(B_i.H Bi)``, where
+     B_i is B restricted to the neighborhood of dof of i.
+Sp : array
+     Row pointer array for BSR matrix S.
+Sj : array
+     Col index array for BSR matrix S.
+Sx : array, inplace
+     Value array for BSR matrix S.
+
+Returns
+-------
+None
+    Sx is modified in place such that S*B = 0.
+
+See Also
+--------
+satisfy_constraints_helper
+
+Notes
+-----
+Equivalent to satisfy_constraints_helper with ``y = S*B``, but S*B is
+formed one block row at a time, so no dense N x NullDim product and no
+conjugated copy of B are needed.)pbdoc");
+
     m.def("calc_BtB", &_calc_BtB<int, float, float>,
         py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
     m.def("calc_BtB", &_calc_BtB<int, double, double>,
@@ -611,6 +1189,14 @@ This implements the python code:
     m.def("calc_BtB", &_calc_BtB<int, std::complex<float>, float>,
         py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
     m.def("calc_BtB", &_calc_BtB<int, std::complex<double>, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
+    m.def("calc_BtB", &_calc_BtB<std::int64_t, float, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
+    m.def("calc_BtB", &_calc_BtB<std::int64_t, double, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
+    m.def("calc_BtB", &_calc_BtB<std::int64_t, std::complex<float>, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert());
+    m.def("calc_BtB", &_calc_BtB<std::int64_t, std::complex<double>, double>,
         py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("b").noconvert(), py::arg("BsqCols"), py::arg("x").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(),
 R"pbdoc(
 Helper routine for energy_prolongation_smoother.
@@ -665,6 +1251,59 @@ Calculates the following python code:
         Bi = mat( B[S2.indices[S2.indptr[i*rows_per_block]:S2.indptr[i*rows_per_block + 1]],:] )
         BtB[i,:,:] = Bi.H*Bi)pbdoc");
 
+    m.def("calc_BtBinv", &_calc_BtBinv<int, float, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<int, double, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<int, std::complex<float>, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<int, std::complex<double>, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<std::int64_t, float, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<std::int64_t, double, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<std::int64_t, std::complex<float>, float>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"));
+    m.def("calc_BtBinv", &_calc_BtBinv<std::int64_t, std::complex<double>, double>,
+        py::arg("NullDim"), py::arg("Nnodes"), py::arg("cols_per_block"), py::arg("B").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("x").noconvert(), py::arg("tol"),
+R"pbdoc(
+Compute pinv(B_i.H B_i) for each block row i of a BSR sparsity pattern S.
+
+Parameters
+----------
+NullDim : int
+     Number of near nullspace vectors, i.e., the number of columns in B.
+Nnodes : int
+     Number of nodes, i.e. number of block rows in BSR matrix, S.
+cols_per_block : int
+     Columns per block in S.
+B : array
+     Near-nullspace vectors, in row major.
+Sp, Sj : array
+     BSR indptr and indices members for matrix, S.
+x : array, inplace
+     Nnodes x NullDim x NullDim output array, in row major.
+tol : float
+     Eigenvalues of B_i.H B_i with ``|lambda| <= tol * max(|lambda|)``
+     are treated as zero in the pseudoinverse.
+
+Returns
+-------
+None
+    ``x[i] = pinv(B_i.H B_i)`` where B_i is B[colindices,:], colindices =
+    all the nonzero column indices for block row i in S.
+
+See Also
+--------
+calc_BtB, pinv_hermitian_array
+
+Notes
+-----
+Principle calling routine is compute_BtBinv(...) in util/utils.py.  This
+fuses calc_BtB with the pseudoinverse of each block, so the products of the
+columns of B and the blocks B_i.H B_i are never stored separately.)pbdoc");
+
     m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<int, float, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
     m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<int, double, double>,
@@ -672,6 +1311,14 @@ Calculates the following python code:
     m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<int, std::complex<float>, float>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
     m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
+    m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
+    m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
+    m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"));
+    m.def("incomplete_mat_mult_bsr", &_incomplete_mat_mult_bsr<std::int64_t, std::complex<double>, double>,
         py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Bp").noconvert(), py::arg("Bj").noconvert(), py::arg("Bx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_B"),
 R"pbdoc(
 Mat-mul over a sparsity pattern.
@@ -733,6 +1380,71 @@ A*P_tent, but only within an accepted sparsity pattern.
 Is generally faster than the commented out incomplete_BSRmatmat(...)
 routine below, except when S has far few nonzeros than A or B.)pbdoc");
 
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<int, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<int, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<int, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<int, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<std::int64_t, float, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<std::int64_t, double, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<std::int64_t, std::complex<float>, float>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert());
+    m.def("incomplete_mat_mult_bsr_constrained", &_incomplete_mat_mult_bsr_constrained<std::int64_t, std::complex<double>, double>,
+        py::arg("Ap").noconvert(), py::arg("Aj").noconvert(), py::arg("Ax").noconvert(), py::arg("Xp").noconvert(), py::arg("Xj").noconvert(), py::arg("Xx").noconvert(), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(), py::arg("n_brow"), py::arg("n_bcol"), py::arg("brow_A"), py::arg("bcol_A"), py::arg("bcol_X"), py::arg("NullDim"), py::arg("B").noconvert(), py::arg("BtBinv").noconvert(), py::arg("D").noconvert(),
+R"pbdoc(
+Constrained mat-mul over a sparsity pattern.
+
+Calculate S = D A X at the pre-existing sparsity pattern of S, as in
+incomplete_mat_mult_bsr, and project each block row of S so that
+S B = 0, as in satisfy_constraints_bsr.
+
+Parameters
+----------
+Ap, Aj, Ax : array
+     BSR matrix A.
+Xp, Xj, Xx : array
+     BSR matrix X.
+Sp, Sj : array
+     BSR row pointer and col index arrays of S.
+Sx : array, inplace
+     BSR value array of S, overwritten.
+n_brow : int
+     Number of block-rows in A.
+n_bcol : int
+     Number of block-cols in S.
+brow_A : int
+     Row blocksize for A.
+bcol_A : int
+     Column blocksize for A.
+bcol_X : int
+     Column blocksize for X.
+NullDim : int
+     Number of columns in B, or 0 to skip the projection.
+B : array
+     Near-nullspace vectors, in row major.
+BtBinv : array
+     ``BtBinv[i] = pinv(B_i.H Bi)``, in row major.
+D : array
+     Block diagonal scaling, ``n_brow`` blocks of size
+     ``brow_A x brow_A`` in row major, or empty for no scaling.
+
+Returns
+-------
+None
+    Sx is overwritten with the projected ``D A X`` on the pattern of S.
+
+Notes
+-----
+Principle calling routine is energy_prolongation_smoother(...) in
+smooth.py, where the search directions of the Krylov methods share the
+pattern of S.  Each block row of S is scaled and projected right after
+it is formed, in a single pass over S.)pbdoc");
+
     m.def("truncate_rows_csr", &_truncate_rows_csr<int, float, float>,
         py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("truncate_rows_csr", &_truncate_rows_csr<int, double, double>,
@@ -740,6 +1452,14 @@ routine below, except when S has far few nonzeros than A or B.)pbdoc");
     m.def("truncate_rows_csr", &_truncate_rows_csr<int, std::complex<float>, float>,
         py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
     m.def("truncate_rows_csr", &_truncate_rows_csr<int, std::complex<double>, double>,
+        py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("truncate_rows_csr", &_truncate_rows_csr<std::int64_t, float, float>,
+        py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("truncate_rows_csr", &_truncate_rows_csr<std::int64_t, double, double>,
+        py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("truncate_rows_csr", &_truncate_rows_csr<std::int64_t, std::complex<float>, float>,
+        py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert());
+    m.def("truncate_rows_csr", &_truncate_rows_csr<std::int64_t, std::complex<double>, double>,
         py::arg("n_row"), py::arg("k"), py::arg("Sp").noconvert(), py::arg("Sj").noconvert(), py::arg("Sx").noconvert(),
 R"pbdoc(
 Truncate the entries in A.
@@ -15,7 +15,7 @@ from ..util.utils import filter_matrix_rows, asfptype
 from ..classical.interpolate import (direct_interpolation, classical_interpolation,
                                      injection_interpolation, one_point_interpolation,
                                      local_air)
-from .split import RS, PMIS, PMISc, CLJP, CLJPc
+from .split import RS, PMIS, HMIS, PMISc, CLJP, CLJPc
 from .cr import CR
 
 
@@ -45,7 +45,7 @@ def air_solver(A,
         strength=None, all nonzero entries of the matrix are considered strong.
     CF : {string} : default 'RS' with second pass
         Method used for coarse grid selection (C/F splitting)
-        Supported methods are RS, PMIS, PMISc, CLJP, CLJPc, and CR.
+        Supported methods are RS, PMIS, HMIS, PMISc, CLJP, CLJPc, and CR.
     interpolation : str
         Options include 'direct', 'classical', 'inject' and 'one-point'.
     restrict : str
@@ -186,6 +186,8 @@ def extend_hierarchy(levels, strength, CF, interpolation, restrict, filter_opera
         splitting = RS(C, **kwargs)
     elif fn == 'PMIS':
         splitting = PMIS(C, **kwargs)
+    elif fn == 'HMIS':
+        splitting = HMIS(C, **kwargs)
     elif fn == 'PMISc':
         splitting = PMISc(C, **kwargs)
     elif fn == 'CLJP':
@@ -6,15 +6,18 @@ from scipy.sparse import csr_array, issparse, SparseEfficiencyWarning
 import numpy as np
 
 from pyamg.multilevel import MultilevelSolver
+from pyamg.util.stencil import StencilOperator
 from pyamg.relaxation.smoothing import change_smoothers
+from pyamg.util.streaming import galerkin_product
 from pyamg.strength import classical_strength_of_connection, \
     symmetric_strength_of_connection, evolution_strength_of_connection, \
     distance_strength_of_connection, energy_based_strength_of_connection, \
     algebraic_distance, affinity_distance, pairwise_strength_of_connection
-from pyamg.classical.interpolate import direct_interpolation, classical_interpolation
+from pyamg.classical.interpolate import direct_interpolation, classical_interpolation, \
+    multipass_interpolation, extended_interpolation
 from . import split
 from .cr import CR
-from ..util.utils import asfptype
+from ..util.utils import asfptype, levelize_smooth_or_improve_candidates
 
 
 def ruge_stuben_solver(A,
@@ -28,8 +31,9 @@ def ruge_stuben_solver(A,
 
     Parameters
     ----------
-    A : csr_array
-        Square matrix in CSR format.
+    A : csr_array, StencilOperator
+        Square matrix in CSR format.  A StencilOperator is assembled for
+        the setup and kept as the matrix-free operator of the finest level.
     strength : str
         Valid strings are ['symmetric', 'classical', 'evolution', 'distance',
         'algebraic_distance','affinity', 'energy_based', None].
@@ -37,11 +41,19 @@ def ruge_stuben_solver(A,
         of the linear system.  Method-specific parameters may be passed in
         using a tuple, e.g. strength=('symmetric',{'theta': 0.25 }). If
         strength=None, all nonzero entries of the matrix are considered strong.
-    CF : str or tuple, default 'RS'
+    CF : str or tuple or list, default 'RS'
         Method used for coarse grid selection (C/F splitting).
-        Supported methods are RS, PMIS, PMISc, CLJP, CLJPc, and CR.
-    interpolation : str, default 'classical'
-        Method for interpolation. Options include 'direct', 'classical'.
+        Supported methods are RS, PMIS, HMIS, PMISc, CLJP, CLJPc, CR, and
+        aggressive, see split.aggressive.  A list gives the method on each
+        level, with the last entry used for all remaining levels, e.g.,
+        CF=[('aggressive', {'method': 'PMIS'}), 'PMIS'] coarsens the first
+        level aggressively.
+    interpolation : str or tuple or list, default 'classical'
+        Method for interpolation. Options include 'direct', 'classical',
+        'multipass', and 'extended' (extended+i).  A list gives the method
+        on each level, as for CF.  Levels with aggressive coarsening
+        require 'multipass' interpolation, since some F-points have no
+        strong C-neighbors, and other methods raise a ValueError.
     presmoother : str or dict
         Method used for presmoothing at each level.  Method-specific parameters
         may be passed in using a tuple, e.g.
@@ -90,9 +102,22 @@ def ruge_stuben_solver(A,
     >>> A = poisson((10,),format='csr')
     >>> ml = ruge_stuben_solver(A,max_coarse=3)
 
+    Aggressive coarsening on the first level:
+
+    >>> A = poisson((10, 10, 10), format='csr')
+    >>> ml = ruge_stuben_solver(A, CF=[('aggressive', {'method': 'PMIS'}), 'PMIS'],
+    ...                         interpolation=['multipass', 'extended'])
+    >>> ml.operator_complexity() < 1.5
+    True
+
     """
     levels = [MultilevelSolver.Level()]
 
+    # a matrix-free fine level is assembled for the setup only
+    stencil = None
+    if isinstance(A, StencilOperator):
+        stencil, A = A, A.tocsr()
+
     # convert A to csr
     if not issparse(A) or A.format != 'csr':
         try:
@@ -108,6 +133,21 @@ def ruge_stuben_solver(A,
 
     levels[-1].A = A
 
+    CF = levelize_smooth_or_improve_candidates(
+        list(CF) if isinstance(CF, list) else CF, max_levels)
+    interpolation = levelize_smooth_or_improve_candidates(
+        list(interpolation) if isinstance(interpolation, list) else interpolation,
+        max_levels)
+
+    # aggressive coarsening leaves F-points without strong C-neighbors,
+    # which only multipass interpolation reaches
+    for cf, interp in zip(CF, interpolation, strict=True):
+        cf = cf[0] if isinstance(cf, tuple) else cf
+        interp = interp[0] if isinstance(interp, tuple) else interp
+        if cf == 'aggressive' and interp != 'multipass':
+            raise ValueError('aggressive coarsening requires multipass '
+                             f'interpolation, not {interp}')
+
     while len(levels) < max_levels and levels[-1].A.shape[0] > max_coarse:
         bottom = _extend_hierarchy(levels, strength, CF, interpolation, keep)
 
@@ -115,6 +155,12 @@ def ruge_stuben_solver(A,
             break
 
     ml = MultilevelSolver(levels, **kwargs)
+    if stencil is not None and len(levels) > 1:
+        # keep the operator as the fine level, with the properties of A
+        for attr in ('symmetry', 'rho_D_inv'):
+            if hasattr(A, attr):
+                setattr(stencil, attr, getattr(A, attr))
+        levels[0].A = stencil
     change_smoothers(ml, presmoother, postsmoother)
     return ml
 
@@ -154,11 +200,13 @@ def _extend_hierarchy(levels, strength, CF, interpolation, keep):
         raise ValueError(f'Unrecognized strength of connection method: {fn}')
 
     # Generate the C/F splitting
-    fn, kwargs = unpack_arg(CF)
+    fn, kwargs = unpack_arg(CF[len(levels)-1])
     if fn == 'RS':
         splitting = split.RS(C, **kwargs)
     elif fn == 'PMIS':
         splitting = split.PMIS(C, **kwargs)
+    elif fn == 'HMIS':
+        splitting = split.HMIS(C, **kwargs)
     elif fn == 'PMISc':
         splitting = split.PMISc(C, **kwargs)
     elif fn == 'CLJP':
@@ -167,8 +215,10 @@ def _extend_hierarchy(levels, strength, CF, interpolation, keep):
         splitting = split.CLJPc(C, **kwargs)
     elif fn == 'CR':
         splitting = CR(C, **kwargs)
+    elif fn == 'aggressive':
+        splitting = split.aggressive(C, **kwargs)
     else:
-        raise ValueError(f'Unknown C/F splitting method {CF}')
+        raise ValueError(f'Unknown C/F splitting method {fn}')
 
     # Make sure all points were not declared as C- or F-points
     # Return early, do not add another coarse level
@@ -178,13 +228,17 @@ def _extend_hierarchy(levels, strength, CF, interpolation, keep):
 
     # Generate the interpolation matrix that maps from the coarse-grid to the
     # fine-grid
-    fn, kwargs = unpack_arg(interpolation)
+    fn, kwargs = unpack_arg(interpolation[len(levels)-1])
     if fn == 'classical':
         P = classical_interpolation(A, C, splitting, **kwargs)
     elif fn == 'direct':
         P = direct_interpolation(A, C, splitting, **kwargs)
+    elif fn == 'multipass':
+        P = multipass_interpolation(A, C, splitting, **kwargs)
+    elif fn == 'extended':
+        P = extended_interpolation(A, C, splitting, **kwargs)
     else:
-        raise ValueError(f'Unknown interpolation method {interpolation}')
+        raise ValueError(f'Unknown interpolation method {fn}')
 
     # Generate the restriction matrix that maps from the fine-grid to the
     # coarse-grid
@@ -200,6 +254,6 @@ def _extend_hierarchy(levels, strength, CF, interpolation, keep):
 
     # Form next level through Galerkin product
     levels.append(MultilevelSolver.Level())
-    A = R @ A @ P
+    A = galerkin_product(R, A, P)
     levels[-1].A = A
     return False
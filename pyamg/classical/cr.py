@@ -1,12 +1,9 @@
 """Compatible Relaxation."""
 
-from copy import deepcopy
 import numpy as np
-from scipy.linalg import norm
 from scipy.sparse import issparse, diags_array
 
 from pyamg import amg_core
-from ..relaxation.relaxation import gauss_seidel, gauss_seidel_indexed
 
 
 def _CRsweep(A, B, Findex, Cindex, nu, thetacr, method):
@@ -42,38 +39,15 @@ def _CRsweep(A, B, Findex, Cindex, nu, thetacr, method):
         Smoothed error vector
 
     """
-    n = A.shape[0]    # problem size
-    # numax = nu
-    z = np.zeros((n,))
-    e = deepcopy(B[:, 0])
-    e[Cindex] = 0.0
-    enorm = norm(e)
-    rhok = 1
-    it = 0
-
-    while True:
-        if method not in ('habituated', 'concurrent'):
-            raise NotImplementedError('method not recognized: need habituated '
-                                      'or concurrent')
-        if method == 'habituated':
-            gauss_seidel(A, e, z, iterations=1)
-            e[Cindex] = 0.0
-        elif method == 'concurrent':
-            gauss_seidel_indexed(A, e, z, indices=Findex, iterations=1)
-
-        enorm_old = enorm
-        enorm = norm(e)
-        rhok_old = rhok
-        rhok = enorm / enorm_old
-        it += 1
-
-        # criteria 1 -- fast convergence
-        if rhok < 0.1 * thetacr:
-            break
+    if method not in ('habituated', 'concurrent'):
+        raise NotImplementedError('method not recognized: need habituated '
+                                  'or concurrent')
 
-        # criteria 2 -- at least nu iters, small relative change in CF (<0.1)
-        if ((abs(rhok - rhok_old) / rhok) < 0.1) and (it >= nu):
-            break
+    dtype = np.result_type(A.dtype, B.dtype, np.float32)
+    e = np.array(B[:, 0], dtype=dtype)
+    rhok = amg_core.cr_sweep(A.indptr, A.indices, A.data.astype(dtype, copy=False),
+                             e, Findex, Cindex, nu, thetacr,
+                             method == 'concurrent')
 
     return rhok, e
 
@@ -165,12 +139,13 @@ def CR(A, method='habituated', B=None, nu=3, thetacr=0.7,
     target = B[:, 0]
 
     # 3.1a - Initialize all nodes as F points
-    splitting = np.zeros((n,), dtype='intc')
-    indices = np.zeros((n+1,), dtype='intc')
+    index_type = A.indptr.dtype
+    splitting = np.zeros((n,), dtype=index_type)
+    indices = np.zeros((n+1,), dtype=index_type)
     indices[0] = n
-    indices[1:] = np.arange(0, n, dtype='intc')
+    indices[1:] = np.arange(0, n, dtype=index_type)
     Findex = indices[1:]
-    Cindex = np.empty((0,), dtype='intc')
+    Cindex = np.empty((0,), dtype=index_type)
     gamma = np.zeros((n,))
 
     # 3.1b - Run initial smoothing sweep
@@ -266,48 +241,14 @@ def binormalize(A, tol=1e-5, maxiter=10):
         raise NotImplementedError('complex A not implemented')
 
     n = A.shape[0]
-    it = 0
-    x = np.ones((n, 1)).ravel()
+    x = np.ones((n,), dtype=np.result_type(A.dtype, np.float32))
 
-    # 1.
+    # see equations (7) and (12)
     B = A.multiply(A).tocsc()  # power(A,2) inconsistent in numpy, scipy.sparse
-    d = B.diagonal().ravel()
-
-    # 2.
-    beta = B @ x
-    betabar = (1.0/n) * np.dot(x, beta)
-    stdev = rowsum_stdev(x, beta)
-
-    # 3
-    while stdev > tol and it < maxiter:
-        for i in range(0, n):
-            # solve equation x_i, keeping x_j's fixed
-            # see equation (12)
-            c2 = (n-1)*d[i]
-            c1 = (n-2)*(beta[i] - d[i]*x[i])
-            c0 = -d[i]*x[i]*x[i] + 2*beta[i]*x[i] - n*betabar
-
-            if -c0 < 1e-14:
-                print('warning: A nearly un-binormalizable...')
-                return A
-
-            # see equation (12)
-            xnew = (2*c0)/(-c1 - np.sqrt(c1*c1 - 4*c0*c2))
-            dx = xnew - x[i]
-
-            # here we assume input matrix is symmetric since we grab a row of B
-            # instead of a column
-            ii = B.indptr[i]
-            iii = B.indptr[i+1]
-            dot_Bcol = np.dot(x[B.indices[ii:iii]], B.data[ii:iii])
-
-            betabar = betabar + (1.0/n)*dx*(dot_Bcol + beta[i] + d[i]*dx)
-            beta[B.indices[ii:iii]] += dx*B.data[ii:iii]
-
-            x[i] = xnew
-
-        stdev = rowsum_stdev(x, beta)
-        it += 1
+    if amg_core.binormalize(B.indptr, B.indices, B.data.astype(x.dtype, copy=False),
+                            x, tol, maxiter) < 0:
+        print('warning: A nearly un-binormalizable...')
+        return A
 
     # rescale for unit 2-norm
     d = np.sqrt(x)
@@ -171,6 +171,181 @@ def classical_interpolation(A, C, splitting, theta=None, norm='min', modified=Tr
     return csr_array((P_data, P_indices, P_indptr), shape=[n, nc])
 
 
+def multipass_interpolation(A, C, splitting, theta=None, norm='min'):
+    """Create prolongator using multipass interpolation.
+
+    F-points with a strong C-neighbor use direct interpolation.  Each further
+    pass interpolates the F-points with a strong connection to the points of
+    the earlier passes, by substituting the interpolation of those points.
+    This reaches F-points without a strong C-neighbor, as produced by
+    aggressive coarsening.
+
+    Parameters
+    ----------
+    A : csr_array
+        NxN matrix in CSR format
+    C : csr_array
+        Strength-of-Connection matrix
+        Must have zero diagonal
+    splitting : array
+        C/F splitting stored in an array of length N
+    theta : float in [0, 1), default None
+        theta value defining strong connections in a classical AMG
+        sense. Provide if a different SOC is used for P than for
+        CF-splitting; otherwise, theta = None.
+    norm : string, default 'min'
+        Norm used in redefining classical SOC. Options are 'min' and
+        'abs' for CSR matrices. See strength.py for more information.
+
+    Returns
+    -------
+    P : csr_array
+        Prolongator using multipass interpolation
+
+    See Also
+    --------
+    pyamg.classical.split.aggressive
+
+    References
+    ----------
+    .. [1] K. Stuben, "An Introduction to Algebraic Multigrid,"
+       In Multigrid, Trottenberg U, Oosterlee CW, Schuller A.
+       Academic Press: London, 2001; Appendix A, Sec. A.7.1.3.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.classical.interpolate import multipass_interpolation
+    >>> import numpy as np
+    >>> A = poisson((5,),format='csr')
+    >>> splitting = np.array([1,0,0,0,1], dtype='intc')
+    >>> P = multipass_interpolation(A, A, splitting)
+    >>> print(P.toarray())
+    [[1.  0. ]
+     [1.  0. ]
+     [0.5 0.5]
+     [0.  1. ]
+     [0.  1. ]]
+
+    """
+    if not issparse(A) or A.format != 'csr':
+        raise TypeError('expected csr_array for A')
+
+    if not issparse(C) or C.format != 'csr':
+        raise TypeError('expected csr_array for C')
+
+    if theta is not None:
+        C = classical_strength_of_connection(A, theta=theta, norm=norm)
+    else:
+        C = C.copy()
+    C.eliminate_zeros()
+
+    # Interpolation weights are computed based on entries in A, but subject to the
+    # sparsity pattern of C.  So, copy the entries of A into sparsity pattern of C.
+    C.data[:] = 1.0
+    C = C.multiply(A).tocsr()
+
+    passes = np.empty_like(splitting, dtype=A.indptr.dtype)
+    P_indptr = np.empty_like(A.indptr)
+    amg_core.rs_multipass_interpolation_pass1(A.shape[0], C.indptr, C.indices,
+                                              splitting, passes, P_indptr)
+    nnz = P_indptr[-1]
+    P_indices = np.empty(nnz, dtype=P_indptr.dtype)
+    P_data = np.empty(nnz, dtype=A.dtype)
+
+    amg_core.rs_multipass_interpolation_pass2(A.shape[0], A.indptr, A.indices,
+                                              A.data, C.indptr, C.indices, C.data,
+                                              splitting, passes, P_indptr,
+                                              P_indices, P_data)
+
+    nc = np.sum(splitting)
+    n = A.shape[0]
+    P = csr_array((P_data, P_indices, P_indptr), shape=[n, nc])
+    P.sort_indices()
+    return P
+
+
+def extended_interpolation(A, C, splitting, theta=None, norm='min'):
+    """Create prolongator using extended+i interpolation.
+
+    The interpolatory set of an F-point contains its strong C-neighbors and
+    the strong C-neighbors of its strong F-neighbors, so that strong
+    F-connections are distributed to distance-two C-points instead of being
+    lost.  See Eq. (4.10) of [1]_.
+
+    Parameters
+    ----------
+    A : csr_array
+        NxN matrix in CSR format
+    C : csr_array
+        Strength-of-Connection matrix
+        Must have zero diagonal
+    splitting : array
+        C/F splitting stored in an array of length N
+    theta : float in [0, 1), default None
+        theta value defining strong connections in a classical AMG
+        sense. Provide if a different SOC is used for P than for
+        CF-splitting; otherwise, theta = None.
+    norm : string, default 'min'
+        Norm used in redefining classical SOC. Options are 'min' and
+        'abs' for CSR matrices. See strength.py for more information.
+
+    Returns
+    -------
+    P : csr_array
+        Prolongator using extended+i interpolation
+
+    References
+    ----------
+    .. [1] "Distance-Two Interpolation for Parallel Algebraic Multigrid,"
+       H. De Sterck, R. Falgout, J. Nolting, U. M. Yang, (2008).
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.classical.interpolate import extended_interpolation
+    >>> import numpy as np
+    >>> A = poisson((5,),format='csr')
+    >>> splitting = np.array([1,0,0,1,1], dtype='intc')
+    >>> P = extended_interpolation(A, A, splitting)
+    >>> print(P.toarray().round(4))
+    [[1.     0.     0.    ]
+     [0.6667 0.3333 0.    ]
+     [0.3333 0.6667 0.    ]
+     [0.     1.     0.    ]
+     [0.     0.     1.    ]]
+
+    """
+    if not issparse(A) or A.format != 'csr':
+        raise TypeError('expected csr_array for A')
+
+    if not issparse(C) or C.format != 'csr':
+        raise TypeError('expected csr_array for C')
+
+    if theta is not None:
+        C = classical_strength_of_connection(A, theta=theta, norm=norm)
+    else:
+        C = C.copy()
+    C.eliminate_zeros()
+
+    P_indptr = np.empty_like(A.indptr)
+    amg_core.rs_extended_interpolation_pass1(A.shape[0], C.indptr, C.indices,
+                                             splitting, P_indptr)
+    nnz = P_indptr[-1]
+    P_indices = np.empty(nnz, dtype=P_indptr.dtype)
+    P_data = np.empty(nnz, dtype=A.dtype)
+
+    amg_core.rs_extended_interpolation_pass2(A.shape[0], A.indptr, A.indices,
+                                             A.data, C.indptr, C.indices,
+                                             splitting, P_indptr, P_indices, P_data)
+
+    nc = np.sum(splitting)
+    n = A.shape[0]
+    P = csr_array((P_data, P_indices, P_indptr), shape=[n, nc])
+    P.sort_indices()
+    return P
+
+
 def injection_interpolation(A, splitting):
     """Create interpolation operator by injection.
 
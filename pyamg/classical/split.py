@@ -31,6 +31,14 @@ PMIS: Parallel Modified Independent Set
     - Uses method similar to Luby's Maximal Independent Set algorithm.
     - See References [1] and [3]
 
+HMIS: Hybrid Modified Independent Set
+    - First pass of Ruge-Stuben, followed by PMIS for the points that the
+      first pass leaves without a strong C-neighbor.
+    - In serial, the first pass covers all points, so HMIS is the first
+      pass of Ruge-Stuben unless S is nonsymmetric and the first pass
+      leaves F-points without a strong C-neighbor.
+    - See References [3]
+
 PMISc: Parallel Modified Independent Set in Color
     - Fast construction with low operator complexity.
     - Better scalability than PMIS on structured meshes.
@@ -48,6 +56,13 @@ CLJP-c: Cleary-Luby-Jones-Plassmann in Color
     - Better scalability than CLJP on structured meshes.
     - See References [1]
 
+aggressive: Aggressive coarsening
+    - Applies one of the above methods twice, the second time to the
+      C-points with distance-two strong connections.
+    - Much lower operator complexity, requires long-range interpolation
+      such as multipass interpolation.
+    - See References [5]
+
 
 Summary
 -------
@@ -55,11 +70,18 @@ In general, methods that use a graph coloring perform better on structured
 meshes [1].  Unstructured meshes do not appear to benefit substantially
 from coloring.
 
+The random weights of PMIS, PMISc, HMIS and CLJP are counter-based: the
+weight of a node depends only on the seed and the node, and the
+independent set and weight update phases depend only on the state at the
+start of each phase.  A splitting therefore does not depend on the order
+in which nodes are processed.  The kernels themselves run serially.
+
     ========  ========  ========  ==========
      method   parallel  in color     cost
     ========  ========  ========  ==========
        RS        no        no      moderate
       PMIS      yes        no      very low
+      HMIS      yes        no        low
       PMISc     yes       yes        low
       CLJP      yes        no      moderate
       CLJPc     yes       yes      moderate
@@ -87,6 +109,10 @@ References
     Frontiers in Applied Mathematics, vol. 3.
     SIAM: Philadelphia, PA, 1987; 73-130.
 
+..  [5] K. Stuben, "An Introduction to Algebraic Multigrid,"
+    In Multigrid, Trottenberg U, Oosterlee CW, Schuller A.
+    Academic Press: London, 2001; Appendix A, 413-532.
+
 """
 import numpy as np
 from scipy.sparse import csr_array, issparse
@@ -137,8 +163,8 @@ def RS(S, second_pass=False):
     S = remove_diagonal(S)
 
     T = S.T.tocsr()  # transpose S for efficient column access
-    splitting = np.empty(S.shape[0], dtype='intc')
-    influence = np.zeros((S.shape[0],), dtype='intc')
+    splitting = np.empty(S.shape[0], dtype=S.indptr.dtype)
+    influence = np.zeros((S.shape[0],), dtype=S.indptr.dtype)
 
     amg_core.rs_cf_splitting(S.shape[0],
                              S.indptr, S.indices,
@@ -152,7 +178,7 @@ def RS(S, second_pass=False):
     return splitting
 
 
-def PMIS(S):
+def PMIS(S, seed=None):
     """C/F splitting using the Parallel Modified Independent Set method.
 
     Parameters
@@ -160,6 +186,9 @@ def PMIS(S):
     S : csr_array
         Strength of connection matrix indicating the strength between nodes i
         and j (S_ij)
+    seed : int, optional
+        Seed of the random weights.  By default, the seed is drawn from
+        numpy.random.
 
     Returns
     -------
@@ -185,7 +214,7 @@ def PMIS(S):
 
     """
     S = remove_diagonal(S)
-    weights, G, S, T = _preprocess(S)
+    weights, G, S, T = _preprocess(S, seed=seed)
     del S, T
 
     splitting = MIS(G, weights)
@@ -194,7 +223,72 @@ def PMIS(S):
     return splitting
 
 
-def PMISc(S, method='JP'):
+def HMIS(S, seed=None):
+    """C/F splitting using the Hybrid Modified Independent Set method.
+
+    The C-points of the first pass of Ruge-Stuben coarsening are kept.  The
+    F-points of the first pass without a strong C-neighbor are then split
+    with PMIS on the graph of strong connections between them.
+
+    Parameters
+    ----------
+    S : csr_array
+        Strength of connection matrix indicating the strength between nodes i
+        and j (S_ij)
+    seed : int, optional
+        Seed of the random weights of PMIS.  By default, the seed is drawn
+        from numpy.random.
+
+    Returns
+    -------
+    splitting : ndarray
+        Array of length of S of ones (coarse) and zeros (fine)
+
+    See Also
+    --------
+    RS, PMIS
+
+    Notes
+    -----
+    In parallel, the first pass is done on each processor and PMIS fixes the
+    points near the processor boundaries [1]_.  Here the first pass is done
+    for all points at once, so for a symmetric S the splitting is that of
+    ``RS(S)``, and PMIS only changes the F-points that a nonsymmetric S
+    leaves without a strong C-neighbor.
+
+    References
+    ----------
+    .. [1] Hans De Sterck, Ulrike M Yang, and Jeffrey J Heys
+       "Reducing complexity in parallel algebraic multigrid preconditioners"
+       SIAM Journal on Matrix Analysis and Applications 2006; 27:1019-1039.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.classical.split import HMIS
+    >>> S = poisson((7,), format='csr') # 1D mesh with 7 vertices
+    >>> splitting = HMIS(S)
+
+    """
+    splitting = RS(S)
+    S = remove_diagonal(S)
+
+    # F-points without a strong C-neighbor
+    S = csr_array((np.ones(S.nnz, dtype=np.int32), S.indices, S.indptr),
+                  shape=S.shape)
+    rest = (splitting == 0) & (S @ splitting == 0) & (np.diff(S.indptr) > 0)
+    rest = np.flatnonzero(rest)
+    if len(rest) > 0:
+        R = S[rest][:, rest].tocsr()
+        rest_splitting = PMIS(R, seed=seed)
+        # points without strong connections between the rest become C-points
+        rest_splitting[np.diff((R + R.T).tocsr().indptr) == 0] = 1
+        splitting[rest] = rest_splitting
+
+    return splitting
+
+
+def PMISc(S, method='JP', seed=None):
     """C/F splitting using Parallel Modified Independent Set (in color).
 
     PMIS-c, or PMIS in color, improves PMIS by perturbing the initial
@@ -210,6 +304,10 @@ def PMISc(S, method='JP'):
             * 'MIS' - Maximal Independent Set
             * 'JP'  - Jones-Plassmann (parallel)
             * 'LDF' - Largest-Degree-First (parallel)
+    seed : int, optional
+        Seed of the random weights.  By default, the seed is drawn from
+        numpy.random.  The 'JP' and 'LDF' colorings draw their own random
+        weights from numpy.random.
 
     Returns
     -------
@@ -235,12 +333,12 @@ def PMISc(S, method='JP'):
 
     """
     S = remove_diagonal(S)
-    weights, G, S, T = _preprocess(S, coloring_method=method)
+    weights, G, S, T = _preprocess(S, coloring_method=method, seed=seed)
     del S, T
     return MIS(G, weights)
 
 
-def CLJP(S, color=False):
+def CLJP(S, color=False, seed=0):
     """Compute a C/F splitting using the parallel CLJP algorithm.
 
     Parameters
@@ -250,6 +348,8 @@ def CLJP(S, color=False):
         and j (S_ij)
     color : bool
         use the CLJP coloring approach
+    seed : int
+        Seed of the random weights, if color is False.
 
     Returns
     -------
@@ -283,13 +383,13 @@ def CLJP(S, color=False):
         colorid = 1
 
     T = S.T.tocsr()  # transpose S for efficient column access
-    splitting = np.empty(S.shape[0], dtype='intc')
+    splitting = np.empty(S.shape[0], dtype=S.indptr.dtype)
 
     amg_core.cljp_naive_splitting(S.shape[0],
                                   S.indptr, S.indices,
                                   T.indptr, T.indices,
                                   splitting,
-                                  colorid)
+                                  colorid, seed)
 
     return splitting
 
@@ -333,6 +433,86 @@ def CLJPc(S):
     return CLJP(S, color=True)
 
 
+def aggressive(S, method='PMIS', num_paths=1, **kwargs):
+    """Compute a C/F splitting with aggressive coarsening.
+
+    A first splitting of S is computed with method.  The C-points of the
+    first splitting are then split again, with the strength of connection
+    between two C-points given by the strong paths of length at most two
+    between them.  Only the C-points of the second splitting are kept.
+
+    Parameters
+    ----------
+    S : csr_array
+        Strength of connection matrix indicating the strength between nodes i
+        and j (S_ij)
+    method : {'RS', 'PMIS', 'HMIS', 'PMISc', 'CLJP', 'CLJPc'}
+        Splitting method used in both stages.
+    num_paths : int
+        Number of strong paths of length at most two required for a
+        distance-two strong connection.  Use 1 for the A1 and 2 for the A2
+        scheme of [1]_; A1 coarsens more aggressively.
+    **kwargs : dict
+        Extra keywords passed to method.
+
+    Returns
+    -------
+    splitting : array
+        Array of length of S of ones (coarse) and zeros (fine)
+
+    See Also
+    --------
+    amg_core.rs_aggressive_strength_pass1,
+    pyamg.classical.interpolate.multipass_interpolation
+
+    References
+    ----------
+    .. [1] K. Stuben, "An Introduction to Algebraic Multigrid,"
+       In Multigrid, Trottenberg U, Oosterlee CW, Schuller A.
+       Academic Press: London, 2001; Appendix A, Sec. A.7.1.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.classical.split import aggressive, RS
+    >>> S = poisson((10, 10), format='csr')
+    >>> splitting = aggressive(S, 'RS')
+    >>> int(splitting.sum()) < int(RS(S).sum())
+    True
+
+    """
+    if not issparse(S) or S.format != 'csr':
+        raise TypeError('expected csr_array')
+    if num_paths < 1:
+        raise ValueError('num_paths must be >= 1')
+
+    methods = {'RS': RS, 'PMIS': PMIS, 'HMIS': HMIS, 'PMISc': PMISc,
+               'CLJP': CLJP, 'CLJPc': CLJPc}
+    if method not in methods:
+        raise ValueError(f'Unknown C/F splitting method {method}')
+    fn = methods[method]
+
+    S = remove_diagonal(S)
+    first = fn(S, **kwargs)
+    first = np.asarray(first, dtype=S.indptr.dtype)
+    nc = int(first.sum())
+
+    # distance-two strength between the C-points
+    Tp = np.empty(nc + 1, dtype=S.indptr.dtype)
+    amg_core.rs_aggressive_strength_pass1(S.shape[0], S.indptr, S.indices,
+                                          first, num_paths, Tp)
+    Tj = np.empty(Tp[-1], dtype=S.indptr.dtype)
+    amg_core.rs_aggressive_strength_pass2(S.shape[0], S.indptr, S.indices,
+                                          first, num_paths, Tp, Tj)
+    T = csr_array((np.ones(len(Tj)), Tj, Tp), shape=(nc, nc))
+
+    second = fn(T, **kwargs)
+
+    splitting = np.zeros(S.shape[0], dtype=S.indptr.dtype)
+    splitting[np.flatnonzero(first)[second == 1]] = 1
+    return splitting
+
+
 def MIS(G, weights, maxiter=None):
     """Compute a maximal independent set of a graph in parallel.
 
@@ -368,7 +548,7 @@ def MIS(G, weights, maxiter=None):
         raise TypeError('expected csr_array')
     G = remove_diagonal(G)
 
-    mis = np.empty(G.shape[0], dtype='intc')
+    mis = np.empty(G.shape[0], dtype=G.indptr.dtype)
     mis[:] = -1
 
     fn = amg_core.maximal_independent_set_parallel
@@ -385,7 +565,7 @@ def MIS(G, weights, maxiter=None):
 
 
 # internal function
-def _preprocess(S, coloring_method=None):
+def _preprocess(S, coloring_method=None, seed=None):
     """Preprocess splitting functions.
 
     Parameters
@@ -397,6 +577,8 @@ def _preprocess(S, coloring_method=None):
             * 'MIS' - Maximal Independent Set
             * 'JP'  - Jones-Plassmann (parallel)
             * 'LDF' - Largest-Degree-First (parallel)
+    seed : int, optional
+        Seed of the random weights, drawn from numpy.random by default.
 
     Returns
     -------
@@ -416,7 +598,7 @@ def _preprocess(S, coloring_method=None):
         - Replaces S.data with ones
         - Creates T = S.T in CSR format
         - Creates G = S union T in CSR format
-        - Creates random weights
+        - Creates counter-based random weights from seed
         - Augments weights with graph coloring (if use_color == True)
 
     """
@@ -437,12 +619,18 @@ def _preprocess(S, coloring_method=None):
     weights = np.ravel(T.sum(axis=1))  # initial weights
     # weights -= T.diagonal()          # discount self loops
 
+    # counter-based random weights
+    if seed is None:
+        seed = np.random.randint(np.iinfo(np.int32).max)
+    rand = np.empty(N, dtype=np.float64)
+    amg_core.counter_based_uniform(N, seed, rand)
+
     if coloring_method is None:
-        weights = weights + np.random.rand(len(weights))
+        weights = weights + rand
     else:
         coloring = vertex_coloring(G, coloring_method)
         num_colors = coloring.max() + 1
-        weights = (weights + (np.random.rand(len(weights)) + coloring)
+        weights = (weights + (rand + coloring)
                    / num_colors)
 
     return (weights, G, S, T)
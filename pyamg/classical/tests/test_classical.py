@@ -2,11 +2,12 @@
 import warnings
 
 import numpy as np
+import pytest
 
 from numpy.testing import TestCase, assert_equal, assert_almost_equal, \
     assert_array_almost_equal
 
-from scipy.sparse import csr_array, coo_array, SparseEfficiencyWarning
+from scipy.sparse import csr_array, coo_array, diags_array, SparseEfficiencyWarning
 
 from pyamg.gallery import poisson, load_example
 from pyamg.strength import classical_strength_of_connection
@@ -14,7 +15,7 @@ from pyamg.strength import classical_strength_of_connection
 from pyamg.classical import split
 from pyamg.classical.classical import ruge_stuben_solver
 from pyamg.classical.interpolate import direct_interpolation, \
-    classical_interpolation
+    classical_interpolation, multipass_interpolation, extended_interpolation
 
 
 class TestRugeStubenFunctions(TestCase):
@@ -77,6 +78,24 @@ class TestRugeStubenFunctions(TestCase):
             # Y = (S @ S.T) - X
             # assert(Y.nnz == 0 or Y.data.min() > 0)
 
+    def test_hmis_splitting(self):
+        for A, _ in self.cases:
+            S = classical_strength_of_connection(A, 0.25)
+
+            splitting = split.HMIS(S)
+
+            assert splitting.min() >= 0     # could be all 1s
+            assert_equal(splitting.max(), 1)
+
+            S.setdiag(0)
+            S.eliminate_zeros()
+            S.data[:] = 1
+
+            # check that all F-nodes with strong connections are strongly
+            # connected to a C-node
+            covered = (splitting + S @ splitting) > 0
+            assert covered[np.diff(S.indptr) > 0].all()
+
     def test_cljp_splitting(self):
         for A, _ in self.cases:
             S = classical_strength_of_connection(A, 0.0)
@@ -129,6 +148,74 @@ class TestRugeStubenFunctions(TestCase):
 
             assert_array_almost_equal(result.data, expected.data)
 
+    def test_aggressive_splitting(self):
+        from pyamg import amg_core
+        for A, _ in self.cases:
+            S = classical_strength_of_connection(A, 0.25)
+            S.setdiag(0)
+            S.eliminate_zeros()
+            S.data[:] = 1
+            first = split.RS(S)
+            Cpts = np.flatnonzero(first)
+
+            # distance-two strength between C-points against S + S^2
+            for num_paths in [1, 2]:
+                Tp = np.empty(len(Cpts) + 1, dtype=S.indptr.dtype)
+                amg_core.rs_aggressive_strength_pass1(A.shape[0], S.indptr, S.indices,
+                                                      first, num_paths, Tp)
+                Tj = np.empty(Tp[-1], dtype=S.indptr.dtype)
+                amg_core.rs_aggressive_strength_pass2(A.shape[0], S.indptr, S.indices,
+                                                      first, num_paths, Tp, Tj)
+                T = csr_array((np.ones(len(Tj)), Tj, Tp), shape=(len(Cpts),) * 2)
+                paths = (S + S @ S)[Cpts][:, Cpts].toarray()
+                np.fill_diagonal(paths, 0)
+                assert_equal(T.toarray(), paths >= num_paths)
+
+            # C-points are a subset of the first stage C-points
+            splitting = split.aggressive(S, method='RS')
+            assert (splitting <= first).all()
+            for method in ['PMIS', 'CLJP']:
+                splitting = split.aggressive(S, method=method)
+                assert_equal(set(np.unique(splitting)) <= {0, 1}, True)
+
+    def test_multipass_interpolation(self):
+        for A, label in self.cases:
+            S = classical_strength_of_connection(A, 0.25)
+            splitting = split.aggressive(S, method='RS')
+            if splitting.sum() == 0:
+                continue
+            P = multipass_interpolation(A, S, splitting)
+            assert_equal(P.shape, (A.shape[0], splitting.sum()))
+            assert_almost_equal(P[splitting == 1].toarray(), np.eye(splitting.sum()))
+            assert np.isfinite(P.data).all()
+            if label.startswith('poisson'):
+                # every F-point is interpolated, and constants are
+                # interpolated exactly for zero row sums
+                assert (np.diff(P.indptr) > 0).all()
+                L = A - diags_array(A.sum(axis=1)).tocsr()
+                P = multipass_interpolation(L, S, splitting)
+                assert_almost_equal(P.sum(axis=1), 1)
+
+    def test_extended_interpolation(self):
+        for A, label in self.cases:
+            if not label.startswith('poisson'):
+                continue
+            S = classical_strength_of_connection(A, 0.25)
+            splitting = split.PMIS(S)
+            P = extended_interpolation(A, S, splitting)
+            assert_almost_equal(P[splitting == 1].toarray(), np.eye(splitting.sum()))
+            # constants are interpolated exactly for zero row sums
+            L = A - diags_array(A.sum(axis=1)).tocsr()
+            P = extended_interpolation(L, S, splitting)
+            assert_almost_equal(P.sum(axis=1)[splitting == 0], 1)
+
+            # reduces to direct interpolation without strong F-F connections
+            splitting = np.ones(A.shape[0], dtype='intc')
+            splitting[1::2] = 0
+            if 'x' not in label:
+                assert_almost_equal(extended_interpolation(A, S, splitting).toarray(),
+                                    direct_interpolation(A, S, splitting).toarray())
+
     def test_remove_strong_FF_connections(self):
         from pyamg import amg_core
         # test removing an F-F connection without any strong C in between (4--2),
@@ -181,6 +268,32 @@ class TestSolverPerformance(TestCase):
                 avg_convergence_ratio = (res[-1]/res[0])**(1.0/len(res))
                 assert (avg_convergence_ratio < 0.20)
 
+    def test_aggressive_coarsening(self):
+        A = poisson((20, 20, 20), format='csr')
+        np.random.seed(0)
+        b = np.random.rand(A.shape[0])
+
+        ml = ruge_stuben_solver(A)
+        for CF, interpolation in [('aggressive', 'multipass'),
+                                  ([('aggressive', {'method': 'PMIS'}), 'PMIS'],
+                                   ['multipass', 'extended']),
+                                  ([('aggressive', {'num_paths': 2}), 'RS'],
+                                   ['multipass', 'classical'])]:
+            mla = ruge_stuben_solver(A, CF=CF, interpolation=interpolation)
+            assert mla.operator_complexity() < 1.6
+            assert mla.operator_complexity() < ml.operator_complexity()
+
+            res = []
+            mla.solve(b, tol=1e-8, maxiter=50, residuals=res, accel='cg')
+            assert res[-1] < 1e-8 * res[0]
+
+        # other interpolations leave F-points with zero rows in P
+        for CF, interpolation in [('aggressive', 'classical'),
+                                  ([('aggressive', {'method': 'PMIS'}), 'PMIS'],
+                                   [('direct', {}), 'extended'])]:
+            with pytest.raises(ValueError, match='multipass'):
+                ruge_stuben_solver(A, CF=CF, interpolation=interpolation)
+
     def test_matrix_formats(self):
         warnings.simplefilter('ignore', SparseEfficiencyWarning)
 
@@ -198,6 +311,25 @@ class TestSolverPerformance(TestCase):
             assert np.abs(np.ravel(Ac_old - Ac_new)).max() < 0.01
             rs_old = rs_new
 
+    def test_int64_indices(self):
+        # 64-bit index arrays are kept on all levels and give the same solver
+        A = poisson((20, 20), format='csr')
+        A64 = csr_array((A.data, A.indices.astype(np.int64),
+                         A.indptr.astype(np.int64)), shape=A.shape)
+        for kwargs in [{}, {'CF': 'PMIS', 'interpolation': 'extended'},
+                       {'CF': 'CLJP'}, {'CF': 'CR'}]:
+            np.random.seed(1730228)
+            rs = ruge_stuben_solver(A, max_coarse=10, **kwargs)
+            np.random.seed(1730228)
+            rs64 = ruge_stuben_solver(A64, max_coarse=10, **kwargs)
+            for level in rs64.levels:
+                assert level.A.indptr.dtype == np.int64
+                assert level.A.indices.dtype == np.int64
+
+            b = np.random.rand(A.shape[0])
+            assert_array_almost_equal(rs64.solve(b, maxiter=5, tol=1e-20),
+                                      rs.solve(b, maxiter=5, tol=1e-20))
+
 
 #   reference implementations for unittests  #
 def reference_direct_interpolation(A, S, splitting):
@@ -1,9 +1,10 @@
 """Test compatible relaxation."""
 import numpy as np
-from numpy.testing import TestCase
+from numpy.testing import TestCase, assert_allclose
 from scipy.sparse import csr_array
 from pyamg.gallery import poisson, load_example
-from pyamg.classical.cr import binormalize, CR
+from pyamg.classical.cr import binormalize, CR, _CRsweep
+from pyamg.relaxation.relaxation import gauss_seidel, gauss_seidel_indexed
 
 
 class TestCR(TestCase):
@@ -33,6 +34,36 @@ class TestCR(TestCase):
             alpha = abs(1.0-C.multiply(C).sum(axis=1)).max()
             assert alpha < 1e-4
 
+    def test_crsweep(self):
+        np.random.seed(3271941)
+        A = poisson((10, 10), format='csr')
+        B = np.random.rand(A.shape[0], 1)
+        Cindex = np.arange(0, A.shape[0], 3, dtype=np.intc)
+        Findex = np.setdiff1d(np.arange(A.shape[0], dtype=np.intc), Cindex)
+
+        for method in ['habituated', 'concurrent']:
+            # reference sweeps
+            z = np.zeros(A.shape[0])
+            e = B[:, 0].copy()
+            e[Cindex] = 0.0
+            enorm = np.linalg.norm(e)
+            rhok, it = 1, 0
+            while True:
+                if method == 'habituated':
+                    gauss_seidel(A, e, z, iterations=1)
+                    e[Cindex] = 0.0
+                else:
+                    gauss_seidel_indexed(A, e, z, indices=Findex, iterations=1)
+                rhok_old, rhok = rhok, np.linalg.norm(e) / enorm
+                enorm = np.linalg.norm(e)
+                it += 1
+                if rhok < 0.07 or (abs(rhok - rhok_old) / rhok < 0.1 and it >= 3):
+                    break
+
+            rho, e2 = _CRsweep(A, B, Findex, Cindex, 3, 0.7, method)
+            assert_allclose(rho, rhok)
+            assert_allclose(e2, e)
+
     def test_cr(self):
         A = self.cases[6]
 
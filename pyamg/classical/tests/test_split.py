@@ -2,6 +2,7 @@
 
 import numpy as np
 from numpy.testing import assert_array_equal
+from scipy import sparse
 import pyamg
 
 
@@ -31,3 +32,71 @@ class TestMIS:
                       [0, 1, 0, 0, 0, 1, 0],
                       [0, 0, 0, 1, 0, 0, 0]], dtype=np.int32)
         assert_array_equal(splitting.reshape((7, 7)), splitting_paper)
+
+    def test_greedy_order(self):
+        # the MIS is the greedy MIS in order of decreasing weight, so it does
+        # not depend on the order of the vertices
+        np.random.seed(2417839)
+        S = pyamg.gallery.poisson((15, 15), format='csr')
+        w = np.random.rand(S.shape[0])
+        splitting = pyamg.classical.split.MIS(S, w)
+
+        expected = np.zeros(S.shape[0], dtype=np.int32)
+        blocked = np.zeros(S.shape[0], dtype=bool)
+        for i in np.argsort(-w, kind='stable'):
+            if not blocked[i]:
+                expected[i] = 1
+                blocked[S.indices[S.indptr[i]:S.indptr[i+1]]] = True
+        assert_array_equal(splitting, expected)
+
+        p = np.random.permutation(S.shape[0])
+        Sp = S[p][:, p].tocsr()
+        assert_array_equal(pyamg.classical.split.MIS(Sp, w[p]), splitting[p])
+
+
+class TestHMIS:
+    def test_symmetric(self):
+        # the first pass reaches every F-point of a symmetric S
+        S = pyamg.gallery.poisson((15, 15), format='csr')
+        split = pyamg.classical.split
+        assert_array_equal(split.HMIS(S, seed=0), split.RS(S))
+
+    def test_pmis_stage(self):
+        # upwind strength on a 10x10 grid, each point depends only on its
+        # west and south neighbors
+        n = 10
+        I = sparse.eye_array(n)
+        D = sparse.eye_array(n, k=-1)
+        S = sparse.csr_array(sparse.kron(I, D) + sparse.kron(D, I))
+        split = pyamg.classical.split
+        rs = split.RS(S)
+        splitting = split.HMIS(S, seed=0)
+        assert (splitting != rs).any()
+
+        # the C-points of the first pass are kept and every F-point with
+        # strong connections has a strong C-neighbor
+        assert (splitting[rs == 1] == 1).all()
+        fpts = np.flatnonzero((splitting == 0) & (np.diff(S.indptr) > 0))
+        assert (S[fpts] @ splitting > 0).all()
+
+
+class TestCounterBasedWeights:
+    def test_seed(self):
+        S = pyamg.gallery.poisson((20, 20), format='csr')
+        split = pyamg.classical.split
+        for fn, kwargs in [(split.PMIS, {}), (split.PMISc, {'method': 'MIS'}),
+                           (split.HMIS, {}), (split.CLJP, {})]:
+            np.random.seed(0)
+            s0 = fn(S, seed=5, **kwargs)
+            np.random.seed(1)
+            assert_array_equal(fn(S, seed=5, **kwargs), s0)
+
+        # weights depend only on the seed and the index
+        x = np.empty(100)
+        y = np.empty(40)
+        pyamg.amg_core.counter_based_uniform(100, 7, x)
+        pyamg.amg_core.counter_based_uniform(40, 7, y)
+        assert_array_equal(x[:40], y)
+        assert x.min() >= 0
+        assert x.max() < 1
+        assert abs(x.mean() - 0.5) < 0.1
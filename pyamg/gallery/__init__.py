@@ -5,6 +5,7 @@ Functions
     - poisson() : Poisson problem using Finite Differences
     - linear_elasticity() : Linear Elasticity using Finite Elements
     - stencil_grid() : General stencil generation from 1D, 2D, and 3D
+    - StencilOperator : Matrix-free operator of a stencil on a regular grid
     - diffusion_stencil_2d() : 2D rotated anisotropic FE/FD stencil
 """
 
@@ -17,7 +18,7 @@ from . import fem
 from .elasticity import linear_elasticity, linear_elasticity_p1
 from .example import load_example
 from .laplacian import poisson, gauge_laplacian
-from .stencil import stencil_grid
+from .stencil import stencil_grid, StencilOperator
 from .mesh import regular_triangle_mesh
 from .diffusion import diffusion_stencil_2d
 from .advection import advection_2d
@@ -26,6 +27,7 @@ from .random_sparse import sprand  # note: could use scipy.sparse.random_array
 from .demo import demo
 
 __all__ = [
+    'StencilOperator',
     'advection_2d',
     'demo',
     'diffusion',
@@ -2,7 +2,8 @@
 # pylint: disable=redefined-builtin
 
 import numpy as np
-from scipy import sparse
+
+from ..util.stencil import StencilOperator, stencil_matrix
 
 
 def stencil_grid(S, grid, dtype=None, format=None):
@@ -17,11 +18,12 @@ def stencil_grid(S, grid, dtype=None, format=None):
     dtype : dtype
         Data type of the result.
     format : str
-        Sparse array format to return, e.g. "csr", "coo", etc.
+        Sparse array format to return, e.g. "csr", "coo", etc., or
+        "operator" for a matrix-free StencilOperator.
 
     Returns
     -------
-    sparray
+    sparray or StencilOperator
         Sparse array which represents the operator given by applying
         stencil S at each vertex of a regular grid with given dimensions.
 
@@ -63,73 +65,7 @@ def stencil_grid(S, grid, dtype=None, format=None):
            [ 0.,  0.,  0.,  0.,  0., -1.,  0., -1.,  4.]])
 
     """
-    S = np.asarray(S, dtype=dtype)
-    grid = tuple(grid)
-
-    if not (np.asarray(S.shape) % 2 == 1).all():
-        raise ValueError('all stencil dimensions must be odd')
-
-    if len(grid) != np.ndim(S):
-        raise ValueError('stencil dimension must equal number of grid\
-                          dimensions')
-
-    if min(grid) < 1:
-        raise ValueError('grid dimensions must be positive')
-
-    N_v = np.prod(grid)  # number of vertices in the mesh
-    N_s = (S != 0).sum()    # number of nonzero stencil entries
-
-    # diagonal offsets
-    diags = np.zeros(N_s, dtype=int)
-
-    # compute index offset of each dof within the stencil
-    strides = np.cumprod([1] + list(reversed(grid)))[:-1]  # noqa: RUF005
-    indices = tuple(i.astype(np.int32) for i in S.nonzero())
-    for i, s in zip(indices, S.shape):
-        i -= s // 2
-        # i = (i - s) // 2
-        # i = i // 2
-        # i = i - (s // 2)
-    for stride, coords in zip(strides, reversed(indices)):
-        diags += stride * coords
-
-    data = S[S != 0].repeat(N_v).reshape(N_s, N_v)
-
-    indices = np.vstack(indices).T
-
-    # zero boundary connections
-    for index, diag in zip(indices, data):
-        diag = diag.reshape(grid)
-        for n, i in enumerate(index):
-            if i > 0:
-                s = [slice(None)] * len(grid)
-                s[n] = slice(0, i)
-                s = tuple(s)
-                diag[s] = 0
-            elif i < 0:
-                s = [slice(None)]*len(grid)
-                s[n] = slice(i, None)
-                s = tuple(s)
-                diag[s] = 0
-
-    # remove diagonals that lie outside matrix
-    mask = abs(diags) < N_v
-    if not mask.all():
-        diags = diags[mask]
-        data = data[mask]
-
-    # sum duplicate diagonals
-    if len(np.unique(diags)) != len(diags):
-        new_diags = np.unique(diags)
-        new_data = np.zeros((len(new_diags), data.shape[1]),
-                            dtype=data.dtype)
-
-        for dia, dat in zip(diags, data):
-            n = np.searchsorted(new_diags, dia)
-            new_data[n, :] += dat
-
-        diags = new_diags
-        data = new_data
+    if format == 'operator':
+        return StencilOperator(S, grid, dtype=dtype)
 
-    return sparse.dia_array((data, diags),
-                             shape=(N_v, N_v)).asformat(format)
+    return stencil_matrix(np.asarray(S, dtype=dtype), grid, format=format)
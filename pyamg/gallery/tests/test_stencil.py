@@ -1,8 +1,8 @@
 """Test stencil construction."""
 import numpy as np
-from pyamg.gallery.stencil import stencil_grid
+from pyamg.gallery.stencil import stencil_grid, StencilOperator
 
-from numpy.testing import TestCase, assert_equal
+from numpy.testing import TestCase, assert_equal, assert_allclose
 
 
 class TestStencil(TestCase):
@@ -131,3 +131,28 @@ class TestStencil(TestCase):
         for grid, expected in cases:
             result = stencil_grid(stencil, grid).toarray()
             assert_equal(result, expected)
+
+    def test_operator(self):
+        np.random.seed(1062024)
+        cases = [(np.array([1, 2, 3]), (5,)),
+                 (np.array([1, 2, 3, 4, 5]), (2,)),  # entries outside the grid
+                 (np.array([[0, -1, 0], [-1, 4, -1], [0, -1, 0]]), (4, 6)),
+                 (np.random.rand(3, 3) + 1j * np.random.rand(3, 3), (5, 4)),
+                 (np.random.rand(3, 5, 3), (4, 2, 5))]
+
+        for S, grid in cases:
+            A = stencil_grid(S, grid, format='operator')
+            assert isinstance(A, StencilOperator)
+            expected = stencil_grid(S, grid, dtype=A.dtype, format='csr')
+
+            assert_equal(A.shape, expected.shape)
+            assert_equal(A.nnz, expected.nnz)
+            assert_equal(A.toarray(), expected.toarray())
+            assert_equal(A.diagonal(), expected.diagonal())
+
+            x = np.random.rand(A.shape[0])
+            X = np.random.rand(A.shape[0], 3)
+            assert_allclose(A @ x, expected @ x)
+            assert_allclose(A @ X, expected @ X)
+            assert_allclose(A.T @ x, expected.T @ x)
+            assert_allclose(A.H @ x, expected.T.conjugate() @ x)
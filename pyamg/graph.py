@@ -62,7 +62,7 @@ def maximal_independent_set(G, algo='serial', k=None):
     G = asgraph(G)
     N = G.shape[0]
 
-    mis = np.empty(N, dtype='intc')
+    mis = np.empty(N, G.indptr.dtype)
     mis[:] = -1
 
     if k is None:
@@ -109,7 +109,7 @@ def vertex_coloring(G, method='MIS'):
     G = asgraph(G)
     N = G.shape[0]
 
-    coloring = np.empty(N, dtype='intc')
+    coloring = np.empty(N, G.indptr.dtype)
 
     if method == 'MIS':
         fn = amg_core.vertex_coloring_mis
@@ -138,8 +138,10 @@ def bellman_ford(G, centers, method='standard', tiebreaking=True):
     method : string
         - 'standard': base implementation of Bellman-Ford.
         - 'balanced': a balanced version of Bellman-Ford.
+        - 'dijkstra': multi-source Dijkstra, same distances as 'standard'.
+        - 'dijkstra_balanced': Dijkstra version of 'balanced'.
     tiebreaking : bool
-        Tie break flag if ``method='balanced'``.
+        Tie break flag if ``method='balanced'`` or ``method='dijkstra_balanced'``.
 
     Returns
     -------
@@ -164,6 +166,11 @@ def bellman_ford(G, centers, method='standard', tiebreaking=True):
     could be run `for seed in seeds`.  Also note that ``test_graph.py`` tests
     against ``csgraph.bellman_ford(G.T)``.
 
+    Bellman-Ford sweeps every edge until no distance changes, which costs
+    O(n * diameter).  The Dijkstra variants settle the nodes with a priority
+    queue in O(E log n) and compute the same distances; only the choice
+    among equidistant centers may differ.
+
     """
     G = asgraph(G)
     n = G.shape[0]
@@ -174,33 +181,44 @@ def bellman_ford(G, centers, method='standard', tiebreaking=True):
     if G.dtype == complex:
         raise ValueError('Bellman-Ford is defined only for real weights.')
 
-    centers = np.asarray(centers, dtype=np.int32)
+    index_type = G.indptr.dtype
+    centers = np.asarray(centers, dtype=index_type)
     num_clusters = len(centers)
 
     # allocate space for returns and working arrays
-    distances = np.full(n, np.inf, dtype=G.dtype)  # distance to cluster center (inf)
-    nearest = np.full(n, -1, dtype=np.int32)       # nearest center, cluster membership (-1)
-    predecessors = np.full(n, -1, dtype=np.int32)  # predecessor on the shortest path (-1)
-    distances[centers] = 0                         # distance = 0 at centers
-    nearest[centers] = np.arange(num_clusters)     # number the membership
+    distances = np.full(n, np.inf, dtype=G.dtype)    # distance to cluster center (inf)
+    nearest = np.full(n, -1, dtype=index_type)       # nearest center, membership (-1)
+    predecessors = np.full(n, -1, dtype=index_type)  # predecessor on the shortest path (-1)
+    distances[centers] = 0                           # distance = 0 at centers
+    nearest[centers] = np.arange(num_clusters)       # number the membership
 
     if method == 'standard':
         amg_core.bellman_ford(n, G.indptr, G.indices, G.data, centers,  # IN
                               distances, nearest, predecessors)         # OUT
     elif method == 'balanced':
-        predecessors_count = np.full(n, 0, dtype=np.int32)
-        cluster_size = np.full(num_clusters, 1, dtype=np.int32)
+        predecessors_count = np.full(n, 0, dtype=index_type)
+        cluster_size = np.full(num_clusters, 1, dtype=index_type)
         amg_core.bellman_ford_balanced(n, G.indptr, G.indices, G.data, centers,  # IN
                                        distances, nearest, predecessors,         # OUT
                                        predecessors_count, cluster_size,         # OUT
                                        tiebreaking)
+    elif method == 'dijkstra':
+        amg_core.dijkstra(n, G.indptr, G.indices, G.data, centers,  # IN
+                          distances, nearest, predecessors)         # OUT
+    elif method == 'dijkstra_balanced':
+        predecessors_count = np.full(n, 0, dtype=index_type)
+        cluster_size = np.full(num_clusters, 1, dtype=index_type)
+        amg_core.dijkstra_balanced(n, G.indptr, G.indices, G.data, centers,  # IN
+                                   distances, nearest, predecessors,         # OUT
+                                   predecessors_count, cluster_size,         # OUT
+                                   tiebreaking)
     else:
         raise ValueError(f'Method {method} is not supported in Bellman-Ford')
 
     return distances, nearest, predecessors
 
 
-def lloyd_cluster(G, centers, maxiter=5):
+def lloyd_cluster(G, centers, maxiter=5, method='bellman_ford'):
     """Perform Lloyd clustering on graph with weighted edges.
 
     Parameters
@@ -214,6 +232,11 @@ def lloyd_cluster(G, centers, maxiter=5):
         and n-1 that will be used as the initial centers for clustering.
     maxiter : int
         Maximum number of iterations.
+    method : {'bellman_ford', 'dijkstra'}
+        Shortest path algorithm used to assign nodes to the nearest center.
+        'dijkstra' settles nodes with a priority queue, O(E log n) per
+        iteration instead of O(n * diameter), and is preferred for large
+        graphs.
 
     Returns
     -------
@@ -240,11 +263,12 @@ def lloyd_cluster(G, centers, maxiter=5):
         if G.data.min() < 0:
             raise ValueError('Lloyd Clustering is defined only for positive weights.')
 
+    index_type = G.indptr.dtype
     if np.isscalar(centers):
         centers = np.random.permutation(n)[:centers]
-        centers = np.int32(centers)
+        centers = centers.astype(index_type)
     else:
-        centers = np.asarray(centers, dtype=np.int32)
+        centers = np.asarray(centers, dtype=index_type)
 
     num_clusters = len(centers)
 
@@ -257,16 +281,21 @@ def lloyd_cluster(G, centers, maxiter=5):
     if centers.max() >= n:
         raise ValueError(f'invalid center index {centers.max()}')
 
+    if method == 'bellman_ford':
+        shortest_paths = amg_core.bellman_ford
+    elif method == 'dijkstra':
+        shortest_paths = amg_core.dijkstra
+    else:
+        raise ValueError(f'Method {method} is not supported in Lloyd clustering')
+
     distances = np.full(n, np.inf, dtype=G.dtype)
-    clusters = np.full(n, -1, dtype=np.int32)
-    predecessors = np.full(n, -1, dtype=np.int32)
+    clusters = np.full(n, -1, dtype=index_type)
+    predecessors = np.full(n, -1, dtype=index_type)
     distances[centers] = 0
     clusters[centers] = np.arange(num_clusters)
     changed = True
     it = 0
 
-    _dist, _near, _pred = bellman_ford(G, centers, method='standard')
-
     while changed and it < maxiter:
         if it > 0:
             distances.fill(np.inf)
@@ -275,8 +304,8 @@ def lloyd_cluster(G, centers, maxiter=5):
             distances[centers] = 0
             clusters[centers] = np.arange(num_clusters)
 
-        amg_core.bellman_ford(n, G.indptr, G.indices, G.data, centers,  # IN
-                              distances, clusters, predecessors)        # OUT
+        shortest_paths(n, G.indptr, G.indices, G.data, centers,  # IN
+                       distances, clusters, predecessors)        # OUT
 
         changed = amg_core.most_interior_nodes(n, G.indptr, G.indices, G.data, centers,
                                                distances, clusters, predecessors)
@@ -286,7 +315,8 @@ def lloyd_cluster(G, centers, maxiter=5):
     return clusters, centers
 
 
-def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking=True):
+def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking=True,
+                           method='bellman_ford'):
     """Perform Lloyd clustering on graph with weighted edges.
 
     Parameters
@@ -305,6 +335,12 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
         Number of post-Lloyd rebalancing iterations to run.
     tiebreaking : bool, default True
         Flag for triggering tiebreaking.
+    method : {'bellman_ford', 'dijkstra'}
+        'bellman_ford' uses bellman_ford_balanced and Floyd-Warshall to find
+        the cluster centers.  'dijkstra' uses dijkstra_balanced and one
+        Dijkstra search per node, restricted to its cluster, which avoids
+        the dense per-cluster distance matrices and is preferred for large
+        graphs.
 
     Returns
     -------
@@ -337,11 +373,12 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
         if G.data.min() < 0:
             raise ValueError('Lloyd Clustering is defined only for positive weights.')
 
+    index_type = G.indptr.dtype
     if np.isscalar(centers):
         centers = np.random.permutation(n)[:centers]  # same as np.random.choice()
-        centers = np.int32(centers)
+        centers = centers.astype(index_type)
     else:
-        centers = np.asarray(centers, dtype=np.int32)
+        centers = np.asarray(centers, dtype=index_type)
 
     num_clusters = len(centers)
 
@@ -354,28 +391,29 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
     if centers.max() >= n:
         raise ValueError(f'invalid center index {centers.max()}')
 
+    if method not in ('bellman_ford', 'dijkstra'):
+        raise ValueError(f'Method {method} is not supported in Lloyd clustering')
+
     # create work arrays for C++
     # empty() values are initialized in the kernel
     maxsize = int(12*np.ceil(n / num_clusters))
 
-    d = np.full(n, np.inf, dtype=G.dtype)         # distance to cluster center (inf)
-    m = np.full(n, -1, dtype=np.int32)            # cluster membership or index (-1)
-    p = np.full(n, -1, dtype=np.int32)            # predecessor on the shortest path (-1)
-    pc = np.full(n, 0, dtype=np.int32)            # predecessor count (0)
-    s = np.full(num_clusters, 1, dtype=np.int32)  # cluster size (1)
-    d[centers] = 0                                # distance = 0 at centers
-    m[centers] = np.arange(num_clusters)          # number the membership
-
-    Cptr = np.empty(num_clusters, dtype=np.int32)    # ptr to start in C for each cluster
-    CC = np.empty(n, dtype=np.int32)                 # FW global index for current cluster
-
-    D = np.empty(maxsize*maxsize, dtype=G.dtype)     # FW distance array
-    P = np.empty(maxsize*maxsize, dtype=np.int32)    # FW predecessor array
-    L = np.empty(n, dtype=np.int32)                  # FW local index for current cluster
-    q = np.empty(maxsize, dtype=G.dtype)             # FW work array for d**2
-
-    # global work array for distances
-    dist_all = np.empty((num_clusters, maxsize*maxsize), dtype=G.dtype, order='C')
+    d = np.full(n, np.inf, dtype=G.dtype)           # distance to cluster center (inf)
+    m = np.full(n, -1, dtype=index_type)            # cluster membership or index (-1)
+    p = np.full(n, -1, dtype=index_type)            # predecessor on the shortest path (-1)
+    pc = np.full(n, 0, dtype=index_type)            # predecessor count (0)
+    s = np.full(num_clusters, 1, dtype=index_type)  # cluster size (1)
+    d[centers] = 0                                  # distance = 0 at centers
+    m[centers] = np.arange(num_clusters)            # number the membership
+
+    # dense Floyd-Warshall arrays for center_nodes
+    if method == 'bellman_ford':
+        Cptr = np.empty(num_clusters, dtype=index_type)  # ptr to start in C per cluster
+        CC = np.empty(n, dtype=index_type)               # FW global index in the cluster
+        D = np.empty(maxsize*maxsize, dtype=G.dtype)     # FW distance array
+        P = np.empty(maxsize*maxsize, dtype=index_type)  # FW predecessor array
+        L = np.empty(n, dtype=index_type)                # FW local index in the cluster
+        q = np.empty(maxsize, dtype=G.dtype)             # FW work array for d**2
 
     for riter in range(rebalance_iters+1):
 
@@ -394,19 +432,28 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
         d[centers] = 0
         m[centers] = np.arange(num_clusters)
         while (changed1 or changed2) and (it < maxiter):
-            changed1 = amg_core.bellman_ford_balanced(n, G.indptr, G.indices, G.data,
+            if method == 'dijkstra':
+                changed1 = amg_core.dijkstra_balanced(n, G.indptr, G.indices, G.data,
                                                       centers, d, m, p, pc, s, tiebreaking)
+            else:
+                changed1 = amg_core.bellman_ford_balanced(n, G.indptr, G.indices, G.data,
+                                                          centers, d, m, p, pc, s,
+                                                          tiebreaking)
 
-            if s.max() > maxsize:
+            if method == 'bellman_ford' and s.max() > maxsize:
                 raise ValueError('maxsize (maximum cluster size) is too small')
 
             if m.min() < 0 or d.min() < 0:
                 raise ValueError('Encountered a disconnected nodes from m or d:  '
                                  f'{m.min()=} {d.min()=})')
 
-            changed2 = amg_core.center_nodes(n, G.indptr, G.indices, G.data,
-                                             Cptr, D, P, CC, L, q,
-                                             centers, d, m, p, pc, s)
+            if method == 'dijkstra':
+                changed2 = amg_core.center_nodes_dijkstra(n, G.indptr, G.indices, G.data,
+                                                          centers, d, m, p, pc, s)
+            else:
+                changed2 = amg_core.center_nodes(n, G.indptr, G.indices, G.data,
+                                                 Cptr, D, P, CC, L, q,
+                                                 centers, d, m, p, pc, s)
 
             it += 1
 
@@ -423,19 +470,8 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
         if num_clusters < 2:
             break
 
-        # calculate distances
-        dist_all.fill(np.inf)
-        for a in range(num_clusters):
-            N = s[a]  # cluster size
-            Nloc = Cptr[a]+N
-            if Nloc >= G.shape[0]:
-                Nloc = None
-            P.fill(-1)
-            amg_core.floyd_warshall(G.shape[0], G.indptr, G.indices, G.data,
-                                    dist_all[a, :].ravel(), P, CC[Cptr[a]:Nloc], L,
-                                    m, a, N)
         # rebalance
-        centers, rebalance_change = _rebalance(G, centers, m, d, dist_all, num_clusters)
+        centers, rebalance_change = _rebalance(G, centers, m, d, num_clusters)
 
         # rebalance did nothing
         if not rebalance_change:
@@ -444,7 +480,7 @@ def balanced_lloyd_cluster(G, centers, maxiter=5, rebalance_iters=5, tiebreaking
     return m, centers
 
 
-def _rebalance(G, c, m, d, dist_all, num_clusters):
+def _rebalance(G, c, m, d, num_clusters):
     """Rebalance clusters.
 
     Parameters
@@ -457,8 +493,6 @@ def _rebalance(G, c, m, d, dist_all, num_clusters):
         Cluster membership.
     d : array
         Distance to cluster center.
-    dist_all : array
-        Node-to-node distance for every node in each cluster.
     num_clusters : int
         Number of clusters (= number centers).
 
@@ -469,109 +503,32 @@ def _rebalance(G, c, m, d, dist_all, num_clusters):
     bool
         Indicate whether centers has changed.
 
-    """
-    newc = c.copy()
+    Notes
+    -----
+    The cluster with the smallest elimination penalty is eliminated and the
+    cluster with the largest split improvement is split, as long as the
+    penalty does not exceed the improvement and neither cluster neighbors an
+    already modified cluster.  See amg_core.rebalance_measures and
+    amg_core.rebalance_centers.
 
-    # aggregate-to-aggregate neighbors
-    AggOp = sparse.coo_array((np.ones(len(m)), (np.arange(len(m)), m))).tocsr()
-    Agg2Agg = AggOp.T @ G @ AggOp
-    Agg2Agg = Agg2Agg.tocsr()
+    """
+    index_type = G.indptr.dtype
+    newc = np.array(c, dtype=index_type)
 
     # calculate elimination and split measures
-    E = _elimination_penalty(G, m, d, dist_all, num_clusters)
-    S, c1, c2 = _split_improvement(m, d, dist_all, num_clusters)
-
-    # sort both ascending
-    M = np.ones(num_clusters, dtype=bool)
-    Esortidx = np.argsort(E)
-    Ssortidx = np.argsort(S)
-
-    i_e = 0               # elimination index
-    i_s = num_clusters-1  # splitting index
+    E = np.empty(num_clusters, dtype=G.dtype)
+    S = np.empty(num_clusters, dtype=G.dtype)
+    c1 = np.empty(num_clusters, dtype=index_type)
+    c2 = np.empty(num_clusters, dtype=index_type)
+    amg_core.rebalance_measures(G.shape[0], G.indptr, G.indices, G.data, d, m,
+                                E, S, c1, c2)
 
-    rebalance_change = False
-    # 0, 1, ..., num_clusters-1
-    while i_e <= (num_clusters-1) and i_s >= 0:
-        a_e = Esortidx[i_e]
-        a_s = Ssortidx[i_s]
-
-        if not M[a_e] or a_e == a_s:  # is cluster a_e modifiable and distinct from a_s?
-            i_e += 1
-            continue
-
-        if not M[a_s]:                # is cluster a_s modifiable?
-            i_s -= 1
-            continue
-
-        if E[a_e] > S[a_s]:
-            break
-
-        M[Agg2Agg[[a_e], :].indices] = False  # neighbors of a_e
-        M[Agg2Agg[[a_s], :].indices] = False  # neighbors of a_s
-        newc[a_e] = c1[a_s]   # redefine centers
-        newc[a_s] = c2[a_s]   # redefine centers
-        rebalance_change = True
+    rebalance_change = amg_core.rebalance_centers(G.shape[0], G.indptr, G.indices, m,
+                                                  E, S, c1, c2, newc)
 
     return newc, rebalance_change
 
 
-def _elimination_penalty(A, m, d, dist_all, num_clusters):
-    """Calculate elimination penalty.
-
-    see _rebalance()
-    """
-    Acol = A.tocsc()
-
-    # pylint: disable=too-many-nested-blocks
-    E = np.inf * np.ones(num_clusters)
-    for a in range(num_clusters):
-        E[a] = 0
-        Va = np.int32(np.where(m == a)[0])
-        N = len(Va)
-
-        for iloc, _ in enumerate(Va):
-            dmin = np.inf
-            for jloc, j in enumerate(Va):
-                for k in Acol[:, [j]].indices:
-                    if m[k] != m[j]:
-                        jiloc = jloc * N + iloc
-                        dmin = min(d[k] + A[k, j] + dist_all[a, jiloc], dmin)
-            E[a] += dmin**2
-        E[a] -= np.sum(d[Va]**2)
-    return E
-
-
-def _split_improvement(m, d, dist_all, num_clusters):
-    """Calculate split improvement.
-
-    see _rebalance()
-    """
-    S = np.inf * np.ones(num_clusters)
-    I = -1 * np.ones(num_clusters, dtype=np.int32)  # better cluster centers if split
-    J = -1 * np.ones(num_clusters, dtype=np.int32)  # better cluster centers if split
-    for a in range(num_clusters):
-        S[a] = np.inf
-        Va = np.int32(np.where(m == a)[0])
-        N = len(Va)
-
-        for iloc, i in enumerate(Va):
-            for jloc, j in enumerate(Va):
-                Snew = 0
-                for kloc, _ in enumerate(Va):
-                    ikloc = iloc * N + kloc
-                    jkloc = jloc * N + kloc
-                    if dist_all[a, ikloc] < dist_all[a, jkloc]:
-                        Snew = Snew + dist_all[a, ikloc]**2
-                    else:
-                        Snew = Snew + dist_all[a, jkloc]**2
-                if Snew < S[a]:
-                    S[a] = Snew
-                    I[a] = i
-                    J[a] = j
-        S[a] = np.sum(d[Va]**2) - S[a]
-    return S, I, J
-
-
 def _choice(p):
     """Random selection based on a distribution.
 
@@ -836,28 +793,71 @@ def pseudo_peripheral_node(A):
             return x, order, level
 
 
-def metis_partition(G, nparts=5, seed=None):
+def metis_partition(G, nparts=5, seed=None, backend=None):
     """Perform partitioning of graph with weighted edges using METIS.
 
     Parameters
     ----------
     G : sparray
-        A sparse n x n matrix where each nonzero entry G[i,j] is the distance
-        between nodes i and j.  G[i,j] is required to be integer.
+        A sparse, symmetric n x n matrix where each nonzero entry G[i,j] is
+        the weight of the edge between nodes i and j.  G[i,j] is required to
+        be a nonnegative integer for the 'metis' backend.
     nparts : int
         Number of parts in the resulting partition.
     seed : int
-        Random seed for METIS.
+        Random seed for the partitioner.
+    backend : {None, 'metis', 'native'}
+        Partitioner to use.  'metis' calls METIS through pymetis, and
+        'native' uses the multilevel partitioner in amg_core, which also
+        accepts real weights.  None (default) selects 'metis' if pymetis is
+        installed and 'native' otherwise.
 
     Returns
     -------
     array
         Array of n x 1 indices from 0 ... nparts-1.
 
+    Notes
+    -----
+    Both backends return connected parts.  The 'native' backend coarsens the
+    graph by heavy edge matching, grows an initial partition on the coarsest
+    graph, and refines the boundary on each level, following [1]_.
+
+    References
+    ----------
+    .. [1] Karypis, G., and Kumar, V., "A fast and high quality multilevel
+       scheme for partitioning irregular graphs", SIAM J. Sci. Comput.,
+       20(1), 359-392, 1998.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.sparse import csr_array
+    >>> from pyamg.graph import metis_partition
+    >>> G = csr_array(np.array([[0, 10, 10, 1, 0, 0],
+    ...                         [10, 0, 10, 0, 0, 0],
+    ...                         [10, 10, 0, 0, 0, 0],
+    ...                         [1, 0, 0, 0, 10, 10],
+    ...                         [0, 0, 0, 10, 0, 10],
+    ...                         [0, 0, 0, 10, 10, 0]]))
+    >>> parts = metis_partition(G, nparts=2, backend='native')
+    >>> print(parts[:3] == parts[0], parts[3:] == parts[3], parts[0] != parts[3])
+    [ True  True  True] [ True  True  True] True
+
     """
     G = sparse.csr_array(G)
 
-    if G.dtype.kind != 'i':
+    if backend is None:
+        try:
+            import pymetis  # noqa: PLC0415
+            backend = 'metis'
+        except ImportError:
+            backend = 'native'
+
+    if backend not in ('metis', 'native'):
+        raise ValueError(f'Unrecognized value backend={backend}')
+
+    if backend == 'metis' and G.dtype.kind != 'i':
         raise ValueError('METIS partitioning requires integer weights')
 
     if G.nnz > 0:
@@ -867,6 +867,16 @@ def metis_partition(G, nparts=5, seed=None):
     if not isinstance(nparts, int) or nparts < 1:
         raise ValueError('nparts should be a positive integer')
 
+    if backend == 'native':
+        if G.dtype.kind in 'biu':
+            G = G.astype(np.int32)
+        elif G.dtype not in (np.float32, np.float64):
+            raise ValueError('native partitioning requires real weights')
+        parts = np.empty(G.shape[0], dtype=G.indptr.dtype)
+        amg_core.partition_graph(G.shape[0], G.indptr, G.indices, G.data,
+                                 nparts, seed or 0, parts)
+        return parts
+
     try:
         import pymetis  # noqa: PLC0415
     except ImportError as expt:
@@ -1,5 +1,7 @@
 """Reference implementations of graph algorithms."""
 import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 
 
 def bellman_ford_reference(A, c):
@@ -129,3 +131,66 @@ def bellman_ford_balanced_reference(A, c):
         cnt += 1
 
     return (d, m, p)
+
+
+def rebalance_measures_reference(A, m, d):
+    """Execute reference implementation of the balanced Lloyd rebalance measures.
+
+    Parameters
+    ----------
+    A : sparse matrix
+        n x n directed graph with positive weights
+    m : array_like
+        cluster index
+    d : array_like
+        distance to cluster center
+
+    Returns
+    -------
+    E : ndarray
+        elimination penalty
+    S : ndarray
+        split improvement
+    c1 : ndarray
+        first center of the best split
+    c2 : ndarray
+        second center of the best split
+
+    See Also
+    --------
+    amg_core.graph.rebalance_measures
+
+    """
+    A = sparse.csr_array(A)
+    Acol = A.tocsc()
+    num_clusters = m.max() + 1
+
+    E = np.zeros(num_clusters)
+    S = np.inf * np.ones(num_clusters)
+    c1 = -1 * np.ones(num_clusters, dtype=np.int32)
+    c2 = -1 * np.ones(num_clusters, dtype=np.int32)
+    for a in range(num_clusters):
+        Va = np.where(m == a)[0]
+        N = len(Va)
+
+        # dense distances within the cluster, dist[i, j] from i to j
+        dist = csgraph.shortest_path(A[Va][:, Va], directed=True)
+
+        for iloc in range(N):
+            dmin = np.inf
+            for jloc, j in enumerate(Va):
+                for k in Acol[:, [j]].indices:
+                    if m[k] != m[j]:
+                        dmin = min(d[k] + A[k, j] + dist[jloc, iloc], dmin)
+            E[a] += dmin**2
+        E[a] -= np.sum(d[Va]**2)
+
+        for iloc, i in enumerate(Va):
+            for jloc, j in enumerate(Va):
+                Snew = np.sum(np.minimum(dist[iloc], dist[jloc])**2)
+                if Snew < S[a]:
+                    S[a] = Snew
+                    c1[a] = i
+                    c2[a] = j
+        S[a] = np.sum(d[Va]**2) - S[a]
+    return E, S, c1, c2
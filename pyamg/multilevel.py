@@ -1,5 +1,6 @@
 """Generic AMG solver."""
 from warnings import warn
+from threading import Lock
 
 import scipy as sp
 from scipy.linalg import pinv
@@ -7,11 +8,13 @@ import scipy.sparse.linalg as sla
 from scipy.sparse.linalg import LinearOperator
 import numpy as np
 
-from . import krylov
-from .util.utils import to_type
+from . import amg_core, krylov
+from .util.utils import to_type, type_prep, csr_matvec, bsr_matvec
 from .util.params import set_tol
-from .relaxation import smoothing
-from .util import upcast
+from .relaxation import relaxation, smoothing
+from .util import upcast, streaming
+from .util.stencil import StencilOperator
+from .util.linalg import rmatvec
 
 
 class MultilevelSolver:
@@ -83,7 +86,9 @@ class MultilevelSolver:
     Notes
     -----
     If not defined, the R attribute on each level is set to
-    the transpose of P.
+    the transpose of P.  If R is None, restriction is applied as the
+    conjugate transpose of P with ``pyamg.util.linalg.rmatvec``, so that only
+    P is stored.
 
     Examples
     --------
@@ -208,7 +213,7 @@ class MultilevelSolver:
 
         return output
 
-    def cycle_complexity(self, cycle='V'):
+    def cycle_complexity(self, cycle='V', transfer=False):
         """Cycle complexity of V, W, AMLI, and F(1,1) cycle with simple relaxation.
 
         Cycle complexity is an approximate measure of the number of
@@ -219,6 +224,10 @@ class MultilevelSolver:
         ----------
         cycle : {'V','W','F','AMLI'}
             Type of multigrid cycle to perform in each iteration.
+        transfer : bool
+            If True, include the cost of restriction and interpolation,
+            i.e., the number of nonzeros in P and R, on each level.  An
+            implicit restriction (R is None) costs as much as P.
 
         Returns
         -------
@@ -244,33 +253,38 @@ class MultilevelSolver:
         cycle = str(cycle).upper()
 
         nnz = [level.A.nnz for level in self.levels]
+        work = [2 * n for n in nnz]
+        if transfer:
+            for lvl, level in enumerate(self.levels[:-1]):
+                work[lvl] += level.P.nnz + \
+                    (level.P.nnz if level.R is None else level.R.nnz)
 
         def V(level):
             if len(self.levels) == 1:
                 return nnz[0]
 
             if level == len(self.levels) - 2:
-                return 2 * nnz[level] + nnz[level + 1]
+                return work[level] + nnz[level + 1]
 
-            return 2 * nnz[level] + V(level + 1)
+            return work[level] + V(level + 1)
 
         def W(level):
             if len(self.levels) == 1:
                 return nnz[0]
 
             if level == len(self.levels) - 2:
-                return 2 * nnz[level] + nnz[level + 1]
+                return work[level] + nnz[level + 1]
 
-            return 2 * nnz[level] + 2 * W(level + 1)
+            return work[level] + 2 * W(level + 1)
 
         def F(level):
             if len(self.levels) == 1:
                 return nnz[0]
 
             if level == len(self.levels) - 2:
-                return 2 * nnz[level] + nnz[level + 1]
+                return work[level] + nnz[level + 1]
 
-            return 2 * nnz[level] + F(level + 1) + V(level + 1)
+            return work[level] + F(level + 1) + V(level + 1)
 
         if cycle == 'V':
             flops = V(0)
@@ -283,7 +297,7 @@ class MultilevelSolver:
 
         return float(flops) / float(nnz[0])
 
-    def operator_complexity(self):
+    def operator_complexity(self, transfer=False):
         """Operator complexity of this multigrid hierarchy.
 
         Defined as::
@@ -291,14 +305,23 @@ class MultilevelSolver:
             Number of nonzeros in the matrix on all levels /
             Number of nonzeros in the matrix on the finest level
 
+        Parameters
+        ----------
+        transfer : bool
+            If True, also count the stored nonzeros of P and R on each
+            level.  An implicit restriction (R is None) stores nothing.
+
         Returns
         -------
         scalar
             Measure of the operator complexity.
 
         """
-        return sum(level.A.nnz for level in self.levels) /\
-            float(self.levels[0].A.nnz)
+        nnz = sum(level.A.nnz for level in self.levels)
+        if transfer:
+            for level in self.levels[:-1]:
+                nnz += level.P.nnz + (0 if level.R is None else level.R.nnz)
+        return nnz / float(self.levels[0].A.nnz)
 
     def grid_complexity(self):
         """Grid complexity of this multigrid hierarchy.
@@ -395,6 +418,29 @@ class MultilevelSolver:
 
         return LinearOperator(shape, matvec, dtype=dtype)
 
+    def compile(self, cycle='V', dtype=None):
+        """Freeze the hierarchy into a low-overhead solver for repeated solves.
+
+        Parameters
+        ----------
+        cycle : {'V','W'}
+            Type of multigrid cycle to perform in each iteration.
+        dtype : dtype, optional
+            Type of the right-hand sides and solutions.  Default is the
+            upcast of the types of the level matrices.
+
+        Returns
+        -------
+        FastSolver
+            Solver with preallocated work arrays for the given cycle.
+
+        See Also
+        --------
+        FastSolver
+
+        """
+        return FastSolver(self, cycle=cycle, dtype=dtype)
+
     def solve(self, b, x0=None, tol=1e-5, maxiter=100, cycle='V', accel=None,
               callback=None, residuals=None, cycles_per_level=1, return_info=False):
         """Execute multigrid cycling.
@@ -499,6 +545,8 @@ class MultilevelSolver:
                     accel = getattr(sla, accel)
 
             M = self.aspreconditioner(cycle=cycle)
+            if streaming.is_mapped(A):
+                A = streaming.aslinearoperator(A)
 
             try:  # try PyAMG style interface which has a residuals parameter
                 x, info = accel(A, b, x0=x0, tol=tol, maxiter=maxiter, M=M,
@@ -512,13 +560,13 @@ class MultilevelSolver:
                 # history is desired
 
                 if residuals is not None:
-                    residuals[:] = [np.linalg.norm(b - A @ x)]
+                    residuals[:] = [np.linalg.norm(b - streaming.matvec(A, x))]
 
                     def callback_wrapper(x):
                         if np.isscalar(x):
                             residuals.append(x)
                         else:
-                            residuals.append(np.linalg.norm(b - A @ x))
+                            residuals.append(np.linalg.norm(b - streaming.matvec(A, x)))
                         if callback is not None:
                             callback(x)
                 else:
@@ -542,7 +590,7 @@ class MultilevelSolver:
                 normb = 1.0  # set so that we have an absolute tolerance
 
         # Start cycling (no acceleration)
-        normr = np.linalg.norm(b - A @ x)
+        normr = np.linalg.norm(b - streaming.matvec(A, x))
         if residuals is not None:
             residuals[:] = [normr]  # initial residual
 
@@ -564,7 +612,7 @@ class MultilevelSolver:
 
             it += 1
 
-            normr = np.linalg.norm(b - A @ x)
+            normr = np.linalg.norm(b - streaming.matvec(A, x))
             if residuals is not None:
                 residuals.append(normr)
 
@@ -609,9 +657,13 @@ class MultilevelSolver:
 
         self.levels[lvl].presmoother(A, x, b)
 
-        residual = b - A @ x
+        residual = b - streaming.matvec(A, x)
 
-        coarse_b = self.levels[lvl].R @ residual
+        R = self.levels[lvl].R
+        if R is None:
+            coarse_b = rmatvec(self.levels[lvl].P, residual)
+        else:
+            coarse_b = R @ residual
         coarse_x = np.zeros_like(coarse_b)
 
         if lvl == len(self.levels) - 2:
@@ -714,38 +766,53 @@ def coarse_grid_solver(solver):
 
     solver, kwargs = unpack_arg(solver)
 
+    # the factorizations are computed on the first solve; the lock makes
+    # concurrent first solves from several threads factor only once
+    lock = Lock()
+
     if solver in ['pinv', 'pinv2']:
         def solve(self, A, b):
             if not hasattr(self, 'P'):
-                self.P = pinv(A.toarray(), **kwargs)
+                with lock:
+                    if not hasattr(self, 'P'):
+                        self.P = pinv(A.toarray(), **kwargs)
             return np.dot(self.P, b)
 
     elif solver == 'lu':
         def solve(self, A, b):
             if not hasattr(self, 'LU'):
-                self.LU = sp.linalg.lu_factor(A.toarray(), **kwargs)
+                with lock:
+                    if not hasattr(self, 'LU'):
+                        self.LU = sp.linalg.lu_factor(A.toarray(), **kwargs)
             return sp.linalg.lu_solve(self.LU, b)
 
     elif solver == 'cholesky':
         def solve(self, A, b):
             if not hasattr(self, 'L'):
-                self.L = sp.linalg.cho_factor(A.toarray(), **kwargs)
+                with lock:
+                    if not hasattr(self, 'L'):
+                        self.L = sp.linalg.cho_factor(A.toarray(), **kwargs)
             return sp.linalg.cho_solve(self.L, b)
 
     elif solver == 'splu':
+        def factor(self, A):
+            # for multiple candidates in B, A will often have a couple zero
+            # rows/columns that must be removed
+            Acsc = A.tocsc()
+            Acsc.eliminate_zeros()
+            diffptr = Acsc.indptr[:-1] - Acsc.indptr[1:]
+            nonzero_cols = (diffptr != 0).nonzero()[0]
+            Map = sp.sparse.eye_array(Acsc.shape[0], Acsc.shape[1], format='csc')
+            Map = Map[:, nonzero_cols]
+            Acsc = Map.T.tocsc() @ Acsc @ Map
+            self.LU_Map = Map
+            self.LU = sp.sparse.linalg.splu(Acsc, **kwargs)  # set last
+
         def solve(self, A, b):
             if not hasattr(self, 'LU'):
-                # for multiple candidates in B, A will often have a couple zero
-                # rows/columns that must be removed
-                Acsc = A.tocsc()
-                Acsc.eliminate_zeros()
-                diffptr = Acsc.indptr[:-1] - Acsc.indptr[1:]
-                nonzero_cols = (diffptr != 0).nonzero()[0]
-                Map = sp.sparse.eye_array(Acsc.shape[0], Acsc.shape[1], format='csc')
-                Map = Map[:, nonzero_cols]
-                Acsc = Map.T.tocsc() @ Acsc @ Map
-                self.LU = sp.sparse.linalg.splu(Acsc, **kwargs)
-                self.LU_Map = Map
+                with lock:
+                    if not hasattr(self, 'LU'):
+                        factor(self, A)
 
             return self.LU_Map @ self.LU.solve(np.ravel(self.LU_Map.T @ b))
 
@@ -756,10 +823,8 @@ def coarse_grid_solver(solver):
             fn = getattr(sla, solver)
 
         def solve(_, A, b):
-            if 'tol' not in kwargs:
-                kwargs['tol'] = set_tol(A.dtype)
-
-            return fn(A, b, **kwargs)[0]
+            # default tolerance from the type of A, without changing kwargs
+            return fn(A, b, **{'tol': set_tol(A.dtype), **kwargs})[0]
 
     elif solver in ['gauss_seidel', 'jacobi', 'block_gauss_seidel', 'schwarz',
                     'block_jacobi', 'richardson', 'sor', 'chebyshev',
@@ -826,6 +891,337 @@ def coarse_grid_solver(solver):
     return GenericSolver()
 
 
+class FastSolver:
+    """Multigrid cycle on a frozen hierarchy, for many small repeated solves.
+
+    The operators of the hierarchy are stored as the raw arrays of the
+    sparse kernels, the Gauss-Seidel and Jacobi smoothers are resolved to
+    their compiled sweeps, and all work vectors are allocated once.  A solve
+    is then a direct sequence of kernel calls, without the input checks,
+    residual history and dispatch of ``MultilevelSolver.solve``.
+
+    Parameters
+    ----------
+    ml : MultilevelSolver
+        Hierarchy to freeze.  Later changes to ``ml`` (e.g. to the smoothers)
+        are not seen by the solver.
+    cycle : {'V','W'}
+        Type of multigrid cycle to perform in each iteration.
+    dtype : dtype, optional
+        Type of the right-hand sides and solutions.  Default is the upcast of
+        the types of the level matrices.
+
+    Attributes
+    ----------
+    shape : tuple
+        Shape of the fine-level matrix.
+    dtype : dtype
+        Type of the right-hand sides and solutions.
+    cycle : str
+        Type of multigrid cycle.
+
+    See Also
+    --------
+    MultilevelSolver.compile, MultilevelSolver.solve
+
+    Notes
+    -----
+    Smoothers other than ``gauss_seidel`` and ``jacobi`` on CSR or BSR
+    matrices are called as in ``MultilevelSolver``, and the coarse grid is
+    solved with ``ml.coarse_solver``.  The work vectors are shared by all
+    calls, so a FastSolver must not be used by several threads at once.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg import smoothed_aggregation_solver
+    >>> from pyamg.gallery import poisson
+    >>> A = poisson((100, 100), format='csr')
+    >>> b = np.random.rand(A.shape[0])
+    >>> ml = smoothed_aggregation_solver(A)
+    >>> fast = ml.compile()
+    >>> x = np.zeros(A.shape[0])
+    >>> x = fast.solve_into(b, x, maxiter=10)
+    >>> np.allclose(x, ml.solve(b, maxiter=10, tol=1e-20))
+    True
+
+    """
+
+    def __init__(self, ml, cycle='V', dtype=None):
+        """Freeze the operators, smoothers and work vectors of ml."""
+        if cycle not in ('V', 'W'):
+            raise ValueError(f'Unsupported cycle type ({cycle})')
+
+        levels = ml.levels
+        if dtype is None:
+            dtype = upcast(*[level.A.dtype for level in levels])
+        self.dtype = np.dtype(dtype)
+        self.cycle = cycle
+        self.shape = levels[0].A.shape
+
+        self._levels = []
+        for level in levels[:-1]:
+            A = level.A
+            if level.R is None:
+                R = _frozen_rmatvec(level.P, self.dtype)  # implicit restriction
+            else:
+                R = _frozen_matvec(level.R, self.dtype)
+            n, nc = A.shape[0], level.P.shape[1]
+            self._levels.append((
+                _frozen_matvec(A, self.dtype),
+                R,
+                _frozen_matvec(level.P, self.dtype),
+                _frozen_smoother(level.presmoother, A, self.dtype),
+                _frozen_smoother(level.postsmoother, A, self.dtype),
+                np.empty(n, dtype=self.dtype),     # residual
+                np.empty(n, dtype=self.dtype),     # coarse grid correction
+                np.empty(nc, dtype=self.dtype),    # coarse x
+                np.empty(nc, dtype=self.dtype)))   # coarse b
+
+        self._coarse_solver = ml.coarse_solver
+        self._coarse_A = levels[-1].A
+        if self._levels:
+            self._matvec = self._levels[0][0]
+        else:
+            self._matvec = _frozen_matvec(levels[0].A, self.dtype)
+        self._r = np.empty(self.shape[0], dtype=self.dtype)
+
+    def _cycle(self, lvl, x, b):
+        A, R, P, presmoother, postsmoother, r, t, coarse_x, coarse_b = self._levels[lvl]
+
+        presmoother(x, b)
+
+        A(x, r)
+        np.subtract(b, r, out=r)
+        R(r, coarse_b)
+
+        if lvl == len(self._levels) - 1:
+            coarse_x[:] = self._coarse_solver(self._coarse_A, coarse_b)
+        else:
+            coarse_x[:] = 0
+            self._cycle(lvl + 1, coarse_x, coarse_b)
+            if self.cycle == 'W':
+                self._cycle(lvl + 1, coarse_x, coarse_b)
+
+        P(coarse_x, t)
+        x += t
+
+        postsmoother(x, b)
+
+    def solve_into(self, b, out, maxiter=1, tol=None):
+        """Apply multigrid cycles in place.
+
+        Parameters
+        ----------
+        b : array
+            Right-hand side, of length ``shape[0]``.
+        out : array
+            Initial guess on entry and solution on exit.  Must be a contiguous
+            1D array of type ``dtype``.
+        maxiter : int
+            Maximum number of cycles.
+        tol : float, optional
+            Stop once the residual norm is below ``tol * ||b||``.  The residual
+            is only computed if tol is given.
+
+        Returns
+        -------
+        array
+            The array out.
+
+        """
+        n = self.shape[0]
+        if out.dtype != self.dtype or out.shape != (n,) or not out.flags.c_contiguous:
+            raise ValueError(f'out must be a contiguous array of shape ({n},) '
+                             f'and type {self.dtype}')
+        b = np.asarray(b)
+        if b.dtype != self.dtype or not b.flags.c_contiguous:
+            b = np.ascontiguousarray(b, dtype=self.dtype)
+        if b.shape != (n,):
+            b = b.reshape(n)
+
+        if not self._levels:
+            out[:] = self._coarse_solver(self._coarse_A, b)
+            return out
+
+        if tol is not None:
+            normb = np.linalg.norm(b)
+            if normb == 0.0:
+                normb = 1.0  # set so that we have an absolute tolerance
+
+        for _ in range(maxiter):
+            self._cycle(0, out, b)
+
+            if tol is not None:
+                self._matvec(out, self._r)
+                np.subtract(b, self._r, out=self._r)
+                if np.linalg.norm(self._r) < tol * normb:
+                    break
+
+        return out
+
+    def solve(self, b, x0=None, maxiter=1, tol=None):
+        """Apply multigrid cycles.
+
+        Parameters
+        ----------
+        b : array
+            Right-hand side, of length ``shape[0]``.
+        x0 : array, optional
+            Initial guess.  Default is zero.
+        maxiter : int
+            Maximum number of cycles.
+        tol : float, optional
+            Stop once the residual norm is below ``tol * ||b||``.
+
+        Returns
+        -------
+        array
+            Approximate solution to Ax=b.
+
+        """
+        if x0 is None:
+            x = np.zeros(self.shape[0], dtype=self.dtype)
+        else:
+            x = np.array(x0, dtype=self.dtype).reshape(self.shape[0])
+        return self.solve_into(b, x, maxiter=maxiter, tol=tol)
+
+
+def _frozen_matvec(M, dtype):
+    """Return ``apply(x, y)`` that overwrites y with ``M @ x``."""
+    if isinstance(M, StencilOperator):
+        grid = np.array(M.grid, dtype=M.offsets.dtype)
+        offsets = M.offsets.ravel()
+        values = M.values.astype(dtype)
+
+        def apply(x, y):
+            amg_core.stencil_matvec(grid, offsets, values, x, y)
+
+        return apply
+
+    if not sp.sparse.issparse(M) and hasattr(M, 'tocsr'):
+        M = M.tocsr()  # implicit transfer operators
+
+    if streaming.is_mapped(M):
+        def apply(x, y):
+            streaming.matvec(M, x, out=y)
+
+    elif sp.sparse.issparse(M) and M.format == 'bsr' and M.blocksize != (1, 1):
+        R, C = M.blocksize
+        n_brow, n_bcol = M.shape[0] // R, M.shape[1] // C
+        Ap, Aj = M.indptr, M.indices
+        Ax = np.ravel(M.data.astype(dtype, copy=False))
+
+        def apply(x, y):
+            y[:] = 0
+            bsr_matvec(n_brow, n_bcol, R, C, Ap, Aj, Ax, x, y)
+
+    elif sp.sparse.issparse(M):
+        if M.format != 'bsr':
+            M = M.tocsr()
+        n_row, n_col = M.shape
+        Ap, Aj = M.indptr, M.indices
+        Ax = np.ravel(M.data.astype(dtype, copy=False))  # 1x1 blocks are CSR
+
+        def apply(x, y):
+            y[:] = 0
+            csr_matvec(n_row, n_col, Ap, Aj, Ax, x, y)
+
+    else:
+        def apply(x, y):
+            y[:] = M @ x
+
+    return apply
+
+
+def _frozen_rmatvec(M, dtype):
+    """Return ``apply(x, y)`` that overwrites y with ``M.H @ x``, without forming M.H."""
+    if not sp.sparse.issparse(M) or M.format not in ('csr', 'bsr'):
+        return _frozen_matvec(M.T.conjugate(), dtype)
+
+    Ap, Aj = M.indptr, M.indices
+    Ax = np.ravel(M.data.astype(dtype, copy=False))
+    conj = int(np.iscomplexobj(Ax))
+    if M.format == 'bsr':
+        R, C = M.blocksize
+        n_brow, n_bcol = M.shape[0] // R, M.shape[1] // C
+
+        def apply(x, y):
+            amg_core.bsr_matvec_transpose(n_brow, n_bcol, R, C, Ap, Aj, Ax, x, y, conj)
+
+    else:
+        n_row, n_col = M.shape
+
+        def apply(x, y):
+            amg_core.csr_matvec_transpose(n_row, n_col, Ap, Aj, Ax, x, y, conj)
+
+    return apply
+
+
+def _frozen_smoother(smoother, A, dtype):
+    """Return ``relax(x, b)`` that applies the smoother of A in place."""
+    func = getattr(smoother, 'func', None)
+    kwargs = getattr(smoother, 'keywords', {})
+
+    compiled = (func in (relaxation.gauss_seidel, relaxation.jacobi)
+                and not smoother.args
+                and sp.sparse.issparse(A) and A.format in ('csr', 'bsr')
+                and not streaming.is_mapped(A))
+    blocksize = 1
+    if compiled and A.format == 'bsr':
+        # a BSR matrix with 1x1 blocks is swept with the CSR kernels
+        blocksize = A.blocksize[0]
+        compiled = A.blocksize[1] == blocksize
+
+    if compiled and func is relaxation.gauss_seidel \
+            and set(kwargs) <= {'iterations', 'sweep'}:
+        n = A.shape[0] // blocksize
+        forward, backward = (0, n, 1), (n - 1, -1, -1)
+        sweeps = {'forward': [forward],
+                  'backward': [backward],
+                  'symmetric': [forward, backward]}.get(kwargs.get('sweep', 'forward'))
+        if sweeps is not None:
+            sweeps = sweeps * kwargs.get('iterations', 1)
+            Ap, Aj = A.indptr, A.indices
+            Ax = np.ravel(A.data.astype(dtype, copy=False))
+
+            if blocksize == 1:
+                def relax(x, b):
+                    for row_start, row_stop, row_step in sweeps:
+                        amg_core.gauss_seidel(Ap, Aj, Ax, x, b,
+                                              row_start, row_stop, row_step)
+            else:
+                def relax(x, b):
+                    for row_start, row_stop, row_step in sweeps:
+                        amg_core.bsr_gauss_seidel(Ap, Aj, Ax, x, b, row_start,
+                                                  row_stop, row_step, blocksize)
+            return relax
+
+    if compiled and func is relaxation.jacobi and set(kwargs) <= {'iterations', 'omega'}:
+        n = A.shape[0] // blocksize
+        iterations = kwargs.get('iterations', 1)
+        [omega] = type_prep(dtype, [kwargs.get('omega', 1.0)])
+        Ap, Aj = A.indptr, A.indices
+        Ax = np.ravel(A.data.astype(dtype, copy=False))
+        temp = np.empty(A.shape[0], dtype=dtype)
+
+        if blocksize == 1:
+            def relax(x, b):
+                for _ in range(iterations):
+                    amg_core.jacobi(Ap, Aj, Ax, x, b, temp, 0, n, 1, omega)
+        else:
+            def relax(x, b):
+                for _ in range(iterations):
+                    amg_core.bsr_jacobi(Ap, Aj, Ax, x, b, temp, 0, n, 1,
+                                        blocksize, omega)
+        return relax
+
+    def relax(x, b):
+        smoother(A, x, b)
+
+    return relax
+
+
 class multilevel_solver(MultilevelSolver):  # noqa: N801
     """Deprecated level class.
 
@@ -9,6 +9,8 @@ from scipy.linalg import lapack as la
 from ..util.utils import type_prep, get_diagonal, get_block_diag
 from ..util.params import set_tol
 from ..util.linalg import norm
+from ..util import streaming
+from ..util.stencil import StencilOperator
 from .. import amg_core
 
 
@@ -267,7 +269,7 @@ def gauss_seidel(A, x, b, iterations=1, sweep='forward', omega=1.0):
 
     Parameters
     ----------
-    A : csr_array, bsr_array
+    A : csr_array, bsr_array, StencilOperator
         Sparse NxN matrix
     x : ndarray
         Approximate solution (length N)
@@ -284,6 +286,13 @@ def gauss_seidel(A, x, b, iterations=1, sweep='forward', omega=1.0):
     -------
     Nothing, x will be modified in place.
 
+    Notes
+    -----
+    For a StencilOperator, the grid points are swept by color in a
+    multicolor ordering (red-black for the 5-point Laplacian), in which no
+    stencil entry couples two points of the same color.  A backward sweep
+    visits the colors in reverse order.
+
     Examples
     --------
     >>> # Use Gauss-Seidel as a Stand-Alone Solver
@@ -309,20 +318,20 @@ def gauss_seidel(A, x, b, iterations=1, sweep='forward', omega=1.0):
     >>> x = sa.solve(b, x0=x0, tol=1e-8, residuals=residuals)
 
     """
+    if isinstance(A, StencilOperator):
+        A, x, b = make_system(A, x, b)
+        _stencil_gauss_seidel(A, x, b, iterations, sweep, omega)
+        return
+
     A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
 
-    if sparse.issparse(A) and A.format == 'csr':
-        blocksize = 1
-    else:
+    if A.format == 'bsr':
         R, C = A.blocksize
         if R != C:
             raise ValueError('BSR blocks must be square')
-        blocksize = R
 
-    if sweep == 'forward':
-        row_start, row_stop, row_step = 0, int(len(x)/blocksize), 1
-    elif sweep == 'backward':
-        row_start, row_stop, row_step = int(len(x)/blocksize)-1, -1, -1
+    if sweep in ('forward', 'backward'):
+        backward = sweep == 'backward'
     elif sweep == 'symmetric':
         for _iter in range(iterations):
             gauss_seidel(A, x, b, iterations=1, sweep='forward')
@@ -331,19 +340,64 @@ def gauss_seidel(A, x, b, iterations=1, sweep='forward', omega=1.0):
     else:
         raise ValueError('valid sweep directions: "forward", "backward", and "symmetric"')
 
-    if sparse.issparse(A) and A.format == 'csr':
-        if omega != 1.0:
-            for _iter in range(iterations):
-                amg_core.sor_gauss_seidel(A.indptr, A.indices, A.data, x, b,
-                                      row_start, row_stop, row_step, omega)
-        else:
-            for _iter in range(iterations):
-                amg_core.gauss_seidel(A.indptr, A.indices, A.data, x, b,
-                                      row_start, row_stop, row_step)
+    # a memory-mapped A is swept one block of rows at a time
+    for _iter in range(iterations):
+        for row_start, row_stop, row_step in streaming.sweep(A, backward):
+            if A.format == 'csr':
+                if omega != 1.0:
+                    amg_core.sor_gauss_seidel(A.indptr, A.indices, A.data, x, b,
+                                              row_start, row_stop, row_step, omega)
+                else:
+                    amg_core.gauss_seidel(A.indptr, A.indices, A.data, x, b,
+                                          row_start, row_stop, row_step)
+            else:
+                amg_core.bsr_gauss_seidel(A.indptr, A.indices, np.ravel(A.data),
+                                          x, b, row_start, row_stop, row_step, R)
+
+
+def _stencil_coloring(A):
+    """Color the grid of a StencilOperator for Gauss-Seidel.
+
+    Returns the arguments ``(mods, weights, num_colors)`` of
+    amg_core.stencil_gauss_seidel for a coloring in which no stencil entry
+    couples two grid points of the same color.  This is the red-black
+    coloring if every off-center entry changes the parity of the sum of
+    the grid indices, and otherwise colors each axis periodically with
+    period one more than the largest offset along the axis.
+    """
+    offsets = A.offsets[np.any(A.offsets != 0, axis=1)]
+    ndim = len(A.grid)
+    if np.all(offsets.sum(axis=1) % 2 != 0):
+        mods = np.full(ndim, 2)
+        weights = np.ones(ndim)
+        num_colors = 2
     else:
-        for _iter in range(iterations):
-            amg_core.bsr_gauss_seidel(A.indptr, A.indices, np.ravel(A.data),
-                                      x, b, row_start, row_stop, row_step, R)
+        mods = np.abs(offsets).max(axis=0, initial=0) + 1
+        weights = np.cumprod(np.concatenate([[1], mods[:0:-1]]))[::-1]
+        num_colors = int(np.prod(mods))
+    index_type = A.offsets.dtype
+    return mods.astype(index_type), weights.astype(index_type), num_colors
+
+
+def _stencil_gauss_seidel(A, x, b, iterations, sweep, omega):
+    """Perform multicolor Gauss-Seidel iteration with a StencilOperator."""
+    mods, weights, num_colors = _stencil_coloring(A)
+    colors = list(range(num_colors))
+    if sweep == 'forward':
+        pass
+    elif sweep == 'backward':
+        colors = colors[::-1]
+    elif sweep == 'symmetric':
+        colors = colors + colors[::-1]
+    else:
+        raise ValueError('valid sweep directions: "forward", "backward", and "symmetric"')
+
+    [omega] = type_prep(A.dtype, [omega])
+    grid = np.array(A.grid, dtype=A.offsets.dtype)
+    for _iter in range(iterations):
+        for color in colors:
+            amg_core.stencil_gauss_seidel(grid, A.offsets.ravel(), A.values, x, b,
+                                          mods, weights, num_colors, color, omega)
 
 
 def jacobi(A, x, b, iterations=1, omega=1.0):
@@ -351,7 +405,7 @@ def jacobi(A, x, b, iterations=1, omega=1.0):
 
     Parameters
     ----------
-    A : csr_array
+    A : csr_array, bsr_array, StencilOperator
         Sparse NxN matrix
     x : ndarray
         Approximate solution (length N)
@@ -391,12 +445,19 @@ def jacobi(A, x, b, iterations=1, omega=1.0):
     >>> x = sa.solve(b, x0=x0, tol=1e-8, residuals=residuals)
 
     """
-    A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
+    if isinstance(A, StencilOperator):
+        A, x, b = make_system(A, x, b)
+        temp = np.empty_like(x)
+        [omega] = type_prep(A.dtype, [omega])
+        grid = np.array(A.grid, dtype=A.offsets.dtype)
+        for _iter in range(iterations):
+            amg_core.stencil_jacobi(grid, A.offsets.ravel(), A.values, x, b,
+                                    temp, omega)
+        return
 
-    sweep = slice(None)
-    (row_start, row_stop, row_step) = sweep.indices(A.shape[0])
+    A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
 
-    if (row_stop - row_start) * row_step <= 0:  # no work to do
+    if A.shape[0] == 0:  # no work to do
         return
 
     temp = np.empty_like(x)
@@ -404,23 +465,29 @@ def jacobi(A, x, b, iterations=1, omega=1.0):
     # Create uniform type, convert possibly complex scalars to length 1 arrays
     [omega] = type_prep(A.dtype, [omega])
 
-    if A.format == 'csr':
-        for _iter in range(iterations):
-            amg_core.jacobi(A.indptr, A.indices, A.data, x, b, temp,
-                            row_start, row_stop, row_step, omega)
-    else:
+    if A.format == 'bsr':
         R, C = A.blocksize
         if R != C:
             raise ValueError('BSR blocks must be square')
-        row_start = int(row_start / R)
-        row_stop = int(row_stop / R)
-        for _iter in range(iterations):
-            amg_core.bsr_jacobi(A.indptr, A.indices, np.ravel(A.data),
-                                x, b, temp, row_start, row_stop,
-                                row_step, R, omega)
-
 
-def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0):
+    # a memory-mapped A is swept one block of rows at a time, so each block
+    # reads the previous iterate from temp
+    mapped = streaming.is_mapped(A)
+    for _iter in range(iterations):
+        if mapped:
+            temp[:] = x
+        for row_start, row_stop, row_step in streaming.sweep(A):
+            if A.format == 'csr':
+                amg_core.jacobi(A.indptr, A.indices, A.data, x, b, temp,
+                                row_start, row_stop, row_step, omega)
+            else:
+                amg_core.bsr_jacobi(A.indptr, A.indices, np.ravel(A.data),
+                                    x, b, temp, row_start, row_stop,
+                                    row_step, R, omega)
+
+
+def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0,
+                 Dlu=None):
     """Perform block Jacobi iteration on the linear system Ax=b.
 
     Parameters
@@ -440,6 +507,10 @@ def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0):
         Number of iterations to perform
     omega : scalar
         Damping parameter
+    Dlu : tuple
+        Pair (LU, piv) of LU factors of the diagonal blocks of A, as returned by
+        pyamg.util.linalg.lu_factor_array.  If given, Dinv is ignored and each
+        block solve uses the stored factors instead of an explicit inverse.
 
     Returns
     -------
@@ -474,7 +545,12 @@ def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0):
     A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
     A = A.tobsr(blocksize=(blocksize, blocksize))
 
-    if Dinv is None:
+    if Dlu is not None:
+        LU, piv = Dlu
+        piv = piv.astype(A.indices.dtype, copy=False)
+        if LU.shape != (int(A.shape[0]/blocksize), blocksize, blocksize):
+            raise ValueError('Dlu and A have incompatible dimensions')
+    elif Dinv is None:
         Dinv = get_block_diag(A, blocksize=blocksize, inv_flag=True)
     elif Dinv.shape[0] != int(A.shape[0]/blocksize):
         raise ValueError('Dinv and A have incompatible dimensions')
@@ -492,6 +568,14 @@ def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0):
     # Create uniform type, convert possibly complex scalars to length 1 arrays
     [omega] = type_prep(A.dtype, [omega])
 
+    if Dlu is not None:
+        for _iter in range(iterations):
+            amg_core.block_jacobi_lu(A.indptr, A.indices, np.ravel(A.data),
+                                     x, b, np.ravel(LU), np.ravel(piv), temp,
+                                     row_start, row_stop, row_step,
+                                     omega, blocksize)
+        return
+
     for _iter in range(iterations):
         amg_core.block_jacobi(A.indptr, A.indices, np.ravel(A.data),
                               x, b, np.ravel(Dinv), temp,
@@ -499,6 +583,150 @@ def block_jacobi(A, x, b, Dinv=None, blocksize=1, iterations=1, omega=1.0):
                               omega, blocksize)
 
 
+def jacobi_tiled(A, x, b, Dinv=None, iterations=1, omega=1.0, tilesize=None):
+    """Perform several (block) Jacobi sweeps with temporal blocking.
+
+    Parameters
+    ----------
+    A : csr_array or bsr_array
+        Sparse NxN matrix
+    x : ndarray
+        Approximate solution (length N)
+    b : ndarray
+        Right-hand side (length N)
+    Dinv : array
+        Array holding block diagonal inverses of A, size
+        (N/blocksize, blocksize, blocksize).  If None, point-wise Jacobi
+        is used, i.e., the inverse of the diagonal of A.
+    iterations : int
+        Number of iterations to perform
+    omega : scalar
+        Damping parameter
+    tilesize : int
+        Number of (block) rows per tile.  If None, see
+        jacobi_tiled_parameters.
+
+    Returns
+    -------
+    Nothing, x will be modified in place.
+
+    Notes
+    -----
+    The result is the same as `iterations` sweeps of jacobi (if Dinv is
+    None) or block_jacobi, up to round-off.  The sweeps are carried out
+    tile by tile in amg_core.block_jacobi_tiled, so that each tile of A is
+    read from memory once for all sweeps.  This pays off for matrices with a
+    small bandwidth relative to the tile size, e.g., matrices from
+    structured or well-ordered meshes.
+
+    Examples
+    --------
+    >>> from pyamg.relaxation.relaxation import jacobi_tiled
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.linalg import norm
+    >>> import numpy as np
+    >>> A = poisson((10,10), format='csr')
+    >>> x0 = np.zeros((A.shape[0],1))
+    >>> b = np.ones((A.shape[0],1))
+    >>> jacobi_tiled(A, x0, b, iterations=10, omega=1.0, tilesize=16)
+    >>> print(f'{norm(b-A@x0):2.4}')
+    5.835
+
+    """
+    A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
+
+    if Dinv is None:
+        blocksize = 1
+        if A.format == 'bsr':
+            if A.blocksize[0] != A.blocksize[1]:
+                raise ValueError('BSR blocks must be square')
+            blocksize = A.blocksize[0]
+        Dinv = _point_block_diag(A, blocksize)
+    else:
+        blocksize = Dinv.shape[1]
+        if Dinv.shape[0] != int(A.shape[0]/blocksize):
+            raise ValueError('Dinv and A have incompatible dimensions')
+
+    if blocksize > 1 or A.format == 'bsr':
+        A = A.tobsr(blocksize=(blocksize, blocksize))
+
+    tilesize, bandwidth = jacobi_tiled_parameters(A, iterations, tilesize=tilesize)
+    if tilesize <= 0:
+        tilesize = A.indptr.shape[0] - 1
+
+    temp = np.empty_like(x)
+
+    # Create uniform type, convert possibly complex scalars to length 1 arrays
+    [omega] = type_prep(A.dtype, [omega])
+
+    amg_core.block_jacobi_tiled(A.indptr, A.indices, np.ravel(A.data),
+                                x, b, np.ravel(Dinv), temp,
+                                iterations, tilesize, bandwidth,
+                                omega, blocksize)
+
+
+def jacobi_tiled_parameters(A, iterations, tilesize=None, cachesize=2**21):
+    """Choose the tile size and bandwidth for jacobi_tiled.
+
+    Parameters
+    ----------
+    A : csr_array or bsr_array
+        System matrix for relaxation
+    iterations : int
+        Number of Jacobi sweeps per call
+    tilesize : int
+        Number of (block) rows per tile.  If None, the tile is chosen as
+        large as possible while the rows of A in the tile and its halo fit
+        into cachesize bytes.
+    cachesize : int
+        Target number of bytes of A per tile
+
+    Returns
+    -------
+    tilesize : int
+        Number of (block) rows per tile
+    bandwidth : int
+        Maximum of |i - j| over the nonzero (block) entries of A
+
+    Notes
+    -----
+    A tile only pays off if the halo of iterations*bandwidth rows on either
+    side is small compared to the tile.  If this is not the case, the
+    returned tilesize is 0.
+
+    The bandwidth is stored as A.bandwidth, so that it is only computed once.
+
+    """
+    nrows = A.indptr.shape[0] - 1
+    if not hasattr(A, 'bandwidth'):
+        if A.nnz == 0:
+            A.bandwidth = 0
+        else:
+            rows = np.repeat(np.arange(nrows, dtype=A.indices.dtype), np.diff(A.indptr))
+            A.bandwidth = int(np.abs(rows - A.indices).max())
+    bandwidth = A.bandwidth
+
+    if nrows == 0:
+        return 1, bandwidth
+
+    if tilesize is None:
+        bytes_per_row = (A.data.nbytes + A.indices.nbytes) / nrows
+        tilesize = int(cachesize / bytes_per_row)
+        if tilesize < 4 * iterations * bandwidth and tilesize < nrows:
+            tilesize = 0
+
+    return tilesize, bandwidth
+
+
+def _point_block_diag(A, blocksize):
+    """Return the inverse of the diagonal of A as diagonal blocks."""
+    D = get_diagonal(A, inv=True)
+    Dinv = np.zeros((int(A.shape[0]/blocksize), blocksize, blocksize), dtype=D.dtype)
+    idx = np.arange(blocksize)
+    Dinv[:, idx, idx] = D.reshape(-1, blocksize)
+    return Dinv
+
+
 def block_gauss_seidel(A, x, b, iterations=1, sweep='forward', blocksize=1,
                        Dinv=None):
     """Perform block Gauss-Seidel iteration on the linear system Ax=b.
@@ -562,10 +790,8 @@ def block_gauss_seidel(A, x, b, iterations=1, sweep='forward', blocksize=1,
     elif (Dinv.shape[1] != blocksize) or (Dinv.shape[2] != blocksize):
         raise ValueError('Dinv and blocksize are incompatible')
 
-    if sweep == 'forward':
-        row_start, row_stop, row_step = 0, int(len(x)/blocksize), 1
-    elif sweep == 'backward':
-        row_start, row_stop, row_step = int(len(x)/blocksize)-1, -1, -1
+    if sweep in ('forward', 'backward'):
+        backward = sweep == 'backward'
     elif sweep == 'symmetric':
         for _iter in range(iterations):
             block_gauss_seidel(A, x, b, iterations=1, sweep='forward',
@@ -576,10 +802,12 @@ def block_gauss_seidel(A, x, b, iterations=1, sweep='forward', blocksize=1,
     else:
         raise ValueError('valid sweep directions: "forward", "backward", and "symmetric"')
 
+    # a memory-mapped A is swept one block of rows at a time
     for _iter in range(iterations):
-        amg_core.block_gauss_seidel(A.indptr, A.indices, np.ravel(A.data),
-                                    x, b, np.ravel(Dinv),
-                                    row_start, row_stop, row_step, blocksize)
+        for row_start, row_stop, row_step in streaming.sweep(A, backward):
+            amg_core.block_gauss_seidel(A.indptr, A.indices, np.ravel(A.data),
+                                        x, b, np.ravel(Dinv),
+                                        row_start, row_stop, row_step, blocksize)
 
 
 def polynomial(A, x, b, coefficients, iterations=1):
@@ -587,7 +815,7 @@ def polynomial(A, x, b, coefficients, iterations=1):
 
     Parameters
     ----------
-    A : sparse matrix
+    A : sparse matrix, StencilOperator
         Sparse NxN matrix
     x : ndarray
         Approximate solution (length N)
@@ -704,7 +932,7 @@ def gauss_seidel_indexed(A, x, b, indices, iterations=1, sweep='forward'):
     """
     A, x, b = make_system(A, x, b, formats=['csr'])
 
-    indices = np.asarray(indices, dtype='intc')
+    indices = np.asarray(indices, dtype=A.indptr.dtype)
 
     # if indices.min() < 0:
     #     raise ValueError('row index (%d) is invalid' % indices.min())
@@ -1034,8 +1262,8 @@ def schwarz_parameters(A, subdomain=None, subdomain_ptr=None,
         if subdomain is not None and subdomain_ptr is not None:
             # check that the existing parameters correspond to the same
             # subdomains
-            if np.array(A.schwarz_parameters[0] == subdomain).all() and \
-               np.array(A.schwarz_parameters[1] == subdomain_ptr).all():
+            if np.array_equal(A.schwarz_parameters[0], subdomain) and \
+               np.array_equal(A.schwarz_parameters[1], subdomain_ptr):
                 return A.schwarz_parameters
         else:
             return A.schwarz_parameters
@@ -1078,6 +1306,165 @@ def schwarz_parameters(A, subdomain=None, subdomain_ptr=None,
     return A.schwarz_parameters
 
 
+def spai(A, x, b, M=None, iterations=1):
+    """Apply a sparse approximate inverse (SPAI) smoother to Ax=b.
+
+    Parameters
+    ----------
+    A : csr_array or bsr_array
+        Sparse NxN matrix
+    x : ndarray
+        Approximate solution (length N)
+    b : ndarray
+        Right-hand side (length N)
+    M : csr_array or bsr_array
+        Sparse approximate inverse of A, see spai_parameters.
+        If None, the SPAI-0 inverse of A is used.
+    iterations : int
+        Number of iterations to perform
+
+    Returns
+    -------
+    Nothing, x will be modified in place.
+
+    Notes
+    -----
+    Each iteration is the update x[:] = x + M (b - A@x).  Unlike Jacobi,
+    no damping parameter or spectral radius estimate is needed, since M
+    is constructed to minimize || I - M A ||_F.
+
+    Examples
+    --------
+    >>> from pyamg.relaxation.relaxation import spai, spai_parameters
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.linalg import norm
+    >>> import numpy as np
+    >>> A = poisson((10,10), format='csr')
+    >>> x0 = np.zeros((A.shape[0],1))
+    >>> b = np.ones((A.shape[0],1))
+    >>> M = spai_parameters(A, order=1)
+    >>> spai(A, x0, b, M, iterations=10)
+    >>> print(f'{norm(b-A@x0):2.4}')
+    3.983
+
+    """
+    A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
+
+    if M is None:
+        M = spai_parameters(A, order=0)
+
+    for _iter in range(iterations):
+        x += M @ (b - A @ x)
+
+
+def spai_parameters(A, order=0):
+    """Compute a sparse approximate inverse for SPAI relaxation.
+
+    Helper function for setting up SPAI relaxation.  The inverse is stored
+    on A, which avoids computing it twice when setting up pre and post
+    smoothing with the same method.
+
+    Parameters
+    ----------
+    A : csr_array or bsr_array
+        System matrix for relaxation
+    order : {0, 1}
+        Sparsity pattern of the approximate inverse M.  For 0 (SPAI-0), M is
+        (block) diagonal.  For 1 (SPAI-1), M has the (block) sparsity
+        pattern of A.
+
+    Returns
+    -------
+    M : csr_array or bsr_array
+        Approximate inverse minimizing || I - M A ||_F over the pattern,
+        in the same format as A.
+
+    Notes
+    -----
+    SPAI-0 has the closed form M_ii = conj(A_ii) / || A_i,: ||^2, or for BSR
+    matrices, M_ii = A_ii^H (A_i,: A_i,:^H)^+ for each block row.
+
+    SPAI-1 solves one small least squares problem per row with
+    amg_core.spai_csr, and is only available for real-valued matrices.
+
+    References
+    ----------
+    .. [1] Broker, O. and Grote, M. J., "Sparse approximate inverse
+       smoothers for geometric and algebraic multigrid", Applied Numerical
+       Mathematics, 41(1), pp. 61--80, 2002.
+
+    Examples
+    --------
+    >>> from pyamg.relaxation.relaxation import spai_parameters
+    >>> from pyamg.gallery import poisson
+    >>> A = poisson((4,), format='csr')
+    >>> M = spai_parameters(A, order=0)
+    >>> M.diagonal()
+    array([0.4       , 0.33333333, 0.33333333, 0.4       ])
+
+    """
+    if hasattr(A, 'spai_parameters') and order in A.spai_parameters:
+        return A.spai_parameters[order]
+
+    if not sparse.issparse(A) or A.format not in ('csr', 'bsr'):
+        raise TypeError('Expected csr_array or bsr_array')
+
+    if order == 0:
+        if A.format == 'csr':
+            rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+            rownorm = np.bincount(rows, weights=np.abs(A.data)**2,
+                                  minlength=A.shape[0])
+            D = A.diagonal()
+            Mx = np.zeros_like(D)
+            mask = rownorm != 0
+            Mx[mask] = D[mask].conjugate() / rownorm[mask]
+            M = sparse.diags_array(Mx, format='csr')
+        else:
+            R, C = A.blocksize
+            if R != C:
+                raise ValueError('BSR blocks must be square')
+            nblocks = int(A.shape[0] / R)
+            rows = np.repeat(np.arange(nblocks), np.diff(A.indptr))
+
+            # G_i = sum_j A_ij A_ij^H for each block row i
+            G = np.zeros((nblocks, R, R), dtype=A.dtype)
+            np.add.at(G, rows, np.einsum('kab,kcb->kac', A.data, A.data.conjugate()))
+            D = get_block_diag(A, blocksize=R, inv_flag=False)
+            DH = np.conjugate(np.transpose(D, (0, 2, 1)))
+            Mx = DH @ np.linalg.pinv(G, hermitian=True)
+            M = sparse.bsr_array((Mx, np.arange(nblocks, dtype=A.indices.dtype),
+                                  np.arange(nblocks + 1, dtype=A.indptr.dtype)),
+                                 shape=A.shape)
+    elif order == 1:
+        if np.iscomplexobj(A.data):
+            raise ValueError('SPAI-1 is only implemented for real-valued matrices')
+
+        if A.format == 'csr':
+            pattern = A
+            Acsr = A
+        else:
+            if A.blocksize[0] != A.blocksize[1]:
+                raise ValueError('BSR blocks must be square')
+            pattern = sparse.bsr_array((np.ones_like(A.data), A.indices, A.indptr),
+                                       shape=A.shape).tocsr()
+            Acsr = A.tocsr()
+
+        Mx = np.zeros(pattern.indices.shape[0], dtype=A.dtype)
+        amg_core.spai_csr(Acsr.indptr, Acsr.indices, Acsr.data,
+                          pattern.indptr, pattern.indices, Mx)
+        M = sparse.csr_array((Mx, pattern.indices.copy(), pattern.indptr.copy()),
+                             shape=A.shape)
+        if A.format == 'bsr':
+            M = M.tobsr(blocksize=A.blocksize)
+    else:
+        raise ValueError(f'SPAI order must be 0 or 1, not {order}')
+
+    if not hasattr(A, 'spai_parameters'):
+        A.spai_parameters = {}
+    A.spai_parameters[order] = M
+    return M
+
+
 def jacobi_indexed(A, x, b, indices, iterations=1, omega=1.0):
     """Perform indexed Jacobi iteration on the linear system Ax=b.
 
@@ -1119,7 +1506,7 @@ def jacobi_indexed(A, x, b, indices, iterations=1, omega=1.0):
     """
     A, x, b = make_system(A, x, b, formats=['csr', 'bsr'])
 
-    indices = np.asarray(indices, dtype='intc')
+    indices = np.asarray(indices, dtype=A.indptr.dtype)
 
     # Create uniform type, convert possibly complex scalars to length 1 arrays
     [omega] = type_prep(A.dtype, [omega])
@@ -32,7 +32,9 @@ from scipy import sparse
 from scipy.sparse.linalg import LinearOperator
 
 from ..util.utils import scale_rows, get_block_diag, get_diagonal
-from ..util.linalg import approximate_spectral_radius
+from ..util.linalg import approximate_spectral_radius, lu_factor_array
+from ..util import streaming
+from ..util.stencil import StencilOperator
 from ..krylov import gmres, cgne, cgnr, cg
 from . import relaxation
 from .chebyshev import chebyshev_polynomial_coefficients
@@ -48,6 +50,12 @@ SYMMETRIC_RELAXATION = ['jacobi', 'richardson', 'block_jacobi',
 # List of supported Krylov relaxation schemes
 KRYLOV_RELAXATION = ['cg', 'cgne', 'cgnr', 'gmres']
 
+# List of relaxation schemes supported on a StencilOperator level, block
+# schemes with blocksize 1 only
+STENCIL_RELAXATION = ['gauss_seidel', 'block_gauss_seidel', 'jacobi',
+                      'block_jacobi', 'richardson', 'chebyshev', 'cg', 'gmres',
+                      None]
+
 
 def _unpack_arg(v):
     if isinstance(v, tuple):
@@ -55,6 +63,17 @@ def _unpack_arg(v):
     return v, {}
 
 
+def _check_stencil_smoother(lvl, fn, kwargs):
+    """Check that a smoother is supported if lvl.A is a StencilOperator."""
+    if not isinstance(lvl.A, StencilOperator):
+        return
+    if fn not in STENCIL_RELAXATION or kwargs.get('blocksize', 1) != 1:
+        supported = ', '.join(str(name) for name in STENCIL_RELAXATION)
+        raise ValueError(f'Smoother {fn} is not supported for a StencilOperator, '
+                         f'use one of {supported}, with blocksize 1 for block '
+                         'smoothers')
+
+
 def _extract_splitting(lvl):
     """Check and extract splitting."""
     # Get C-points and F-points from splitting
@@ -126,6 +145,9 @@ def change_smoothers(ml, presmoother, postsmoother):
       for "algebraically" directed relaxation, such as strength_based_schwarz,
       which uses only the strong connections of a degree-of-freedom to define
       overlapping regions
+    - If the fine level operator is a StencilOperator, its smoothers must be
+      one of STENCIL_RELAXATION, with blocksize 1 for block methods, or a
+      ValueError is raised.
     - Available smoother methods::
 
         gauss_seidel
@@ -139,6 +161,8 @@ def change_smoothers(ml, presmoother, postsmoother):
         richardson
         sor
         chebyshev
+        spai0
+        spai1
         gauss_seidel_nr
         gauss_seidel_ne
         jacobi_ne
@@ -204,6 +228,7 @@ def change_smoothers(ml, presmoother, postsmoother):
     for i in range(0, min_len):
         # unpack presmoother[i]
         fn1, kwargs1 = _unpack_arg(presmoother[i])
+        _check_stencil_smoother(ml.levels[i], fn1, kwargs1)
         # get function handle
         setup_presmoother = _setup_call(fn1)
 
@@ -211,6 +236,7 @@ def change_smoothers(ml, presmoother, postsmoother):
 
         # unpack postsmoother[i]
         fn2, kwargs2 = _unpack_arg(postsmoother[i])
+        _check_stencil_smoother(ml.levels[i], fn2, kwargs2)
         # get function handle
         setup_postsmoother = _setup_call(fn2)
 
@@ -374,7 +400,7 @@ def rho_D_inv_A(A):
 
     Parameters
     ----------
-    A : sparse matrix
+    A : sparse matrix, StencilOperator
         Target matrix for computing the spectral radius
 
     Returns
@@ -394,7 +420,11 @@ def rho_D_inv_A(A):
     """
     if not hasattr(A, 'rho_D_inv'):
         D_inv = get_diagonal(A, inv=True)
-        D_inv_A = scale_rows(A, D_inv, copy=True)
+        if streaming.is_mapped(A) or isinstance(A, StencilOperator):
+            # apply D_inv A without forming it
+            D_inv_A = streaming.aslinearoperator(A, D_inv)
+        else:
+            D_inv_A = scale_rows(A, D_inv, copy=True)
         A.rho_D_inv = approximate_spectral_radius(D_inv_A)
 
     return A.rho_D_inv
@@ -407,9 +437,10 @@ def rho_block_D_inv_A(A, Dinv):
     ----------
     A : sparse-matrix
         size NxN
-    Dinv : array
+    Dinv : array or tuple
         Inverse of diagonal blocks of A
-        size (N/blocksize, blocksize, blocksize)
+        size (N/blocksize, blocksize, blocksize), or a pair (LU, piv) of
+        LU factors of the diagonal blocks from pyamg.util.linalg.lu_factor_array
 
     Returns
     -------
@@ -426,6 +457,10 @@ def rho_block_D_inv_A(A, Dinv):
     """
     if not hasattr(A, 'rho_block_D_inv'):
 
+        if isinstance(Dinv, tuple):
+            A.rho_block_D_inv = _rho_block_lu(A, Dinv)
+            return A.rho_block_D_inv
+
         blocksize = Dinv.shape[1]
         if Dinv.shape[1] != Dinv.shape[2]:
             raise ValueError('Dinv has incorrect dimensions')
@@ -434,8 +469,8 @@ def rho_block_D_inv_A(A, Dinv):
             raise ValueError('Dinv and A have incompatible dimensions')
 
         Dinv = sparse.bsr_array((Dinv,
-                                 np.arange(Dinv.shape[0], dtype=np.int32),
-                                 np.arange(Dinv.shape[0] + 1, dtype=np.int32)),
+                                 np.arange(Dinv.shape[0], dtype=A.indptr.dtype),
+                                 np.arange(Dinv.shape[0] + 1, dtype=A.indptr.dtype)),
                                 shape=A.shape)
 
         # Don't explicitly form Dinv @ A
@@ -448,6 +483,25 @@ def rho_block_D_inv_A(A, Dinv):
     return A.rho_block_D_inv
 
 
+def _rho_block_lu(A, Dlu):
+    """Approximate the spectral radius of D^-1 @ A from LU factors of D."""
+    blocksize = Dlu[0].shape[1]
+    if Dlu[0].shape[0] != int(A.shape[0]/blocksize):
+        raise ValueError('Dinv and A have incompatible dimensions')
+
+    Absr = A.tobsr(blocksize=(blocksize, blocksize))
+    b = np.zeros(A.shape[0], dtype=A.dtype)
+
+    # One undamped block Jacobi sweep with b = 0 maps x to x - D^-1 @ A @ x
+    def matvec(x):
+        y = np.array(np.ravel(x), dtype=A.dtype)
+        relaxation.block_jacobi(Absr, y, b, blocksize=blocksize, Dlu=Dlu)
+        return np.ravel(x) - y
+    D_inv_A = LinearOperator(A.shape, matvec, dtype=A.dtype)
+
+    return approximate_spectral_radius(D_inv_A)
+
+
 # pylint: disable=redefined-builtin
 def matrix_asformat(lvl, name, format, blocksize=None):
     """Set a matrix to a specific format.
@@ -503,11 +557,44 @@ def setup_jacobi(lvl, iterations=DEFAULT_NITER, omega=1.0, withrho=True):
     if withrho:
         omega = omega/rho_D_inv_A(lvl.A)
 
+    if iterations >= 2:
+        smoother = _setup_jacobi_tiled(lvl.A, iterations, omega)
+        if smoother is not None:
+            update_wrapper(smoother, relaxation.jacobi)  # set __name__
+            return smoother
+
     smoother = partial(relaxation.jacobi, iterations=iterations, omega=omega)
     update_wrapper(smoother, relaxation.jacobi)  # set __name__
     return smoother
 
 
+def _setup_jacobi_tiled(A, iterations, omega, Dinv=None):
+    """Set up temporal-blocked (block) Jacobi, if it pays off for A.
+
+    Returns None if A is not in CSR/BSR format with blocks matching Dinv, or
+    if the bandwidth of A is too large compared to a cache-sized tile, see
+    relaxation.jacobi_tiled_parameters.
+    """
+    if not sparse.issparse(A) or A.format not in ('csr', 'bsr'):
+        return None
+
+    blocksize = A.blocksize[0] if A.format == 'bsr' else 1
+    if Dinv is not None and Dinv.shape[1] != blocksize:
+        return None
+    if A.format == 'bsr' and A.blocksize[0] != A.blocksize[1]:
+        return None
+
+    tilesize, _ = relaxation.jacobi_tiled_parameters(A, iterations)
+    if tilesize == 0:
+        return None
+
+    if Dinv is None:
+        Dinv = relaxation._point_block_diag(A, blocksize)
+
+    return partial(relaxation.jacobi_tiled, Dinv=Dinv, iterations=iterations,
+                   omega=omega, tilesize=tilesize)
+
+
 def setup_schwarz(lvl, iterations=DEFAULT_NITER, subdomain=None,
                   subdomain_ptr=None, inv_subblock=None, inv_subblock_ptr=None,
                   sweep=DEFAULT_SWEEP):
@@ -542,19 +629,27 @@ def setup_strength_based_schwarz(lvl, iterations=DEFAULT_NITER,
     subdomain_ptr = C.indptr.copy()
     subdomain = C.indices.copy()
 
+    # set up once, so that smoothing does not modify lvl
+    smoother = setup_schwarz(lvl, iterations=iterations, subdomain=subdomain,
+                             subdomain_ptr=subdomain_ptr, sweep=sweep)
+
     def strength_based_schwarz(A, x, b):
-        smoother = setup_schwarz(lvl, iterations=iterations, subdomain=subdomain,
-                                 subdomain_ptr=subdomain_ptr, sweep=sweep)
         smoother(A, x, b)
     return strength_based_schwarz
 
 
 def setup_block_jacobi(lvl, iterations=DEFAULT_NITER, omega=1.0, Dinv=None,
-                       blocksize=None, withrho=True):
-    """Set up block Jacobi."""
+                       blocksize=None, withrho=True, factorization='inverse'):
+    """Set up block Jacobi.
+
+    With factorization='lu', the diagonal blocks are stored as LU factors
+    and each sweep applies them by substitution instead of forming explicit
+    inverses.
+    """
     # Determine Blocksize
     if blocksize is None and Dinv is None:
-        if sparse.issparse(lvl.A) and lvl.A.format == 'csr':
+        if isinstance(lvl.A, StencilOperator) or \
+                (sparse.issparse(lvl.A) and lvl.A.format == 'csr'):
             blocksize = 1
         elif sparse.issparse(lvl.A) and lvl.A.format == 'bsr':
             blocksize = lvl.A.blocksize[0]
@@ -567,12 +662,31 @@ def setup_block_jacobi(lvl, iterations=DEFAULT_NITER, omega=1.0, Dinv=None,
         update_wrapper(smoother, relaxation.block_jacobi)  # set __name__
         return smoother
 
+    if factorization not in ('inverse', 'lu'):
+        raise ValueError(f'Unknown factorization {factorization}')
+
+    if factorization == 'lu' and Dinv is None:
+        LU = get_block_diag(lvl.A, blocksize=blocksize, inv_flag=False).copy()
+        Dlu = (LU, lu_factor_array(LU, index_type=lvl.A.indices.dtype))
+        if withrho:
+            omega = omega/rho_block_D_inv_A(lvl.A, Dlu)
+        smoother = partial(relaxation.block_jacobi, iterations=iterations, omega=omega,
+                           Dlu=Dlu, blocksize=blocksize)
+        update_wrapper(smoother, relaxation.block_jacobi)  # set __name__
+        return smoother
+
     # Use Block Jacobi
     if Dinv is None:
         Dinv = get_block_diag(lvl.A, blocksize=blocksize, inv_flag=True)
     if withrho:
         omega = omega/rho_block_D_inv_A(lvl.A, Dinv)
 
+    if iterations >= 2:
+        smoother = _setup_jacobi_tiled(lvl.A, iterations, omega, Dinv=Dinv)
+        if smoother is not None:
+            update_wrapper(smoother, relaxation.block_jacobi)  # set __name__
+            return smoother
+
     smoother = partial(relaxation.block_jacobi, iterations=iterations, omega=omega,
                        Dinv=Dinv, blocksize=blocksize)
     update_wrapper(smoother, relaxation.block_jacobi)  # set __name__
@@ -585,7 +699,8 @@ def setup_block_gauss_seidel(lvl, iterations=DEFAULT_NITER,
     """Set up block Gauss-Seidel."""
     # Determine Blocksize
     if blocksize is None and Dinv is None:
-        if sparse.issparse(lvl.A) and lvl.A.format == 'csr':
+        if isinstance(lvl.A, StencilOperator) or \
+                (sparse.issparse(lvl.A) and lvl.A.format == 'csr'):
             blocksize = 1
         elif sparse.issparse(lvl.A) and lvl.A.format == 'bsr':
             blocksize = lvl.A.blocksize[0]
@@ -638,6 +753,24 @@ def setup_chebyshev(lvl, lower_bound=1.0/30.0, upper_bound=1.1, degree=3,
     return chebyshev
 
 
+def setup_spai0(lvl, iterations=DEFAULT_NITER):
+    """Set up SPAI-0."""
+    M = relaxation.spai_parameters(lvl.A, order=0)
+
+    def spai0(A, x, b):
+        relaxation.spai(A, x, b, M, iterations=iterations)
+    return spai0
+
+
+def setup_spai1(lvl, iterations=DEFAULT_NITER):
+    """Set up SPAI-1."""
+    M = relaxation.spai_parameters(lvl.A, order=1)
+
+    def spai1(A, x, b):
+        relaxation.spai(A, x, b, M, iterations=iterations)
+    return spai1
+
+
 def setup_jacobi_ne(lvl, iterations=DEFAULT_NITER, omega=1.0, withrho=True):
     """Set up Jacobi NE."""
     matrix_asformat(lvl, 'A', 'csr')
@@ -852,6 +985,8 @@ def _setup_call(fn):
         'richardson':             setup_richardson,
         'sor':                    setup_sor,
         'chebyshev':              setup_chebyshev,
+        'spai0':                  setup_spai0,
+        'spai1':                  setup_spai1,
         'jacobi_ne':              setup_jacobi_ne,
         'gauss_seidel_ne':        setup_gauss_seidel_ne,
         'gauss_seidel_nr':        setup_gauss_seidel_nr,
@@ -9,13 +9,15 @@ from scipy.linalg import solve
 
 from pyamg.classical.split import RS
 from pyamg.classical import ruge_stuben_solver
-from pyamg.gallery import poisson, sprand, elasticity
+from pyamg.gallery import poisson, sprand, elasticity, stencil_grid
 from pyamg.relaxation.relaxation import gauss_seidel, jacobi, \
     block_jacobi, block_gauss_seidel, jacobi_ne, schwarz, sor, \
     gauss_seidel_indexed, polynomial, gauss_seidel_ne, \
     gauss_seidel_nr, \
-    jacobi_indexed, cf_jacobi, fc_jacobi, cf_block_jacobi, fc_block_jacobi
+    jacobi_indexed, cf_jacobi, fc_jacobi, cf_block_jacobi, fc_block_jacobi, \
+    spai, spai_parameters, jacobi_tiled
 from pyamg.util.utils import get_block_diag
+from pyamg.util.linalg import lu_factor_array
 
 # Ignore efficiency warnings
 warnings.simplefilter('ignore', SparseEfficiencyWarning)
@@ -44,6 +46,8 @@ class TestCommonRelaxation(TestCase):
         self.cases.append((gauss_seidel_indexed, ([1, 0],), {}))
         self.cases.append((polynomial, ([0.6, 0.1],), {}))
         self.cases.append((jacobi_indexed, ([1, 0],), {}))
+        self.cases.append((spai, (), {}))
+        self.cases.append((jacobi_tiled, (), {'iterations': 2}))
 
     def test_single_precision(self):
 
@@ -834,6 +838,96 @@ class TestRelaxation(TestCase):
         sor(A, x, b, 0.5, iterations=38)
         assert_allclose(x, x38, rtol=1e-6)
 
+    def test_stencil_operator(self):
+        np.random.seed(2132024)
+        S3 = np.random.rand(3, 5, 3)
+        S3[1, 2, 1] = 2 * S3.sum()
+        # stencil, grid, and the color (sum_k weights[k] * (i[k] % mods[k])) % n
+        # of grid point i in the ordering of the Gauss-Seidel sweeps
+        cases = [(np.array([[0, -1, 0], [-1, 4, -1], [0, -1, 0]]), (7, 9),
+                  [2, 2], [1, 1], 2),  # red-black
+                 (np.array([[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]]), (6, 5),
+                  [2, 2], [2, 1], 4),
+                 (S3, (4, 7, 5), [2, 3, 2], [6, 2, 1], 12)]
+
+        for S, grid, mods, weights, n in cases:
+            A = stencil_grid(S, grid, format='operator')
+            C = A.tocsr()
+            b = np.random.rand(A.shape[0])
+            x0 = np.random.rand(A.shape[0])
+
+            for omega in [1.0, 2.0/3.0]:
+                x, y = x0.copy(), x0.copy()
+                jacobi(A, x, b, iterations=2, omega=omega)
+                jacobi(C, y, b, iterations=2, omega=omega)
+                assert_allclose(x, y)
+
+            colors = (np.indices(grid).reshape(len(grid), -1).T % mods) @ weights % n
+            indices = np.argsort(colors, kind='stable').astype(C.indices.dtype)
+            for sweep in ['forward', 'backward', 'symmetric']:
+                x, y = x0.copy(), x0.copy()
+                gauss_seidel(A, x, b, iterations=2, sweep=sweep)
+                gauss_seidel_indexed(C, y, b, indices, iterations=2, sweep=sweep)
+                assert_allclose(x, y)
+
+            x, y = x0.copy(), x0.copy()
+            polynomial(A, x, b, [0.1, -0.2, 0.3])
+            polynomial(C, y, b, [0.1, -0.2, 0.3])
+            assert_allclose(x, y)
+
+    def test_spai(self):
+        np.random.seed(0)
+
+        cases = []
+        cases.append(poisson((5,), format='csr'))
+        cases.append(poisson((4, 4), format='csr'))
+        A = sprand(12, 12, 0.3) + 4.0 * eye_array(12)
+        cases.append(csr_array(A))
+
+        for A in cases:
+            Ad = A.toarray()
+            n = A.shape[0]
+
+            # SPAI-0: diagonal minimizer of ||I - M A||_F
+            M = spai_parameters(A, order=0)
+            m = Ad.diagonal() / (Ad**2).sum(axis=1)
+            assert_allclose(M.diagonal(), m)
+
+            # SPAI-1: row-wise least squares over the pattern of A
+            M = spai_parameters(A, order=1).toarray()
+            for i in range(n):
+                J = A.indices[A.indptr[i]:A.indptr[i+1]]
+                mi = np.linalg.lstsq(Ad[J, :].T, np.eye(n)[i], rcond=None)[0]
+                assert_allclose(M[i, J], mi, atol=1e-10)
+
+            # one iteration is x + M (b - A x)
+            b = np.random.rand(n)
+            x = np.random.rand(n)
+            x_copy = x.copy()
+            spai(A, x, b, csr_array(M), iterations=1)
+            assert_allclose(x, x_copy + M @ (b - Ad @ x_copy))
+
+        # BSR inverses keep the block pattern and reduce ||I - M A||_F
+        A, _ = elasticity.linear_elasticity((6, 6))
+        I = np.eye(A.shape[0])
+        D = get_block_diag(A, blocksize=2, inv_flag=False)
+        Dinv = np.zeros_like(I)
+        for i in range(D.shape[0]):
+            Dinv[2*i:2*i+2, 2*i:2*i+2] = np.linalg.inv(D[i])
+        err_jacobi = np.linalg.norm(I - Dinv @ A.toarray())
+        for order in (0, 1):
+            M = spai_parameters(A, order=order)
+            assert M.format == 'bsr'
+            assert M.blocksize == A.blocksize
+            assert np.linalg.norm(I - (M @ A).toarray()) < err_jacobi
+
+        # cached on the matrix
+        assert spai_parameters(A, order=1) is M
+
+        # SPAI-1 is real only
+        A = poisson((4,), format='csr').astype(complex)
+        check_raises(ValueError, spai_parameters, A, order=1)
+
 
 # Test complex arithmetic
 class TestComplexRelaxation(TestCase):
@@ -1616,6 +1710,65 @@ class TestBlockRelaxation(TestCase):
             assert_almost_equal(x, gold(A, x_copy, b, blocksize, 1.1),
                                 decimal=4)
 
+        # LU-factored diagonal blocks, compare to explicit inverses
+        A = elasticity.linear_elasticity((6, 6))[0]
+        cases = [A, A.astype(complex) + 1.0j*eye_array(A.shape[0], format='bsr')]
+        for A in cases:
+            for blocksize in [2, 4]:
+                Dinv = get_block_diag(A, blocksize=blocksize, inv_flag=True)
+                LU = get_block_diag(A, blocksize=blocksize, inv_flag=False).copy()
+                piv = lu_factor_array(LU)
+                b = np.random.rand(A.shape[0]).astype(A.dtype)
+                x = np.random.rand(A.shape[0]).astype(A.dtype)
+                x_copy = x.copy()
+                block_jacobi(A, x, b, Dinv=Dinv, blocksize=blocksize, iterations=2,
+                             omega=0.8)
+                block_jacobi(A, x_copy, b, Dlu=(LU, piv), blocksize=blocksize,
+                             iterations=2, omega=0.8)
+                assert_allclose(x, x_copy, rtol=1e-10, atol=1e-10)
+
+    def test_jacobi_tiled(self):
+        np.random.seed(0)
+
+        # point Jacobi, compare to jacobi for several tile sizes
+        cases = []
+        cases.append(poisson((20, 20), format='csr'))
+        cases.append(poisson((6, 5, 4), format='csr'))
+        A = poisson((10, 10), format='csr').astype(complex)
+        A.data = A.data + 1.0j*np.random.rand(A.nnz)
+        cases.append(A)
+        cases.append(elasticity.linear_elasticity((8, 8))[0])
+
+        for A in cases:
+            for iterations in [1, 2, 3]:
+                for tilesize in [1, 7, 40, None]:
+                    b = np.random.rand(A.shape[0]).astype(A.dtype)
+                    x = np.random.rand(A.shape[0]).astype(A.dtype)
+                    x_copy = x.copy()
+                    jacobi(A, x, b, iterations=iterations, omega=0.8)
+                    jacobi_tiled(A, x_copy, b, iterations=iterations, omega=0.8,
+                                 tilesize=tilesize)
+                    assert_allclose(x, x_copy, rtol=1e-12, atol=1e-12)
+
+        # block Jacobi, compare to block_jacobi
+        A = elasticity.linear_elasticity((8, 8))[0]
+        Dinv = get_block_diag(A, blocksize=2, inv_flag=True)
+        for iterations in [1, 2, 4]:
+            for tilesize in [1, 5, None]:
+                b = np.random.rand(A.shape[0])
+                x = np.random.rand(A.shape[0])
+                x_copy = x.copy()
+                block_jacobi(A, x, b, Dinv=Dinv, blocksize=2, iterations=iterations,
+                             omega=0.8)
+                jacobi_tiled(A, x_copy, b, Dinv=Dinv, iterations=iterations, omega=0.8,
+                             tilesize=tilesize)
+                assert_allclose(x, x_copy, rtol=1e-12, atol=1e-12)
+
+        # the bandwidth is cached on the matrix
+        A = poisson((10, 10), format='csr')
+        jacobi_tiled(A, np.zeros(100), np.ones(100), iterations=2)
+        assert A.bandwidth == 10
+
     def test_block_gauss_seidel(self):
         np.random.seed(0)
 
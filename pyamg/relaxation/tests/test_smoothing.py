@@ -3,10 +3,11 @@ from numpy.testing import TestCase
 
 from scipy import sparse
 
-from pyamg.gallery import poisson
+from pyamg.gallery import poisson, linear_elasticity
 from pyamg import smoothed_aggregation_solver, ruge_stuben_solver
 from pyamg.util.utils import profile_solver
 from pyamg.relaxation.smoothing import change_smoothers
+from pyamg.relaxation.relaxation import jacobi, jacobi_tiled, block_jacobi
 
 methods = [('gauss_seidel', {'sweep': 'symmetric'}),
            'jacobi',
@@ -27,6 +28,7 @@ methods2 = [('gauss_seidel', 'richardson'),
             (['gauss_seidel_ne', 'gauss_seidel_nr'], 'jacobi_ne'),
             ('cgnr', 'cgne'),
             ('schwarz', 'strength_based_schwarz'),
+            ('spai0', 'spai1'),
             (('gauss_seidel', {'iterations': 3}), None),
             ([('gauss_seidel_ne', {'iterations': 2}),
               ('gmres', {'maxiter': 3})], None),
@@ -102,6 +104,44 @@ class TestSmoothing(TestCase):
             assert not ml.symmetric_smoothing
 
 
+class TestTiledJacobi(TestCase):
+    def test_tiled_selection(self):
+        """Multi-sweep (block) Jacobi uses the temporal-blocked kernel."""
+        A = poisson((50, 50), format='csr')
+        ml = smoothed_aggregation_solver(A, max_coarse=10,
+                                         presmoother=('jacobi', {'iterations': 2}),
+                                         postsmoother=('jacobi', {'iterations': 1}))
+        assert ml.levels[0].presmoother.func is jacobi_tiled
+        assert ml.levels[0].presmoother.__name__ == 'jacobi'
+        assert ml.levels[0].postsmoother.func is jacobi
+
+        residuals = profile_solver(ml)
+        assert (residuals[-1]/residuals[0])**(1.0/len(residuals)) < 0.95
+
+        A, B = linear_elasticity((20, 20))
+        smoother = ('block_jacobi', {'iterations': 2})
+        ml = smoothed_aggregation_solver(A, B=B, max_coarse=10,
+                                         presmoother=smoother, postsmoother=smoother)
+        assert ml.levels[0].presmoother.func is jacobi_tiled
+        assert ml.levels[0].presmoother.__name__ == 'block_jacobi'
+
+        residuals = profile_solver(ml)
+        assert (residuals[-1]/residuals[0])**(1.0/len(residuals)) < 0.95
+
+    def test_block_jacobi_lu(self):
+        """Block Jacobi with LU-factored diagonal blocks."""
+        A, B = linear_elasticity((20, 20))
+        smoother = ('block_jacobi', {'iterations': 2, 'factorization': 'lu'})
+        ml = smoothed_aggregation_solver(A, B=B, max_coarse=10,
+                                         presmoother=smoother, postsmoother=smoother)
+        assert ml.levels[0].presmoother.func is block_jacobi
+        assert 'Dlu' in ml.levels[0].presmoother.keywords
+        assert ml.levels[0].presmoother.__name__ == 'block_jacobi'
+
+        residuals = profile_solver(ml)
+        assert (residuals[-1]/residuals[0])**(1.0/len(residuals)) < 0.95
+
+
 class TestSolverMatrix(TestCase):
     def test_change_solve_matrix(self):
         """Check that the matrix changes and that relaxation stays the same name.
@@ -119,6 +159,8 @@ class TestSolverMatrix(TestCase):
                     'richardson',
                     'sor',
                     'chebyshev',
+                    'spai0',
+                    'spai1',
                     'jacobi_ne',
                     'gauss_seidel_ne',
                     'gauss_seidel_nr',
@@ -15,11 +15,11 @@ import numpy as np
 from scipy import sparse
 from scipy.sparse import csr_array
 from . import amg_core
-from .relaxation.relaxation import jacobi
 from .util.linalg import approximate_spectral_radius
 from .util.utils import (scale_rows_by_largest_entry, amalgamate, scale_rows,
                          get_block_diag, scale_columns)
 from .util.params import set_tol
+from .util import streaming
 
 
 
@@ -463,6 +463,11 @@ def classical_strength_of_connection(A, theta=0.1, block=True, norm='abs'):
         if not sparse.issparse(A) or A.format != 'csr':
             warn('Implicit conversion of A to csr', sparse.SparseEfficiencyWarning)
             A = sparse.csr_array(A)
+        if streaming.is_mapped(A):
+            # the kernel is row-local, so run it on one block of rows at a time
+            return streaming.map_rows(
+                lambda start, stop, block: _classical_strength_rows(block, start,
+                                                                    theta, norm), A)
         data = A.data
         N = A.shape[0]
 
@@ -492,6 +497,33 @@ def classical_strength_of_connection(A, theta=0.1, block=True, norm='abs'):
     return S
 
 
+def _classical_strength_rows(A, start, theta, norm):
+    """Classical strength of rows start:start + A.shape[0] of a CSR matrix.
+
+    A holds the rows, with global column indices.  The result is scaled as
+    in classical_strength_of_connection.
+    """
+    Sp = np.empty_like(A.indptr)
+    Sj = np.empty_like(A.indices)
+    Sx = np.empty_like(A.data)
+
+    # shift the columns so that the diagonal of row i is in column i
+    if norm in ('abs', 'fro'):
+        fn = amg_core.classical_strength_of_connection_abs
+    elif norm == 'min':
+        fn = amg_core.classical_strength_of_connection_min
+    else:
+        raise ValueError('Unrecognized option for norm for strength.')
+    fn(A.shape[0], theta, A.indptr, A.indices - start, A.data, Sp, Sj, Sx)
+    Sj += start
+
+    S = sparse.csr_array((Sx, Sj, Sp), shape=A.shape)
+    S.data = np.abs(S.data)
+    S = scale_rows_by_largest_entry(S)
+    S.eliminate_zeros()
+    return S
+
+
 def symmetric_strength_of_connection(A, theta=0):
     """Symmetric Strength Measure.
 
@@ -562,6 +594,13 @@ def symmetric_strength_of_connection(A, theta=0):
         # if theta == 0:
         #     return A
 
+        if streaming.is_mapped(A):
+            # one block of rows at a time, with the diagonal of all rows
+            diags = np.abs(streaming.diagonal(A))
+            return streaming.map_rows(
+                lambda start, stop, block: _symmetric_strength_rows(block, start,
+                                                                    theta, diags), A)
+
         Sp = np.empty_like(A.indptr)
         Sj = np.empty_like(A.indices)
         Sx = np.empty_like(A.data)
@@ -585,8 +624,10 @@ def symmetric_strength_of_connection(A, theta=0):
         else:
             # the strength of connection matrix is based on the
             # Frobenius norms of the blocks
-            data = (np.conjugate(A.data) * A.data).reshape(-1, R * C)
-            data = np.sqrt(data.sum(axis=1))
+            data = np.concatenate([
+                np.sqrt((np.conjugate(block.data) * block.data).reshape(-1, R * C)
+                        .sum(axis=1))
+                for _start, _stop, block in streaming.row_blocks(A)])
             A = sparse.csr_array((data, A.indices, A.indptr),
                                   shape=(int(M / R), int(N / C)))
             return symmetric_strength_of_connection(A, theta)
@@ -602,6 +643,25 @@ def symmetric_strength_of_connection(A, theta=0):
     return S
 
 
+def _symmetric_strength_rows(A, start, theta, diags):
+    """Symmetric strength of rows start:start + A.shape[0] of a matrix.
+
+    A holds the rows, with global column indices, and diags is the magnitude
+    of the diagonal of the whole matrix.  The result is scaled as in
+    symmetric_strength_of_connection.
+    """
+    rows = np.repeat(np.arange(start, start + A.shape[0], dtype=A.indptr.dtype),
+                     np.diff(A.indptr))
+    normsq = (np.conjugate(A.data) * A.data).real
+    keep = (rows == A.indices) | \
+        (normsq >= theta * theta * diags[rows] * diags[A.indices])
+    indptr = np.concatenate(([0], np.cumsum(keep)))[A.indptr]
+
+    S = sparse.csr_array((np.abs(A.data[keep]), A.indices[keep],
+                          indptr.astype(A.indptr.dtype)), shape=A.shape)
+    return scale_rows_by_largest_entry(S)
+
+
 def energy_based_strength_of_connection(A, theta=0.0, k=2):
     """Energy Strength Measure.
 
@@ -635,8 +695,9 @@ def energy_based_strength_of_connection(A, theta=0.0, k=2):
     where `v_j = v`, such that entry `j` in `v` has been zeroed out.  As is common,
     larger values imply a stronger connection.
 
-    Current implementation is a very slow pure-python implementation for
-    experimental purposes, only.
+    Each column of the approximate inverse is built with weighted-Jacobi on
+    the local neighborhood of its row, so the cost scales with the number of
+    nonzeros of A in the (k+1)-neighborhood of each row.
 
     See [1]_ for more details.
 
@@ -678,61 +739,35 @@ def energy_based_strength_of_connection(A, theta=0.0, k=2):
         bsr_flag = False
         numPDEs = 1
 
-    # Convert A to csc and Atilde to csr
-    if A.format == 'csr':
-        Atilde = A.copy()
-        A = A.tocsc()
-    else:
-        A = A.tocsc()
-        Atilde = A.copy()
-        Atilde = Atilde.tocsr()
+    A = A.tocsr()
+    A.sum_duplicates()
+    AH = A.conj().T.tocsr()
 
     # Calculate the weighted-Jacobi parameter
     D = A.diagonal()
-    Dinv = 1.0 / D
-    Dinv[D == 0] = 0.0
-    Dinv = sparse.csc_array((Dinv, (np.arange(A.shape[0], dtype=A.indptr.dtype),
-                                    np.arange(A.shape[1], dtype=A.indptr.dtype))),
-                            shape=A.shape)
-    DinvA = Dinv @ A
+    Dinv = np.zeros_like(D)
+    Dinv[D != 0] = 1.0 / D[D != 0]
+    DinvA = sparse.diags_array(Dinv) @ A
     omega = 1.0 / approximate_spectral_radius(DinvA)
     del DinvA
 
-    # Approximate A-inverse with k steps of w-Jacobi and a zero initial guess
-    S = sparse.csc_array(A.shape, dtype=A.dtype)  # empty matrix
-    Id = sparse.eye_array(A.shape[0], A.shape[1], format='csc')
-    for _i in range(k + 1):
-        S = S + omega * (Dinv @ (Id - A @ S))
-
-    # Calculate the strength entries in S column-wise, but only strength
-    # values at the sparsity pattern of A
-    for i in range(Atilde.shape[0]):
-        v = S[:, [i]].toarray()
-        v = v.ravel()
-        Av = A @ v
-        denom = np.sqrt(np.inner(v.conj(), Av))
-        # replace entries in row i with strength values
-        for j in range(Atilde.indptr[i], Atilde.indptr[i + 1]):
-            col = Atilde.indices[j]
-            vj = v[col].copy()
-            v[col] = 0.0
-            #   =  (||v_j||_A - ||v||_A) / ||v||_A
-            val = np.sqrt(np.inner(v.conj(), A @ v)) / denom - 1.0
-
-            # Negative values generally imply a weak connection
-            if val > -0.01:
-                Atilde.data[j] = abs(val)
-            else:
-                Atilde.data[j] = 0.0
-
-            v[col] = vj
+    # Approximate each column of A-inverse with k+1 steps of w-Jacobi on the
+    # local neighborhood, and calculate strength values at the sparsity
+    # pattern of A
+    Sx = np.zeros(A.nnz, dtype=np.real(A.data).dtype)
+    amg_core.energy_based_strength_helper(A.shape[0],
+                                          A.indptr, A.indices, A.data,
+                                          AH.indptr, AH.indices, AH.data,
+                                          omega, k, Sx)
+    Atilde = sparse.csr_array((Sx, A.indices.copy(), A.indptr.copy()), shape=A.shape)
+    Id = sparse.eye_array(A.shape[0], A.shape[1], format='csr')
 
     # Apply drop tolerance
     Atilde = classical_strength_of_connection(Atilde, theta=theta)
     Atilde.eliminate_zeros()
 
     # Put ones on the diagonal
-    Atilde = Atilde + Id.tocsr()
+    Atilde = Atilde + Id
     Atilde.sort_indices()
 
     # Amalgamate Atilde for the BSR case, using ones for all strong connections
@@ -761,7 +796,7 @@ def ode_strength_of_connection(A, B=None, epsilon=4.0, k=2, proj_type='l2',
 
 def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
                                      proj_type='l2', block_flag=False,
-                                     symmetrize_measure=True):
+                                     symmetrize_measure=True, rowblock=None):
     """Evolution strength measure.
 
     Construct strength of connection matrix using an Evolution-based measure.
@@ -784,6 +819,11 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
         weighted-Jacobi.
     symmetrize_measure : bool
         Symmetrize the strength as `(A + A.T) / 2`.
+    rowblock : int, optional
+        If given, the evolution operator and the strength values are computed
+        in blocks of `rowblock` rows.  No global matrix power and no global
+        products of the columns of `B` are formed, which bounds peak memory
+        for large `k` or many near nullspace vectors.
 
     Returns
     -------
@@ -792,6 +832,9 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
 
     Notes
     -----
+    The evolution operator ``(I - (1/rho) Dinv A)^k`` is only evaluated at the
+    sparsity pattern of `A`, for any number of time steps `k`.
+
     See [1]_ for more details.
 
     References
@@ -819,6 +862,8 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
         raise ValueError('expected epsilon > 1.0')
     if k <= 0:
         raise ValueError('number of time steps must be > 0')
+    if rowblock is not None and rowblock <= 0:
+        raise ValueError('rowblock must be > 0')
     if proj_type not in ['l2', 'D_A']:
         raise ValueError('proj_type must be "l2" or "D_A"')
     if not sparse.issparse(A) or A.format not in ('csr', 'bsr'):
@@ -880,15 +925,9 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
     else:
         D_A = sparse.eye_array(dimen, format='csr', dtype=A.dtype)
 
-    # Calculate (I - delta_t Dinv A)^k
+    # Calculate one time step
     #      In order to later access columns, we calculate the transpose in
     #      CSR format so that columns will be accessed efficiently
-    # Calculate the number of time steps that can be done by squaring, and
-    # the number of time steps that must be done incrementally
-    nsquare = int(np.log2(k))
-    ninc = k - 2**nsquare
-
-    # Calculate one time step
     Id = sparse.eye_array(dimen, format='csr', dtype=A.dtype)
     Atilde = Id - (1.0 / rho_DinvA) * Dinv_A
     Atilde = Atilde.T.tocsr()
@@ -907,30 +946,7 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
         del row_length, my_pde
         mask.eliminate_zeros()
 
-    # If the total number of time steps is a power of two, then there is
-    # a very efficient computational short-cut.  Otherwise, we support
-    # other numbers of time steps, through an inefficient algorithm.
-    if ninc > 0:
-        warn('The most efficient time stepping for the Evolution Strength '
-             f'Method is done in powers of two.\nYou have chosen {k} time steps.')
-
-        # Calculate (Atilde^nsquare)^T = (Atilde^T)^nsquare
-        for _i in range(nsquare):
-            Atilde = Atilde @ Atilde
-
-        JacobiStep = (Id - (1.0 / rho_DinvA) @ Dinv_A).T.tocsr()
-        for _i in range(ninc):
-            Atilde = Atilde @ JacobiStep
-        del JacobiStep
-
-        # Apply mask to Atilde, zeros in mask have already been eliminated at
-        # start of routine.
-        mask.data[:] = 1.0
-        Atilde = Atilde.multiply(mask)
-        Atilde.eliminate_zeros()
-        Atilde.sort_indices()
-
-    elif nsquare == 0:
+    if k == 1:
         if numPDEs > 1:
             # Apply mask to Atilde, zeros in mask have already been eliminated
             # at start of routine.
@@ -940,24 +956,9 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
             Atilde.sort_indices()
 
     else:
-        # Use computational short-cut for case (ninc == 0) and (nsquare > 0)
-        # Calculate Atilde^k only at the sparsity pattern of mask.
-        for _i in range(nsquare - 1):
-            Atilde = Atilde @ Atilde
-
-        # Call incomplete mat-mat mult
-        AtildeCSC = Atilde.tocsc()
-        AtildeCSC.sort_indices()
-        mask.sort_indices()
-        Atilde.sort_indices()
-        amg_core.incomplete_mat_mult_csr(Atilde.indptr, Atilde.indices,
-                                         Atilde.data, AtildeCSC.indptr,
-                                         AtildeCSC.indices, AtildeCSC.data,
-                                         mask.indptr, mask.indices, mask.data,
-                                         dimen)
-
-        del AtildeCSC, Atilde
-        Atilde = mask
+        # Calculate (Atilde^k)^T = (Atilde^T)^k only at the sparsity pattern
+        # of mask
+        Atilde = _incomplete_matrix_power(Atilde, mask, k, rowblock)
         Atilde.eliminate_zeros()
         Atilde.sort_indices()
 
@@ -1032,31 +1033,18 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
         del data, weak_ratio, angle
 
     else:
-        # For use in computing local B_i^H@B, precompute the element-wise
-        # multiply of each column of B with each other column.  We also scale
-        # by 2.0 to account for BDB's eventual use in a constrained
-        # minimization problem
-        BDBCols = int(np.sum(np.arange(NullDim + 1)))
-        BDB = np.zeros((dimen, BDBCols), dtype=A.dtype)
-        counter = 0
-        for i in range(NullDim):
-            for j in range(i, NullDim):
-                BDB[:, counter] = 2.0 *\
-                    (np.conjugate(np.ravel(Bmat[:, i])) * np.ravel(D_A @ Bmat[:, j]))
-                counter = counter + 1
-
         # Choose tolerance for dropping "numerically zero" values later
         tol = set_tol(Atilde.dtype)
 
-        # Use constrained min problem to define strength
-        amg_core.evolution_strength_helper(Atilde.data,
-                                           Atilde.indptr,
-                                           Atilde.indices,
-                                           Atilde.shape[0],
-                                           np.ravel(Bmat),
-                                           np.ravel((D_A @ B.conj()).T),
-                                           np.ravel(BDB),
-                                           BDBCols, NullDim, tol)
+        # Use constrained min problem to define strength, processing the rows
+        # of Atilde in blocks
+        if rowblock is None:
+            rowblock = dimen
+        DB = D_A @ Bmat
+        DBconj = D_A @ Bmat.conj()
+        for rowstart in range(0, dimen, rowblock):
+            rowstop = min(rowstart + rowblock, dimen)
+            _evolution_strength_block(Atilde, rowstart, rowstop, Bmat, DB, DBconj, tol)
 
         Atilde.eliminate_zeros()
 
@@ -1104,6 +1092,104 @@ def evolution_strength_of_connection(A, B=None, epsilon=4.0, k=2,
     return Atilde
 
 
+def _matrix_power(A, p):
+    """Return A^p for a sparse matrix A and p >= 1, by repeated squaring."""
+    P = None
+    while p > 0:
+        if p % 2 == 1:
+            P = A if P is None else P @ A
+        p //= 2
+        if p > 0:
+            A = A @ A
+    return P
+
+
+def _incomplete_matrix_power(A, mask, k, rowblock=None):
+    """Return A^k evaluated only at the sparsity pattern of mask.
+
+    A^k is split as A^a @ A^b with ``b = k // 2`` and ``a = k - b``.  The
+    factors are formed explicitly and the final product is only computed at
+    the pattern of mask with amg_core.incomplete_mat_mult_csr.
+
+    If rowblock is given, A^(k-1) is instead formed a block of rows at a time
+    and multiplied against A, so that no global matrix power is stored.
+    """
+    dimen = A.shape[0]
+    if rowblock is None:
+        Pb = _matrix_power(A, k // 2)
+        Pa = Pb if k % 2 == 0 else Pb @ A
+        Pb = Pb.tocsc()
+    else:
+        Pb = A.tocsc()
+    Pb.sort_indices()
+
+    S = csr_array((np.zeros(mask.nnz, dtype=A.dtype), mask.indices, mask.indptr),
+                  shape=mask.shape)
+    S.sort_indices()
+
+    for rowstart in range(0, dimen, rowblock or dimen):
+        rowstop = min(rowstart + (rowblock or dimen), dimen)
+        if rowblock is None:
+            Pa_block = Pa
+        else:
+            Pa_block = A[rowstart:rowstop]
+            for _i in range(k - 2):
+                Pa_block = Pa_block @ A
+        Pa_block = csr_array(Pa_block)
+        Pa_block.sort_indices()
+
+        start, stop = S.indptr[rowstart], S.indptr[rowstop]
+        amg_core.incomplete_mat_mult_csr(Pa_block.indptr, Pa_block.indices,
+                                         Pa_block.data, Pb.indptr, Pb.indices,
+                                         Pb.data, S.indptr[rowstart:rowstop+1] - start,
+                                         S.indices[start:stop], S.data[start:stop],
+                                         rowstop - rowstart)
+    return S
+
+
+def _evolution_strength_block(Atilde, rowstart, rowstop, B, db, db_conj, tol):
+    """Apply amg_core.evolution_strength_helper to a block of rows of Atilde.
+
+    The columns referenced by the block are renumbered locally, with the rows
+    of the block first, so that only the rows of B (and the products of its
+    columns) needed by the block are formed.
+    """
+    NullDim = B.shape[1]
+    BDBCols = int(np.sum(np.arange(NullDim + 1)))
+    start, stop = Atilde.indptr[rowstart], Atilde.indptr[rowstop]
+    cols = Atilde.indices[start:stop]
+
+    # Local numbering: rows of the block, then the remaining columns
+    rows = np.arange(rowstart, rowstop, dtype=cols.dtype)
+    order = np.concatenate((rows, np.setdiff1d(cols, rows)))
+    nlocal = order.shape[0]
+    local = np.zeros(Atilde.shape[0], dtype=cols.dtype)
+    local[order] = np.arange(nlocal, dtype=cols.dtype)
+
+    Sp = np.full(nlocal + 1, stop - start, dtype=cols.dtype)
+    Sp[:rowstop - rowstart + 1] = Atilde.indptr[rowstart:rowstop+1] - start
+    Sj = local[cols]
+
+    # For use in computing local B_i^H@B, precompute the element-wise
+    # multiply of each column of B with each other column.  We also scale
+    # by 2.0 to account for BDB's eventual use in a constrained
+    # minimization problem
+    Blocal = B[order]
+    DBlocal = db[order]
+    BDB = np.zeros((nlocal, BDBCols), dtype=Atilde.dtype)
+    counter = 0
+    for i in range(NullDim):
+        for j in range(i, NullDim):
+            BDB[:, counter] = 2.0 * (np.conjugate(Blocal[:, i]) * DBlocal[:, j])
+            counter = counter + 1
+
+    amg_core.evolution_strength_helper(Atilde.data[start:stop], Sp, Sj, nlocal,
+                                       np.ravel(Blocal),
+                                       np.ravel(db_conj[order].T),
+                                       np.ravel(BDB),
+                                       BDBCols, NullDim, tol)
+
+
 def relaxation_vectors(A, R, k, alpha):
     """Generate test vectors by relaxing on Ax=0 for some random vectors x.
 
@@ -1121,20 +1207,19 @@ def relaxation_vectors(A, R, k, alpha):
     Returns
     -------
     array
-        Dense array N x k array of relaxation vectors.
+        Dense N x R array of relaxation vectors.
 
     """
     # random n x R block in column ordering
     n = A.shape[0]
     x = np.random.rand(n * R) - 0.5
     x = np.reshape(x, (n, R), order='F')
-    # for i in range(R):
-    #     x[:,i] = x[:,i] - np.mean(x[:,i])
-    b = np.zeros((n, 1))
 
-    for r in range(0, R):
-        jacobi(A, x[:, r], b, iterations=k, omega=alpha)
-        # x[:,r] = x[:,r]/norm(x[:,r])
+    # relax all R vectors together, stored row-wise
+    x = np.ascontiguousarray(x, dtype=A.dtype)
+    temp = np.empty_like(x)
+    amg_core.jacobi_multivector(A.indptr, A.indices, A.data, np.ravel(x),
+                                np.ravel(temp), R, k, alpha)
 
     return x
 
@@ -1177,6 +1262,11 @@ def affinity_distance(A, alpha=0.5, R=5, k=20, epsilon=4.0):
     if not sparse.issparse(A) or A.format != 'csr':
         A = sparse.csr_array(A)
 
+    if np.iscomplexobj(A):
+        raise ValueError('expected real A, not complex')
+    if not np.issubdtype(A.dtype, np.floating):
+        A = A.astype(float)  # integer or bool
+
     if alpha < 0:
         raise ValueError('expected alpha>0')
 
@@ -1190,9 +1280,10 @@ def affinity_distance(A, alpha=0.5, R=5, k=20, epsilon=4.0):
         raise ValueError('expected epsilon>1.0')
 
     def distance(x):
-        (rows, cols) = A.nonzero()
-        return 1 - np.sum(x[rows] * x[cols], axis=1)**2 / \
-            (np.sum(x[rows]**2, axis=1) * np.sum(x[cols]**2, axis=1))
+        d = np.empty(A.nnz, dtype=x.dtype)
+        amg_core.affinity_distance_csr(A.shape[0], A.indptr, A.indices, A.data,
+                                       np.ravel(x), R, epsilon, d)
+        return d
 
     return distance_measure_common(A, distance, alpha, R, k, epsilon)
 
@@ -1237,6 +1328,11 @@ def algebraic_distance(A, alpha=0.5, R=5, k=20, epsilon=2.0, p=2):
     if not sparse.issparse(A) or A.format != 'csr':
         A = sparse.csr_array(A)
 
+    if np.iscomplexobj(A):
+        raise ValueError('expected real A, not complex')
+    if not np.issubdtype(A.dtype, np.floating):
+        A = A.astype(float)  # integer or bool
+
     if alpha < 0:
         raise ValueError('expected alpha>0')
 
@@ -1253,12 +1349,10 @@ def algebraic_distance(A, alpha=0.5, R=5, k=20, epsilon=2.0, p=2):
         raise ValueError('expected p>1 or equal to numpy.inf')
 
     def distance(x):
-        (rows, cols) = A.nonzero()
-        if p != np.inf:
-            avg = np.sum(np.abs(x[rows] - x[cols])**p, axis=1) / R
-            return (avg)**(1.0 / p)
-
-        return np.abs(x[rows] - x[cols]).max(axis=1)
+        d = np.empty(A.nnz, dtype=x.dtype)
+        amg_core.algebraic_distance_csr(A.shape[0], A.indptr, A.indices, A.data,
+                                        np.ravel(x), R, p, epsilon, d)
+        return d
 
     return distance_measure_common(A, distance, alpha, R, k, epsilon)
 
@@ -1271,7 +1365,9 @@ def distance_measure_common(A, func, alpha, R, k, epsilon):
     A : csr_array
         Input matrix for strength.
     func : callable
-        Function to apply to relaxation vectors.
+        Function to apply to relaxation vectors.  Returns the distances at
+        the nonzeros of `A` (in CSR order), with the drop tolerance `epsilon`
+        already applied and zeros for weak connections and the diagonal.
     alpha : scalar
         Weight for Jacobi.
     R : int
@@ -1290,20 +1386,9 @@ def distance_measure_common(A, func, alpha, R, k, epsilon):
     # create test vectors
     x = relaxation_vectors(A, R, k, alpha)
 
-    # apply distance measure function to vectors
+    # apply distance measure function and filter to vectors
     d = func(x)
-
-    # drop distances to self
-    (rows, cols) = A.nonzero()
-    weak = np.where(rows == cols)[0]
-    d[weak] = 0
-    C = sparse.csr_array((d, (rows, cols)), shape=A.shape)
-    C.eliminate_zeros()
-
-    # remove weak connections
-    # removes entry e from a row if e > theta * min of all entries in the row
-    amg_core.apply_distance_filter(C.shape[0], epsilon, C.indptr,
-                                   C.indices, C.data)
+    C = sparse.csr_array((d, A.indices.copy(), A.indptr.copy()), shape=A.shape)
     C.eliminate_zeros()
 
     # Standardized strength values require small values be weak and large
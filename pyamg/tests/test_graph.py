@@ -4,12 +4,12 @@ from scipy import sparse
 
 import pytest
 
-from numpy.testing import TestCase, assert_equal
+from numpy.testing import TestCase, assert_equal, assert_allclose
 
 from pyamg.gallery import poisson, load_example
 from pyamg.graph import (maximal_independent_set, vertex_coloring,
-                         bellman_ford, lloyd_cluster, connected_components,
-                         metis_partition)
+                         bellman_ford, lloyd_cluster, balanced_lloyd_cluster,
+                         connected_components, metis_partition)
 from pyamg.graph_ref import bellman_ford_reference, bellman_ford_balanced_reference
 from pyamg import amg_core
 
@@ -126,6 +126,18 @@ class TestGraph(TestCase):
                 assert_equal(m_result, m_expected)
                 assert_equal(p_result, p_expected)
 
+                # distances are unique for random weights, so Dijkstra agrees
+                for method, base in [('dijkstra', 'standard'),
+                                     ('dijkstra_balanced', 'balanced')]:
+                    d_result, m_result, p_result = bellman_ford(G, centers, method=method)
+                    d_expected, m_expected, p_expected = bellman_ford(G, centers,
+                                                                      method=base)
+                    if method == 'dijkstra_balanced':
+                        p_expected[centers] = centers  # centers are their own predecessor
+                    assert_allclose(d_result, d_expected, rtol=1e-14)
+                    assert_equal(m_result, m_expected)
+                    assert_equal(p_result, p_expected)
+
     def test_bellman_ford_reference(self):
         Edges = np.array([[1, 4],
                           [3, 1],
@@ -162,6 +174,67 @@ class TestGraph(TestCase):
 
                 _clusters, _centers = lloyd_cluster(G, n_clusters)
 
+                np.random.seed(0)
+                clusters, centers = lloyd_cluster(G, n_clusters)
+                np.random.seed(0)
+                clusters_d, centers_d = lloyd_cluster(G, n_clusters, method='dijkstra')
+                assert_equal(clusters_d, clusters)
+                assert_equal(centers_d, centers)
+
+    def test_balanced_lloyd_cluster(self):
+        np.random.seed(1827764418)
+
+        for G in self.cases:
+            G.data = np.random.rand(G.nnz)
+            G = G + G.T
+            N = G.shape[0]
+            if N < 10 or N > 300 or sparse.csgraph.connected_components(G)[0] > 1:
+                continue
+
+            for rebalance_iters in [0, 1]:
+                seed = np.random.randint(2**31)
+                np.random.seed(seed)
+                clusters, centers = balanced_lloyd_cluster(
+                    G, N // 5, rebalance_iters=rebalance_iters)
+                np.random.seed(seed)
+                clusters_d, centers_d = balanced_lloyd_cluster(
+                    G, N // 5, rebalance_iters=rebalance_iters, method='dijkstra')
+                assert_equal(clusters_d, clusters)
+                assert_equal(centers_d, centers)
+
+    def test_center_nodes_dijkstra(self):
+        np.random.seed(2276417346)
+
+        for G in self.cases:
+            G.data = np.random.rand(G.nnz)
+            G = (G + G.T).tocsr()
+            N = G.shape[0]
+            if N < 10:
+                continue
+
+            c = np.random.permutation(N)[:N // 8].astype(np.int32)
+            d, m, p = bellman_ford(G, c)
+            p[c] = c
+            pc = np.bincount(p[p > -1], minlength=N).astype(np.int32)
+            s = np.bincount(m[m > -1], minlength=len(c)).astype(np.int32)
+
+            # reference, with Floyd-Warshall
+            maxsize = s.max()
+            args = [c.copy(), d.copy(), m.copy(), p.copy(), pc.copy(), s.copy()]
+            changed = amg_core.center_nodes(
+                N, G.indptr, G.indices, G.data,
+                np.empty(len(c), dtype=np.int32), np.empty(maxsize**2),
+                np.empty(maxsize**2, dtype=np.int32), np.empty(N, dtype=np.int32),
+                np.empty(N, dtype=np.int32), np.empty(maxsize), *args)
+
+            args_d = [c.copy(), d.copy(), m.copy(), p.copy(), pc.copy(), s.copy()]
+            changed_d = amg_core.center_nodes_dijkstra(N, G.indptr, G.indices, G.data,
+                                                       *args_d)
+            assert changed == changed_d
+            assert_allclose(args_d[1], args[1], rtol=1e-14)
+            for k in [0, 2, 3, 4, 5]:
+                assert_equal(args_d[k], args[k])
+
 
 class TestComplexGraph(TestCase):
     def setUp(self):
@@ -463,9 +536,58 @@ def reference_connected_components(G):
 
 
 def test_metis():
-    # check if pymetis is available before testing
-    metis = pytest.importorskip('pymetis')  # noqa: F841
-
+    # the native backend is always available
+    backends = ['native']
+    try:
+        import pymetis  # noqa: F401
+        backends.append('metis')
+    except ImportError:
+        pass
+
+    for backend in backends:
+        _check_metis_partition(backend)
+
+
+def test_native_partition():
+    np.random.seed(1664236979)
+    G = poisson((40, 40), format='csr').astype(int)
+    G.data = np.abs(G.data)
+    n = G.shape[0]
+
+    for nparts in [2, 7, 160]:
+        for weights in ['int', 'float']:
+            H = G.copy()
+            if weights == 'float':
+                H.data = np.random.rand(H.nnz)
+            H = (H + H.T).tocsr()
+            parts = metis_partition(H, nparts=nparts, seed=3, backend='native')
+
+            assert parts.shape == (n,)
+            assert parts.min() >= 0
+            assert parts.max() < nparts
+
+            # parts are connected and roughly balanced
+            sizes = np.bincount(parts, minlength=nparts)
+            assert sizes.max() <= 2 * np.ceil(n / nparts)
+            assert (sizes > 0).sum() >= 0.9 * nparts
+            for p in np.unique(parts):
+                idx = np.where(parts == p)[0]
+                assert sparse.csgraph.connected_components(G[idx][:, idx])[0] == 1
+
+    # deterministic for a fixed seed
+    parts1 = metis_partition(G, nparts=7, seed=5, backend='native')
+    parts2 = metis_partition(G, nparts=7, seed=5, backend='native')
+    assert_equal(parts1, parts2)
+
+    # trivial cases
+    assert_equal(metis_partition(G, nparts=1, backend='native'), np.zeros(n))
+    assert_equal(metis_partition(G[:5][:, :5], nparts=5, backend='native'), np.arange(5))
+
+    with pytest.raises(ValueError, match='backend'):
+        metis_partition(G, nparts=2, backend='chaco')
+
+
+def _check_metis_partition(backend):
     # 0        4
     # | \    / |
     # 1--2--3--5
@@ -486,7 +608,7 @@ def test_metis():
     G.setdiag(4.4)
     G = G.tocsr()
 
-    parts = metis_partition(G, nparts=2)
+    parts = metis_partition(G, nparts=2, backend=backend)
 
     # check left part
     assert_equal(parts[:3], parts[0]*np.ones(3, dtype=int))
@@ -522,7 +644,7 @@ def test_metis():
     G = sparse.coo_array((w, (Edges[:, 0], Edges[:, 1])), shape=(9, 9))
     G = G.tocsr()
 
-    parts = metis_partition(G, nparts=2)
+    parts = metis_partition(G, nparts=2, backend=backend)
 
     # check first part
     I = [0, 1, 2, 3, 6]
@@ -8,6 +8,7 @@ import pytest
 
 import pyamg
 from pyamg import amg_core
+from pyamg.graph_ref import rebalance_measures_reference
 
 
 @pytest.fixture
@@ -226,19 +227,16 @@ def test_rebalance():
     # x  x  x  x  x  x  o <- cluster id
     # nearest neigbor unit distance
     G = sparse.diags_array([1., 0, 1], offsets=[-1, 0, 1], shape=(7, 7)).tocsr()
+    n = G.shape[0]
     c = np.array([3, 6], dtype=np.int32)
     m = np.array([0, 0, 0, 0, 0, 0, 1], dtype=np.int32)
     d = np.array([3, 2, 1, 0, 1, 2, 0], dtype=np.float64)
-    dist_all = np.empty((2, 40), dtype=np.float64)
-    dist_all.fill(np.inf)
-    dist_all[0, :36] = np.array([
-        0, 1, 2, 3, 4, 5,
-        1, 0, 1, 2, 3, 4,
-        2, 1, 0, 1, 2, 3,
-        3, 2, 1, 0, 1, 2,
-        4, 3, 2, 1, 0, 1,
-        5, 4, 3, 2, 1, 0], dtype=np.float64)
-    dist_all[1, [0]] = np.array([0])
+
+    E = np.empty(2)
+    S = np.empty(2)
+    c1 = np.empty(2, dtype=np.int32)
+    c2 = np.empty(2, dtype=np.int32)
+    amg_core.rebalance_measures(n, G.indptr, G.indices, G.data, d, m, E, S, c1, c2)
 
     # elimination penalty
     # cluster 0:
@@ -248,7 +246,6 @@ def test_rebalance():
     # cluster 1:
     # 3**2 - 0**2
     # = 9
-    E = pyamg.graph._elimination_penalty(G, m, d, dist_all, num_clusters=2)
     np.testing.assert_array_equal(E, [72, 9])
 
     # split improvement
@@ -258,11 +255,9 @@ def test_rebalance():
     #     center 4:  - (1^2 + 0^2 + 1^2)
     # S[0] = 19 - 4 = 15
     # S[1] = 0 (unchanged sinnce cluster size == 1)
-    S, c1, c2 = pyamg.graph._split_improvement(m, d, dist_all, num_clusters=2)
     np.testing.assert_array_equal(S, [15, 0])
     np.testing.assert_array_equal(c1, [1, 6])
     np.testing.assert_array_equal(c2, [4, 6])
-    print(c1, c2)
 
     # rebalance
     # new centers: 1, 4 (from above)
@@ -272,7 +267,30 @@ def test_rebalance():
         c=c,
         m=m,
         d=d,
-        dist_all=dist_all,
         num_clusters=2)
     np.testing.assert_array_equal(np.sort(newc), [1, 4])
     assert rebalance_change
+
+    # compare to the dense reference on random graphs
+    np.random.seed(3461127749)
+    for A in [pyamg.gallery.poisson((9, 9), format='csr'),
+              pyamg.gallery.load_example('airfoil')['A'].tocsr()]:
+        G = A.copy()
+        G.data = np.random.rand(G.nnz)
+        G = (G + G.T).tocsr()
+        n = G.shape[0]
+        num_clusters = n // 8
+        m, c = pyamg.graph.balanced_lloyd_cluster(G, num_clusters, rebalance_iters=0)
+        d = pyamg.graph.bellman_ford(G, c)[0]
+
+        E_ref, S_ref, c1_ref, c2_ref = rebalance_measures_reference(G, m, d)
+
+        E = np.empty(num_clusters)
+        S = np.empty(num_clusters)
+        c1 = np.empty(num_clusters, dtype=np.int32)
+        c2 = np.empty(num_clusters, dtype=np.int32)
+        amg_core.rebalance_measures(n, G.indptr, G.indices, G.data, d, m, E, S, c1, c2)
+        np.testing.assert_allclose(E, E_ref, rtol=1e-12)
+        np.testing.assert_allclose(S, S_ref, rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(c1, c1_ref)
+        np.testing.assert_array_equal(c2, c2_ref)
@@ -2,6 +2,7 @@
 import numpy as np
 from numpy.testing import TestCase, assert_almost_equal, assert_equal
 from scipy import sparse
+import pytest
 
 from pyamg.gallery import poisson
 from pyamg.multilevel import coarse_grid_solver, MultilevelSolver
@@ -133,6 +134,162 @@ class TestMultilevel(TestCase):
         assert_equal(mg.cycle_complexity(cycle='AMLI'), 388.0/100.0)  # 2,4,8,4
         assert_equal(mg.cycle_complexity(cycle='F'), 366.0/100.0)  # 2,4,6,3
 
+        # transfer operators, stored or implicit restriction
+        mg = MultilevelSolver(levels[:2])
+        assert_equal(mg.cycle_complexity(cycle='V', transfer=True), 325.0/100.0)
+        assert_equal(mg.operator_complexity(transfer=True), 225.0/100.0)
+        levels[0].R = None
+        assert_equal(mg.cycle_complexity(cycle='V', transfer=True), 325.0/100.0)
+        assert_equal(mg.operator_complexity(transfer=True), 175.0/100.0)
+
+    def test_implicit_restriction(self):
+        from pyamg import smoothed_aggregation_solver, rootnode_solver
+        np.random.seed(2650176)
+
+        A = poisson((50, 50), format='csr')
+        b = np.random.rand(A.shape[0])
+        for solver in [smoothed_aggregation_solver, rootnode_solver]:
+            # same random initial guesses in the spectral radius estimates
+            np.random.seed(0)
+            ml = solver(A, max_coarse=10)
+            np.random.seed(0)
+            mli = solver(A, max_coarse=10, implicit_restriction=True)
+            for level, leveli in zip(ml.levels[:-1], mli.levels[:-1], strict=True):
+                assert leveli.R is None
+                assert_almost_equal(leveli.A.toarray(), level.A.toarray())
+
+            res, resi = [], []
+            ml.solve(b, tol=1e-8, residuals=res)
+            mli.solve(b, tol=1e-8, residuals=resi)
+            assert_almost_equal(resi, res)
+            assert mli.operator_complexity(transfer=True) < \
+                ml.operator_complexity(transfer=True)
+
+        # R is kept when it is not the conjugate transpose of P
+        A = A + 1e-2j * sparse.diags_array(np.random.rand(A.shape[0]))
+        ml = smoothed_aggregation_solver(A, symmetry='symmetric',
+                                         implicit_restriction=True)
+        assert ml.levels[0].R is not None
+
+    def test_compile(self):
+        from pyamg import (smoothed_aggregation_solver, ruge_stuben_solver,
+                           pairwise_solver)
+        from pyamg.gallery import linear_elasticity
+        np.random.seed(8152023)
+
+        A = poisson((40, 40), format='csr')
+        E = linear_elasticity((12, 12), format='bsr')[0]
+        cases = [smoothed_aggregation_solver(A, max_coarse=10),
+                 smoothed_aggregation_solver(A, implicit_restriction=True,
+                                             presmoother=('jacobi', {'iterations': 2}),
+                                             postsmoother='jacobi'),
+                 smoothed_aggregation_solver(A, presmoother='sor', postsmoother='sor'),
+                 ruge_stuben_solver(A),
+                 pairwise_solver(A),
+                 smoothed_aggregation_solver(E, max_coarse=10),
+                 smoothed_aggregation_solver(E, max_coarse=10, implicit_restriction=True),
+                 smoothed_aggregation_solver(E, presmoother='jacobi',
+                                             postsmoother='jacobi'),
+                 smoothed_aggregation_solver(A, max_levels=1)]
+        for ml in cases:
+            b = np.random.rand(ml.levels[0].A.shape[0])
+            for cycle in ['V', 'W']:
+                fast = ml.compile(cycle=cycle)
+                x = np.zeros_like(b)
+                out = fast.solve_into(b, x, maxiter=4)
+                assert out is x
+                assert_almost_equal(x, ml.solve(b, maxiter=4, tol=1e-20, cycle=cycle))
+
+            # residual based stopping
+            x = ml.solve(b, tol=1e-6)
+            assert_almost_equal(ml.compile().solve(b, maxiter=100, tol=1e-6), x)
+
+        # complex right-hand sides, by linearity of the cycles
+        fast = cases[0].compile(dtype=complex)
+        b = np.random.rand(A.shape[0]) + 1j * np.random.rand(A.shape[0])
+        x = cases[0].solve(b.real, maxiter=3, tol=1e-20) + \
+            1j * cases[0].solve(b.imag, maxiter=3, tol=1e-20)
+        assert_almost_equal(fast.solve(b, maxiter=3), x)
+
+        x = np.zeros(A.shape[0], dtype=np.float32)
+        with pytest.raises(ValueError, match='out must be'):
+            cases[0].compile().solve_into(b.real, x)
+        with pytest.raises(ValueError, match='cycle'):
+            cases[0].compile(cycle='F')
+
+    def test_stencil_operator(self):
+        from pyamg import smoothed_aggregation_solver, ruge_stuben_solver
+        from pyamg.gallery import stencil_grid, StencilOperator
+        np.random.seed(10192026)
+
+        stencil = [[0, -1, 0], [-1, 4, -1], [0, -1, 0]]
+        A = stencil_grid(stencil, (40, 40), format='operator')
+        b = np.random.rand(A.shape[0])
+        cases = [(smoothed_aggregation_solver, {}),
+                 (smoothed_aggregation_solver, {'presmoother': 'jacobi',
+                                                'postsmoother': 'jacobi'}),
+                 (smoothed_aggregation_solver, {'presmoother': 'chebyshev',
+                                                'postsmoother': 'chebyshev'}),
+                 (ruge_stuben_solver, {})]
+        for solver, kwargs in cases:
+            C = A.tocsr()
+
+            # same random initial guesses in the spectral radius estimates
+            np.random.seed(0)
+            ml = solver(A, max_coarse=10, **kwargs)
+            np.random.seed(0)
+            mlc = solver(C, max_coarse=10, **kwargs)
+
+            # the operator is the fine level, and the coarse levels are unchanged
+            assert isinstance(ml.levels[0].A, StencilOperator)
+            assert_equal(len(ml.levels), len(mlc.levels))
+            for level, levelc in zip(ml.levels[1:], mlc.levels[1:], strict=True):
+                assert_almost_equal(level.A.toarray(), levelc.A.toarray())
+            assert_equal(ml.operator_complexity(), mlc.operator_complexity())
+
+            for accel in [None, 'cg']:
+                x = ml.solve(b, tol=1e-8, accel=accel)
+                assert np.linalg.norm(b - C @ x) < 1e-7 * np.linalg.norm(b)
+            assert_almost_equal(ml.compile().solve(b, maxiter=4),
+                                ml.solve(b, maxiter=4, tol=1e-20))
+
+            # Jacobi is the same with the operator, Gauss-Seidel is multicolor
+            if kwargs.get('presmoother') == 'jacobi':
+                assert_almost_equal(ml.solve(b, maxiter=4, tol=1e-20),
+                                    mlc.solve(b, maxiter=4, tol=1e-20))
+
+        # smoothers that need the entries of A are rejected
+        for smoother in ['sor', 'schwarz', 'gauss_seidel_nr', 'jacobi_ne', 'spai0',
+                         ('block_jacobi', {'blocksize': 2})]:
+            with pytest.raises(ValueError, match='not supported for a StencilOperator'):
+                smoothed_aggregation_solver(A, max_coarse=10, presmoother=smoother)
+        ml = smoothed_aggregation_solver(A, max_coarse=10, presmoother='block_jacobi',
+                                         postsmoother='block_jacobi')
+        x = ml.solve(b, tol=1e-8)
+        assert np.linalg.norm(b - A @ x) < 1e-7 * np.linalg.norm(b)
+
+    def test_threaded_solve(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from pyamg import smoothed_aggregation_solver
+        np.random.seed(5121987)
+
+        A = poisson((40, 40), format='csr')
+        bs = [np.random.rand(A.shape[0]) for _ in range(8)]
+        for coarse_solver in ['splu', 'pinv', 'lu', 'cholesky', 'cg']:
+            ml = smoothed_aggregation_solver(A, coarse_solver=coarse_solver,
+                                             presmoother='strength_based_schwarz',
+                                             postsmoother='gauss_seidel')
+            expected = [ml.solve(b, tol=1e-8) for b in bs]
+
+            # the first solves of a new hierarchy factor the coarse matrix
+            ml = smoothed_aggregation_solver(A, coarse_solver=coarse_solver,
+                                             presmoother='strength_based_schwarz',
+                                             postsmoother='gauss_seidel')
+            with ThreadPoolExecutor(4) as pool:
+                xs = list(pool.map(lambda b, ml=ml: ml.solve(b, tol=1e-8), bs))
+            for x, y in zip(xs, expected, strict=True):
+                assert_almost_equal(x, y)
+
 
 class TestComplexMultilevel(TestCase):
     def test_coarse_grid_solver(self):
@@ -4,12 +4,15 @@ from numpy.testing import TestCase, assert_equal, assert_array_almost_equal, \
     assert_array_equal, assert_allclose
 from scipy import sparse
 import scipy.linalg as sla
+import pytest
 
 from pyamg.gallery import poisson, linear_elasticity, load_example, \
     stencil_grid
 from pyamg.strength import classical_strength_of_connection, \
     symmetric_strength_of_connection, evolution_strength_of_connection, \
-    distance_strength_of_connection, energy_based_strength_of_connection
+    distance_strength_of_connection, energy_based_strength_of_connection, \
+    algebraic_distance, affinity_distance, relaxation_vectors
+from pyamg import amg_core
 from pyamg.amg_core import incomplete_mat_mult_csr
 from pyamg.util.linalg import approximate_spectral_radius
 from pyamg.util.utils import scale_rows
@@ -118,6 +121,70 @@ class TestStrengthOfConnection(TestCase):
                 assert_equal(result.nnz, expected.nnz)
                 assert_array_almost_equal(result.toarray(), expected.toarray())
 
+    def test_energy_based_strength_of_connection(self):
+        cases = [poisson((N,), format='csr') for N in [2, 5, 11]]
+        cases += [poisson((N, N), format='csr') for N in [3, 7]]
+        stencil = np.array([[-1.0, -1.0, -1.0], [-1.0, 8.0, -1.0], [-1.0, -1.0, -1.0]])
+        cases.append(stencil_grid(stencil, (6, 6), format='csr'))
+        cases.append(linear_elasticity((4, 4))[0])
+        A = poisson((6, 6), format='csr').astype(complex)
+        rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        A.data = A.data + 0.2j*np.sign(A.indices - rows)  # Hermitian
+        cases.append(A)
+
+        for A in cases:
+            for k in [0, 1, 3]:
+                for theta in [0.0, 0.25]:
+                    np.random.seed(0)
+                    expected = reference_energy_based_soc(A, theta, k)
+                    np.random.seed(0)
+                    result = energy_soc(A, theta, k)
+
+                    assert_equal(result.nnz, expected.nnz)
+                    assert_array_almost_equal(result.toarray(), expected.toarray())
+
+    def test_algebraic_distance(self):
+        cases = [poisson((10, 10), format='csr'), load_example('airfoil')['A'].tocsr()]
+        for A in cases:
+            for p in [1, 2, 3, np.inf]:
+                np.random.seed(0)
+                x = relaxation_vectors(A, 4, 10, 0.5)
+                expected = reference_distance_measure(A, x, 2.0, 'algebraic', p)
+                np.random.seed(0)
+                result = algebraic_distance(A, R=4, k=10, epsilon=2.0, p=p)
+                assert_equal(result.nnz, expected.nnz)
+                assert_array_almost_equal(result.toarray(), expected.toarray())
+
+            np.random.seed(0)
+            x = relaxation_vectors(A, 4, 10, 0.5)
+            expected = reference_distance_measure(A, x, 4.0, 'affinity')
+            np.random.seed(0)
+            result = affinity_distance(A, R=4, k=10, epsilon=4.0)
+            assert_equal(result.nnz, expected.nnz)
+            assert_array_almost_equal(result.toarray(), expected.toarray())
+
+        # integer matrices are cast, complex ones are rejected
+        A = poisson((10, 10), format='csr')
+        np.random.seed(0)
+        expected = algebraic_distance(A, R=4, k=10)
+        np.random.seed(0)
+        result = algebraic_distance(A.astype(np.int32), R=4, k=10)
+        assert_array_almost_equal(result.toarray(), expected.toarray())
+        for fn in [algebraic_distance, affinity_distance]:
+            with pytest.raises(ValueError, match='complex'):
+                fn(A.astype(complex))
+
+    def test_relaxation_vectors(self):
+        A = poisson((10, 10), format='csr')
+        np.random.seed(0)
+        x = relaxation_vectors(A, 3, 5, 0.6)
+        np.random.seed(0)
+        expected = np.reshape(np.random.rand(3 * A.shape[0]) - 0.5, (-1, 3), order='F')
+        Dinv = 1.0 / A.diagonal()
+        for _i in range(5):
+            expected = expected - 0.6 * Dinv[:, None] * (A @ expected)
+        assert_array_almost_equal(x, expected)
+
     def test_distance_strength_of_connection(self):
         data = load_example('airfoil')
         cases = []
@@ -310,6 +377,16 @@ class TestStrengthOfConnection(TestCase):
             cases.append({'A': A.copy(), 'B': B.copy(), 'epsilon': 32.0,
                           'k': 8, 'proj': 'D_A'})
 
+        # Number of time steps that is not a power of two
+        for k in [3, 5, 6]:
+            A = poisson((7, 7), format='csr')
+            B = np.ones((A.shape[0], 1))
+            cases.append({'A': A.copy(), 'B': B.copy(), 'epsilon': 4.0,
+                          'k': k, 'proj': 'l2'})
+            (A, B) = linear_elasticity((5, 5), format='bsr')
+            cases.append({'A': A.copy(), 'B': B.copy(), 'epsilon': 32.0,
+                          'k': k, 'proj': 'D_A'})
+
         # Run an example with a non-uniform stencil
         ex = load_example('airfoil')
         A = ex['A'].tocsr()
@@ -351,6 +428,13 @@ class TestStrengthOfConnection(TestCase):
             assert_array_almost_equal(result.toarray(), expected.toarray(),
                                       decimal=4)
 
+            # Streaming row blocks give the same result
+            np.random.seed(2001321804)  # make results deterministic
+            result_blocked = evolution_soc(ca['A'], ca['B'], epsilon=ca['epsilon'],
+                                           k=ca['k'], proj_type=ca['proj'],
+                                           symmetrize_measure=False, rowblock=7)
+            assert_array_almost_equal(result_blocked.toarray(), result.toarray())
+
         # Test Scale Invariance for multiple near nullspace candidates
         (A, B) = linear_elasticity((5, 5), format='bsr')
         np.random.seed(4055795935)  # make results deterministic
@@ -889,3 +973,84 @@ def reference_distance_soc(A, V, theta=2.0, relative_drop=True):
     C = scale_rows(C, largest_row_entry, copy=True)
 
     return C
+
+
+def reference_energy_based_soc(A, theta=0.0, k=2):
+    """Construct reference energy-based strength of connection.
+
+    Each column of the approximate inverse is formed globally and the change in
+    energy is computed with a full matrix-vector product per nonzero.
+    """
+    bsr_flag = A.format == 'bsr'
+    numPDEs = A.blocksize[0] if bsr_flag else 1
+    A = A.tocsc()
+    Atilde = A.tocsr()
+
+    D = A.diagonal()
+    Dinv = np.zeros_like(D)
+    Dinv[D != 0] = 1.0 / D[D != 0]
+    Dinv = sparse.diags_array(Dinv, format='csc')
+    omega = 1.0 / approximate_spectral_radius(Dinv @ A)
+
+    S = sparse.csc_array(A.shape, dtype=A.dtype)
+    Id = sparse.eye_array(A.shape[0], format='csc')
+    for _i in range(k + 1):
+        S = S + omega * (Dinv @ (Id - A @ S))
+
+    data = np.zeros(Atilde.nnz)
+    for i in range(Atilde.shape[0]):
+        v = S[:, [i]].toarray().ravel()
+        denom = np.sqrt(np.real(np.inner(v.conj(), A @ v)))
+        for j in range(Atilde.indptr[i], Atilde.indptr[i + 1]):
+            col = Atilde.indices[j]
+            vj = v[col].copy()
+            v[col] = 0.0
+            val = np.sqrt(np.real(np.inner(v.conj(), A @ v))) / denom - 1.0
+            data[j] = abs(val) if val > -0.01 else 0.0
+            v[col] = vj
+    Atilde = sparse.csr_array((data, Atilde.indices, Atilde.indptr), shape=Atilde.shape)
+
+    Atilde = classical_strength_of_connection(Atilde, theta=theta)
+    Atilde.eliminate_zeros()
+    Atilde = Atilde + Id.tocsr()
+
+    if bsr_flag:
+        Atilde = Atilde.tobsr(blocksize=(numPDEs, numPDEs))
+        Atilde = sparse.csr_array((np.ones(Atilde.indices.shape[0]),
+                                   Atilde.indices, Atilde.indptr),
+                                  shape=(Atilde.shape[0] // numPDEs,
+                                         Atilde.shape[1] // numPDEs))
+
+    largest_row_entry = np.abs(Atilde).max(axis=1).toarray().ravel()
+    largest_row_entry[largest_row_entry != 0] = \
+        1.0 / largest_row_entry[largest_row_entry != 0]
+    return scale_rows(Atilde, largest_row_entry, copy=True)
+
+
+def reference_distance_measure(A, x, epsilon, measure, p=2):
+    """Construct reference algebraic or affinity distance strength of connection.
+
+    The distances are computed on the COO expansion of A from the given test
+    vectors x.
+    """
+    (rows, cols) = A.nonzero()
+    if measure == 'affinity':
+        d = 1 - np.sum(x[rows] * x[cols], axis=1)**2 / \
+            (np.sum(x[rows]**2, axis=1) * np.sum(x[cols]**2, axis=1))
+    elif p != np.inf:
+        d = (np.sum(np.abs(x[rows] - x[cols])**p, axis=1) / x.shape[1])**(1.0 / p)
+    else:
+        d = np.abs(x[rows] - x[cols]).max(axis=1)
+
+    d[rows == cols] = 0
+    C = sparse.csr_array((d, (rows, cols)), shape=A.shape)
+    C.eliminate_zeros()
+    amg_core.apply_distance_filter(C.shape[0], epsilon, C.indptr, C.indices, C.data)
+    C.eliminate_zeros()
+    C.data = 1.0 / C.data
+    C = C + sparse.eye_array(C.shape[0], format='csr')
+
+    largest_row_entry = np.abs(C).max(axis=1).toarray().ravel()
+    largest_row_entry[largest_row_entry != 0] = \
+        1.0 / largest_row_entry[largest_row_entry != 0]
+    return scale_rows(C, largest_row_entry, copy=True)
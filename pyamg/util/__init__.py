@@ -3,10 +3,12 @@
 from . import linalg
 from . import utils
 from . import params
+from . import streaming
+from . import stencil
 
 from .utils import make_system, upcast
 
-__all__ = ['linalg', 'make_system', 'params', 'upcast', 'utils']
+__all__ = ['linalg', 'make_system', 'params', 'stencil', 'streaming', 'upcast', 'utils']
 
 __doc__ += """
 linalg.py provides some linear algebra functionality not yet found in scipy.
@@ -16,4 +18,10 @@ utils.py provides some utility functions for use with pyamg
 bsr_utils.py provides utility functions for accessing and writing individual
 rows of BSR matrices
 
+streaming.py provides row-block processing of memory-mapped CSR and BSR
+matrices
+
+stencil.py provides a matrix-free operator of a constant stencil on a
+regular grid
+
 """
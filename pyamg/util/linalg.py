@@ -8,6 +8,7 @@ from scipy.sparse.linalg import aslinearoperator
 from scipy.linalg import lapack, get_blas_funcs, eig, svd
 
 from .params import set_tol
+from .. import amg_core
 
 
 def norm(x, pnorm='2'):
@@ -122,6 +123,65 @@ def axpy(x, y, a=1.0):
     fn = get_blas_funcs(['axpy'], [x, y])[0]
     fn(x, y, a)
 
+
+def rmatvec(A, x, conjugate=True):
+    """Multiply by the conjugate transpose of a sparse matrix without forming it.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array, csc_array or operator
+        Matrix of size (m, n).
+    x : array
+        Vector of length m, or array of size (m, k).
+    conjugate : bool
+        If True, return A.H @ x, otherwise A.T @ x.
+
+    Returns
+    -------
+    array
+        Vector of length n, or array of size (n, k).
+
+    Notes
+    -----
+    CSR and BSR matrices are applied with amg_core.csr_matvec_transpose and
+    amg_core.bsr_matvec_transpose, which scatter the rows of A.  A CSC
+    matrix is applied through its transpose, which is a CSR matrix without
+    a copy.  Other operators are transposed explicitly.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.sparse import csr_array
+    >>> from pyamg.util.linalg import rmatvec
+    >>> P = csr_array([[1.0, 0.0], [1.0, 0.5], [0.0, 1.0]])
+    >>> rmatvec(P, np.array([1.0, 2.0, 3.0]))
+    array([3., 4.])
+
+    """
+    x = np.asarray(x)
+    if x.ndim == 2:
+        return np.column_stack([rmatvec(A, x[:, k], conjugate)
+                                for k in range(x.shape[1])])
+
+    fmt = A.format if sparse.issparse(A) else None
+    if fmt not in ('csr', 'bsr'):
+        AT = A.T
+        return (AT.conjugate() if conjugate else AT) @ x
+
+    dtype = np.result_type(A.dtype, x.dtype, np.float32)
+    data = A.data.astype(dtype, copy=False)
+    x = np.ascontiguousarray(x, dtype=dtype)
+    y = np.empty(A.shape[1], dtype=dtype)
+    conj = int(conjugate and np.iscomplexobj(data))
+    if fmt == 'csr':
+        amg_core.csr_matvec_transpose(A.shape[0], A.shape[1], A.indptr, A.indices,
+                                      data, x, y, conj)
+    else:
+        R, C = A.blocksize
+        amg_core.bsr_matvec_transpose(A.shape[0] // R, A.shape[1] // C, R, C,
+                                      A.indptr, A.indices, data.ravel(), x, y, conj)
+    return y
+
 # def approximate_spectral_radius(A, tol=0.1, maxiter=10, symmetric=False):
 #    """approximate the spectral radius of a matrix
 #
@@ -553,7 +613,7 @@ def ishermitian(A, fast_check=True, tol=1e-6, verbose=False):
     return False
 
 
-def pinv_array(a, tol=None):
+def pinv_array(a, tol=None, hermitian=False):
     """Calculate the Moore-Penrose pseudo inverse of each block of the 3D array a.
 
     Parameters
@@ -563,6 +623,11 @@ def pinv_array(a, tol=None):
     tol : {float}
         Used by gelss to filter numerically zeros singular values.
         If None, a suitable value is chosen for you.
+    hermitian : {bool}
+        If True, each block is assumed Hermitian, and all blocks are inverted
+        in one compiled pass with a Jacobi eigensolver.  Eigenvalues with
+        magnitude at most tol times the largest are treated as zero, which is
+        the same cutoff that gelss applies to the singular values.
 
     Returns
     -------
@@ -595,6 +660,15 @@ def pinv_array(a, tol=None):
         a[zero_entries] = 0.0
         del zero_entries
 
+    elif hermitian:
+        if tol is None:
+            tol = set_tol(a.dtype)
+        # the kernel works in place, on a C-ordered copy if a is not C-ordered
+        b = np.ascontiguousarray(a)
+        amg_core.pinv_hermitian_array(b.ravel(), n, m, tol)
+        if b is not a:
+            a[...] = b
+
     else:
         # The block size is greater than 1
 
@@ -615,3 +689,120 @@ def pinv_array(a, tol=None):
             gelssoutput = gelss(a[kk], RHS, cond=tol, lwork=lwork,
                                 overwrite_a=True, overwrite_b=False)
             a[kk] = gelssoutput[1]
+
+
+def inv_array(a, tol=None):
+    """Invert each block of the 3D array a, using a pseudo inverse only if singular.
+
+    Parameters
+    ----------
+    a   : {dense array}
+        Is of size (n, m, m)
+    tol : {float}
+        A block is treated as singular if an LU pivot is smaller than tol
+        times the largest entry of the block.  The same value is used by
+        pinv_array to filter numerically zero singular values.
+        If None, a suitable value is chosen for you.
+
+    Returns
+    -------
+    Nothing, a is modified in place so that a[k] holds the inverse of that
+    block, or its pseudo-inverse if the block is singular.
+
+    Notes
+    -----
+    The blocks are inverted by a batched LU factorization with partial
+    pivoting in amg_core.lu_inv_array, which is much cheaper than a
+    pseudo-inverse for each block.  Only the singular blocks are passed to
+    pinv_array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg.util.linalg import inv_array
+    >>> a = np.array([[[1.,2.],[1.,1.]], [[1.,1.],[3.,3.]]])
+    >>> inv_array(a)
+    >>> print(a[0])
+    [[-1.  2.]
+     [ 1. -1.]]
+
+    """
+    if tol is None:
+        tol = set_tol(a.dtype)
+
+    if a.shape[1] == 1:
+        pinv_array(a, tol=tol)
+        return
+
+    # the kernel works in place, on a C-ordered copy if a is not C-ordered
+    b = np.ascontiguousarray(a)
+    flag = np.empty(a.shape[0], dtype=np.int32)
+    nsingular = amg_core.lu_inv_array(b.ravel(), flag, a.shape[0], a.shape[1], tol)
+
+    if nsingular > 0:
+        mask = flag == 1
+        singular = b[mask]
+        pinv_array(singular, tol=tol)
+        b[mask] = singular
+
+    if b is not a:
+        a[...] = b
+
+
+def lu_factor_array(a, tol=None, index_type=np.int32):
+    """Compute the LU factorization of each block of the 3D array a.
+
+    Parameters
+    ----------
+    a   : {dense array}
+        Is of size (n, m, m)
+    tol : {float}
+        A block is treated as singular if an LU pivot is smaller than tol
+        times the largest entry of the block.
+        If None, a suitable value is chosen for you.
+    index_type : {dtype}
+        Integer type of the pivots, which must match the index type of the
+        matrix passed to amg_core.block_jacobi_lu.
+
+    Returns
+    -------
+    piv : array
+        Row pivots of size (n, m).  For singular blocks, piv[k, 0] is -1.
+
+    Notes
+    -----
+    The array a is modified in place so that a[k] holds the LU factors of
+    that block (row-major analog of LAPACK getrf), or its pseudo-inverse if
+    the block is singular.  The factors are used by block Jacobi with
+    amg_core.block_jacobi_lu.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg.util.linalg import lu_factor_array
+    >>> a = np.array([[[1.,2.],[2.,1.]], [[1.,1.],[3.,3.]]])
+    >>> piv = lu_factor_array(a)
+    >>> print(piv)
+    [[ 1  1]
+     [-1  0]]
+
+    """
+    if tol is None:
+        tol = set_tol(a.dtype)
+
+    # the kernel works in place, on a C-ordered copy if a is not C-ordered
+    b = np.ascontiguousarray(a)
+    piv = np.zeros(a.shape[:2], dtype=index_type)
+    nsingular = amg_core.lu_factor_array(b.ravel(), piv.ravel(), a.shape[0], a.shape[1],
+                                         tol)
+
+    if nsingular > 0:
+        mask = piv[:, 0] == -1
+        singular = b[mask]
+        pinv_array(singular, tol=tol)
+        b[mask] = singular
+
+    if b is not a:
+        a[...] = b
+
+    return piv
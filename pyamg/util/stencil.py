@@ -0,0 +1,208 @@
+"""Matrix-free operator of a constant stencil on a regular grid."""
+# pylint: disable=redefined-builtin
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator
+
+from .. import amg_core
+
+
+def _check_stencil(S, grid):
+    """Check that a stencil S can be applied on a grid."""
+    if not (np.asarray(S.shape) % 2 == 1).all():
+        raise ValueError('all stencil dimensions must be odd')
+
+    if len(grid) != np.ndim(S):
+        raise ValueError('stencil dimension must equal number of grid\
+                          dimensions')
+
+    if min(grid) < 1:
+        raise ValueError('grid dimensions must be positive')
+
+
+def stencil_matrix(S, grid, format=None):
+    """Assemble the sparse matrix of a stencil on a regular grid.
+
+    See pyamg.gallery.stencil_grid, which calls this function for all
+    formats other than "operator".
+    """
+    S = np.asarray(S)
+    grid = tuple(grid)
+    _check_stencil(S, grid)
+
+    N_v = np.prod(grid)  # number of vertices in the mesh
+    N_s = (S != 0).sum()    # number of nonzero stencil entries
+
+    # diagonal offsets
+    diags = np.zeros(N_s, dtype=int)
+
+    # compute index offset of each dof within the stencil
+    strides = np.cumprod([1] + list(reversed(grid)))[:-1]  # noqa: RUF005
+    indices = tuple(i.astype(np.int32) for i in S.nonzero())
+    for i, s in zip(indices, S.shape):
+        i -= s // 2
+        # i = (i - s) // 2
+        # i = i // 2
+        # i = i - (s // 2)
+    for stride, coords in zip(strides, reversed(indices)):
+        diags += stride * coords
+
+    data = S[S != 0].repeat(N_v).reshape(N_s, N_v)
+
+    indices = np.vstack(indices).T
+
+    # zero boundary connections
+    for index, diag in zip(indices, data):
+        diag = diag.reshape(grid)
+        for n, i in enumerate(index):
+            if i > 0:
+                s = [slice(None)] * len(grid)
+                s[n] = slice(0, i)
+                s = tuple(s)
+                diag[s] = 0
+            elif i < 0:
+                s = [slice(None)]*len(grid)
+                s[n] = slice(i, None)
+                s = tuple(s)
+                diag[s] = 0
+
+    # remove diagonals that lie outside matrix
+    mask = abs(diags) < N_v
+    if not mask.all():
+        diags = diags[mask]
+        data = data[mask]
+
+    # sum duplicate diagonals
+    if len(np.unique(diags)) != len(diags):
+        new_diags = np.unique(diags)
+        new_data = np.zeros((len(new_diags), data.shape[1]),
+                            dtype=data.dtype)
+
+        for dia, dat in zip(diags, data):
+            n = np.searchsorted(new_diags, dia)
+            new_data[n, :] += dat
+
+        diags = new_diags
+        data = new_data
+
+    return sparse.dia_array((data, diags),
+                             shape=(N_v, N_v)).asformat(format)
+
+
+class StencilOperator(LinearOperator):
+    """Matrix-free operator of a constant stencil on a regular grid.
+
+    The operator is the matrix ``stencil_grid(S, grid)``, applied directly
+    from the stencil by compiled kernels instead of being stored.  It
+    provides the matrix-vector product, its (conjugate) transpose, and the
+    diagonal, and the Jacobi, Gauss-Seidel and polynomial relaxation methods
+    in ``pyamg.relaxation`` accept it in place of a sparse matrix.
+
+    Parameters
+    ----------
+    S : array_like
+        Matrix stencil stored in n-d array.
+    grid : tuple
+        Tuple containing the grid dimensions.
+    dtype : dtype, optional
+        Data type of the operator.  Default is the type of S, or float64
+        for integer stencils.
+
+    Attributes
+    ----------
+    stencil : ndarray
+        The stencil S.
+    grid : tuple
+        The grid dimensions.
+    offsets : ndarray
+        Offset of each nonzero stencil entry from the stencil center, one
+        row per entry.  Stored as int32, or as int64 for grids with more
+        than ``2**31 - 1`` points.
+    values : ndarray
+        Value of each nonzero stencil entry.
+    nnz : int
+        Number of nonzeros of the matrix.
+
+    See Also
+    --------
+    stencil_grid
+
+    Notes
+    -----
+    The grid vertices are enumerated as in stencil_grid, and stencil
+    entries that fall outside the grid are dropped.  The matrix is formed
+    with ``tocsr()`` or ``asformat()`` only when it is needed, e.g., for the
+    Galerkin product of the first coarse level in ``smoothed_aggregation_solver``
+    and ``ruge_stuben_solver``, which keep the operator as the finest level.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg.gallery import stencil_grid
+    >>> stencil = [[0,-1,0],[-1,4,-1],[0,-1,0]] # 2D Poisson stencil
+    >>> A = stencil_grid(stencil, (3, 3), format='operator')
+    >>> A
+    <9x9 StencilOperator with dtype=float64>
+    >>> A @ np.ones(9)
+    array([2., 1., 2., 1., 0., 1., 2., 1., 2.])
+    >>> A.nnz == stencil_grid(stencil, (3, 3), format='csr').nnz
+    True
+
+    """
+
+    def __init__(self, S, grid, dtype=None):
+        """Initialize the operator."""
+        S = np.asarray(S, dtype=dtype)
+        grid = tuple(int(n) for n in grid)
+        _check_stencil(S, grid)
+        if S.dtype.kind not in 'fc':
+            S = S.astype(np.float64)
+
+        N = int(np.prod(grid))
+        super().__init__(S.dtype, (N, N))
+
+        index_type = np.int32 if N <= np.iinfo(np.int32).max else np.int64
+        self.stencil = S
+        self.grid = grid
+        self.offsets = np.ascontiguousarray(np.argwhere(S != 0) - np.array(S.shape) // 2,
+                                            dtype=index_type)
+        self.values = S[S != 0]
+
+    @property
+    def nnz(self):
+        """Number of nonzeros of the matrix."""
+        counts = np.maximum(np.array(self.grid) - np.abs(self.offsets), 0)
+        return int(np.prod(counts, axis=1, dtype=np.int64).sum())
+
+    def _matvec(self, x):
+        dtype = np.result_type(self.dtype, x.dtype)
+        x = np.ascontiguousarray(x, dtype=dtype).ravel()
+        y = np.empty_like(x)
+        amg_core.stencil_matvec(np.array(self.grid, dtype=self.offsets.dtype),
+                                self.offsets.ravel(),
+                                self.values.astype(dtype, copy=False), x, y)
+        return y
+
+    def _transpose(self):
+        return StencilOperator(np.flip(self.stencil), self.grid)
+
+    def _adjoint(self):
+        return StencilOperator(np.flip(self.stencil).conjugate(), self.grid)
+
+    def diagonal(self):
+        """Return the diagonal of the matrix."""
+        center = self.stencil[tuple(n // 2 for n in self.stencil.shape)]
+        return np.full(self.shape[0], center, dtype=self.dtype)
+
+    def asformat(self, format):
+        """Return the matrix in a sparse format."""
+        return stencil_matrix(self.stencil, self.grid, format=format)
+
+    def tocsr(self):
+        """Return the matrix as a csr_array."""
+        return self.asformat('csr')
+
+    def toarray(self):
+        """Return the matrix as a dense array."""
+        return self.tocsr().toarray()
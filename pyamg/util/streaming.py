@@ -0,0 +1,468 @@
+"""Row-block streaming of memory-mapped sparse matrices.
+
+A CSR or BSR matrix whose arrays are backed by a memory map, e.g.
+``np.memmap`` or ``np.load(..., mmap_mode='r')``, is processed one block
+of rows at a time: the entries of a block are read from the mapping, used,
+and their pages are handed back to the operating system before the next
+block is read.  No copy of the matrix is made, so the resident memory for
+the matrix stays near one block of ``BLOCK_NNZ`` stored entries.
+
+Matrices held in memory are processed as a single block.
+"""
+
+import itertools
+import mmap
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator
+
+
+BLOCK_NNZ = 2**22  # number of stored entries in a block of rows
+
+
+def _mapping(a):
+    """Return the mmap behind array a and the mode of its memmap, or None."""
+    mode = None
+    while a is not None and not isinstance(a, mmap.mmap):
+        if mode is None and isinstance(a, np.memmap):
+            mode = a.mode
+        a = getattr(a, 'base', None)
+    if a is None:
+        return None, None
+    return a, mode
+
+
+def is_mapped(A):
+    """Return True if A is a CSR or BSR matrix with memory-mapped arrays.
+
+    Parameters
+    ----------
+    A : any
+        Matrix to check.
+
+    Returns
+    -------
+    bool
+        True if the data, indices or indptr array of A is a view of a
+        memory map.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.streaming import is_mapped
+    >>> is_mapped(poisson((10,), format='csr'))
+    False
+
+    """
+    if not sparse.issparse(A) or A.format not in ('csr', 'bsr'):
+        return False
+    return any(_mapping(a)[0] is not None for a in (A.data, A.indices, A.indptr))
+
+
+def release(a, start, stop):
+    """Release the pages of a[start:stop] if a is memory mapped.
+
+    Only pages that lie entirely in the range are released.  Nothing is done
+    for copy-on-write maps (mode ``'c'``), whose pages hold private changes,
+    or on platforms without ``madvise``.
+
+    Parameters
+    ----------
+    a : array
+        Array, contiguous along its first axis.
+    start, stop : int
+        Range of the first axis of a.
+
+    Returns
+    -------
+    None
+
+    """
+    mm, mode = _mapping(a)
+    if mm is None or mode == 'c' or not hasattr(mmap, 'MADV_DONTNEED'):
+        return
+    base = np.frombuffer(mm, dtype=np.uint8).ctypes.data
+    first = a.ctypes.data - base + start * a.strides[0]
+    last = a.ctypes.data - base + stop * a.strides[0]
+    first = -(-first // mmap.PAGESIZE) * mmap.PAGESIZE
+    last = last // mmap.PAGESIZE * mmap.PAGESIZE
+    if last > first:
+        mm.madvise(mmap.MADV_DONTNEED, first, last - first)
+
+
+def row_ranges(A, block_nnz=None):
+    """Split the rows of a CSR or BSR matrix into blocks.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    block_nnz : int, optional
+        Approximate number of stored entries in a block.  Default is
+        ``BLOCK_NNZ``.  A block has at least one row.
+
+    Returns
+    -------
+    list
+        ``(start, stop)`` for each block, in rows of A for CSR and in
+        block rows of A for BSR.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.streaming import row_ranges
+    >>> A = poisson((10,), format='csr')
+    >>> row_ranges(A, block_nnz=10)
+    [(0, 3), (3, 7), (7, 10)]
+
+    """
+    if block_nnz is None:
+        block_nnz = BLOCK_NNZ
+    if A.format == 'bsr':
+        block_nnz = max(block_nnz // (A.blocksize[0] * A.blocksize[1]), 1)
+
+    indptr = A.indptr
+    n = len(indptr) - 1
+    targets = np.arange(block_nnz, int(indptr[-1]), block_nnz) + int(indptr[0])
+    cuts = np.searchsorted(indptr, targets, side='right') - 1
+    cuts = np.unique(np.concatenate(([0], cuts, [n])))
+    return [(int(start), int(stop)) for start, stop in itertools.pairwise(cuts)]
+
+
+def row_slice(A, start, stop):
+    """Return rows start:stop of a CSR or BSR matrix, sharing its entries.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    start, stop : int
+        Range of rows of A.  For BSR, both are multiples of the number of
+        rows in a block.
+
+    Returns
+    -------
+    csr_array, bsr_array
+        The rows of A, with data and indices that are views of those of A.
+
+    """
+    R = A.blocksize[0] if A.format == 'bsr' else 1
+    if start % R or stop % R:
+        raise ValueError('rows must start and stop at a block row')
+    indptr = A.indptr[start // R:stop // R + 1]
+    lo, hi = indptr[0], indptr[-1]
+    shape = (stop - start, A.shape[1])
+    if A.format == 'bsr':
+        block = sparse.bsr_array(shape, blocksize=A.blocksize, dtype=A.dtype)
+    else:
+        block = sparse.csr_array(shape, dtype=A.dtype)
+
+    # the constructor would copy views of a small part of the arrays of A
+    block.data, block.indices, block.indptr = A.data[lo:hi], A.indices[lo:hi], indptr - lo
+    return block
+
+
+def row_blocks(A, block_nnz=None):
+    """Iterate over blocks of rows of a CSR or BSR matrix.
+
+    The pages of each block are released once the next block is requested.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    block_nnz : int, optional
+        Number of stored entries in a block.  Default is ``BLOCK_NNZ``.
+
+    Yields
+    ------
+    start, stop : int
+        Range of rows of A in the block.
+    block : csr_array, bsr_array
+        Rows start:stop of A.
+
+    """
+    R = A.blocksize[0] if A.format == 'bsr' else 1
+    for start, stop in row_ranges(A, block_nnz):
+        yield start * R, stop * R, row_slice(A, start * R, stop * R)
+        release_rows(A, start, stop)
+
+
+def release_rows(A, start, stop):
+    """Release the pages of (block) rows start:stop of a mapped matrix.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    start, stop : int
+        Range of rows of A for CSR, or of block rows for BSR.
+
+    Returns
+    -------
+    None
+
+    """
+    lo, hi = int(A.indptr[start]), int(A.indptr[stop])
+    release(A.indices, lo, hi)
+    release(A.data, lo, hi)
+    release(A.indptr, start, stop)
+
+
+def sweep(A, backward=False):
+    """Iterate over the rows of a matrix in blocks for a relaxation sweep.
+
+    A matrix held in memory is swept as a single block.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    backward : bool
+        If True, sweep from the last row to the first.
+
+    Yields
+    ------
+    row_start, row_stop, row_step : int
+        Range of (block) rows in the convention of the relaxation kernels.
+
+    """
+    if not is_mapped(A):
+        n = len(A.indptr) - 1
+        yield (n - 1, -1, -1) if backward else (0, n, 1)
+        return
+
+    ranges = row_ranges(A)
+    if backward:
+        ranges = ranges[::-1]
+    for start, stop in ranges:
+        yield (stop - 1, start - 1, -1) if backward else (start, stop, 1)
+        release_rows(A, start, stop)
+
+
+def stack(blocks, shape):
+    """Stack blocks of rows of the same format into one matrix.
+
+    Parameters
+    ----------
+    blocks : list
+        CSR matrices, or BSR matrices with the same blocksize.
+    shape : tuple
+        Shape of the result.
+
+    Returns
+    -------
+    csr_array, bsr_array
+        The blocks, one below the other.
+
+    """
+    counts = [int(block.indptr[-1]) for block in blocks]
+    index_type = np.result_type(np.int32, *(block.indices.dtype for block in blocks))
+    if sum(counts) > np.iinfo(np.int32).max:
+        index_type = np.int64
+
+    offsets = np.cumsum([0, *counts[:-1]])
+    indptr = np.concatenate([np.zeros(1, dtype=index_type)] +
+                            [block.indptr[1:] + offset
+                             for block, offset in zip(blocks, offsets, strict=True)])
+    indices = np.concatenate([block.indices[:count]
+                              for block, count in zip(blocks, counts, strict=True)])
+    data = np.concatenate([block.data[:count]
+                           for block, count in zip(blocks, counts, strict=True)])
+    arrays = (data, indices.astype(index_type, copy=False),
+              indptr.astype(index_type, copy=False))
+    if blocks[0].format == 'bsr':
+        return sparse.bsr_array(arrays, shape=shape, blocksize=blocks[0].blocksize)
+    return sparse.csr_array(arrays, shape=shape)
+
+
+def map_rows(fn, A, shape=None):
+    """Apply a function to each block of rows and stack the results.
+
+    Parameters
+    ----------
+    fn : callable
+        ``fn(start, stop, block)`` returns a sparse matrix with
+        ``stop - start`` rows, in the same format for all blocks.
+    A : csr_array, bsr_array
+        Sparse matrix.
+    shape : tuple, optional
+        Shape of the result.  Default is the shape of A.
+
+    Returns
+    -------
+    csr_array, bsr_array
+        The results of fn for all blocks, stacked.
+
+    """
+    if shape is None:
+        shape = A.shape
+    blocks = [fn(start, stop, block) for start, stop, block in row_blocks(A)]
+    return stack(blocks, shape)
+
+
+def diagonal(A):
+    """Return the diagonal of a CSR or BSR matrix, one block of rows at a time.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Square sparse matrix.
+
+    Returns
+    -------
+    array
+        Diagonal of A.
+
+    """
+    D = np.zeros(A.shape[0], dtype=A.dtype)
+    for start, stop, block in row_blocks(A):
+        D[start:stop] = block.diagonal(k=start)
+    return D
+
+
+def matvec(A, x, out=None):
+    """Return A @ x, one block of rows of A at a time.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    x : array
+        Vector, or block of vectors.
+    out : array, optional
+        Array for the result.
+
+    Returns
+    -------
+    array
+        A @ x
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.streaming import matvec
+    >>> A = poisson((4,), format='csr')
+    >>> matvec(A, np.ones(4))
+    array([1., 0., 0., 1.])
+
+    """
+    if not is_mapped(A):
+        if out is None:
+            return A @ x
+        out[...] = A @ x
+        return out
+
+    if out is None:
+        out = np.empty((A.shape[0], *x.shape[1:]), dtype=np.result_type(A.dtype, x))
+    for start, stop, block in row_blocks(A):
+        out[start:stop] = block @ x
+    return out
+
+
+def aslinearoperator(A, scale=None):
+    """Return A, with rows scaled by scale, as a streaming LinearOperator.
+
+    Parameters
+    ----------
+    A : csr_array, bsr_array
+        Sparse matrix.
+    scale : array, optional
+        Scaling of the rows of A.
+
+    Returns
+    -------
+    LinearOperator
+        Operator that applies ``scale * (A @ x)`` with `matvec`.
+
+    """
+    def apply(x):
+        y = matvec(A, x)
+        if scale is not None:
+            y *= scale.reshape(-1, *(1,) * (y.ndim - 1))
+        return y
+
+    dtype = A.dtype if scale is None else np.result_type(A.dtype, scale)
+    return LinearOperator(A.shape, matvec=apply, matmat=apply, dtype=dtype)
+
+
+def galerkin_product(R, A, P):
+    """Return the coarse operator R @ A @ P, one block of rows of A at a time.
+
+    The product is streamed when A is memory mapped and P and R are sparse
+    or AggregationOperators.  Otherwise, it is formed directly.
+
+    Parameters
+    ----------
+    R : sparse matrix, AggregationOperator
+        Restriction.
+    A : sparse matrix
+        Fine operator.
+    P : sparse matrix, AggregationOperator
+        Prolongation.
+
+    Returns
+    -------
+    sparse matrix
+        R @ A @ P, in the format of P, or in CSR format if P is an
+        AggregationOperator.
+
+    Examples
+    --------
+    >>> from pyamg.gallery import poisson
+    >>> from pyamg.util.streaming import galerkin_product
+    >>> from scipy import sparse
+    >>> A = poisson((4,), format='csr')
+    >>> P = sparse.csr_array([[1.0, 0], [1, 0], [0, 1], [0, 1]])
+    >>> galerkin_product(P.T, A, P).toarray()
+    array([[ 2., -1.],
+           [-1.,  2.]])
+
+    """
+    # pyamg.aggregation imports this module
+    from ..aggregation.operator import AggregationOperator  # noqa: PLC0415
+
+    def supported(T):
+        return sparse.issparse(T) or isinstance(T, AggregationOperator)
+
+    if not (is_mapped(A) and supported(P) and supported(R)):
+        return R @ A @ P
+
+    # rows of R.T are sliced at the block rows of A
+    RT = R.T
+    blocksize = A.blocksize[0] if A.format == 'bsr' else 1
+    if isinstance(RT, AggregationOperator):
+        if RT.transposed:
+            RT = RT.tocsr()
+    elif RT.format not in ('csr', 'bsr') or \
+            (RT.format == 'bsr' and blocksize % RT.blocksize[0]):
+        RT = RT.tocsr()
+
+    def slice_rows(T, start, stop):
+        if sparse.issparse(T):
+            return row_slice(T, start, stop)
+        # the products with an AggregationOperator copy only the block of A
+        scale = None if T.scale is None else T.scale[start:stop]
+        return AggregationOperator(T.aggregates[start:stop], T.num_aggregates,
+                                   scale=scale, dtype=T.dtype)
+
+    # sum the contributions (rows of R.T)^T @ (rows of A) @ P of each block
+    rows, cols, vals = [], [], []
+    for start, stop, block in row_blocks(A):
+        coarse = (slice_rows(RT, start, stop).T @ (block @ P)).tocoo()
+        rows.append(coarse.row)
+        cols.append(coarse.col)
+        vals.append(coarse.data)
+    shape = (R.shape[0], P.shape[1])
+    Ac = sparse.coo_array((np.concatenate(vals),
+                           (np.concatenate(rows), np.concatenate(cols))),
+                          shape=shape).tocsr()
+
+    if isinstance(P, AggregationOperator):
+        return Ac
+    if P.format == 'bsr':
+        C = P.blocksize[1]
+        return Ac.tobsr(blocksize=(C, C))
+    return Ac.asformat(P.format)
@@ -9,7 +9,8 @@ from numpy.testing import (TestCase, assert_almost_equal, assert_equal,
 
 from pyamg.util.linalg import (approximate_spectral_radius,
                                infinity_norm, norm, condest, cond,
-                               ishermitian, pinv_array)
+                               ishermitian, pinv_array, inv_array,
+                               lu_factor_array, rmatvec)
 
 from pyamg import gallery
 
@@ -135,6 +136,24 @@ class TestLinalg(TestCase):
         A = np.array([[1.3, -4.7, 0], [-2.23, 5.5, 0], [9, 0, -2]])
         assert_equal(infinity_norm(csr_array(A)), 11)
 
+    def test_rmatvec(self):
+        np.random.seed(4109875)
+        cases = []
+        cases.append(csr_array(np.random.rand(7, 4)))
+        cases.append(gallery.poisson((6, 6), format='csr')[:, :20])
+        cases.append(gallery.linear_elasticity((4, 4), format='bsr')[0])
+        A = np.random.rand(8, 6) + 1j * np.random.rand(8, 6)
+        cases.append(csr_array(A).tobsr(blocksize=(2, 3)))
+        cases.append(csr_array(A).tocsc())
+
+        for A in cases:
+            Ad = A.toarray()
+            for shape in [(A.shape[0],), (A.shape[0], 2)]:
+                x = np.random.rand(*shape) + 1j * np.random.rand(*shape)
+                assert_array_almost_equal(rmatvec(A, x), Ad.T.conjugate() @ x)
+                assert_array_almost_equal(rmatvec(A, x, conjugate=False), Ad.T @ x)
+                assert_array_almost_equal(rmatvec(A, x.real), Ad.T.conjugate() @ x.real)
+
 
 class TestComplexLinalg(TestCase):
     def test_approximate_spectral_radius(self):
@@ -355,3 +374,61 @@ class TestComplexLinalg(TestCase):
 
             pinv_array(test)
             assert_array_almost_equal(test, pinv_test, decimal=4)
+
+        # Hermitian blocks, including singular ones
+        for test in tests:
+            test = test + np.conjugate(np.swapaxes(test, 1, 2))
+            if test.shape[1] > 2:
+                test[0] = test[0] @ np.diag([1.0, 1.0, 0.0]) @ test[0]
+            pinv_test = np.zeros_like(test)
+            for i in range(pinv_test.shape[0]):
+                pinv_test[i] = pinv(test[i])
+
+            test_f = test.copy(order='F')
+            pinv_array(test, hermitian=True)
+            assert_array_almost_equal(test, pinv_test, decimal=4)
+            pinv_array(test_f, hermitian=True)
+            assert_array_almost_equal(test_f, pinv_test, decimal=4)
+
+    def test_inv_array(self):
+        np.random.seed(0)
+        tests = []
+        tests.append(np.random.rand(5, 1, 1))
+        tests.append(np.random.rand(5, 3, 3))
+        tests.append(np.random.rand(5, 6, 6))
+        tests.append(np.random.rand(4, 8, 8) + 1.0j*np.random.rand(4, 8, 8))
+        # singular blocks fall back to the pseudo-inverse
+        A = np.random.rand(3, 4, 4)
+        A[1, 0, :] = A[1, 1, :]
+        A[2] = 0.0
+        tests.append(A)
+
+        for test in tests:
+            inv_test = np.array([pinv(block) for block in test])
+            # arrays that are not C-ordered are also modified in place
+            test_f = test.copy(order='F')
+            inv_array(test_f)
+            assert_array_almost_equal(test_f, inv_test, decimal=6)
+            inv_array(test)
+            assert_array_almost_equal(test, inv_test, decimal=6)
+
+    def test_lu_factor_array(self):
+        np.random.seed(0)
+        A = np.random.rand(6, 4, 4) + 1.0j*np.random.rand(6, 4, 4)
+        A[3, 0, :] = A[3, 2, :]
+        b = np.random.rand(4)
+
+        LU = A.copy()
+        piv = lu_factor_array(LU)
+        assert_equal(piv.shape, (6, 4))
+        assert_equal(piv[3, 0], -1)
+        assert_array_almost_equal(LU[3], pinv(A[3]))
+
+        for i in [0, 1, 2, 4, 5]:
+            assert piv[i, 0] >= 0
+            x = linalg.lu_solve((LU[i], piv[i]), b)
+            assert_array_almost_equal(x, np.linalg.solve(A[i], b))
+
+        LU_f = A.copy(order='F')
+        assert_equal(lu_factor_array(LU_f), piv)
+        assert_array_almost_equal(LU_f, LU)
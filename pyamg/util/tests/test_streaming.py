@@ -0,0 +1,123 @@
+"""Test row-block streaming of memory-mapped matrices."""
+import os
+import tempfile
+
+import numpy as np
+from numpy.testing import TestCase, assert_allclose, assert_equal
+from scipy import sparse
+
+from pyamg import smoothed_aggregation_solver, ruge_stuben_solver, pairwise_solver
+from pyamg.aggregation.operator import AggregationOperator
+from pyamg.gallery import poisson, linear_elasticity
+from pyamg.relaxation.relaxation import gauss_seidel, jacobi
+from pyamg.util import streaming
+
+
+def memmap_matrix(A, directory):
+    """Return a copy of a CSR or BSR matrix with read-only memory-mapped arrays."""
+    arrays = []
+    for name in ('data', 'indices', 'indptr'):
+        a = getattr(A, name)
+        filename = os.path.join(directory, f'{name}{id(A)}.dat')
+        a.tofile(filename)
+        arrays.append(np.memmap(filename, dtype=a.dtype, mode='r', shape=a.shape))
+    if A.format == 'bsr':
+        return sparse.bsr_array(tuple(arrays), shape=A.shape, blocksize=A.blocksize)
+    return sparse.csr_array(tuple(arrays), shape=A.shape)
+
+
+class TestStreaming(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.block_nnz = streaming.BLOCK_NNZ
+        streaming.BLOCK_NNZ = 500  # several blocks for small matrices
+
+        self.cases = [poisson((40, 40), format='csr'),
+                      linear_elasticity((10, 10), format='bsr')[0]]
+        self.mapped = [memmap_matrix(A, self.directory.name) for A in self.cases]
+
+    def tearDown(self):
+        streaming.BLOCK_NNZ = self.block_nnz
+        del self.mapped
+        self.directory.cleanup()
+
+    def test_blocks(self):
+        for A, Am in zip(self.cases, self.mapped, strict=True):
+            assert not streaming.is_mapped(A)
+            assert streaming.is_mapped(Am)
+
+            ranges = streaming.row_ranges(Am)
+            assert len(ranges) > 1
+            assert_equal(ranges[0][0], 0)
+            assert_equal(ranges[-1][1], len(A.indptr) - 1)
+
+            blocks = list(streaming.row_blocks(Am))
+            assert_allclose(streaming.stack([block for _, _, block in blocks],
+                                            A.shape).toarray(), A.toarray())
+            for start, stop, block in blocks:
+                assert_allclose(block.toarray(), A.toarray()[start:stop])
+
+            assert_allclose(streaming.diagonal(Am), A.diagonal())
+            x = np.random.rand(A.shape[0])
+            assert_allclose(streaming.matvec(Am, x), A @ x)
+            X = np.random.rand(A.shape[0], 3)
+            assert_allclose(streaming.aslinearoperator(Am) @ X, A @ X)
+
+            P = sparse.random_array((A.shape[0], 7), density=0.2, format='csr',
+                                    random_state=np.random.default_rng(0))
+            assert_allclose(streaming.galerkin_product(P.T, Am, P).toarray(),
+                            (P.T @ A @ P).toarray())
+
+            aggregates = np.arange(A.shape[0]) // 5
+            aggregates[::7] = -1
+            P = AggregationOperator(aggregates, scale=np.random.rand(A.shape[0]))
+            Ac = streaming.galerkin_product(P.T, Am, P)
+            assert_equal(Ac.format, 'csr')
+            assert_allclose(Ac.toarray(), (P.T @ A @ P).toarray())
+
+    def test_relaxation(self):
+        for A, Am in zip(self.cases, self.mapped, strict=True):
+            b = np.random.rand(A.shape[0])
+            for method, kwargs in [(gauss_seidel, {'sweep': 'symmetric'}),
+                                   (gauss_seidel, {'sweep': 'backward', 'omega': 0.9}),
+                                   (jacobi, {'iterations': 2, 'omega': 2.0/3.0})]:
+                if A.format == 'bsr' and 'omega' in kwargs and method is gauss_seidel:
+                    continue
+                x = np.zeros_like(b)
+                xm = np.zeros_like(b)
+                method(A, x, b, **kwargs)
+                method(Am, xm, b, **kwargs)
+                assert_allclose(xm, x)
+
+    def test_solvers(self):
+        np.random.seed(2092018)
+        cases = [(smoothed_aggregation_solver, 0, {}),
+                 (smoothed_aggregation_solver, 0, {'presmoother': 'jacobi',
+                                                   'postsmoother': 'jacobi'}),
+                 (smoothed_aggregation_solver, 1,
+                  {'strength': ('symmetric', {'theta': 0.1})}),
+                 (smoothed_aggregation_solver, 0, {'smooth': None}),
+                 (pairwise_solver, 0, {}),
+                 (ruge_stuben_solver, 0, {})]
+        for solver, i, kwargs in cases:
+            A, Am = self.cases[i], self.mapped[i]
+
+            # same random initial guesses in the spectral radius estimates
+            np.random.seed(0)
+            ml = solver(A, max_coarse=10, **kwargs)
+            np.random.seed(0)
+            mlm = solver(Am, max_coarse=10, **kwargs)
+
+            # the fine level operator is not copied
+            assert streaming.is_mapped(mlm.levels[0].A)
+            assert_equal(len(mlm.levels), len(ml.levels))
+            for level, levelm in zip(ml.levels[1:], mlm.levels[1:], strict=True):
+                assert_equal(levelm.A.format, level.A.format)
+                assert_allclose(levelm.A.toarray(), level.A.toarray(), atol=1e-10)
+
+            b = np.random.rand(A.shape[0])
+            for accel in [None, 'cg']:
+                x = ml.solve(b, tol=1e-8, accel=accel)
+                assert_allclose(mlm.solve(b, tol=1e-8, accel=accel), x, atol=1e-8)
+            assert_allclose(mlm.compile().solve(b, maxiter=5),
+                            ml.solve(b, maxiter=5, tol=1e-20), atol=1e-8)
@@ -4,6 +4,7 @@ from scipy.sparse import bsr_array, csr_array, csc_array, issparse, diags_array
 
 from numpy.testing import (TestCase, assert_equal, assert_almost_equal,
                            assert_array_almost_equal, assert_array_equal)
+import pytest
 
 import pyamg
 
@@ -1086,6 +1087,34 @@ class TestUtils(TestCase):
         assert_array_almost_equal(A.toarray(), A_stored)
         assert_array_almost_equal(Dinv.toarray(), Dinv_stored)
 
+    def test_coord_to_rbm(self):
+        from pyamg.util.utils import coord_to_rbm
+        np.random.seed(0)
+        x, y, z = np.random.rand(3, 5)
+
+        rbm = coord_to_rbm(5, 1, x, y, z)
+        assert_array_equal(rbm, np.ones((5, 1)))
+
+        for ndof in [3, 6]:
+            rbm = coord_to_rbm(5, ndof, x, y, z)
+            assert_equal(rbm.shape, (5*ndof, 6))
+            for node in range(5):
+                block = np.zeros((ndof, 6))
+                block[:, :ndof] = np.eye(ndof)
+                block[:3, 3:] = [[0, z[node], -y[node]],
+                                 [-z[node], 0, x[node]],
+                                 [y[node], -x[node], 0]]
+                assert_array_equal(rbm[node*ndof:(node+1)*ndof], block)
+
+            # write into a preallocated array, and return the blocks
+            out = np.empty((5, ndof, 6))
+            blocks = coord_to_rbm(5, ndof, x, y, z, out=out, blocks=True)
+            assert np.shares_memory(blocks, out)
+            assert_array_equal(out.reshape(-1, 6), rbm)
+
+        with pytest.raises(ValueError, match='C-contiguous'):
+            coord_to_rbm(5, 3, x, y, z, out=np.empty((6, 15)).T)
+
 
 class TestComplexUtils(TestCase):
     def test_diag_sparse(self):
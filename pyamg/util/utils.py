@@ -13,10 +13,13 @@ from scipy.sparse._sparsetools import (csr_scale_rows, bsr_scale_rows,
 
 # pylint: disable=unused-import
 from scipy.sparse.linalg._isolve.utils import make_system  # noqa: F401
+from scipy.sparse._sparsetools import csr_matvec, bsr_matvec  # noqa: F401
 from scipy.sparse._sputils import upcast
 
 from .. import amg_core
+from .stencil import StencilOperator
 from . import linalg
+from .params import set_tol
 
 
 def get_blocksize(A):
@@ -521,7 +524,7 @@ def get_diagonal(A, norm_eq=False, inv=False):
 
     Parameters
     ----------
-    A   : {dense or sparse matrix}
+    A   : {dense or sparse matrix, StencilOperator}
         e.g. array, matrix, csr_array, ...
     norm_eq : {0, 1, 2}
         0 ==> D = diag(A)
@@ -553,12 +556,17 @@ def get_diagonal(A, norm_eq=False, inv=False):
     [0.2        0.16666667 0.16666667 0.16666667 0.2       ]
 
     """
-    if not issparse(A) or A.format not in ('bsr', 'csc', 'csr'):
+    if isinstance(A, StencilOperator):
+        # only the normal equations need the matrix
+        if norm_eq:
+            A = A.tocsr()
+    elif not issparse(A) or A.format not in ('bsr', 'csc', 'csr'):
         warn('Implicit conversion to sparse matrix')
         A = csr_array(A)
 
     # critical to sort the indices of A
-    A.sort_indices()
+    if issparse(A):
+        A.sort_indices()
     if norm_eq == 1:
         # This transpose involves almost no work, use csr data structures as
         # csc, or vice versa
@@ -656,13 +664,8 @@ def get_block_diag(A, blocksize, inv_flag=True):
         block_diag[nonzero_mask, :, :] = A.data[diag_entries, :, :]
 
     if inv_flag:
-        # Invert each block
-        if block_diag.shape[1] < 7:
-            # This specialized routine lacks robustness for large matrices
-            amg_core.pinv_array(block_diag.ravel(), block_diag.shape[0],
-                                block_diag.shape[1], 'T')
-        else:
-            linalg.pinv_array(block_diag)
+        # Invert each block, with a pseudo-inverse for singular blocks
+        linalg.inv_array(block_diag)
         A.block_D_inv = block_diag
     else:
         A.block_D = block_diag
@@ -977,7 +980,7 @@ def hierarchy_spectrum(mg, filter_entries=True):
     return leveleigs
 
 
-def coord_to_rbm(nnodes, ndof, x, y, z):
+def coord_to_rbm(nnodes, ndof, x, y, z, out=None, blocks=False):
     """Convert 2D or 3D coordinates into Rigid body modes.
 
     For use as near nullspace modes in elasticity AMG solvers.
@@ -990,12 +993,25 @@ def coord_to_rbm(nnodes, ndof, x, y, z):
         Number of dofs per node
     x,y,z : array_like
         Coordinate vectors
+    out : array, optional
+        C-contiguous array of size (nnodes*ndof) x (1 | 6), or
+        nnodes x ndof x (1 | 6), to write the modes into, e.g., a
+        preallocated array or an ``np.memmap``.
+    blocks : bool
+        If True, return the modes as an nnodes x ndof x (1 | 6) view, with
+        the block of each node in ``rbm[node]``.
 
     Returns
     -------
     rbm : array
         An array of size (nnodes*ndof) x (1 | 6) containing the 6 rigid
-        body modes
+        body modes, or out if given
+
+    Notes
+    -----
+    The rows of each node are contiguous, which is the layout used for the
+    candidates B of a BSR matrix with blocksize ndof in
+    smoothed_aggregation_solver, so rbm is passed on without a copy.
 
     Examples
     --------
@@ -1042,55 +1058,36 @@ def coord_to_rbm(nnodes, ndof, x, y, z):
     #    (nnodes x 1) or (1 x nnodes).")
 
     # preallocate rbm
-    rbm = np.array(np.zeros((nnodes*ndof, numcols)))
-
-    for node in range(nnodes):  # pylint: disable=too-many-nested-blocks
-        dof = node * ndof
-
-        if ndof == 1:
-            rbm[node] = 1.0
-
-        if ndof == 6:
-            for ii in range(3, 6):  # lower half = [ 0 I ]
-                for jj in range(0, 6):
-                    if ii == jj:
-                        rbm[dof+ii, jj] = 1.0
-                    else:
-                        rbm[dof+ii, jj] = 0.0
-
-        if ndof in (3, 6):
-            for ii in range(0, 3):  # upper left = [ I ]
-                for jj in range(0, 3):
-                    if ii == jj:
-                        rbm[dof+ii, jj] = 1.0
-                    else:
-                        rbm[dof+ii, jj] = 0.0
-
-            for ii in range(0, 3):  # upper right = [ Q ]
-                for jj in range(3, 6):
-                    if ii == (jj-3):
-                        rbm[dof+ii, jj] = 0.0
-                    elif (ii+jj) == 4:
-                        rbm[dof+ii, jj] = z[node]
-                    elif (ii+jj) == 5:
-                        rbm[dof+ii, jj] = y[node]
-                    elif (ii+jj) == 6:
-                        rbm[dof+ii, jj] = x[node]
-                    else:
-                        rbm[dof+ii, jj] = 0.0
-
-            ii = 0
-            jj = 5
-            rbm[dof+ii, jj] *= -1.0
-
-            ii = 1
-            jj = 3
-            rbm[dof+ii, jj] *= -1.0
-
-            ii = 2
-            jj = 4
-            rbm[dof+ii, jj] *= -1.0
+    if out is None:
+        rbm = np.zeros((nnodes*ndof, numcols))
+    else:
+        rbm = out
+        if rbm.size != nnodes*ndof*numcols or not rbm.flags.c_contiguous:
+            raise ValueError('coord_to_rbm(...) requires out to be a C-contiguous '
+                             f'array of size {nnodes*ndof} x {numcols}')
+    blocked = rbm.reshape(nnodes, ndof, numcols)
 
+    if ndof == 1:
+        blocked[:] = 1.0
+    else:
+        blocked[:] = 0.0
+        for ii in range(ndof):  # diagonal = [ I 0 ; 0 I ]
+            blocked[:, ii, ii] = 1.0
+
+        # upper right = [ Q ]
+        blocked[:, 0, 4] = np.ravel(z)
+        blocked[:, 0, 5] = np.ravel(y)
+        blocked[:, 1, 3] = np.ravel(z)
+        blocked[:, 1, 5] = np.ravel(x)
+        blocked[:, 2, 3] = np.ravel(y)
+        blocked[:, 2, 4] = np.ravel(x)
+
+        blocked[:, 0, 5] *= -1.0
+        blocked[:, 1, 3] *= -1.0
+        blocked[:, 2, 4] *= -1.0
+
+    if blocks:
+        return blocked
     return rbm
 
 
@@ -1571,33 +1568,17 @@ def compute_BtBinv(B, C):
     else:
         cols_per_block = 1
         rows_per_block = 1
-    Ncoarse = C.shape[1]
     Nfine = C.shape[0]
     NullDim = B.shape[1]
     Nnodes = int(Nfine/rows_per_block)
 
-    # Construct BtB
+    # Construct BtB for each block row and replace it with its pseudo-inverse
+    # in one pass.  Eigenvalues of BtB below tol relative to the largest are
+    # treated as zero, which matches the singular value cutoff of pinv_array.
+    B = np.ascontiguousarray(B)
     BtBinv = np.zeros((Nnodes, NullDim, NullDim), dtype=B.dtype)
-    BsqCols = sum(range(NullDim+1))
-    Bsq = np.zeros((Ncoarse, BsqCols), dtype=B.dtype)
-    counter = 0
-    for i in range(NullDim):
-        for j in range(i, NullDim):
-            Bsq[:, counter] = np.conjugate(np.ravel(np.asarray(B[:, i]))) * \
-                np.ravel(np.asarray(B[:, j]))
-            counter = counter + 1
-    # This specialized C-routine calculates (B.T B) for each row using Bsq
-    amg_core.calc_BtB(NullDim, Nnodes, cols_per_block,
-                      np.ravel(np.asarray(Bsq)),
-                      BsqCols, np.ravel(np.asarray(BtBinv)),
-                      C.indptr.astype(np.int32), C.indices.astype(np.int32))
-
-    # Invert each block of BtBinv, noting that amg_core.calc_BtB(...) returns
-    # values in column-major form, thus necessitating the deep transpose
-    #   This is the old call to a specialized routine, but lacks robustness
-    #   amg_core.pinv_array(np.ravel(BtBinv), Nnodes, NullDim, 'F')
-    BtBinv = BtBinv.transpose((0, 2, 1)).copy()
-    linalg.pinv_array(BtBinv)
+    amg_core.calc_BtBinv(NullDim, Nnodes, cols_per_block, np.ravel(B),
+                         C.indptr, C.indices, np.ravel(BtBinv), set_tol(B.dtype))
 
     return BtBinv
 